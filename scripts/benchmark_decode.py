@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark the torero inventory decoders
+
+Generates synthetic 'torero get <kind> --raw' documents and times how long
+each decoder takes to turn them into inventory items:
+
+- stream: incremental JSON parsing plus one Pydantic model per item (default)
+- fast:   msgspec decoding into compact records (TORERO_API_DECODER=fast),
+          plus converting one 100-item page to models as the API does
+
+Usage:
+    python scripts/benchmark_decode.py
+    python scripts/benchmark_decode.py --kind decorators --sizes 1000 10000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from torero_api.core.fastdecode import as_models, decode_inventory, fast_decode_available
+from torero_api.core.jsonstream import JSONItemParser
+from torero_api.models.decorator import Decorator
+from torero_api.models.registry import Registry
+from torero_api.models.service import Service
+
+CHUNK_SIZE = 64 * 1024
+PAGE_SIZE = 100
+
+def make_service(i: int) -> dict:
+    return {
+        "name": f"service-{i}",
+        "description": f"Synthetic service number {i}",
+        "type": ("ansible-playbook", "opentofu-plan", "python-script")[i % 3],
+        "tags": ["network", f"site-{i % 50}", "backup" if i % 2 else "audit"],
+        "registries": {"file": {"path": f"/etc/torero/services/service-{i}"}}
+    }
+
+def make_decorator(i: int) -> dict:
+    return {
+        "name": f"decorator-{i}",
+        "description": f"Synthetic decorator number {i}",
+        "type": "decorator",
+        "id": f"dec-{i}",
+        "created": "2024-01-01T00:00:00Z",
+        "tags": ["auth", f"team-{i % 20}"],
+        "schema": {"type": "object", "properties": {"username": {"type": "string"}}}
+    }
+
+def make_registry(i: int) -> dict:
+    return {
+        "name": f"registry-{i}",
+        "description": f"Synthetic registry number {i}",
+        "type": ("ansible-galaxy", "pypi")[i % 2],
+        "url": f"https://registry-{i}.example.com",
+        "id": f"reg-{i}",
+        "created": "2024-01-01T00:00:00Z",
+        "tags": ["production"]
+    }
+
+def build_decorator(data: dict) -> Decorator:
+    # Same mapping as torero_executor._fetch_decorators_async
+    return Decorator(
+        name=data.get("name", "unknown"),
+        description=data.get("description") or None,
+        type=data.get("type", "decorator"),
+        parameters=data.get("schema") or data.get("parameters"),
+        registries={"metadata": {"id": data.get("id"), "created": data.get("created"), "tags": data.get("tags", [])}}
+    )
+
+def build_registry(data: dict) -> Registry:
+    # Same mapping as torero_executor._fetch_registries_async
+    return Registry(
+        name=data.get("name", "unknown"),
+        description=data.get("description"),
+        type=data.get("type", "unknown"),
+        url=data.get("url", ""),
+        metadata={"id": data.get("id"), "created": data.get("created"), "tags": data.get("tags", []), "credentials": data.get("credentials")}
+    )
+
+KINDS = {
+    "services": (make_service, lambda data: Service(**data)),
+    "decorators": (make_decorator, build_decorator),
+    "registries": (make_registry, build_registry)
+}
+
+def decode_stream(kind: str, document: bytes) -> list:
+    """Decode a document the way the stream decoder does."""
+    build = KINDS[kind][1]
+    parser = JSONItemParser(("decorators", "items") if kind == "decorators" else ("items",))
+    items = []
+    for start in range(0, len(document), CHUNK_SIZE):
+        items.extend(build(item) for item in parser.feed(document[start:start + CHUNK_SIZE]))
+    items.extend(build(item) for item in parser.close())
+    return items
+
+def decode_fast(kind: str, document: bytes) -> list:
+    """Decode a document the way the fast decoder does, converting one page at the boundary."""
+    records = decode_inventory(kind, document)
+    as_models(records[:PAGE_SIZE])
+    return records
+
+def best_time(function, *args, repeat: int) -> float:
+    """Return the fastest of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the torero inventory decoders")
+    parser.add_argument("--kind", default="services", choices=sorted(KINDS), help="Inventory kind to generate")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Inventory sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest is reported")
+    args = parser.parse_args()
+
+    if not fast_decode_available():
+        parser.error("msgspec is required: pip install torero-api[fast]")
+
+    make = KINDS[args.kind][0]
+    print(f"{'items':>8}  {'size':>9}  {'stream':>9}  {'fast':>9}  {'speedup':>7}")
+    for size in args.sizes:
+        document = json.dumps([make(i) for i in range(size)]).encode()
+
+        stream = best_time(decode_stream, args.kind, document, repeat=args.repeat)
+        fast = best_time(decode_fast, args.kind, document, repeat=args.repeat)
+
+        print(f"{size:>8}  {len(document) / 2**20:>7.1f}MB  {stream * 1000:>7.1f}ms  {fast * 1000:>7.1f}ms  {stream / fast:>6.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Measure the memory held by a cached services inventory
+
+Builds a synthetic services inventory and compares, with tracemalloc, the
+memory retained by:
+
+- models:  a list of Pydantic Service models (the original representation)
+- catalog: the compact catalog entries the inventory cache now holds
+
+Usage:
+    python scripts/benchmark_memory.py
+    python scripts/benchmark_memory.py --size 10000 --tags 200
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from torero_api.core.catalog import ServiceCatalog
+from torero_api.models.service import Service
+
+TYPES = ("ansible-playbook", "opentofu-plan", "python-script")
+
+def make_document(size: int, tag_count: int) -> bytes:
+    """Generate a synthetic 'torero get services --raw' document."""
+    rng = random.Random(0)
+    vocabulary = [f"tag-{i}" for i in range(tag_count)]
+    return json.dumps([
+        {
+            "name": f"service-{i}",
+            "description": f"Synthetic service number {i}",
+            "type": rng.choice(TYPES),
+            "tags": rng.sample(vocabulary, 3),
+            "registries": {"file": {"path": f"/etc/torero/services/service-{i}"}}
+        }
+        for i in range(size)
+    ]).encode()
+
+def retained(build, document: bytes) -> int:
+    """Return the bytes still allocated by build(document)'s result once it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(document)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+def build_models(document: bytes) -> list:
+    return [Service(**svc) for svc in json.loads(document)]
+
+def build_catalog(document: bytes) -> list:
+    catalog = ServiceCatalog()
+    return [catalog.add(Service(**svc)) for svc in json.loads(document)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory held by a cached services inventory")
+    parser.add_argument("--size", type=int, default=100000, help="Number of services")
+    parser.add_argument("--tags", type=int, default=50, help="Size of the tag vocabulary")
+    args = parser.parse_args()
+
+    document = make_document(args.size, args.tags)
+    models = retained(build_models, document)
+    catalog = retained(build_catalog, document)
+
+    print(f"{args.size} services, {args.tags} distinct tags")
+    print(f"  models:  {models / 2**20:8.1f} MB  ({models / args.size:6.0f} B/service)")
+    print(f"  catalog: {catalog / 2**20:8.1f} MB  ({catalog / args.size:6.0f} B/service)")
+    print(f"  saved:   {(models - catalog) / 2**20:8.1f} MB  ({1 - catalog / models:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Shared pytest fixtures and helpers for the torero API tests
+"""
+
+import io
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from torero_api.core.cache import invalidate_inventory
+from torero_api.core.health import health_probe
+from torero_api.core.history import execution_history
+
+def make_process(returncode=0, stdout="", stderr=""):
+    """Build a mock asyncio subprocess that returns the given output."""
+
+    process_mock = MagicMock()
+    process_mock.returncode = returncode
+    process_mock.communicate = AsyncMock(return_value=(stdout.encode(), stderr.encode()))
+    process_mock.wait = AsyncMock(return_value=returncode)
+
+    # Streamed reads of the pipes
+    stdout_pipe = io.BytesIO(stdout.encode())
+    process_mock.stdout.read = AsyncMock(side_effect=lambda n=-1: stdout_pipe.read(n))
+    stderr_pipe = io.BytesIO(stderr.encode())
+    process_mock.stderr.read = AsyncMock(side_effect=lambda n=-1: stderr_pipe.read(n))
+    return process_mock
+
+def parse_events(text):
+    """Split a Server-Sent Events body into (event, data) tuples."""
+
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = [line.split(": ", 1) for line in block.split("\n")]
+        event = next(value for key, value in fields if key == "event")
+        data = "\n".join(value for key, value in fields if key == "data")
+        events.append((event, data))
+    return events
+
+@pytest.fixture(autouse=True)
+def clear_inventory_cache():
+    """Make sure no test sees inventories cached by another test."""
+
+    invalidate_inventory()
+    yield
+    invalidate_inventory()
+
+@pytest.fixture(autouse=True)
+def clear_health_probe():
+    """Make sure no test sees a torero health result from another test."""
+
+    health_probe.reset()
+    yield
+    health_probe.reset()
+
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path):
+    """Record executions in a database of the test's own, never in ~/.torero-api."""
+
+    execution_history.configure(path=str(tmp_path / "history.db"), enabled=True)
+    yield execution_history
+    execution_history.close()
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only; the executor is built on asyncio subprocesses."""
+
+    return "asyncio"
@@ -0,0 +1,408 @@
+"""
+Test module for the torero executor backends
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.backends import (
+    CLIBackend,
+    ServerBackend,
+    ToreroBackend,
+    create_backend,
+    get_backend,
+    set_backend
+)
+from torero_api.core.torero_executor import get_services_async, check_torero_available_async
+from tests.conftest import make_process
+
+class StandInServer:
+    """
+    Local stand-in for a torero command server.
+
+    Each request is answered by handler(args) -> dict, in its own task so
+    responses can arrive out of order.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.connections = 0
+        self.requests = []
+        self._server = None
+        self._writers = []
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"127.0.0.1:{port}"
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+        tasks = []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            self.requests.append(request)
+            tasks.append(asyncio.create_task(self._answer(request, writer)))
+        await asyncio.gather(*tasks, return_exceptions=True)
+        writer.close()
+
+    async def _answer(self, request, writer):
+        response = await self.handler(request["args"])
+        if response is None:
+            return
+        response["id"] = request["id"]
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    def drop_connections(self):
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def stop(self):
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+async def echo_handler(args):
+    """Answer every command with its arguments on stdout."""
+
+    return {"return_code": 0, "stdout": " ".join(args), "stderr": ""}
+
+@pytest.fixture
+def restore_backend():
+    """Put the default backend back after a test replaces it."""
+
+    previous = set_backend(None)
+    yield
+    set_backend(previous)
+
+def test_backend_must_implement_run():
+    """Test that a backend without run() cannot be created."""
+
+    class IncompleteBackend(ToreroBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        ToreroBackend()
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+@pytest.mark.anyio
+async def test_cli_backend_runs_subprocess():
+    """Test that the CLI backend spawns the command and hands out its raw and decoded output."""
+
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+        # Set up the mock
+        mock_exec.return_value = make_process(returncode=2, stdout="out", stderr="err")
+
+        # Call the backend
+        result = await CLIBackend().run(["torero", "version"], timeout=5)
+
+        # Assertions
+        assert (result.return_code, result.stdout, result.stderr) == (2, "out", "err")
+        assert result.stdout_bytes == b"out"
+        mock_exec.assert_called_once_with(
+            "torero", "version",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+@pytest.mark.anyio
+async def test_cli_backend_streams_output():
+    """Test that the CLI backend hands out stdout in chunks and reports the exit status."""
+
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
+         patch("torero_api.core.backends.STREAM_CHUNK_SIZE", 4):
+        # Set up the mock
+        mock_exec.return_value = make_process(returncode=1, stdout="0123456789", stderr="err")
+
+        # Call the backend
+        async with CLIBackend().stream(["torero", "get", "services", "--raw"], timeout=5) as stream:
+            chunks = [chunk async for chunk in stream]
+            return_code = await stream.finish()
+
+        # Assertions
+        assert chunks == [b"0123", b"4567", b"89"]
+        assert return_code == 1
+        assert stream.stderr == "err"
+
+@pytest.mark.anyio
+async def test_cli_backend_stream_kills_abandoned_process():
+    """Test that a stream left before the end of the output kills the process."""
+
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
+         patch("torero_api.core.backends.STREAM_CHUNK_SIZE", 4):
+        # Set up the mock
+        process_mock = make_process(stdout="0123456789")
+        mock_exec.return_value = process_mock
+
+        # Call the backend
+        async with CLIBackend().stream(["torero", "get", "services", "--raw"], timeout=5) as stream:
+            async for chunk in stream:
+                break
+
+        # Assertions
+        process_mock.kill.assert_called_once()
+        assert stream.return_code is None
+
+@pytest.mark.anyio
+async def test_server_backend_streams_whole_response():
+    """Test that the default stream() hands out the complete output as one chunk."""
+
+    server = StandInServer(echo_handler)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        async with backend.stream(["torero", "get", "services", "--raw"], timeout=5) as stream:
+            chunks = [chunk async for chunk in stream]
+
+        assert chunks == [b"get services --raw"]
+        assert stream.return_code == 0
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_cli_backend_output_relays_lines_from_both_pipes():
+    """Test that the CLI backend hands out stdout and stderr lines and the exit status."""
+
+    script = (
+        "import sys\n"
+        "print('one', flush=True)\n"
+        "print('oops', file=sys.stderr, flush=True)\n"
+        "sys.stdout.write('two\\r\\nthree')\n"
+        "sys.exit(3)\n"
+    )
+
+    # Call the backend
+    async with CLIBackend().output([sys.executable, "-c", script], timeout=10) as output:
+        lines = [line async for line in output]
+
+    # Assertions
+    assert [line for line in lines if line.channel == "stdout"] == [("stdout", "one"), ("stdout", "two"), ("stdout", "three")]
+    assert ("stderr", "oops") in lines
+    assert output.return_code == 3
+
+@pytest.mark.anyio
+async def test_cli_backend_output_is_live():
+    """Test that lines arrive while the command runs, and leaving early kills it."""
+
+    script = "import time\nprint('started', flush=True)\ntime.sleep(30)\n"
+    began = time.monotonic()
+
+    # Call the backend
+    async with CLIBackend().output([sys.executable, "-c", script], timeout=60) as output:
+        async for line in output:
+            break
+
+    # Assertions
+    assert line == ("stdout", "started")
+    assert time.monotonic() - began < 10
+    assert output.return_code is None
+
+@pytest.mark.anyio
+async def test_cli_backend_output_splits_long_lines():
+    """Test that an overlong line is handed out in pieces."""
+
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
+         patch("torero_api.core.backends.MAX_LINE_SIZE", 4), \
+         patch("torero_api.core.backends.STREAM_CHUNK_SIZE", 3):
+        # Set up the mock
+        mock_exec.return_value = make_process(stdout="0123456789\nab\n\nabcdefghi")
+
+        # Call the backend
+        async with CLIBackend().output(["torero", "run", "service", "python-script", "x"], timeout=5) as output:
+            lines = [line.text async for line in output]
+
+        # Assertions
+        assert lines == ["0123", "4567", "89", "ab", "", "abcd", "efgh", "i"]
+
+@pytest.mark.anyio
+async def test_server_backend_output_after_completion():
+    """Test that the default output() hands out the lines once the command has finished."""
+
+    async def handler(args):
+        return {"return_code": 1, "stdout": "a\nb\n", "stderr": "failed"}
+
+    server = StandInServer(handler)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        async with backend.output(["torero", "run", "service", "python-script", "x"], timeout=5) as output:
+            lines = [line async for line in output]
+
+        assert lines == [("stdout", "a"), ("stdout", "b"), ("stderr", "failed")]
+        assert output.return_code == 1
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_server_backend_runs_command():
+    """Test that the server backend sends the arguments and returns the response."""
+
+    server = StandInServer(echo_handler)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        result = await backend.run(["torero", "get", "services", "--raw"], timeout=5)
+
+        assert result.return_code == 0
+        assert result.stdout == "get services --raw"
+        assert result.stdout_bytes == b"get services --raw"
+        assert server.requests[0]["args"] == ["get", "services", "--raw"]
+        assert server.requests[0]["timeout"] == 5
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_server_backend_reuses_one_connection():
+    """Test that concurrent and consecutive commands share a single connection."""
+
+    async def handler(args):
+        # Answer later requests first to exercise out-of-order responses
+        await asyncio.sleep(0.05 / int(args[-1]))
+        return {"return_code": 0, "stdout": args[-1], "stderr": ""}
+
+    server = StandInServer(handler)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        results = await asyncio.gather(*(
+            backend.run(["torero", "describe", "service", str(i)], timeout=5) for i in range(1, 11)
+        ))
+        await backend.run(["torero", "describe", "service", "1"], timeout=5)
+
+        assert [r.stdout for r in results] == [str(i) for i in range(1, 11)]
+        assert server.connections == 1
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_server_backend_reconnects():
+    """Test that the backend opens a new connection after the server drops it."""
+
+    server = StandInServer(echo_handler)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        await backend.run(["torero", "version"], timeout=5)
+        server.drop_connections()
+        await asyncio.sleep(0.01)
+
+        result = await backend.run(["torero", "version"], timeout=5)
+
+        assert result.stdout == "version"
+        assert server.connections == 2
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_server_backend_timeout():
+    """Test that a missing response raises TimeoutExpired."""
+
+    async def never(args):
+        return None
+
+    server = StandInServer(never)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            await backend.run(["torero", "version"], timeout=0.05)
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_server_backend_error_response():
+    """Test that an error response is raised as RuntimeError."""
+
+    async def failing(args):
+        return {"error": "torero not installed"}
+
+    server = StandInServer(failing)
+    address = await server.start()
+    backend = ServerBackend(address)
+
+    try:
+        with pytest.raises(RuntimeError) as excinfo:
+            await backend.run(["torero", "version"], timeout=5)
+        assert "torero not installed" in str(excinfo.value)
+    finally:
+        await backend.close()
+        await server.stop()
+
+@pytest.mark.anyio
+async def test_server_backend_unreachable():
+    """Test that an unreachable server raises ConnectionError."""
+
+    backend = ServerBackend("127.0.0.1:1")
+
+    with pytest.raises(ConnectionError):
+        await backend.run(["torero", "version"], timeout=5)
+
+@pytest.mark.anyio
+async def test_executor_uses_server_backend(restore_backend):
+    """Test that executor functions go through the configured backend without spawning processes."""
+
+    services = [{"name": "svc", "description": "", "type": "python-script", "tags": []}]
+
+    async def handler(args):
+        return {"return_code": 0, "stdout": json.dumps(services), "stderr": ""}
+
+    server = StandInServer(handler)
+    address = await server.start()
+    backend = ServerBackend(address)
+    set_backend(backend)
+
+    try:
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
+             patch("shutil.which", return_value=None):
+            result = await get_services_async()
+            available, message = await check_torero_available_async()
+
+            assert [s.name for s in result] == ["svc"]
+            assert available is True
+            mock_exec.assert_not_called()
+    finally:
+        await backend.close()
+        await server.stop()
+
+def test_create_backend():
+    """Test backend creation by name."""
+
+    assert isinstance(create_backend("cli"), CLIBackend)
+    assert create_backend("server", "localhost:5000").address == "localhost:5000"
+    with pytest.raises(ValueError):
+        create_backend("server")
+    with pytest.raises(ValueError):
+        create_backend("grpc")
+
+def test_backend_from_env(restore_backend):
+    """Test that the backend is selected from the environment on first use."""
+
+    with patch.dict("os.environ", {"TORERO_API_BACKEND": "server", "TORERO_API_SERVER_ADDRESS": "unix:/tmp/torero.sock"}):
+        backend = get_backend()
+
+    assert isinstance(backend, ServerBackend)
+    assert backend.address == "unix:/tmp/torero.sock"
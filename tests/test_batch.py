@@ -0,0 +1,260 @@
+"""
+Test module for batch service executions
+"""
+
+import asyncio
+import json
+import uuid
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.inventory import InventorySnapshot
+from torero_api.core.torero_executor import plan_executions_async, run_many_async, run_service_async
+from torero_api.models.service import Service
+from torero_api.server import app
+from tests.conftest import parse_events
+
+SNAPSHOT = InventorySnapshot("services", [
+    Service(name="backup-1", type="ansible-playbook", tags=[]),
+    Service(name="backup-2", type="ansible-playbook", tags=[]),
+    Service(name="report", type="python-script", tags=[]),
+    Service(name="infra", type="opentofu-plan", tags=[]),
+])
+
+RESULT = {
+    "return_code": 0,
+    "stdout": "ok",
+    "stderr": "",
+    "start_time": "2025-05-26T22:18:41.905955",
+    "end_time": "2025-05-26T22:18:42.905955",
+    "elapsed_time": 1.0
+}
+
+@pytest.mark.anyio
+async def test_plan_executions_uses_one_snapshot():
+    """Test that every item is checked against a single services snapshot."""
+
+    # Set up the mock
+    with patch("torero_api.core.torero_executor.get_inventory_snapshot_async", AsyncMock(return_value=SNAPSHOT)) as mock_snapshot:
+        # Call the function
+        plans = await plan_executions_async([
+            ("backup-1", None),
+            ("infra", "destroy"),
+            ("missing", None),
+            ("infra", None),
+            ("report", "apply"),
+        ])
+
+    # Assertions
+    mock_snapshot.assert_awaited_once_with("services")
+    assert plans[:2] == ["ansible-playbook", "opentofu-plan/destroy"]
+    assert isinstance(plans[2], LookupError)
+    assert isinstance(plans[3], ValueError)
+    assert isinstance(plans[4], ValueError)
+
+@pytest.mark.anyio
+async def test_run_many_bounds_concurrency_and_yields_as_completed():
+    """Test that at most `concurrency` runs are in flight and outcomes arrive in completion order."""
+
+    in_flight = 0
+    peak = 0
+
+    def make_run(delay, error=None):
+        async def run():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delay)
+            in_flight -= 1
+            if error is not None:
+                raise error
+            return delay
+        return run
+
+    runs = [("slow", make_run(0.2)), ("fast", make_run(0.01)), ("broken", make_run(0.05, RuntimeError("boom"))),
+            ("last", make_run(0.01))]
+
+    # Call the function
+    outcomes = [outcome async for outcome in run_many_async(runs, concurrency=2)]
+
+    # Assertions
+    assert peak == 2
+    assert [key for key, _ in outcomes] == ["fast", "broken", "last", "slow"]
+    assert isinstance(dict(outcomes)["broken"], RuntimeError)
+    assert dict(outcomes)["slow"] == 0.2
+
+@pytest.mark.anyio
+async def test_run_many_cancels_pending_runs_when_abandoned():
+    """Test that closing the iteration early cancels the runs still in flight."""
+
+    started = []
+    cancelled = []
+
+    async def run(key, delay):
+        started.append(key)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(key)
+            raise
+        return key
+
+    # Call the function
+    outcomes = run_many_async([(key, lambda key=key, delay=delay: run(key, delay))
+                               for key, delay in (("a", 0), ("b", 10), ("c", 10))], concurrency=2)
+    first = await outcomes.__anext__()
+    await outcomes.aclose()
+
+    # Assertions
+    assert first == ("a", "a")
+    assert "b" in cancelled
+    assert sorted(cancelled) == sorted(set(started) - {"a"})
+
+@pytest.mark.anyio
+async def test_run_service_dispatches_by_operation():
+    """Test that operations map to their run functions and unknown ones are rejected."""
+
+    with patch("torero_api.core.torero_executor.run_opentofu_plan_apply_service_async", new_callable=AsyncMock) as mock_apply:
+        mock_apply.return_value = RESULT
+
+        # Call the function
+        result = await run_service_async("opentofu-plan/apply", "infra", {"workspace": "prod"})
+
+    # Assertions
+    assert result == RESULT
+    mock_apply.assert_awaited_once_with("infra", workspace="prod")
+    with pytest.raises(ValueError):
+        await run_service_async("opentofu-plan/plan", "infra")
+
+@patch("torero_api.api.v1.endpoints.execution.run_service_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.get_inventory_snapshot_async", new_callable=AsyncMock)
+def test_batch_endpoint(mock_snapshot, mock_run):
+    """Test per-item results, parameters and idempotent repeats of a synchronous batch."""
+
+    # Set up the mocks
+    mock_snapshot.return_value = SNAPSHOT
+
+    async def run(operation, name, params):
+        if name == "backup-2":
+            raise RuntimeError("Service execution timed out after 5 minutes")
+        return {**RESULT, "stdout": f"{operation} {name} {params}"}
+
+    mock_run.side_effect = run
+    client = TestClient(app)
+    body = {"items": [
+        {"service": "backup-1", "params": {"limit": "core"}},
+        {"service": "missing"},
+        {"service": "backup-2"},
+        {"service": "infra", "operation": "apply"},
+        {"service": "infra"},
+    ]}
+    key = {"Idempotency-Key": uuid.uuid4().hex}
+
+    # Call the API
+    response = client.post("/v1/execute/batch?concurrency=2", json=body, headers=key)
+    repeat = client.post("/v1/execute/batch?concurrency=2", json=body, headers=key)
+    invalid = client.post("/v1/execute/batch?concurrency=0", json=body)
+    empty = client.post("/v1/execute/batch", json={"items": []})
+
+    # Assertions
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["status_code"] for r in results] == [200, 404, 500, 200, 400]
+    assert results[0]["result"]["stdout"] == "ansible-playbook backup-1 {'limit': 'core'}"
+    assert results[3]["operation"] == "opentofu-plan/apply"
+    assert "timed out" in results[2]["error"]
+    assert repeat.json() == results
+    assert mock_run.await_count == 3
+    assert invalid.status_code == 422
+    assert empty.status_code == 422
+
+@patch("torero_api.api.v1.endpoints.execution.run_service_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.get_inventory_snapshot_async", new_callable=AsyncMock)
+def test_batch_endpoint_streams_results_as_they_complete(mock_snapshot, mock_run):
+    """Test that streamed batches send ruled-out items first, then results in completion order."""
+
+    # Set up the mocks
+    mock_snapshot.return_value = SNAPSHOT
+
+    async def run(operation, name, params):
+        await asyncio.sleep(0.05 if name == "backup-1" else 0)
+        return {**RESULT, "return_code": 2 if name == "report" else 0}
+
+    mock_run.side_effect = run
+    client = TestClient(app)
+    body = {"items": [{"service": "backup-1"}, {"service": "report"}, {"service": "missing"}]}
+
+    # Call the API
+    response = client.post("/v1/execute/batch", json=body, headers={"Accept": "text/event-stream"})
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [(event, json.loads(data)) for event, data in parse_events(response.text)]
+    assert [(event, data.get("index")) for event, data in events] == [
+        ("result", 2), ("result", 1), ("result", 0), ("end", None)
+    ]
+    assert events[0][1]["status_code"] == 404
+    assert events[-1][1] == {"total": 3, "succeeded": 1, "failed": 2}
+
+@patch("torero_api.core.torero_executor.get_inventory_snapshot_async", new_callable=AsyncMock)
+def test_batch_endpoint_async_mode(mock_snapshot):
+    """Test that async batches answer 202 with a job per valid item."""
+
+    # Set up the mocks
+    mock_snapshot.return_value = SNAPSHOT
+    client = TestClient(app)
+    body = {"items": [{"service": "backup-1"}, {"service": "missing"}, {"service": "infra", "operation": "destroy"}]}
+
+    # Call the API
+    with patch("torero_api.api.v1.endpoints.execution.job_manager") as mock_manager:
+        mock_manager.submit.return_value.to_dict.return_value = {
+            "id": "1", "service": "backup-1", "operation": "ansible-playbook", "priority": "low",
+            "status": "queued", "created_at": "2025-05-26T22:18:41Z"
+        }
+        response = client.post("/v1/execute/batch?async=true&priority=low", json=body)
+
+    # Assertions
+    assert response.status_code == 202
+    results = response.json()
+    assert [r["status_code"] for r in results] == [202, 404, 202]
+    assert results[0]["job"]["id"] == "1"
+    assert [c.args[:2] for c in mock_manager.submit.call_args_list] == [
+        ("backup-1", "ansible-playbook"), ("infra", "opentofu-plan/destroy")
+    ]
+    assert all(c.args[3] == "low" for c in mock_manager.submit.call_args_list)
+
+@pytest.mark.parametrize("key", ["set=evil --debug", "Limit", "-x", "limit ", "name", "operation", "raw", "set"])
+@patch("torero_api.api.v1.endpoints.execution.run_service_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.get_inventory_snapshot_async", new_callable=AsyncMock)
+def test_batch_endpoint_rejects_unsafe_param_names(mock_snapshot, mock_run, key):
+    """Test that parameter names that could add torero flags or collide with arguments are rejected."""
+
+    # Set up the mocks
+    mock_snapshot.return_value = SNAPSHOT
+    client = TestClient(app)
+
+    # Call the API
+    response = client.post("/v1/execute/batch", json={"items": [{"service": "backup-1", "params": {key: "1"}}]})
+
+    # Assertions
+    assert response.status_code == 422
+    mock_run.assert_not_awaited()
+
+@pytest.mark.anyio
+async def test_run_service_passes_params_apart_from_its_arguments():
+    """Test that parameters are passed as a dict and reach the command as --key=value arguments."""
+
+    with patch("torero_api.core.torero_executor.run_ansible_playbook_service_async", new_callable=AsyncMock) as mock_run:
+        mock_run.return_value = RESULT
+
+        # Call the function
+        await run_service_async("ansible-playbook", "backup-1", {"limit": "core", "check-mode": True})
+        await run_service_async("ansible-playbook", "backup-2")
+
+    # Assertions
+    assert mock_run.await_args_list[0].args == ("backup-1",)
+    assert mock_run.await_args_list[0].kwargs == {"limit": "core", "check-mode": True}
+    assert mock_run.await_args_list[1].kwargs == {}
@@ -0,0 +1,115 @@
+"""
+Test module for the torero API bulk describe endpoints
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.inventory import InventorySnapshot
+from torero_api.core.torero_executor import describe_many_async
+from torero_api.models.service import Service
+from torero_api.server import app
+from tests.conftest import make_process
+
+SNAPSHOT = InventorySnapshot("services", [
+    Service(name=f"svc-{i}", type="ansible-playbook", tags=[]) for i in range(10)
+])
+
+@pytest.mark.anyio
+async def test_describe_many_bounds_concurrency():
+    """Test that at most `concurrency` describes run at the same time."""
+
+    in_flight = 0
+    peak = 0
+
+    async def describe(name):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"metadata": {"name": name}}]
+
+    # Set up the mocks
+    with patch("torero_api.core.torero_executor.get_inventory_snapshot_async", AsyncMock(return_value=SNAPSHOT)), \
+         patch("torero_api.core.torero_executor.describe_service_async", side_effect=describe):
+        # Call the function
+        results = await describe_many_async("services", [f"svc-{i}" for i in range(10)], concurrency=3)
+
+    # Assertions
+    assert peak == 3
+    assert list(results) == [f"svc-{i}" for i in range(10)]
+    assert results["svc-4"] == [{"metadata": {"name": "svc-4"}}]
+
+@pytest.mark.anyio
+async def test_describe_many_reports_errors_per_item():
+    """Test that missing items and failures are reported without failing the others."""
+
+    async def describe(name):
+        if name == "svc-1":
+            raise RuntimeError("torero error: boom")
+        if name == "svc-2":
+            return None
+        return [{"metadata": {"name": name}}]
+
+    # Set up the mocks
+    with patch("torero_api.core.torero_executor.get_inventory_snapshot_async", AsyncMock(return_value=SNAPSHOT)), \
+         patch("torero_api.core.torero_executor.describe_service_async", side_effect=describe) as mock_describe:
+        # Call the function
+        results = await describe_many_async("services", ["svc-0", "svc-1", "svc-2", "missing", "svc-0"])
+
+    # Assertions
+    assert list(results) == ["svc-0", "svc-1", "svc-2", "missing"]
+    assert results["svc-0"] == [{"metadata": {"name": "svc-0"}}]
+    assert isinstance(results["svc-1"], RuntimeError)
+    assert isinstance(results["svc-2"], LookupError)
+    assert str(results["missing"]) == "Service 'missing' not found"
+    assert mock_describe.call_count == 3
+
+@pytest.mark.anyio
+async def test_describe_many_rejects_unknown_kind():
+    """Test that kinds without a describe command are rejected."""
+
+    with pytest.raises(ValueError):
+        await describe_many_async("registries", ["reg"])
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_bulk_describe_endpoint(mock_exec):
+    """Test that the endpoint maps each name to its result and status code."""
+
+    # Set up the mock
+    def process(*args, **kwargs):
+        if args[1] == "get":
+            return make_process(stdout=json.dumps([
+                {"name": "svc-a", "type": "ansible-playbook", "tags": []},
+                {"name": "svc-b", "type": "python-script", "tags": []}
+            ]))
+        if args[3] == "svc-b":
+            return make_process(returncode=1, stderr="describe failed")
+        return make_process(stdout=json.dumps([{"metadata": {"name": args[3]}}]))
+
+    mock_exec.side_effect = process
+    client = TestClient(app)
+
+    # Call the API
+    response = client.post("/v1/services/describe", json={"names": ["svc-a", "svc-b", "svc-c"]})
+
+    # Assertions
+    assert response.status_code == 200
+    data = response.json()
+    assert data["svc-a"] == {"status_code": 200, "description": [{"metadata": {"name": "svc-a"}}], "error": None}
+    assert data["svc-b"]["status_code"] == 500
+    assert "describe failed" in data["svc-b"]["error"]
+    assert data["svc-c"] == {"status_code": 404, "description": None, "error": "Service 'svc-c' not found"}
+
+def test_bulk_describe_requires_names():
+    """Test that an empty list of names is rejected."""
+
+    client = TestClient(app)
+
+    response = client.post("/v1/secrets/describe", json={"names": []})
+
+    assert response.status_code == 422
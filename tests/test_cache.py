@@ -0,0 +1,239 @@
+"""
+Test module for the torero API inventory cache
+"""
+
+import asyncio
+import pytest
+import json
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.cache import InventoryCache, inventory_cache, invalidate_inventory
+from torero_api.core.torero_executor import get_inventory_snapshot_async, get_services
+from torero_api.models.service import Service
+from tests.conftest import make_process
+
+SERVICES_JSON = json.dumps([
+    {"name": "test-service-1", "type": "ansible-playbook", "tags": ["network"]},
+    {"name": "test-service-2", "type": "python-script", "tags": []}
+])
+
+@pytest.mark.anyio
+async def test_get_or_load_caches_value():
+    """Test that a loaded value is reused until it expires."""
+
+    cache = InventoryCache(default_ttl=60)
+    loader = AsyncMock(return_value=["a", "b"])
+    
+    first = await cache.get_or_load("services", loader)
+    second = await cache.get_or_load("services", loader)
+    
+    assert first == ["a", "b"]
+    assert second == ["a", "b"]
+    loader.assert_awaited_once()
+
+@pytest.mark.anyio
+async def test_get_or_load_expires():
+    """Test that an expired value is reloaded when stale serving is disabled."""
+
+    cache = InventoryCache(default_ttl=10, max_stale=0)
+    loader = AsyncMock(side_effect=[["old"], ["new"]])
+    
+    with patch("torero_api.core.cache.time.monotonic", return_value=100.0):
+        assert await cache.get_or_load("services", loader) == ["old"]
+    with patch("torero_api.core.cache.time.monotonic", return_value=105.0):
+        assert await cache.get_or_load("services", loader) == ["old"]
+    with patch("torero_api.core.cache.time.monotonic", return_value=110.0):
+        assert await cache.get_or_load("services", loader) == ["new"]
+    
+    assert loader.await_count == 2
+
+@pytest.mark.anyio
+async def test_zero_ttl_disables_caching():
+    """Test that a TTL of 0 disables caching for that kind only."""
+
+    cache = InventoryCache(default_ttl=60, ttls={"secrets": 0})
+    loader = AsyncMock(return_value=["value"])
+    
+    await cache.get_or_load("secrets", loader)
+    await cache.get_or_load("secrets", loader)
+    await cache.get_or_load("services", loader)
+    await cache.get_or_load("services", loader)
+    
+    assert loader.await_count == 3
+
+@pytest.mark.anyio
+async def test_failed_load_is_not_cached():
+    """Test that loader errors propagate and are not cached."""
+
+    cache = InventoryCache(default_ttl=60)
+    loader = AsyncMock(side_effect=[RuntimeError("boom"), ["ok"]])
+    
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("services", loader)
+    assert await cache.get_or_load("services", loader) == ["ok"]
+
+def test_invalidate_single_kind():
+    """Test that invalidating one kind leaves the others cached."""
+
+    cache = InventoryCache(default_ttl=60)
+    cache.put("services", ["s"])
+    cache.put("secrets", ["x"])
+    
+    cache.invalidate("services")
+    
+    assert cache.get("services") is None
+    assert cache.get("secrets") == ["x"]
+    
+    cache.invalidate()
+    assert cache.get("secrets") is None
+
+def test_from_env(monkeypatch):
+    """Test reading TTLs from environment variables."""
+
+    monkeypatch.setenv("TORERO_API_CACHE_TTL", "12")
+    monkeypatch.setenv("TORERO_API_CACHE_TTL_SERVICES", "30")
+    monkeypatch.setenv("TORERO_API_CACHE_TTL_SECRETS", "not-a-number")
+    
+    cache = InventoryCache.from_env()
+    
+    assert cache.get_ttl("services") == 30
+    assert cache.get_ttl("decorators") == 12
+    assert cache.get_ttl("secrets") == 12
+
+def test_configure_rejects_unknown_kind():
+    """Test that configuring an unknown kind raises ValueError."""
+
+    cache = InventoryCache()
+    with pytest.raises(ValueError):
+        cache.configure(ttls={"widgets": 10})
+    with pytest.raises(ValueError):
+        cache.configure(default_ttl=-1)
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_services_uses_cache(mock_exec):
+    """Test that repeated get_services calls spawn torero only once."""
+
+    mock_exec.side_effect = lambda *args, **kwargs: make_process(stdout=SERVICES_JSON)
+    
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        first = get_services()
+        second = get_services()
+        
+        assert [s.name for s in first] == ["test-service-1", "test-service-2"]
+        assert [s.name for s in second] == ["test-service-1", "test-service-2"]
+        mock_exec.assert_called_once()
+        
+        # Invalidation forces a reload
+        invalidate_inventory("services")
+        get_services()
+        assert mock_exec.call_count == 2
+
+@pytest.mark.anyio
+async def test_stale_value_served_while_revalidating():
+    """Test that a recently expired value is returned at once and reloaded in the background."""
+
+    cache = InventoryCache(default_ttl=10, max_stale=60)
+    loader = AsyncMock(side_effect=[["old"], ["new"]])
+    
+    with patch("torero_api.core.cache.time.monotonic", return_value=100.0):
+        await cache.get_or_load("services", loader)
+    with patch("torero_api.core.cache.time.monotonic", return_value=115.0):
+        assert await cache.get_or_load("services", loader) == ["old"]
+        assert len(cache._refresh_tasks) == 1
+        
+        # Let the background reload run
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        
+        assert loader.await_count == 2
+        assert not cache._refresh_tasks
+        assert await cache.get_or_load("services", loader) == ["new"]
+
+@pytest.mark.anyio
+async def test_failed_reload_serves_last_good_value():
+    """Test that a failed reload falls back to the previous value and records the error."""
+
+    cache = InventoryCache(default_ttl=10, max_stale=0)
+    loader = AsyncMock(side_effect=[["old"], RuntimeError("torero hung"), ["new"]])
+    
+    with patch("torero_api.core.cache.time.monotonic", return_value=100.0):
+        await cache.get_or_load("services", loader)
+    with patch("torero_api.core.cache.time.monotonic", return_value=200.0):
+        assert await cache.get_or_load("services", loader) == ["old"]
+        
+        status = cache.status()["services"]
+        assert status["stale"] is True
+        assert status["last_error"] == "torero hung"
+        
+        # A successful reload clears the error
+        assert await cache.refresh("services", loader) == ["new"]
+        assert cache.status()["services"]["last_error"] is None
+
+def test_age_and_idle_time():
+    """Test entry age and time since the last read."""
+
+    cache = InventoryCache(default_ttl=10)
+    assert cache.age("services") is None
+    assert cache.idle_time("services") is None
+    
+    with patch("torero_api.core.cache.time.monotonic", return_value=100.0):
+        cache.put("services", ["s"])
+    with patch("torero_api.core.cache.time.monotonic", return_value=104.0):
+        assert cache.age("services") == 4.0
+
+@pytest.mark.anyio
+async def test_invalidate_during_load_is_not_overwritten():
+    """Test that a load that started before an invalidation does not store its value."""
+
+    cache = InventoryCache(default_ttl=10)
+    cache.set_watched(True)
+    release = asyncio.Event()
+    results = [["old"], ["new"]]
+
+    async def slow_loader():
+        value = results.pop(0)
+        if value == ["old"]:
+            await release.wait()
+        return value
+
+    # Call the function
+    in_flight = asyncio.ensure_future(cache.get_or_load("services", slow_loader))
+    await asyncio.sleep(0)
+    cache.invalidate("services")
+    release.set()
+
+    # Assertions
+    assert await in_flight == ["old"]
+    assert cache.peek("services") is None
+    assert await cache.get_or_load("services", slow_loader) == ["new"]
+    assert await cache.get_or_load("services", slow_loader) == ["new"]
+
+@pytest.mark.anyio
+async def test_load_after_invalidate_does_not_join_older_flight():
+    """Test that a snapshot load started after an invalidation runs torero again instead of joining."""
+
+    release = asyncio.Event()
+    fetched = []
+
+    async def fetch():
+        fetched.append(len(fetched))
+        if len(fetched) == 1:
+            await release.wait()
+            return [Service(name="old", type="ansible-playbook", tags=[])]
+        return [Service(name="new", type="ansible-playbook", tags=[])]
+
+    # Set up the mock
+    with patch.dict("torero_api.core.torero_executor._INVENTORY_FETCHERS", {"services": fetch}):
+        # Call the function
+        first = asyncio.ensure_future(get_inventory_snapshot_async("services"))
+        await asyncio.sleep(0)
+        invalidate_inventory("services")
+        second = asyncio.ensure_future(get_inventory_snapshot_async("services"))
+        await asyncio.sleep(0)
+        release.set()
+        old, new = await asyncio.gather(first, second)
+
+        # Assertions
+        assert len(fetched) == 2
+        assert old.get("old") is not None and new.get("new") is not None
+        assert (await get_inventory_snapshot_async("services")).get("new") is not None
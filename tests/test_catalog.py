@@ -0,0 +1,82 @@
+"""
+Test module for the compact service catalog
+"""
+
+import json
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.cache import inventory_cache
+from torero_api.core.catalog import ServiceCatalog, ServiceEntry, TagTable
+from torero_api.core.torero_executor import get_services
+from torero_api.models.service import Service
+from tests.conftest import make_process
+
+def make_service(name, type="ansible-playbook", tags=("network", "backup")):
+    return Service(name=name, description=f"{name} service", type=type, tags=list(tags),
+                   registries={"file": {"path": f"/etc/torero/services/{name}"}})
+
+def test_tag_table():
+    """Test that tags get stable IDs in order of first use."""
+
+    table = TagTable()
+
+    assert table.id_for("network") == 0
+    assert table.id_for("backup") == 1
+    assert table.id_for("network") == 0
+    assert table.get("backup") == 1
+    assert table.get("missing") is None
+    assert table.names == ["network", "backup"]
+
+def test_entries_share_strings_and_tag_sets():
+    """Test that entries share type strings, the tag table and identical tag combinations."""
+
+    catalog = ServiceCatalog()
+
+    first = catalog.add(make_service("a", type="".join(["python-", "script"])))
+    second = catalog.add(make_service("b", type="".join(["python-", "script"])))
+    other = catalog.add(make_service("c", tags=["cloud"]))
+
+    assert first.type is second.type
+    assert first.tag_ids is second.tag_ids
+    assert first.tags == ["network", "backup"]
+    assert other.tag_ids == (2,)
+    assert len(catalog.tags) == 3
+
+def test_entry_round_trip():
+    """Test that an entry converts back to an equal model."""
+
+    service = make_service("svc")
+    entry = ServiceCatalog().add(service)
+
+    assert isinstance(entry, ServiceEntry)
+    assert entry.to_model() == service
+    assert entry.has_tag("backup")
+    assert not entry.has_tag("cloud")
+    assert not hasattr(entry, "__dict__")
+
+def test_entry_without_tags():
+    """Test that services without tags get an empty tag tuple."""
+
+    entry = ServiceCatalog().add(Service(name="svc", type="python-script", tags=None))
+
+    assert entry.tag_ids == ()
+    assert entry.tags == []
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_services_returns_catalog_entries(mock_exec):
+    """Test that the executor caches services as catalog entries of one catalog and returns models."""
+
+    # Set up the mock
+    services = [make_service(f"svc-{i}").model_dump() for i in range(3)]
+    mock_exec.return_value = make_process(stdout=json.dumps(services))
+
+    # Call the function
+    result = get_services()
+    cached = inventory_cache.peek("services")
+
+    # Assertions
+    assert all(isinstance(entry, ServiceEntry) for entry in cached)
+    assert len({id(entry._table) for entry in cached}) == 1
+    assert [service.model_dump() for service in result] == services
+    result.append(make_service("svc-new"))
+    assert len(cached) == 3
@@ -0,0 +1,128 @@
+"""
+Test module for ETags and conditional requests
+"""
+
+import json
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.cache import inventory_cache
+from torero_api.core.conditional import etag_matches, kind_for_path, make_etag
+from torero_api.core.torero_executor import refresh_inventory
+from torero_api.models.service import Service
+from torero_api.server import app
+from tests.conftest import make_process
+
+TEST_SERVICES = [
+    Service(name="svc-1", type="ansible-playbook", tags=["network"]),
+    Service(name="svc-2", type="python-script", tags=["backup"])
+]
+
+def test_kind_for_path():
+    """Test mapping request paths to the inventory they read."""
+
+    assert kind_for_path("/v1/services/") == "services"
+    assert kind_for_path("/v1/services/svc/describe") == "services"
+    assert kind_for_path("/v1/registries") == "registries"
+    assert kind_for_path("/v1/execute/python-script/svc") is None
+    assert kind_for_path("/health") is None
+
+def test_etag_matches():
+    """Test If-None-Match comparison."""
+
+    etag = make_etag("digest", "/v1/services/")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert make_etag("digest", "/v1/services/", "limit=5") != etag
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_conditional_get(mock_fetch):
+    """Test that a matching If-None-Match is answered with 304 without running the endpoint."""
+
+    # Set up the mock
+    mock_fetch.return_value = TEST_SERVICES
+    client = TestClient(app)
+
+    with patch.object(inventory_cache, "get_ttl", return_value=60), \
+         patch("torero_api.api.v1.endpoints.services.select_items") as mock_select:
+        mock_select.side_effect = lambda items, **kwargs: list(items)
+
+        # Call the API
+        first = client.get("/v1/services/")
+        second = client.get("/v1/services/", headers={"If-None-Match": first.headers["ETag"]})
+        other_query = client.get("/v1/services/?tag=network", headers={"If-None-Match": first.headers["ETag"]})
+
+    # Assertions
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert other_query.status_code == 200
+    assert mock_select.call_count == 2
+    mock_fetch.assert_awaited_once()
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_head_request(mock_fetch):
+    """Test that HEAD returns the GET headers without a body."""
+
+    # Set up the mock
+    mock_fetch.return_value = TEST_SERVICES
+    client = TestClient(app)
+
+    # Call the API
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        get = client.get("/v1/services/types")
+        head = client.head("/v1/services/types")
+
+    # Assertions
+    assert head.status_code == 200
+    assert head.content == b""
+    assert head.headers["ETag"] == get.headers["ETag"]
+    assert head.headers["Content-Length"] == get.headers["Content-Length"]
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_if_none_match_any_requires_existing_item(mock_fetch):
+    """Test that If-None-Match: * only gives 304 for items that exist."""
+
+    # Set up the mock
+    mock_fetch.return_value = TEST_SERVICES
+    client = TestClient(app)
+    any_etag = {"If-None-Match": "*"}
+
+    # Call the API
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        missing = client.get("/v1/services/does-not-exist", headers=any_etag)
+        existing = client.get("/v1/services/svc-1", headers=any_etag)
+        head = client.head("/v1/services/does-not-exist", headers=any_etag)
+
+    # Assertions
+    assert missing.status_code == 404
+    assert existing.status_code == 304
+    assert existing.content == b""
+    assert existing.headers["ETag"]
+    assert head.status_code == 404
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_etag_follows_content(mock_exec):
+    """Test that the ETag survives refreshes with identical output and changes with the content."""
+
+    services = [service.model_dump() for service in TEST_SERVICES]
+    client = TestClient(app)
+
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        mock_exec.return_value = make_process(stdout=json.dumps(services))
+        first = client.get("/v1/services/").headers["ETag"]
+
+        mock_exec.return_value = make_process(stdout=json.dumps(services))
+        refresh_inventory("services")
+        unchanged = client.get("/v1/services/").headers["ETag"]
+
+        mock_exec.return_value = make_process(stdout=json.dumps(services[:1]))
+        refresh_inventory("services")
+        changed = client.get("/v1/services/").headers["ETag"]
+
+    assert unchanged == first
+    assert changed != first
@@ -6,8 +6,8 @@ the torero_executor.py module which interfaces with the torero CLI.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import subprocess
+from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
 import json
 from datetime import datetime
 
@@ -22,12 +22,14 @@ from torero_api.core.torero_executor import (
     get_repositories,
     get_repository_by_name,
     get_secrets,
-    get_secret_by_name
+    get_secret_by_name,
+    run_ansible_playbook_service
 )
 from torero_api.models.service import Service
 from torero_api.models.decorator import Decorator
 from torero_api.models.repository import Repository
 from torero_api.models.secret import Secret
+from tests.conftest import make_process
 
 # Sample test data
 SAMPLE_SERVICES = [
@@ -48,16 +50,13 @@ SAMPLE_SERVICES = [
 ]
 
 @patch("shutil.which")
-@patch("subprocess.run")
-def test_check_torero_available_success(mock_run, mock_which):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_check_torero_available_success(mock_exec, mock_which):
     """Test check_torero_available when torero is available."""
 
     # Set up the mocks
     mock_which.return_value = "/usr/bin/torero"  # torero found in PATH
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = "torero version 1.3.0"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(stdout="torero version 1.3.0")
     
     # Call the function
     available, message = check_torero_available()
@@ -66,25 +65,20 @@ def test_check_torero_available_success(mock_run, mock_which):
     assert available is True
     assert message == "torero is available"
     mock_which.assert_called_once_with("torero")
-    mock_run.assert_called_once_with(
-        ["torero", "version"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=5
+    mock_exec.assert_called_once_with(
+        "torero", "version",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
 @patch("shutil.which")
-@patch("subprocess.run")
-def test_check_torero_available_failure(mock_run, mock_which):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_check_torero_available_failure(mock_exec, mock_which):
     """Test check_torero_available when torero is not available."""
 
     # Set up the mocks
     mock_which.return_value = "/usr/bin/torero"  # torero found in PATH
-    process_mock = MagicMock()
-    process_mock.returncode = 1
-    process_mock.stderr = "command not found: torero"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(returncode=1, stderr="command not found: torero")
     
     # Call the function
     available, message = check_torero_available()
@@ -93,16 +87,18 @@ def test_check_torero_available_failure(mock_run, mock_which):
     assert available is False
     assert "torero command failed" in message
     mock_which.assert_called_once_with("torero")
-    mock_run.assert_called_once()
+    mock_exec.assert_called_once()
 
 @patch("shutil.which")
-@patch("subprocess.run")
-def test_check_torero_available_timeout(mock_run, mock_which):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_check_torero_available_timeout(mock_exec, mock_which):
     """Test check_torero_available when torero command times out."""
 
     # Set up the mocks
     mock_which.return_value = "/usr/bin/torero"  # torero found in PATH
-    mock_run.side_effect = subprocess.TimeoutExpired(cmd="torero version", timeout=5)
+    process_mock = make_process()
+    process_mock.communicate.side_effect = asyncio.TimeoutError
+    mock_exec.return_value = process_mock
     
     # Call the function
     available, message = check_torero_available()
@@ -111,7 +107,7 @@ def test_check_torero_available_timeout(mock_run, mock_which):
     assert available is False
     assert message == "torero command timed out"
     mock_which.assert_called_once_with("torero")
-    mock_run.assert_called_once()
+    mock_exec.assert_called_once()
 
 @patch("shutil.which")
 def test_check_torero_available_not_in_path(mock_which):
@@ -128,48 +124,40 @@ def test_check_torero_available_not_in_path(mock_which):
     assert message == "torero executable not found in PATH"
     mock_which.assert_called_once_with("torero")
 
-@patch("subprocess.run")
-def test_check_torero_version(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_check_torero_version(mock_exec):
     """Test check_torero_version function."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = "torero version 1.3.0\nSome other info\n"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(stdout="torero version 1.3.0\nSome other info\n")
     
     # Call the function
     version = check_torero_version()
     
     # Assertions
     assert version == "1.3.0"
-    mock_run.assert_called_once()
+    mock_exec.assert_called_once()
 
-@patch("subprocess.run")
-def test_check_torero_version_error(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_check_torero_version_error(mock_exec):
     """Test check_torero_version when an error occurs."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 1
-    process_mock.stderr = "Error: torero command not found"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(returncode=1, stderr="Error: torero command not found")
     
     # Call the function
     version = check_torero_version()
     
     # Assertions
     assert version == "unknown"
-    mock_run.assert_called_once()
+    mock_exec.assert_called_once()
 
-@patch("subprocess.run")
-def test_get_services(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_services(mock_exec):
     """Test get_services function."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = json.dumps([
+    mock_exec.return_value = make_process(stdout=json.dumps([
         {
             "name": "test-service-1",
             "description": "Test service 1",
@@ -184,8 +172,7 @@ def test_get_services(mock_run):
             "tags": ["test", "opentofu", "cloud"],
             "registries": {"file": {"path": "/etc/torero/services/test-service-2"}}
         }
-    ])
-    mock_run.return_value = process_mock
+    ]))
     
     # Call the function
     services = get_services()
@@ -198,23 +185,20 @@ def test_get_services(mock_run):
     assert services[1].name == "test-service-2"
     assert services[1].type == "opentofu-plan"
     assert "cloud" in services[1].tags
-    mock_run.assert_called_once_with(
-        ["torero", "get", "services", "--raw"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=30
+    assert isinstance(services, list)
+    assert services[0].model_dump()["name"] == "test-service-1"
+    mock_exec.assert_called_once_with(
+        "torero", "get", "services", "--raw",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
-@patch("subprocess.run")
-def test_get_services_error(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_services_error(mock_exec):
     """Test get_services function when an error occurs."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 1
-    process_mock.stderr = "Error: torero command failed"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(returncode=1, stderr="Error: torero command failed")
     
     # Call the function and expect an exception
     with pytest.raises(RuntimeError) as excinfo:
@@ -222,17 +206,14 @@ def test_get_services_error(mock_run):
     
     # Assertions
     assert "torero error" in str(excinfo.value)
-    mock_run.assert_called_once()
+    mock_exec.assert_called_once()
 
-@patch("subprocess.run")
-def test_get_services_invalid_json(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_services_invalid_json(mock_exec):
     """Test get_services function with invalid JSON response."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = "Not a valid JSON"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(stdout="Not a valid JSON")
     
     # Call the function and expect an exception
     with pytest.raises(RuntimeError) as excinfo:
@@ -240,9 +221,9 @@ def test_get_services_invalid_json(mock_run):
     
     # Assertions
     assert "Invalid JSON" in str(excinfo.value)
-    mock_run.assert_called_once()
+    mock_exec.assert_called_once()
 
-@patch("torero_api.core.torero_executor.get_services")
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
 def test_get_service_by_name_found(mock_get_services):
     """Test get_service_by_name when service is found."""
 
@@ -256,9 +237,10 @@ def test_get_service_by_name_found(mock_get_services):
     assert service is not None
     assert service.name == "test-service-1"
     assert service.type == "ansible-playbook"
+    assert service.model_dump()["name"] == "test-service-1"
     mock_get_services.assert_called_once()
 
-@patch("torero_api.core.torero_executor.get_services")
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
 def test_get_service_by_name_not_found(mock_get_services):
     """Test get_service_by_name when service is not found."""
 
@@ -272,14 +254,12 @@ def test_get_service_by_name_not_found(mock_get_services):
     assert service is None
     mock_get_services.assert_called_once()
 
-@patch("subprocess.run")
-def test_describe_service(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_describe_service(mock_exec):
     """Test describe_service function."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = json.dumps([{
+    mock_exec.return_value = make_process(stdout=json.dumps([{
         "metadata": {
             "name": "test-service-1",
             "description": "Test service 1",
@@ -296,8 +276,7 @@ def test_describe_service(mock_run):
             }
         },
         "type": "ansible-playbook"
-    }])
-    mock_run.return_value = process_mock
+    }]))
     
     # Call the function
     description = describe_service("test-service-1")
@@ -307,22 +286,18 @@ def test_describe_service(mock_run):
     assert description[0]["metadata"]["name"] == "test-service-1"
     assert description[0]["type"] == "ansible-playbook"
     assert "entity" in description[0]
-    mock_run.assert_called_once_with(
-        ["torero", "describe", "service", "test-service-1", "--raw"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=30
+    mock_exec.assert_called_once_with(
+        "torero", "describe", "service", "test-service-1", "--raw",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
-@patch("subprocess.run")
-def test_get_decorators(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_decorators(mock_exec):
     """Test get_decorators function."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = json.dumps([
+    mock_exec.return_value = make_process(stdout=json.dumps([
         {
             "name": "test-decorator-1",
             "description": "Test decorator 1",
@@ -343,8 +318,7 @@ def test_get_decorators(mock_run):
             },
             "registries": {"file": {"path": "/etc/torero/decorators/test-decorator-2"}}
         }
-    ])
-    mock_run.return_value = process_mock
+    ]))
     
     # Call the function
     decorators = get_decorators()
@@ -357,15 +331,13 @@ def test_get_decorators(mock_run):
     assert decorators[1].name == "test-decorator-2"
     assert decorators[1].type == "logging"
     assert "level" in decorators[1].parameters
-    mock_run.assert_called_once_with(
-        ["torero", "get", "decorators", "--raw"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=30
+    mock_exec.assert_called_once_with(
+        "torero", "get", "decorators", "--raw",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
-@patch("torero_api.core.torero_executor.get_decorators")
+@patch("torero_api.core.torero_executor._fetch_decorators_async", new_callable=AsyncMock)
 def test_get_decorator_by_name_found(mock_get_decorators):
     """Test get_decorator_by_name when decorator is found."""
 
@@ -405,7 +377,7 @@ def test_get_decorator_by_name_found(mock_get_decorators):
     assert decorator.type == "authentication"
     mock_get_decorators.assert_called_once()
 
-@patch("torero_api.core.torero_executor.get_decorators")
+@patch("torero_api.core.torero_executor._fetch_decorators_async", new_callable=AsyncMock)
 def test_get_decorator_by_name_not_found(mock_get_decorators):
     """Test get_decorator_by_name when decorator is not found."""
 
@@ -443,14 +415,12 @@ def test_get_decorator_by_name_not_found(mock_get_decorators):
     assert decorator is None
     mock_get_decorators.assert_called_once()
 
-@patch("subprocess.run")
-def test_get_repositories(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_repositories(mock_exec):
     """Test get_repositories function."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = json.dumps([
+    mock_exec.return_value = make_process(stdout=json.dumps([
         {
             "name": "test-repository-1",
             "description": "Test repository 1",
@@ -465,8 +435,7 @@ def test_get_repositories(mock_run):
             "location": "https://github.com/torerodev/torero-services.git",
             "metadata": {"created": "2023-01-02T00:00:00Z", "owner": "torero"}
         }
-    ])
-    mock_run.return_value = process_mock
+    ]))
     
     # Call the function
     repositories = get_repositories()
@@ -479,15 +448,13 @@ def test_get_repositories(mock_run):
     assert repositories[1].name == "test-repository-2"
     assert repositories[1].type == "git"
     assert repositories[1].location == "https://github.com/torerodev/torero-services.git"
-    mock_run.assert_called_once_with(
-        ["torero", "get", "repositories", "--raw"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=30
+    mock_exec.assert_called_once_with(
+        "torero", "get", "repositories", "--raw",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
-@patch("torero_api.core.torero_executor.get_repositories")
+@patch("torero_api.core.torero_executor._fetch_repositories_async", new_callable=AsyncMock)
 def test_get_repository_by_name_found(mock_get_repositories):
     """Test get_repository_by_name when repository is found."""
 
@@ -521,7 +488,7 @@ def test_get_repository_by_name_found(mock_get_repositories):
     assert repository.type == "file"
     mock_get_repositories.assert_called_once()
 
-@patch("torero_api.core.torero_executor.get_repositories")
+@patch("torero_api.core.torero_executor._fetch_repositories_async", new_callable=AsyncMock)
 def test_get_repository_by_name_not_found(mock_get_repositories):
     """Test get_repository_by_name when repository is not found."""
 
@@ -553,14 +520,12 @@ def test_get_repository_by_name_not_found(mock_get_repositories):
     assert repository is None
     mock_get_repositories.assert_called_once()
 
-@patch("subprocess.run")
-def test_get_secrets(mock_run):
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_secrets(mock_exec):
     """Test get_secrets function."""
 
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = json.dumps([
+    mock_exec.return_value = make_process(stdout=json.dumps([
         {
             "name": "test-secret-1",
             "description": "Test secret 1",
@@ -575,8 +540,7 @@ def test_get_secrets(mock_run):
             "created_at": "2023-01-02T00:00:00Z",
             "metadata": {"owner": "admin", "provider": "vault"}
         }
-    ])
-    mock_run.return_value = process_mock
+    ]))
     
     # Call the function
     secrets = get_secrets()
@@ -589,15 +553,13 @@ def test_get_secrets(mock_run):
     assert secrets[1].name == "test-secret-2"
     assert secrets[1].type == "api-key"
     assert secrets[1].created_at.isoformat() == "2023-01-02T00:00:00+00:00"
-    mock_run.assert_called_once_with(
-        ["torero", "get", "secrets", "--raw"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=30
+    mock_exec.assert_called_once_with(
+        "torero", "get", "secrets", "--raw",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
-@patch("torero_api.core.torero_executor.get_secrets")
+@patch("torero_api.core.torero_executor._fetch_secrets_async", new_callable=AsyncMock)
 def test_get_secret_by_name_found(mock_get_secrets):
     """Test get_secret_by_name when secret is found."""
 
@@ -631,7 +593,7 @@ def test_get_secret_by_name_found(mock_get_secrets):
     assert secret.type == "password"
     mock_get_secrets.assert_called_once()
 
-@patch("torero_api.core.torero_executor.get_secrets")
+@patch("torero_api.core.torero_executor._fetch_secrets_async", new_callable=AsyncMock)
 def test_get_secret_by_name_not_found(mock_get_secrets):
     """Test get_secret_by_name when secret is not found."""
 
@@ -661,4 +623,22 @@ def test_get_secret_by_name_not_found(mock_get_secrets):
     
     # Assertions
     assert secret is None
-    mock_get_secrets.assert_called_once()
\ No newline at end of file
+    mock_get_secrets.assert_called_once()
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_run_ansible_playbook_service_timeout(mock_exec):
+    """Test that a timed out service execution kills the torero process."""
+
+    # Set up the mock
+    process_mock = make_process()
+    process_mock.communicate.side_effect = asyncio.TimeoutError
+    process_mock.stdout.read.side_effect = asyncio.TimeoutError
+    mock_exec.return_value = process_mock
+    
+    # Call the function and expect an exception
+    with pytest.raises(RuntimeError) as excinfo:
+        run_ansible_playbook_service("test-service-1")
+    
+    # Assertions
+    assert "timed out" in str(excinfo.value)
+    process_mock.kill.assert_called_once()
+    process_mock.wait.assert_awaited_once()
@@ -3,7 +3,7 @@ Test module for torero API decorators endpoints
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 
 from torero_api.server import app
@@ -46,7 +46,7 @@ TEST_DECORATORS = [
 ]
 
 # Direct patching for decorator endpoints
-@patch("torero_api.api.v1.endpoints.decorators.get_decorators")
+@patch("torero_api.api.v1.endpoints.decorators.get_decorators_async", new_callable=AsyncMock)
 def test_list_decorators(mock_get_decorators):
     """Test listing all decorators with direct endpoint mocking."""
 
@@ -64,7 +64,7 @@ def test_list_decorators(mock_get_decorators):
     assert data[1]["name"] == "test-decorator-2"
     assert data[2]["name"] == "test-decorator-3"
 
-@patch("torero_api.api.v1.endpoints.decorators.get_decorators")
+@patch("torero_api.api.v1.endpoints.decorators.get_decorators_async", new_callable=AsyncMock)
 def test_list_decorators_filter_by_type(mock_get_decorators):
     """Test filtering decorators by type with direct endpoint mocking."""
 
@@ -81,7 +81,7 @@ def test_list_decorators_filter_by_type(mock_get_decorators):
     assert data[0]["name"] == "test-decorator-1"
     assert data[0]["type"] == "authentication"
 
-@patch("torero_api.api.v1.endpoints.decorators.get_decorators")
+@patch("torero_api.api.v1.endpoints.decorators.get_decorators_async", new_callable=AsyncMock)
 def test_list_decorator_types(mock_get_decorators):
     """Test listing decorator types with direct endpoint mocking."""
 
@@ -99,7 +99,7 @@ def test_list_decorator_types(mock_get_decorators):
     assert "logging" in data
     assert "validation" in data
 
-@patch("torero_api.api.v1.endpoints.decorators.get_decorator_by_name")
+@patch("torero_api.api.v1.endpoints.decorators.get_decorator_by_name_async", new_callable=AsyncMock)
 def test_get_decorator_by_name_found(mock_get_decorator_by_name):
     """Test getting a specific decorator by name with direct endpoint mocking."""
 
@@ -116,7 +116,7 @@ def test_get_decorator_by_name_found(mock_get_decorator_by_name):
     assert data["type"] == "logging"
     assert "level" in data["parameters"]
 
-@patch("torero_api.api.v1.endpoints.decorators.get_decorator_by_name")
+@patch("torero_api.api.v1.endpoints.decorators.get_decorator_by_name_async", new_callable=AsyncMock)
 def test_get_decorator_by_name_not_found(mock_get_decorator_by_name):
     """Test getting a non-existent decorator with direct endpoint mocking."""
 
@@ -131,7 +131,7 @@ def test_get_decorator_by_name_not_found(mock_get_decorator_by_name):
     data = response.json()
     assert "not found" in data["detail"]
 
-@patch("torero_api.api.v1.endpoints.decorators.get_decorators")
+@patch("torero_api.api.v1.endpoints.decorators.get_decorators_async", new_callable=AsyncMock)
 def test_exception_handling(mock_get_decorators):
     """Test error handling with direct endpoint mocking."""
 
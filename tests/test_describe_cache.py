@@ -0,0 +1,140 @@
+"""
+Test module for the torero API describe cache
+"""
+
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.cache import invalidate_inventory
+from torero_api.core.describe_cache import DescribeCache, describe_cache
+from torero_api.core.torero_executor import describe_service, get_services
+from torero_api.server import app
+from tests.conftest import make_process
+
+SERVICES_JSON = json.dumps([{"name": "svc", "type": "ansible-playbook", "tags": []}])
+DESCRIPTION_JSON = json.dumps([{"metadata": {"name": "svc"}, "type": "ansible-playbook"}])
+
+def test_hit_requires_same_parent_digest():
+    """Test that a result only hits while its parent inventory is unchanged."""
+
+    cache = DescribeCache()
+    cache.put("services", "svc", "digest-1", {"name": "svc"})
+
+    assert cache.get("services", "svc", "digest-1") == (True, {"name": "svc"})
+    assert cache.get("services", "svc", "digest-2") == (False, None)
+    assert cache.get("services", "svc", "digest-1") == (False, None)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+    assert stats["entries"] == 0 and stats["bytes"] == 0
+
+def test_no_parent_snapshot_is_not_cached():
+    """Test that results without a parent inventory are neither cached nor served."""
+
+    cache = DescribeCache()
+    cache.put("services", "svc", None, {"name": "svc"})
+
+    assert cache.get("services", "svc", None) == (False, None)
+    assert cache.stats()["entries"] == 0
+
+def test_evicts_least_recently_used_by_count():
+    """Test that the entry bound evicts the least recently used result."""
+
+    cache = DescribeCache(max_entries=2)
+    cache.put("services", "a", "d", [1])
+    cache.put("services", "b", "d", [2])
+    cache.get("services", "a", "d")
+    cache.put("services", "c", "d", [3])
+
+    assert cache.get("services", "b", "d") == (False, None)
+    assert cache.get("services", "a", "d") == (True, [1])
+    assert cache.get("services", "c", "d") == (True, [3])
+    assert cache.stats()["evictions"] == 1
+
+def test_evicts_by_size():
+    """Test that the size bound evicts results and oversized results are skipped."""
+
+    value = {"data": "x" * 100}
+    size = len(json.dumps(value))
+    cache = DescribeCache(max_bytes=2 * size)
+
+    cache.put("services", "a", "d", value)
+    cache.put("services", "b", "d", value)
+    cache.put("services", "c", "d", value)
+    cache.put("services", "huge", "d", {"data": "x" * 1000})
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 2 * size
+    assert cache.get("services", "a", "d") == (False, None)
+    assert cache.get("services", "huge", "d") == (False, None)
+
+def test_invalidate_kind_and_configure():
+    """Test invalidating one kind and shrinking the bounds at runtime."""
+
+    cache = DescribeCache()
+    cache.put("services", "a", "d", [1])
+    cache.put("secrets", "b", "d", [2])
+
+    cache.invalidate("services")
+    assert cache.stats()["entries"] == 1
+
+    cache.configure(max_entries=0)
+    assert not cache.enabled
+    assert cache.stats()["entries"] == 0
+
+    with pytest.raises(ValueError):
+        cache.configure(max_bytes=-1)
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_describe_is_cached_with_parent_inventory(mock_exec):
+    """Test that describe runs torero once while the services inventory is cached."""
+
+    # Set up the mock
+    mock_exec.side_effect = lambda *args, **kwargs: make_process(
+        stdout=SERVICES_JSON if args[1] == "get" else DESCRIPTION_JSON
+    )
+
+    # Call the functions
+    with patch("torero_api.core.cache.inventory_cache.get_ttl", return_value=60):
+        get_services()
+        first = describe_service("svc")
+        second = describe_service("svc")
+
+        invalidate_inventory("services")
+        get_services()
+        describe_service("svc")
+
+    # Assertions
+    assert first == second == json.loads(DESCRIPTION_JSON)
+    describe_calls = [c for c in mock_exec.call_args_list if c.args[1] == "describe"]
+    assert len(describe_calls) == 2
+    assert describe_cache.stats()["hits"] >= 1
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_describe_without_inventory_is_not_cached(mock_exec):
+    """Test that describe always runs torero when no inventory is cached."""
+
+    # Set up the mock
+    mock_exec.side_effect = lambda *args, **kwargs: make_process(stdout=DESCRIPTION_JSON)
+
+    # Call the function
+    describe_service("svc")
+    describe_service("svc")
+
+    # Assertions
+    assert mock_exec.call_count == 2
+
+def test_cache_endpoint_reports_stats():
+    """Test that /cache reports the inventory and describe caches."""
+
+    client = TestClient(app)
+
+    response = client.get("/cache")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["inventory"]) == {"services", "decorators", "repositories", "secrets", "registries"}
+    assert {"entries", "bytes", "hits", "misses", "evictions"} <= set(data["describe"])
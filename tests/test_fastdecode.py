@@ -0,0 +1,194 @@
+"""
+Test module for the fast inventory decoder
+"""
+
+import hashlib
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+pytest.importorskip("msgspec")
+
+from torero_api.core.cache import inventory_cache
+from torero_api.core.fastdecode import as_model, as_models, decode_inventory, decoder_name
+from torero_api.core.torero_executor import get_decorators, get_registries, get_repositories, get_secrets, get_services
+from torero_api.models.decorator import Decorator
+from torero_api.models.service import Service
+from torero_api.server import app
+from tests.conftest import make_process
+
+SERVICES = [
+    {"name": "svc-1", "description": "Service 1", "type": "ansible-playbook", "tags": ["network"], "registries": {"file": {"path": "/s1"}}},
+    {"name": "svc-2", "type": "python-script", "tags": None, "unknown": 1}
+]
+
+# One document per kind, with the missing and null fields each mapping falls back on
+INVENTORIES = {
+    "services": (get_services, {"items": SERVICES + [{"name": "svc-3", "type": "opentofu-plan", "description": ""}]}),
+    "decorators": (get_decorators, {"decorators": [
+        {"name": "deco-1", "description": "Decorator 1", "schema": {"type": "object"}, "id": "d1", "created": "2025-01-01", "tags": ["a"]},
+        {"name": "deco-2", "description": "", "type": "custom", "parameters": {"type": "object"}, "tags": None},
+        {"schema": {}, "parameters": {"p": 1}}
+    ]}),
+    "repositories": (get_repositories, {"items": [
+        {"name": "repo-1", "description": "Repo 1", "url": "https://example.com/repo.git", "reference": "main", "tags": ["x"], "private_key_name": "key"},
+        {"name": "repo-2", "type": "file", "location": "/srv/repo", "tags": None, "private_key_name": None},
+        {"url": "https://example.com/repo"},
+        {"name": "repo-4", "url": None, "location": None}
+    ]}),
+    "secrets": (get_secrets, {"items": [
+        {"name": "secret-1", "type": "ssh-key", "description": "Key", "created_at": "2025-01-01T00:00:00Z", "metadata": {"a": 1}},
+        {"name": "secret-2", "type": "token"}
+    ]}),
+    "registries": (get_registries, {"items": [
+        {"name": "reg-1", "description": "Registry 1", "type": "ansible-galaxy", "url": "https://galaxy.example.com", "id": "r1", "created": "2025-01-01", "tags": ["a"], "credentials": "cred"},
+        {"name": "reg-2", "tags": None},
+        {}
+    ]})
+}
+
+@pytest.fixture
+def fast_decoder(monkeypatch):
+    monkeypatch.setenv("TORERO_API_DECODER", "fast")
+
+def test_decode_array_and_wrapped_documents():
+    """Test decoding a top-level array and an object wrapping the items."""
+
+    for document in (SERVICES, {"items": SERVICES, "total": 2}):
+        records = decode_inventory("services", json.dumps(document).encode())
+
+        assert [r.name for r in records] == ["svc-1", "svc-2"]
+        assert records[1].tags == []
+
+def test_records_convert_to_equal_models():
+    """Test that records convert to the same models the stream decoder builds."""
+
+    records = decode_inventory("services", json.dumps(SERVICES))
+
+    assert as_models(records) == [Service(**svc) for svc in SERVICES]
+
+def test_decorator_fields_are_mapped():
+    """Test that the CLI's decorator fields are mapped like the stream decoder does."""
+
+    document = {"decorators": [{"name": "deco", "description": "", "schema": {"type": "object"}, "id": "d1", "tags": ["a"]}]}
+
+    record = decode_inventory("decorators", json.dumps(document))[0]
+
+    assert record.parameters == {"type": "object"}
+    assert record.description is None
+    assert as_model(record) == Decorator(
+        name="deco",
+        type="decorator",
+        parameters={"type": "object"},
+        registries={"metadata": {"id": "d1", "created": None, "tags": ["a"]}}
+    )
+
+@pytest.mark.parametrize("document, message", [
+    ("[{", "truncated"),
+    ('[{"name": "svc"}]', "missing required field"),
+    ('{"name": "svc"}', "Unexpected JSON structure")
+])
+def test_invalid_documents(document, message):
+    """Test that invalid documents raise ValueError."""
+
+    with pytest.raises(ValueError) as excinfo:
+        decode_inventory("services", document)
+
+    assert message in str(excinfo.value)
+
+def test_decoder_name(monkeypatch):
+    """Test selecting the decoder through TORERO_API_DECODER."""
+
+    monkeypatch.delenv("TORERO_API_DECODER", raising=False)
+    assert decoder_name() == "stream"
+
+    monkeypatch.setenv("TORERO_API_DECODER", "fast")
+    assert decoder_name() == "fast"
+
+    with patch("torero_api.core.fastdecode.msgspec", None):
+        assert decoder_name() == "stream"
+
+@pytest.mark.parametrize("kind", list(INVENTORIES))
+def test_decoders_build_equal_models(kind, monkeypatch):
+    """Test that the stream and fast decoders map the same document to the same models."""
+
+    get_inventory, document = INVENTORIES[kind]
+    models = {}
+    for decoder in ("stream", "fast"):
+        # Set up the mock
+        monkeypatch.setenv("TORERO_API_DECODER", decoder)
+        inventory_cache.invalidate()
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=make_process(stdout=json.dumps(document)))):
+            # Call the function
+            models[decoder] = get_inventory()
+
+    # Assertions
+    assert len(models["stream"]) == len(next(iter(document.values())))
+    assert models["fast"] == models["stream"]
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_executor_returns_records(mock_exec, fast_decoder):
+    """Test that inventories are decoded into records with the fast decoder."""
+
+    # Set up the mock
+    mock_exec.return_value = make_process(stdout=json.dumps(SERVICES))
+
+    # Call the function
+    services = get_services()
+    cached = inventory_cache.peek("services")
+
+    # Assertions
+    assert not isinstance(cached[0], Service)
+    assert cached[0].type == "ansible-playbook"
+    assert isinstance(services[0], Service)
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_executor_decodes_and_hashes_raw_output(mock_exec, fast_decoder):
+    """Test that the fast decoder reads torero's undecoded output and fingerprints it like the stream decoder."""
+
+    # Set up the mock
+    raw = json.dumps(SERVICES).encode()
+    mock_exec.return_value = make_process(stdout=raw.decode())
+
+    # Call the function
+    with patch("torero_api.core.torero_executor.decode_inventory", wraps=decode_inventory) as mock_decode:
+        get_services()
+    fast_digest = inventory_cache.peek("services").digest
+    inventory_cache.invalidate()
+    with patch.dict("os.environ", {"TORERO_API_DECODER": "stream"}):
+        get_services()
+
+    # Assertions
+    assert mock_decode.call_args.args == ("services", raw)
+    assert fast_digest == hashlib.blake2b(raw, digest_size=16).hexdigest()
+    assert inventory_cache.peek("services").digest == fast_digest
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_executor_reports_invalid_json(mock_exec, fast_decoder):
+    """Test that undecodable output is reported as invalid JSON."""
+
+    # Set up the mock
+    mock_exec.return_value = make_process(stdout="not json")
+
+    # Call the function
+    with pytest.raises(RuntimeError) as excinfo:
+        get_decorators()
+
+    # Assertions
+    assert "Invalid JSON from torero" in str(excinfo.value)
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_endpoints_return_models(mock_exec, fast_decoder):
+    """Test that endpoints filter records and respond with the models."""
+
+    # Set up the mock
+    mock_exec.return_value = make_process(stdout=json.dumps(SERVICES))
+    client = TestClient(app)
+
+    # Call the API
+    response = client.get("/v1/services/?tag=network")
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.json() == [Service(**SERVICES[0]).model_dump()]
@@ -0,0 +1,131 @@
+"""
+Test module for the torero API health probe
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.health import HealthProbe, health_interval
+from torero_api.core.limiter import ToreroBusyError, process_limiter
+from torero_api.server import app
+from tests.conftest import make_process
+
+@pytest.mark.anyio
+@patch("torero_api.core.torero_executor.check_torero_version_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
+async def test_get_serves_cached_result(mock_available, mock_version):
+    """Test that results are served from memory until a deep check is requested."""
+
+    # Set up the mocks
+    mock_available.return_value = (True, "torero is available")
+    mock_version.return_value = "1.3.1"
+    probe = HealthProbe(interval=30)
+
+    # Call the function
+    first = await probe.get()
+    second = await probe.get()
+    deep = await probe.get(deep=True)
+
+    # Assertions
+    assert first["available"] and first["version"] == "1.3.1"
+    assert second["age"] >= first["age"]
+    assert deep["available"]
+    assert mock_available.await_count == 2
+
+@pytest.mark.anyio
+@patch("torero_api.core.torero_executor.check_torero_version_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
+async def test_concurrent_deep_checks_are_coalesced(mock_available, mock_version):
+    """Test that concurrent live checks share one torero call."""
+
+    async def slow_check():
+        await asyncio.sleep(0.01)
+        return True, "torero is available"
+
+    # Set up the mocks
+    mock_available.side_effect = slow_check
+    mock_version.return_value = "1.3.1"
+    probe = HealthProbe()
+
+    # Call the function
+    results = await asyncio.gather(*(probe.get(deep=True) for _ in range(5)))
+
+    # Assertions
+    assert all(result["available"] for result in results)
+    assert mock_available.await_count == 1
+    assert mock_version.await_count == 1
+
+@pytest.mark.anyio
+@patch("torero_api.core.torero_executor.check_torero_version_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
+async def test_old_results_are_not_served(mock_available, mock_version):
+    """Test that a result older than twice the interval triggers a live check."""
+
+    # Set up the mocks
+    mock_available.return_value = (False, "torero not found")
+    probe = HealthProbe(interval=10)
+
+    # Call the function
+    with patch("torero_api.core.health.time.monotonic", return_value=100.0):
+        result = await probe.get()
+    with patch("torero_api.core.health.time.monotonic", return_value=115.0):
+        assert probe.cached() is not None
+    with patch("torero_api.core.health.time.monotonic", return_value=125.0):
+        assert probe.cached() is None
+        await probe.get()
+
+    # Assertions
+    assert result["version"] is None
+    assert mock_available.await_count == 2
+    mock_version.assert_not_awaited()
+
+def test_health_interval(monkeypatch):
+    """Test reading the check interval from the environment."""
+
+    monkeypatch.setenv("TORERO_API_HEALTH_INTERVAL", "5")
+    assert health_interval() == 5.0
+
+    monkeypatch.setenv("TORERO_API_HEALTH_INTERVAL", "soon")
+    assert health_interval() == 30.0
+
+@patch("torero_api.core.torero_executor.check_torero_version_async", new_callable=AsyncMock)
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
+def test_health_endpoint_deep(mock_available, mock_version):
+    """Test that /health answers from memory and ?deep=true checks torero again."""
+
+    # Set up the mocks
+    mock_available.return_value = (True, "torero is available")
+    mock_version.return_value = "1.3.1"
+    client = TestClient(app)
+
+    # Call the API
+    client.get("/health")
+    response = client.get("/health")
+    assert mock_available.await_count == 1
+
+    response = client.get("/health?deep=true")
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.json()["torero_version"] == "1.3.1"
+    assert mock_available.await_count == 2
+
+@patch("shutil.which", return_value="/usr/bin/torero")
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_health_endpoint_ignores_full_process_limiter(mock_exec, mock_which):
+    """Test that /health still checks torero while every process slot is taken."""
+
+    # Set up the mocks
+    mock_exec.return_value = make_process(stdout="torero version 1.3.1")
+    client = TestClient(app)
+
+    # Call the API
+    with patch.object(process_limiter, "acquire", AsyncMock(side_effect=ToreroBusyError("busy"))) as mock_acquire:
+        response = client.get("/health?deep=true")
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.json()["torero_version"] == "1.3.1"
+    mock_acquire.assert_not_awaited()
@@ -0,0 +1,225 @@
+"""
+Test module for the persistent execution history
+"""
+
+import json
+import sqlite3
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.history import ExecutionHistory, decode_cursor, encode_cursor, execution_history
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.outputs import output_store
+from torero_api.core.torero_executor import run_ansible_playbook_service_async, run_python_script_service_async
+from torero_api.server import app
+from tests.conftest import make_process
+
+def execution_result(return_code):
+    """Build torero's raw result of a service execution."""
+
+    return json.dumps({
+        "return_code": return_code,
+        "stdout": "done",
+        "stderr": "",
+        "start_time": "2025-05-26T22:18:41.905955",
+        "end_time": "2025-05-26T22:18:42.905955",
+        "elapsed_time": 1.0
+    })
+
+@pytest.fixture
+def history():
+    """An in-memory history."""
+
+    history = ExecutionHistory(path=":memory:")
+    yield history
+    history.close()
+
+def test_record_sets_status(history):
+    """Test that the status is derived from the return code or the error."""
+
+    ok = history.record("a", "python-script", {"return_code": 0, "elapsed_time": 1.5})
+    failed = history.record("a", "python-script", {"return_code": 2})
+    error = history.record("a", "python-script", error="timed out")
+
+    # Assertions
+    assert history.get(ok)["status"] == "succeeded"
+    assert history.get(ok)["elapsed_time"] == 1.5
+    assert history.get(failed)["status"] == "failed"
+    assert history.get(error)["status"] == "error"
+    assert history.get(error)["error"] == "timed out"
+    assert history.get(error)["finished_at"].endswith("Z")
+    assert history.get(9999) is None
+
+def test_output_link_is_reported_only_while_the_output_is_kept(history):
+    """Test that records keep the output ID but only link outputs that can still be downloaded."""
+
+    # Set up a kept output
+    output = output_store.create()
+    output.write("stdout", "x" * (2 * 16 * 1024 + 1))
+    result = output_store.finish(output, {"return_code": 0})
+    record_id = history.record("a", "python-script", result)
+
+    # Call the function
+    kept = history.get(record_id)
+    output_store.clear()
+    expired = history.get(record_id)
+
+    # Assertions
+    assert kept["output_id"] == output.id
+    assert kept["output_available"] and kept["output_url"] == result["output_url"]
+    assert expired["output_id"] == output.id
+    assert not expired["output_available"] and expired["output_url"] is None
+
+def test_database_with_output_urls_is_migrated(tmp_path):
+    """Test that records written with an output URL column are read with their output ID."""
+
+    # Set up a database in the old layout
+    path = str(tmp_path / "old.db")
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE executions (id INTEGER PRIMARY KEY AUTOINCREMENT, service TEXT NOT NULL, "
+        "operation TEXT NOT NULL, status TEXT NOT NULL, return_code INTEGER, start_time TEXT, end_time TEXT, "
+        "elapsed_time REAL, finished_at REAL NOT NULL, output_url TEXT, error TEXT);"
+        "INSERT INTO executions (service, operation, status, finished_at, output_url) "
+        "VALUES ('a', 'python-script', 'error', 1000.0, '/v1/outputs/abc123');"
+    )
+    connection.commit()
+    connection.close()
+    history = ExecutionHistory(path=path)
+
+    # Call the function
+    record = history.get(1)
+    history.record("b", "python-script", {"return_code": 0})
+    records, _ = history.query()
+    history.close()
+
+    # Assertions
+    assert record["output_id"] == "abc123"
+    assert not record["output_available"]
+    assert [r["service"] for r in records] == ["b", "a"]
+
+def test_query_filters_and_pages(history):
+    """Test filtering by service, status and time, and walking the pages with the cursor."""
+
+    # Several records share a finish time so paging must also order by ID
+    for i in range(25):
+        history.record(f"svc-{i % 2}", "ansible-playbook", {"return_code": i % 3}, finished_at=1000.0 + i // 2)
+
+    pages, cursor = [], None
+    while True:
+        records, cursor = history.query(limit=4, cursor=cursor)
+        pages.append(records)
+        if cursor is None:
+            break
+
+    # Assertions
+    ids = [record["id"] for page in pages for record in page]
+    assert ids == list(range(25, 0, -1))
+    assert len(pages) == 7
+    services, _ = history.query(service="svc-1", limit=100)
+    assert len(services) == 12 and {r["service"] for r in services} == {"svc-1"}
+    failed, _ = history.query(status="failed", limit=100)
+    assert {r["return_code"] for r in failed} == {1, 2}
+    recent, _ = history.query(since=1010.0, limit=100)
+    assert [r["id"] for r in recent] == [25, 24, 23, 22, 21]
+
+def test_query_uses_indexes(history):
+    """Test that every filter is answered from an index providing the sort order."""
+
+    history.record("a", "python-script", {"return_code": 0})
+    connection = history._connect()
+    for where in ("", "WHERE service = 'a'", "WHERE status = 'failed'"):
+        plan = " ".join(
+            str(row[-1]) for row in connection.execute(
+                f"EXPLAIN QUERY PLAN SELECT id FROM executions {where} ORDER BY finished_at DESC, id DESC LIMIT 5"
+            )
+        )
+
+        # Assertions
+        assert "USING INDEX" in plan or "USING COVERING INDEX" in plan
+        assert "TEMP B-TREE" not in plan
+
+def test_cursor_round_trip():
+    """Test that cursors keep the exact finish time and reject garbage."""
+
+    assert decode_cursor(encode_cursor(1716762000.123456, 42)) == (1716762000.123456, 42)
+    with pytest.raises(ValueError):
+        decode_cursor("garbage")
+
+def test_disabled_history_records_nothing(history):
+    """Test that a disabled history neither records nor lists."""
+
+    history.configure(enabled=False)
+
+    # Assertions
+    assert history.record("a", "python-script", {"return_code": 0}) is None
+    assert history.query() == ([], None)
+
+@pytest.mark.anyio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_executions_are_recorded(mock_exec):
+    """Test that completed, failed and broken executions are recorded."""
+
+    # Set up the mock
+    mock_exec.side_effect = [
+        make_process(stdout=execution_result(0)),
+        make_process(stdout=execution_result(4)),
+        make_process(returncode=1, stdout="not json", stderr="service not found"),
+    ]
+
+    # Call the functions
+    await run_ansible_playbook_service_async("deploy")
+    await run_python_script_service_async("report")
+    with pytest.raises(RuntimeError):
+        await run_python_script_service_async("missing")
+
+    # Assertions
+    records, _ = execution_history.query()
+    assert [(r["service"], r["operation"], r["status"]) for r in records] == [
+        ("missing", "python-script", "error"),
+        ("report", "python-script", "failed"),
+        ("deploy", "ansible-playbook", "succeeded"),
+    ]
+    assert records[1]["return_code"] == 4
+    assert "service not found" in records[0]["error"]
+
+@pytest.mark.anyio
+async def test_busy_executions_are_not_recorded():
+    """Test that executions rejected for lack of a process slot are not recorded."""
+
+    with patch("torero_api.core.torero_executor.process_limiter.slot", side_effect=ToreroBusyError("busy")):
+        with pytest.raises(ToreroBusyError):
+            await run_python_script_service_async("report")
+
+    # Assertions
+    assert execution_history.query() == ([], None)
+
+def test_executions_endpoint():
+    """Test listing, filtering, paging and looking up recorded executions over HTTP."""
+
+    # Set up the history
+    for i in range(3):
+        execution_history.record("deploy", "ansible-playbook", {"return_code": i}, finished_at=1716762000.0 + i)
+    client = TestClient(app)
+    since = datetime.fromtimestamp(1716762001.0, timezone.utc).replace(tzinfo=None).isoformat()
+
+    # Call the API
+    first = client.get("/v1/executions/", params={"limit": 2}).json()
+    second = client.get("/v1/executions/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    succeeded = client.get("/v1/executions/", params={"status": "succeeded"}).json()
+    recent = client.get("/v1/executions/", params={"since": since}).json()
+    record = client.get(f"/v1/executions/{first['items'][0]['id']}")
+    bad_cursor = client.get("/v1/executions/", params={"cursor": "garbage"})
+    missing = client.get("/v1/executions/9999")
+
+    # Assertions
+    assert [r["return_code"] for r in first["items"]] == [2, 1]
+    assert [r["return_code"] for r in second["items"]] == [0]
+    assert second["next_cursor"] is None
+    assert [r["status"] for r in succeeded["items"]] == ["succeeded"]
+    assert len(recent["items"]) == 2
+    assert record.status_code == 200 and record.json()["service"] == "deploy"
+    assert bad_cursor.status_code == 400
+    assert missing.status_code == 404
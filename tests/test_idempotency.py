@@ -0,0 +1,182 @@
+"""
+Test module for idempotency keys on service executions
+"""
+
+import asyncio
+import time
+import uuid
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.idempotency import IdempotencyKeyError, IdempotencyStore, request_fingerprint
+from torero_api.core.jobs import JobManager
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.server import app
+
+RESULT = {
+    "return_code": 0,
+    "stdout": "ok",
+    "stderr": "",
+    "start_time": "2025-05-26T22:18:41.905955",
+    "end_time": "2025-05-26T22:18:42.905955",
+    "elapsed_time": 1.0
+}
+
+FINGERPRINT = request_fingerprint("ansible-playbook", "deploy", mode="sync")
+
+@pytest.mark.anyio
+async def test_repeats_attach_to_running_execution():
+    """Test that concurrent requests with the same key share one execution."""
+
+    store = IdempotencyStore()
+    release = asyncio.Event()
+
+    async def execution():
+        await release.wait()
+        return RESULT
+
+    run = AsyncMock(side_effect=execution)
+
+    # Call the function
+    first = asyncio.ensure_future(store.execute("key-1", FINGERPRINT, run))
+    second = asyncio.ensure_future(store.execute("key-1", FINGERPRINT, run))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(first, second)
+
+    # Assertions
+    assert run.await_count == 1
+    assert results == [(RESULT, False), (RESULT, True)]
+    assert store.stats() == {"running": 0, "finished": 1}
+
+@pytest.mark.anyio
+async def test_finished_result_is_replayed_until_it_expires():
+    """Test that a repeat gets the stored result within the retention window only."""
+
+    store = IdempotencyStore(retention=60)
+    run = AsyncMock(return_value=RESULT)
+
+    # Call the function
+    await store.execute("key-1", FINGERPRINT, run)
+    replay = await store.execute("key-1", FINGERPRINT, run)
+    with patch("torero_api.core.idempotency.time.monotonic", return_value=time.monotonic() + 61):
+        expired = await store.execute("key-1", FINGERPRINT, run)
+
+    # Assertions
+    assert replay == (RESULT, True)
+    assert expired == (RESULT, False)
+    assert run.await_count == 2
+
+@pytest.mark.anyio
+async def test_key_reused_for_another_request_is_rejected():
+    """Test that a key cannot be used for a different request, and malformed keys are rejected."""
+
+    store = IdempotencyStore()
+    await store.execute("key-1", FINGERPRINT, AsyncMock(return_value=RESULT))
+
+    # Call the function and expect an exception
+    with pytest.raises(IdempotencyKeyError) as excinfo:
+        await store.execute("key-1", request_fingerprint("ansible-playbook", "other", mode="sync"), AsyncMock())
+    with pytest.raises(IdempotencyKeyError) as malformed:
+        await store.execute("x" * 256, FINGERPRINT, AsyncMock())
+
+    # Assertions
+    assert excinfo.value.conflict
+    assert not malformed.value.conflict
+
+@pytest.mark.anyio
+async def test_errors_are_replayed_but_busy_rejections_are_not():
+    """Test that failed executions are replayed while executions that never ran are retried."""
+
+    store = IdempotencyStore()
+    failing = AsyncMock(side_effect=RuntimeError("Service execution timed out after 5 minutes"))
+    busy = AsyncMock(side_effect=ToreroBusyError("busy"))
+
+    # Call the function and expect exceptions
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await store.execute("failing", FINGERPRINT, failing)
+        with pytest.raises(ToreroBusyError):
+            await store.execute("busy", FINGERPRINT, busy)
+        await asyncio.sleep(0)
+
+    # Assertions
+    assert failing.await_count == 1
+    assert busy.await_count == 2
+
+@pytest.mark.anyio
+async def test_execution_survives_abandoned_request():
+    """Test that cancelling the first request does not stop the execution a repeat attaches to."""
+
+    store = IdempotencyStore()
+    release = asyncio.Event()
+
+    async def run():
+        await release.wait()
+        return RESULT
+
+    # Call the function
+    first = asyncio.ensure_future(store.execute("key-1", FINGERPRINT, run))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    result = await store.execute("key-1", FINGERPRINT, run)
+
+    # Assertions
+    assert first.cancelled()
+    assert result == (RESULT, True)
+
+@pytest.mark.anyio
+async def test_repeated_job_submission_returns_the_same_job():
+    """Test that asynchronous requests with the same key get the same job."""
+
+    store = IdempotencyStore()
+    manager = JobManager()
+    run = AsyncMock(return_value=RESULT)
+    fingerprint = request_fingerprint("ansible-playbook", "deploy", mode="async")
+
+    # Call the function
+    job, replayed = store.submit("key-1", fingerprint, lambda: manager.submit("deploy", "ansible-playbook", run))
+    again, replayed_again = store.submit("key-1", fingerprint, lambda: manager.submit("deploy", "ansible-playbook", run))
+    await job.task
+
+    # Assertions
+    assert again is job
+    assert (replayed, replayed_again) == (False, True)
+    assert run.await_count == 1
+
+@patch("torero_api.api.v1.endpoints.execution.run_ansible_playbook_service_async", new_callable=AsyncMock)
+@patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", new_callable=AsyncMock)
+def test_execution_endpoint_idempotency_key(mock_get_service, mock_run):
+    """Test that repeated requests with an Idempotency-Key run the playbook once."""
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "ansible-playbook"
+    mock_get_service.return_value = service
+    mock_run.return_value = RESULT
+    client = TestClient(app)
+    key = {"Idempotency-Key": uuid.uuid4().hex}
+    url = "/v1/execute/ansible-playbook/hello-ansible"
+
+    # Call the API
+    first = client.post(url, headers=key)
+    repeat = client.post(url, headers=key)
+    other_request = client.post(url + "?async=true", headers=key)
+    streamed = client.post(url, headers={**key, "Accept": "text/event-stream"})
+    async_key = {"Idempotency-Key": uuid.uuid4().hex}
+    job = client.post(url + "?async=true", headers=async_key)
+    job_repeat = client.post(url + "?async=true", headers=async_key)
+
+    # Assertions
+    assert first.status_code == repeat.status_code == 200
+    assert repeat.json() == first.json()
+    assert "idempotent-replayed" not in first.headers
+    assert repeat.headers["idempotent-replayed"] == "true"
+    assert other_request.status_code == 422
+    assert streamed.status_code == 400
+    assert job.status_code == job_repeat.status_code == 202
+    assert job_repeat.json()["id"] == job.json()["id"]
+    assert job_repeat.headers["location"] == job.headers["location"]
@@ -0,0 +1,135 @@
+"""
+Test module for torero API inventory snapshots
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.inventory import InventorySnapshot, facet_counts, select_items
+from torero_api.core.cache import inventory_cache
+from torero_api.core.torero_executor import get_service_by_name, get_inventory_snapshot_async
+from torero_api.models.service import Service
+from torero_api.server import app
+
+TEST_SERVICES = [
+    Service(name="svc-a", type="ansible-playbook", tags=["network"]),
+    Service(name="svc-b", type="python-script", tags=[]),
+    Service(name="svc-a", type="opentofu-plan", tags=["duplicate"]),
+]
+
+def test_snapshot_name_index():
+    """Test that the snapshot indexes items by name."""
+
+    snapshot = InventorySnapshot("services", TEST_SERVICES)
+    
+    assert len(snapshot) == 3
+    assert snapshot.get("svc-b") is TEST_SERVICES[1]
+    assert snapshot.get("missing") is None
+
+def test_snapshot_duplicate_names_keep_first():
+    """Test that duplicate names resolve to the first item, like a linear scan."""
+
+    snapshot = InventorySnapshot("services", TEST_SERVICES)
+    
+    assert snapshot.get("svc-a") is TEST_SERVICES[0]
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_lookups_share_one_snapshot(mock_fetch_services):
+    """Test that repeated name lookups reuse the cached snapshot."""
+
+    mock_fetch_services.return_value = TEST_SERVICES
+    
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        assert get_service_by_name("svc-a").type == "ansible-playbook"
+        assert get_service_by_name("svc-b").type == "python-script"
+        assert get_service_by_name("svc-c") is None
+    
+    mock_fetch_services.assert_awaited_once()
+
+@pytest.mark.anyio
+async def test_unknown_snapshot_kind():
+    """Test that an unknown resource kind is rejected."""
+
+    with pytest.raises(ValueError):
+        await get_inventory_snapshot_async("widgets")
+
+INDEXED_SERVICES = [
+    Service(name=f"svc-{i}", type=("ansible-playbook", "python-script")[i % 2],
+            tags=["network"] if i % 3 == 0 else ["backup"])
+    for i in range(12)
+]
+
+def test_snapshot_type_and_tag_indexes():
+    """Test that the snapshot indexes item positions by type and tag."""
+
+    snapshot = InventorySnapshot("services", INDEXED_SERVICES)
+
+    assert list(snapshot.by_type["python-script"]) == [1, 3, 5, 7, 9, 11]
+    assert list(snapshot.by_tag["network"]) == [0, 3, 6, 9]
+    assert "missing" not in snapshot.by_tag
+
+@pytest.mark.parametrize("filters, expected", [
+    ({}, [f"svc-{i}" for i in range(12)]),
+    ({"type": "python-script"}, ["svc-1", "svc-3", "svc-5", "svc-7", "svc-9", "svc-11"]),
+    ({"tag": "network"}, ["svc-0", "svc-3", "svc-6", "svc-9"]),
+    ({"type": "python-script", "tag": "network"}, ["svc-3", "svc-9"]),
+    ({"type": "python-script", "skip": 2, "limit": 3}, ["svc-5", "svc-7", "svc-9"]),
+    ({"type": "ansible-playbook", "tag": "backup", "skip": 1, "limit": 2}, ["svc-4", "svc-8"]),
+    ({"tag": "missing"}, []),
+    ({"type": "opentofu-plan", "tag": "network"}, [])
+])
+def test_select(filters, expected):
+    """Test that indexed selection matches filtering and slicing the list."""
+
+    snapshot = InventorySnapshot("services", INDEXED_SERVICES)
+
+    assert [s.name for s in snapshot.select(**filters)] == expected
+    assert [s.name for s in select_items(INDEXED_SERVICES, **filters)] == expected
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_list_endpoint_uses_indexes(mock_fetch_services):
+    """Test that list endpoints filter and paginate the cached snapshot."""
+
+    # Set up the mock
+    mock_fetch_services.return_value = INDEXED_SERVICES
+    client = TestClient(app)
+
+    # Call the API
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        response = client.get("/v1/services/?type=ansible-playbook&tag=backup&skip=1&limit=2")
+
+    # Assertions
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()] == ["svc-4", "svc-8"]
+
+def test_snapshot_facets():
+    """Test that facets count items per type and tag and are computed once."""
+
+    snapshot = InventorySnapshot("services", INDEXED_SERVICES + [Service(name="dup", type="python-script", tags=["network", "network"])])
+
+    assert snapshot.facet("type") == (("ansible-playbook", 6), ("python-script", 7))
+    assert snapshot.facet("tag") == (("backup", 8), ("network", 5))
+    assert snapshot.facet("type") is snapshot.facet("type")
+    assert list(facet_counts(list(snapshot), "tag")) == list(snapshot.facet("tag"))
+
+    with pytest.raises(ValueError):
+        snapshot.facet("name")
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_facet_endpoints_with_counts(mock_fetch_services):
+    """Test that facet endpoints return values, and counts on request."""
+
+    # Set up the mock
+    mock_fetch_services.return_value = INDEXED_SERVICES
+    client = TestClient(app)
+
+    # Call the API
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        types = client.get("/v1/services/types")
+        tags = client.get("/v1/services/tags?counts=true")
+
+    # Assertions
+    assert types.json() == ["ansible-playbook", "python-script"]
+    assert tags.json() == [{"value": "backup", "count": 8}, {"value": "network", "count": 4}]
+    mock_fetch_services.assert_awaited_once()
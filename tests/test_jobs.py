@@ -0,0 +1,192 @@
+"""
+Test module for the torero API background execution jobs
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.jobs import JobManager, COMPLETED, FAILED, QUEUED
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.server import app
+
+RESULT = {
+    "return_code": 0,
+    "stdout": "ok",
+    "stderr": "",
+    "start_time": "2025-05-26T22:18:41.905955",
+    "end_time": "2025-05-26T22:18:42.905955",
+    "elapsed_time": 1.0
+}
+
+@pytest.mark.anyio
+async def test_job_completes_with_result():
+    """Test that a job runs in the background and keeps its result."""
+
+    manager = JobManager()
+    started = asyncio.Event()
+
+    async def run():
+        started.set()
+        await asyncio.sleep(0.01)
+        return RESULT
+
+    # Call the function
+    job = manager.submit("svc", "python-script", run)
+    assert not job.done
+    await started.wait()
+    await job.task
+
+    # Assertions
+    assert manager.get(job.id) is job
+    assert job.status == COMPLETED
+    assert job.result == RESULT
+    assert job.started_at is not None and job.finished_at is not None
+    assert manager.stats()[COMPLETED] == 1
+
+@pytest.mark.anyio
+async def test_job_failure_is_recorded():
+    """Test that an execution error fails the job instead of escaping."""
+
+    manager = JobManager()
+
+    # Call the function
+    job = manager.submit("svc", "ansible-playbook", AsyncMock(side_effect=RuntimeError("torero error: boom")))
+    await job.task
+
+    # Assertions
+    assert job.status == FAILED
+    assert job.error == "torero error: boom"
+    assert job.result is None
+
+@pytest.mark.anyio
+async def test_busy_job_stays_queued_and_retries():
+    """Test that a job waits for a process slot instead of failing."""
+
+    manager = JobManager()
+    run = AsyncMock(side_effect=[ToreroBusyError("busy", retry_after=0.01), RESULT])
+
+    # Call the function
+    job = manager.submit("svc", "python-script", run)
+    await asyncio.sleep(0)
+    assert job.status == QUEUED
+    await job.task
+
+    # Assertions
+    assert job.status == COMPLETED
+    assert run.await_count == 2
+
+@pytest.mark.anyio
+async def test_busy_job_fails_after_max_wait():
+    """Test that a job stops waiting for a process slot after the maximum wait."""
+
+    manager = JobManager(max_wait=0.05)
+    run = AsyncMock(side_effect=ToreroBusyError("All torero process slots are busy", retry_after=1))
+
+    # Call the function
+    job = manager.submit("svc", "python-script", run)
+    await asyncio.wait_for(job.task, timeout=1)
+
+    # Assertions
+    assert job.status == FAILED
+    assert "within 0.05 seconds" in job.error
+    assert "All torero process slots are busy" in job.error
+    assert run.await_count == 2
+
+@pytest.mark.anyio
+async def test_finished_jobs_expire_and_make_room():
+    """Test that finished jobs are dropped after the retention and when the limit is reached."""
+
+    manager = JobManager(retention=60, max_jobs=2)
+    first = manager.submit("a", "python-script", AsyncMock(return_value=RESULT))
+    second = manager.submit("b", "python-script", AsyncMock(return_value=RESULT))
+    await asyncio.gather(first.task, second.task)
+
+    # The oldest finished job makes room for a new one
+    third = manager.submit("c", "python-script", AsyncMock(return_value=RESULT))
+    assert manager.get(first.id) is None
+    assert manager.get(second.id) is second
+    await third.task
+
+    # Expired jobs are forgotten
+    with patch("torero_api.core.jobs.time.monotonic", return_value=time.monotonic() + 61):
+        assert manager.get(second.id) is None
+
+@pytest.mark.anyio
+async def test_job_limit_rejects_when_nothing_finished():
+    """Test that submissions beyond the limit are refused while all jobs are unfinished."""
+
+    manager = JobManager(max_jobs=1)
+    blocker = asyncio.Event()
+
+    async def run():
+        await blocker.wait()
+        return RESULT
+
+    job = manager.submit("a", "python-script", run)
+
+    # Call the function
+    with pytest.raises(ToreroBusyError):
+        manager.submit("b", "python-script", run)
+
+    # Shutting down cancels the unfinished job
+    await manager.shutdown()
+    assert job.status == FAILED
+    assert job.error == "Job was cancelled"
+
+def test_async_execution_endpoint(monkeypatch):
+    """Test that ?async=true answers 202 with a job that can be polled to completion."""
+
+    monkeypatch.setenv("TORERO_API_REFRESH", "0")
+    monkeypatch.setenv("TORERO_API_WARMUP", "0")
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "python-script"
+    with patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", AsyncMock(return_value=service)), \
+         patch("torero_api.api.v1.endpoints.execution.run_python_script_service_async", AsyncMock(return_value=RESULT)) as mock_run:
+        with TestClient(app) as client:
+            # Call the API
+            response = client.post("/v1/execute/python-script/hello-python?async=true")
+            assert response.status_code == 202
+            job = response.json()
+            assert response.headers["location"] == f"/v1/jobs/{job['id']}"
+            assert job["service"] == "hello-python"
+
+            for _ in range(100):
+                job = client.get(f"/v1/jobs/{job['id']}").json()
+                if job["status"] == "completed":
+                    break
+                time.sleep(0.01)
+
+            missing = client.get("/v1/jobs/unknown")
+
+    # Assertions
+    assert job["status"] == "completed"
+    assert job["result"]["stdout"] == "ok"
+    mock_run.assert_awaited_once_with("hello-python")
+    assert missing.status_code == 404
+
+def test_prefer_respond_async_header(monkeypatch):
+    """Test that 'Prefer: respond-async' also submits a job."""
+
+    monkeypatch.setenv("TORERO_API_REFRESH", "0")
+    monkeypatch.setenv("TORERO_API_WARMUP", "0")
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "ansible-playbook"
+    with patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", AsyncMock(return_value=service)), \
+         patch("torero_api.api.v1.endpoints.execution.run_ansible_playbook_service_async", AsyncMock(return_value=RESULT)):
+        with TestClient(app) as client:
+            # Call the API
+            response = client.post("/v1/execute/ansible-playbook/hello-ansible", headers={"Prefer": "respond-async, wait=5"})
+            sync_response = client.post("/v1/execute/ansible-playbook/hello-ansible")
+
+    # Assertions
+    assert response.status_code == 202
+    assert response.json()["operation"] == "ansible-playbook"
+    assert sync_response.status_code == 200
+    assert sync_response.json()["stdout"] == "ok"
@@ -0,0 +1,192 @@
+"""
+Test module for the incremental JSON item parser
+"""
+
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.jsonstream import JSONFieldStreamer, JSONItemParser, JSONStreamError, iter_json_items
+from torero_api.core.torero_executor import get_decorators, get_services
+from tests.conftest import make_process
+
+ITEMS = [
+    {"name": "a", "tags": ["x", "y"], "count": 12345},
+    {"name": "bé", "nested": {"list": [1, 2.5, None, True]}},
+    {"name": "c", "description": "brackets ] and } in \"strings\""}
+]
+
+def feed_bytewise(document, array_keys=("items",)):
+    """Feed a document to a parser one byte at a time and collect the items."""
+
+    parser = JSONItemParser(array_keys)
+    items = []
+    for i in range(len(document)):
+        items.extend(parser.feed(document[i:i + 1]))
+    items.extend(parser.close())
+    return items
+
+def test_top_level_array():
+    """Test that the elements of a top-level array are returned in order."""
+
+    assert feed_bytewise(json.dumps(ITEMS).encode()) == ITEMS
+
+def test_wrapped_array():
+    """Test that the array under a wanted key is used and other values are skipped."""
+
+    document = json.dumps({"kind": "list", "meta": {"items": [0]}, "items": ITEMS, "total": 3}).encode()
+
+    assert feed_bytewise(document) == ITEMS
+
+def test_first_matching_key_wins():
+    """Test that the first key from array_keys found in the object is used."""
+
+    document = json.dumps({"items": [{"name": "b"}], "decorators": [{"name": "a"}]}).encode()
+
+    assert feed_bytewise(document, ("decorators", "items")) == [{"name": "b"}]
+
+def test_items_returned_as_they_complete():
+    """Test that an item is handed out as soon as its closing bracket arrives."""
+
+    parser = JSONItemParser()
+
+    assert parser.feed(b'{"items": [{"name": "a"}, {"na') == [{"name": "a"}]
+    assert parser.feed(b'me": "b"}') == [{"name": "b"}]
+    assert parser.feed(b"]}") == []
+    assert parser.close() == []
+
+def test_number_split_across_chunks():
+    """Test that a number at the end of a chunk waits for the rest of its digits."""
+
+    parser = JSONItemParser()
+
+    assert parser.feed(b"[12") == []
+    assert parser.feed(b"34, 5") == [1234]
+    assert parser.feed(b"6]") == [56]
+    assert parser.close() == []
+
+def test_multibyte_character_split_across_chunks():
+    """Test that a UTF-8 sequence split between chunks is decoded correctly."""
+
+    document = json.dumps(["café"], ensure_ascii=False).encode()
+
+    assert feed_bytewise(document) == ["café"]
+
+@pytest.mark.parametrize("document, message", [
+    (b"", "empty document"),
+    (b'[{"name": "a"}', "Unexpected end"),
+    (b'{"name": "a"}', "Unexpected JSON structure"),
+    (b'"text"', "Unexpected JSON structure"),
+    (b'[{"name": }]', "Expecting value"),
+    (b"[] []", "Extra data")
+])
+def test_invalid_documents(document, message):
+    """Test that invalid or unexpected documents are rejected."""
+
+    parser = JSONItemParser()
+
+    with pytest.raises(JSONStreamError) as excinfo:
+        parser.feed(document)
+        parser.close()
+
+    assert message in str(excinfo.value)
+
+@pytest.mark.anyio
+async def test_iter_json_items():
+    """Test iterating over the items of an asynchronous chunk stream."""
+
+    async def chunks():
+        document = json.dumps({"items": ITEMS}).encode()
+        for i in range(0, len(document), 7):
+            yield document[i:i + 7]
+
+    assert [item async for item in iter_json_items(chunks())] == ITEMS
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_services_streams_output(mock_exec):
+    """Test that services are built from output read in small chunks."""
+
+    # Set up the mock
+    services = [{"name": f"svc-{i}", "type": "python-script", "tags": ["t"]} for i in range(50)]
+    mock_exec.return_value = make_process(stdout=json.dumps(services))
+
+    # Call the function
+    with patch("torero_api.core.backends.STREAM_CHUNK_SIZE", 16):
+        result = get_services()
+
+    # Assertions
+    assert [s.name for s in result] == [f"svc-{i}" for i in range(50)]
+    assert mock_exec.return_value.stdout.read.call_count > 50
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_get_decorators_streams_wrapped_output(mock_exec):
+    """Test that decorators are read from a "decorators" array."""
+
+    # Set up the mock
+    document = {"decorators": [{"name": "deco", "schema": {"type": "object"}}]}
+    mock_exec.return_value = make_process(stdout=json.dumps(document))
+
+    # Call the function
+    with patch("torero_api.core.backends.STREAM_CHUNK_SIZE", 8):
+        result = get_decorators()
+
+    # Assertions
+    assert [d.name for d in result] == ["deco"]
+    assert result[0].parameters == {"type": "object"}
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_failed_command_reports_stderr(mock_exec):
+    """Test that a failing command is reported by its stderr, not as invalid JSON."""
+
+    # Set up the mock
+    mock_exec.return_value = make_process(returncode=1, stderr="no database")
+
+    # Call the function
+    with pytest.raises(RuntimeError) as excinfo:
+        get_services()
+
+    # Assertions
+    assert "torero error: no database" in str(excinfo.value)
+
+def test_number_split_after_decimal_point():
+    """Test that a number cut right after its decimal point is completed by the next chunk."""
+
+    parser = JSONItemParser()
+    items = parser.feed(b'{"items": [1500.')
+    items += parser.feed(b'25]}')
+    items += parser.close()
+
+    assert items == [1500.25]
+
+def test_field_streamer_hands_out_string_pieces():
+    """Test that streamed string fields arrive in pieces and other fields are decoded."""
+
+    result = {
+        "return_code": 2,
+        "stdout": "line \"1\"\n\tline 2 é \U0001F600 \\ end",
+        "stderr": "",
+        "elapsed_time": 1500.25
+    }
+    for ensure_ascii in (True, False):
+        document = json.dumps(result, ensure_ascii=ensure_ascii).encode()
+        parser = JSONFieldStreamer(("stdout", "stderr"))
+        texts = {"stdout": "", "stderr": ""}
+        pieces = []
+        for i in range(len(document)):
+            pieces.extend(parser.feed(document[i:i + 1]))
+        pieces.extend(parser.close())
+        for key, text in pieces:
+            texts[key] += text
+
+        assert texts == {"stdout": result["stdout"], "stderr": ""}
+        assert parser.fields == {"return_code": 2, "elapsed_time": 1500.25}
+        assert len([key for key, _ in pieces if key == "stdout"]) > 1
+
+def test_field_streamer_rejects_incomplete_document():
+    """Test that a document cut inside a streamed string is reported."""
+
+    parser = JSONFieldStreamer(("stdout",))
+    parser.feed(b'{"stdout": "partial')
+
+    with pytest.raises(JSONStreamError):
+        parser.close()
@@ -0,0 +1,116 @@
+"""
+Test module for the torero process limiter
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.server import app
+from torero_api.core.limiter import ProcessLimiter, ToreroBusyError, READ, EXECUTE, process_limiter
+from torero_api.core.torero_executor import get_services_async
+
+# Create a test client using FastAPI's TestClient
+client = TestClient(app)
+
+async def hold(limiter, command_class, tracker, delay=0.02):
+    """Hold a slot for a short time while tracking concurrency."""
+
+    async with limiter.slot(command_class):
+        tracker["current"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["current"])
+        await asyncio.sleep(delay)
+        tracker["current"] -= 1
+
+@pytest.mark.anyio
+async def test_global_limit():
+    """Test that no more than max_processes slots are held at once."""
+
+    limiter = ProcessLimiter(max_processes=2, class_limits={READ: 10, EXECUTE: 10})
+    tracker = {"current": 0, "peak": 0}
+    
+    await asyncio.gather(*(hold(limiter, READ, tracker) for _ in range(6)))
+    
+    assert tracker["peak"] == 2
+    assert limiter.stats()["total_active"] == 0
+
+@pytest.mark.anyio
+async def test_class_limit_does_not_block_other_class():
+    """Test that a saturated execute class leaves room for reads."""
+
+    limiter = ProcessLimiter(max_processes=10, class_limits={READ: 5, EXECUTE: 1})
+    await limiter.acquire(EXECUTE)
+    
+    waiting_execute = asyncio.ensure_future(limiter.acquire(EXECUTE))
+    await asyncio.sleep(0)
+    assert limiter.stats()["queued"] == 1
+    
+    # Reads start immediately despite the queued execution
+    await asyncio.wait_for(limiter.acquire(READ), timeout=0.1)
+    limiter.release(READ)
+    
+    limiter.release(EXECUTE)
+    await asyncio.wait_for(waiting_execute, timeout=0.1)
+    limiter.release(EXECUTE)
+
+@pytest.mark.anyio
+async def test_full_queue_fails_fast():
+    """Test that callers are rejected once the wait queue is full."""
+
+    limiter = ProcessLimiter(max_processes=1, max_queued=1, retry_after=3)
+    await limiter.acquire(READ)
+    queued = asyncio.ensure_future(limiter.acquire(READ))
+    await asyncio.sleep(0)
+    
+    with pytest.raises(ToreroBusyError) as excinfo:
+        await limiter.acquire(READ)
+    assert excinfo.value.retry_after == 3
+    
+    limiter.release(READ)
+    await queued
+    limiter.release(READ)
+
+@pytest.mark.anyio
+async def test_queue_timeout():
+    """Test that waiting longer than the queue timeout raises ToreroBusyError."""
+
+    limiter = ProcessLimiter(max_processes=1, queue_timeout=0.01)
+    await limiter.acquire(READ)
+    
+    with pytest.raises(ToreroBusyError):
+        await limiter.acquire(READ)
+    
+    stats = limiter.stats()
+    assert stats["queued"] == 0
+    assert stats["total_active"] == 1
+
+def test_configure_rejects_invalid_limits():
+    """Test that invalid limits are rejected."""
+
+    limiter = ProcessLimiter()
+    with pytest.raises(ValueError):
+        limiter.configure(max_processes=0)
+    with pytest.raises(ValueError):
+        limiter.configure(class_limits={"write": 1})
+
+@pytest.mark.anyio
+async def test_executor_propagates_busy_error():
+    """Test that the executor does not wrap ToreroBusyError in a generic error."""
+
+    with patch.object(process_limiter, "acquire", AsyncMock(side_effect=ToreroBusyError("busy"))):
+        with pytest.raises(ToreroBusyError):
+            await get_services_async()
+
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
+def test_busy_endpoint_returns_503(mock_get_services):
+    """Test that a busy executor is answered with 503 and Retry-After."""
+
+    mock_get_services.side_effect = ToreroBusyError("Too many torero commands in progress", retry_after=2.5)
+    
+    response = client.get("/v1/services/")
+    
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    data = response.json()
+    assert data["error_type"] == "busy"
@@ -0,0 +1,240 @@
+"""
+Test module for spooled execution output
+"""
+
+import json
+import time
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from torero_api.api.v1.endpoints.outputs import parse_byte_range
+from torero_api.core.outputs import OutputStore, SpooledOutput, output_store
+from torero_api.core.torero_executor import run_python_script_service_async
+from torero_api.server import app
+from tests.conftest import make_process
+
+@pytest.fixture
+def small_output_store():
+    """Make the shared output store spool and truncate tiny outputs."""
+
+    output_store.configure(spool_threshold=64, preview_bytes=16)
+    yield output_store
+    output_store.clear()
+    output_store.configure(spool_threshold=1024 * 1024, preview_bytes=16 * 1024)
+
+def execution_result(stdout, stderr=""):
+    """Build torero's raw result of a service execution."""
+
+    return json.dumps({
+        "return_code": 0,
+        "stdout": stdout,
+        "stderr": stderr,
+        "start_time": "2025-05-26T22:18:41.905955",
+        "end_time": "2025-05-26T22:18:42.905955",
+        "elapsed_time": 1.0
+    })
+
+def test_spooled_output_moves_to_disk():
+    """Test that output beyond the threshold is spooled and previewed as head and tail."""
+
+    output = SpooledOutput(spool_threshold=10)
+    output.write("0123456789")
+    assert not output.on_disk
+
+    output.write("abcdefghij")
+
+    # Assertions
+    assert output.on_disk
+    assert output.size == 20
+    assert output.read(5, 10) == b"56789abcde"
+    assert b"".join(output.iter_range(15, 19)) == b"fghij"
+    assert output.preview(10) == "0123456789abcdefghij"
+    assert output.preview(4) == "0123\n[... 12 bytes omitted ...]\nghij"
+    output.close()
+    assert output.read(0, 5) == b""
+
+def test_store_keeps_only_truncated_outputs():
+    """Test that outputs fitting in the preview are returned inline and not kept."""
+
+    store = OutputStore(preview_bytes=4, retention=60)
+
+    small = store.create()
+    small.write("stdout", "short")
+    result = store.finish(small, {"return_code": 0})
+    assert result == {"return_code": 0, "stdout": "short", "stdout_size": 5, "stderr": "", "stderr_size": 0, "truncated": False}
+    assert store.stats()["outputs"] == 0
+
+    large = store.create()
+    large.write("stderr", "x" * 100)
+    result = store.finish(large, {"return_code": 1})
+
+    # Assertions
+    assert result["truncated"]
+    assert result["stderr"] == "xxxx\n[... 92 bytes omitted ...]\nxxxx"
+    assert result["output_url"] == f"/v1/outputs/{large.id}"
+    assert store.get(large.id) is large
+    with patch("torero_api.core.outputs.time.monotonic", return_value=time.monotonic() + 61):
+        assert store.get(large.id) is None
+
+def test_store_evicts_oldest_outputs_beyond_its_limits():
+    """Test that the oldest kept outputs are dropped to stay within the count and size limits."""
+
+    store = OutputStore(preview_bytes=4, retention=60, max_outputs=3, max_bytes=250)
+
+    def keep(size):
+        output = store.create()
+        output.write("stdout", "x" * size)
+        return output, store.finish(output, {"return_code": 0})
+
+    first, _ = keep(100)
+    second, _ = keep(100)
+    third, _ = keep(100)
+    huge, result = keep(300)
+
+    # Assertions
+    assert store.get(first.id) is None
+    assert store.get(second.id) is second
+    assert "output_url" not in result and result["truncated"]
+    assert store.get(huge.id) is None
+    assert store.stats()["bytes"] == 200
+    store.configure(max_outputs=1)
+    assert store.get(second.id) is None
+    assert store.get(third.id) is third
+    assert store.stats()["outputs"] == 1
+    assert store.stats()["evictions"] == 2
+
+def test_dropped_output_stays_readable_until_its_download_ends():
+    """Test that closing an output while a reader is open is deferred until the reader is done."""
+
+    store = OutputStore(preview_bytes=4, retention=60)
+    output = store.create()
+    output.write("stdout", "0123456789")
+    store.finish(output, {"return_code": 0})
+
+    # Start a download, then drop the output
+    reader = output.open_range("stdout", 0, 9)
+    store.clear()
+
+    # Assertions
+    assert b"".join(reader) == b"0123456789"
+    assert output.streams["stdout"].read(0, 10) == b""
+    assert output.open_range("stdout", 0, 9) is None
+
+@pytest.mark.anyio
+async def test_spilled_writes_run_in_a_worker_thread():
+    """Test that writes stay on the event loop in memory and move to a thread once on disk."""
+
+    output = SpooledOutput(spool_threshold=10)
+
+    with patch("torero_api.core.outputs.asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread:
+        mock_to_thread.side_effect = lambda function, *args: function(*args)
+
+        # Call the function
+        await output.write_async("01234")
+        await output.write_async("56789abcde")
+
+    # Assertions
+    assert mock_to_thread.await_count == 1
+    assert output.read(0, 15) == b"0123456789abcde"
+    output.close()
+
+def test_parse_byte_range():
+    """Test parsing single byte ranges."""
+
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=50-500", 100) == (50, 99)
+    assert parse_byte_range("bytes=0-1,5-9", 100) is None
+    assert parse_byte_range("items=0-9", 100) is None
+    with pytest.raises(HTTPException) as excinfo:
+        parse_byte_range("bytes=100-", 100)
+    assert excinfo.value.status_code == 416
+
+@pytest.mark.anyio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_execution_output_is_spooled(mock_exec, small_output_store):
+    """Test that a long execution output is truncated in the result and kept in full."""
+
+    # Set up the mock
+    stdout = "".join(f"line {i}\n" for i in range(100))
+    mock_exec.return_value = make_process(stdout=execution_result(stdout, "warning"))
+
+    # Call the function
+    with patch("torero_api.core.backends.STREAM_CHUNK_SIZE", 7):
+        result = await run_python_script_service_async("chatty")
+
+    # Assertions
+    assert result["truncated"]
+    assert result["stdout"].startswith("line 0\nline 1\nli")
+    assert result["stdout"].endswith("line 99\n")
+    assert result["stdout_size"] == len(stdout)
+    assert result["stderr"] == "warning"
+    assert result["return_code"] == 0
+    output = small_output_store.get(result["output_url"].rsplit("/", 1)[1])
+    assert output.streams["stdout"].on_disk
+    assert output.streams["stdout"].read(0, len(stdout)).decode() == stdout
+
+@pytest.mark.anyio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_execution_invalid_result(mock_exec):
+    """Test that output that is not a JSON result is reported with torero's error."""
+
+    # Set up the mock
+    mock_exec.return_value = make_process(returncode=1, stdout="not json", stderr="service not found")
+
+    # Call the function and expect an exception
+    with pytest.raises(RuntimeError) as excinfo:
+        await run_python_script_service_async("missing")
+
+    # Assertions
+    assert "Service execution failed with code 1: service not found" in str(excinfo.value)
+
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_output_endpoint_supports_ranges(mock_exec, small_output_store):
+    """Test downloading a kept output in whole, in ranges and with HEAD."""
+
+    # Set up the mock
+    stdout = "".join(f"line {i}\n" for i in range(100))
+    mock_exec.return_value = make_process(stdout=execution_result(stdout))
+    client = TestClient(app)
+
+    with patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value.type = "python-script"
+        result = client.post("/v1/execute/python-script/chatty").json()
+    url = result["output_url"]
+
+    # Call the API
+    info = client.get(url)
+    full = client.get(info.json()["stdout_url"])
+    part = client.get(f"{url}/stdout", headers={"Range": "bytes=7-13"})
+    suffix = client.get(f"{url}/stdout", headers={"Range": "bytes=-8"})
+    with patch.object(SpooledOutput, "iter_range") as mock_iter_range:
+        head = client.head(f"{url}/stdout")
+    outside = client.get(f"{url}/stdout", headers={"Range": f"bytes={len(stdout)}-"})
+    stderr = client.get(f"{url}/stderr")
+    missing = client.get("/v1/outputs/unknown/stdout")
+
+    # Assertions
+    assert result["truncated"]
+    assert info.status_code == 200
+    assert info.json()["stdout_size"] == len(stdout)
+    assert info.json()["stderr_url"] == f"{url}/stderr"
+    assert 0 < info.json()["expires_in"] <= 3600
+    assert client.get("/v1/outputs/unknown").status_code == 404
+    assert full.status_code == 200
+    assert full.text == stdout
+    assert full.headers["accept-ranges"] == "bytes"
+    assert part.status_code == 206
+    assert part.text == "line 1\n"
+    assert part.headers["content-range"] == f"bytes 7-13/{len(stdout)}"
+    assert suffix.text == "line 99\n"
+    assert head.status_code == 200
+    assert head.headers["content-length"] == str(len(stdout))
+    mock_iter_range.assert_not_called()
+    assert outside.status_code == 416
+    assert outside.headers["content-range"] == f"bytes */{len(stdout)}"
+    assert stderr.status_code == 200 and stderr.text == ""
+    assert missing.status_code == 404
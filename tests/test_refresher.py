@@ -0,0 +1,132 @@
+"""
+Test module for the background inventory refresher
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.cache import InventoryCache, inventory_cache
+from torero_api.core.refresher import InventoryRefresher, refresher_enabled
+from torero_api.models.service import Service
+from torero_api.server import app
+
+def make_cache(ttl=10):
+    """Build a cache with a services entry loaded at t=100 and read at t=100."""
+
+    cache = InventoryCache(default_ttl=ttl)
+    with patch("torero_api.core.cache.time.monotonic", return_value=100.0):
+        cache.put("services", ["old"])
+        cache._accessed["services"] = 100.0
+    return cache
+
+def test_due_in():
+    """Test that a kind is due at the refresh-ahead fraction of its TTL."""
+
+    cache = make_cache(ttl=10)
+    refresher = InventoryRefresher(AsyncMock(), cache, refresh_ahead=0.8)
+
+    with patch("torero_api.core.cache.time.monotonic", return_value=103.0):
+        assert refresher.due_in("services") == pytest.approx(5.0)
+
+        # Kinds that were never loaded are left alone
+        assert refresher.due_in("secrets") is None
+
+def test_idle_kind_not_refreshed():
+    """Test that kinds nobody reads any more are not refreshed."""
+
+    cache = make_cache(ttl=10)
+    refresher = InventoryRefresher(AsyncMock(), cache, idle_after=60)
+
+    with patch("torero_api.core.cache.time.monotonic", return_value=200.0):
+        assert refresher.due_in("services") is None
+
+@pytest.mark.anyio
+async def test_refresh_due_refreshes_expiring_kinds():
+    """Test that due kinds are refreshed through the refresh callable."""
+
+    cache = make_cache(ttl=10)
+
+    async def refresh(kind):
+        cache.put(kind, ["new"])
+
+    refresh_mock = AsyncMock(side_effect=refresh)
+    refresher = InventoryRefresher(refresh_mock, cache)
+
+    with patch("torero_api.core.cache.time.monotonic", return_value=109.0):
+        await refresher.refresh_due()
+
+        refresh_mock.assert_awaited_once_with("services")
+        assert cache.get("services") == ["new"]
+
+@pytest.mark.anyio
+async def test_failed_refresh_backs_off():
+    """Test that a failed refresh is retried only after a back-off."""
+
+    cache = make_cache(ttl=10)
+    refresh_mock = AsyncMock(side_effect=RuntimeError("torero hung"))
+    refresher = InventoryRefresher(refresh_mock, cache)
+
+    with patch("torero_api.core.cache.time.monotonic", return_value=109.0), \
+         patch("torero_api.core.refresher.time.monotonic", return_value=109.0):
+        await refresher.refresh_due()
+        await refresher.refresh_due()
+
+        assert refresh_mock.await_count == 1
+        assert refresher.due_in("services") > 0
+
+@pytest.mark.anyio
+async def test_start_and_stop():
+    """Test that the refresher task can be started and stopped."""
+
+    refresher = InventoryRefresher(AsyncMock(), InventoryCache())
+
+    refresher.start()
+    assert refresher.running
+
+    await refresher.stop()
+    assert not refresher.running
+
+def test_refresher_enabled(monkeypatch):
+    """Test the TORERO_API_REFRESH switch."""
+
+    monkeypatch.delenv("TORERO_API_REFRESH", raising=False)
+    assert refresher_enabled()
+
+    monkeypatch.setenv("TORERO_API_REFRESH", "0")
+    assert not refresher_enabled()
+
+def test_lifespan_starts_refresher(monkeypatch):
+    """Test that the application lifespan runs the refresher."""
+
+    monkeypatch.delenv("TORERO_API_REFRESH", raising=False)
+
+    with TestClient(app):
+        assert app.state.refresher.running
+    assert not app.state.refresher.running
+
+@patch("torero_api.core.torero_executor._fetch_services_async", new_callable=AsyncMock)
+def test_inventory_age_header(mock_fetch):
+    """Test that responses built from inventories report the data's age."""
+
+    # Set up the mock
+    mock_fetch.return_value = [Service(name="svc", type="python-script")]
+    client = TestClient(app)
+
+    # Call the API
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        response = client.get("/v1/services/")
+
+    # Assertions
+    assert response.status_code == 200
+    assert float(response.headers["X-Inventory-Age"]) >= 0
+    assert "X-Inventory-Stale" not in response.headers
+
+    # Data older than its TTL is flagged as stale
+    with patch.object(inventory_cache, "get_ttl", return_value=60), \
+         patch("torero_api.core.inventory.time.time", return_value=4102444800.0):
+        response = client.get("/v1/services/")
+    assert response.headers["X-Inventory-Stale"] == "true"
+
+    # Responses that do not use an inventory have no age header
+    assert "X-Inventory-Age" not in client.get("/").headers
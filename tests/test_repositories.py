@@ -3,7 +3,7 @@ Test module for torero API repositories endpoints
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 
 from torero_api.server import app
@@ -38,7 +38,7 @@ TEST_REPOSITORIES = [
 ]
 
 # Direct patching for repository endpoints
-@patch("torero_api.api.v1.endpoints.repositories.get_repositories")
+@patch("torero_api.api.v1.endpoints.repositories.get_repositories_async", new_callable=AsyncMock)
 def test_list_repositories(mock_get_repositories):
     """Test listing all repositories with direct endpoint mocking."""
 
@@ -56,7 +56,7 @@ def test_list_repositories(mock_get_repositories):
     assert data[1]["name"] == "test-repository-2"
     assert data[2]["name"] == "test-repository-3"
 
-@patch("torero_api.api.v1.endpoints.repositories.get_repositories")
+@patch("torero_api.api.v1.endpoints.repositories.get_repositories_async", new_callable=AsyncMock)
 def test_list_repositories_filter_by_type(mock_get_repositories):
     """Test filtering repositories by type with direct endpoint mocking."""
 
@@ -73,7 +73,7 @@ def test_list_repositories_filter_by_type(mock_get_repositories):
     assert data[0]["name"] == "test-repository-2"
     assert data[0]["type"] == "git"
 
-@patch("torero_api.api.v1.endpoints.repositories.get_repositories")
+@patch("torero_api.api.v1.endpoints.repositories.get_repositories_async", new_callable=AsyncMock)
 def test_list_repository_types(mock_get_repositories):
     """Test listing repository types with direct endpoint mocking."""
 
@@ -91,7 +91,7 @@ def test_list_repository_types(mock_get_repositories):
     assert "git" in data
     assert "s3" in data
 
-@patch("torero_api.api.v1.endpoints.repositories.get_repository_by_name")
+@patch("torero_api.api.v1.endpoints.repositories.get_repository_by_name_async", new_callable=AsyncMock)
 def test_get_repository_by_name_found(mock_get_repository_by_name):
     """Test getting a specific repository by name with direct endpoint mocking."""
 
@@ -108,7 +108,7 @@ def test_get_repository_by_name_found(mock_get_repository_by_name):
     assert data["type"] == "git"
     assert data["location"] == "https://github.com/torerodev/torero-services.git"
 
-@patch("torero_api.api.v1.endpoints.repositories.get_repository_by_name")
+@patch("torero_api.api.v1.endpoints.repositories.get_repository_by_name_async", new_callable=AsyncMock)
 def test_get_repository_by_name_not_found(mock_get_repository_by_name):
     """Test getting a non-existent repository with direct endpoint mocking."""
 
@@ -123,7 +123,7 @@ def test_get_repository_by_name_not_found(mock_get_repository_by_name):
     data = response.json()
     assert "not found" in data["detail"]
 
-@patch("torero_api.api.v1.endpoints.repositories.get_repositories")
+@patch("torero_api.api.v1.endpoints.repositories.get_repositories_async", new_callable=AsyncMock)
 def test_exception_handling(mock_get_repositories):
     """Test error handling with direct endpoint mocking."""
 
@@ -0,0 +1,163 @@
+"""
+Test module for the torero API execution scheduler
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+from torero_api.__main__ import parse_concurrency_limits
+from torero_api.core.jobs import JobManager, COMPLETED, QUEUED
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.scheduler import ExecutionScheduler, parse_limits, schedule_context
+from torero_api.server import app
+
+async def settle():
+    """Let woken tasks run."""
+
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+@pytest.mark.anyio
+async def test_type_limit_queues_excess_executions():
+    """Test that executions beyond a type's limit wait for a running one to finish."""
+
+    scheduler = ExecutionScheduler(type_limits={"opentofu-plan": 1})
+    await scheduler.acquire("opentofu-plan", "infra-a")
+
+    # Call the function
+    waiting = asyncio.ensure_future(scheduler.acquire("opentofu-plan", "infra-b"))
+    await settle()
+    assert not waiting.done()
+    assert scheduler.stats()["waiting"]["normal"] == 1
+
+    scheduler.release("opentofu-plan", "infra-a")
+    await settle()
+
+    # Assertions
+    assert waiting.done()
+    assert scheduler.stats()["running"]["services"] == {"infra-b": 1}
+
+@pytest.mark.anyio
+async def test_higher_priority_is_admitted_first():
+    """Test that waiting executions are admitted by priority, then in submission order."""
+
+    scheduler = ExecutionScheduler(type_limits={"ansible-playbook": 1})
+    await scheduler.acquire("ansible-playbook", "running")
+    admitted = []
+
+    async def run(name, priority):
+        with schedule_context(priority):
+            await scheduler.acquire("ansible-playbook", name)
+        admitted.append(name)
+        scheduler.release("ansible-playbook", name)
+
+    # Call the function
+    tasks = [asyncio.ensure_future(run(name, priority)) for name, priority in
+             (("low", "low"), ("normal-1", "normal"), ("high", "high"), ("normal-2", "normal"))]
+    await settle()
+    scheduler.release("ansible-playbook", "running")
+    await asyncio.gather(*tasks)
+
+    # Assertions
+    assert admitted == ["high", "normal-1", "normal-2", "low"]
+
+@pytest.mark.anyio
+async def test_blocked_waiter_does_not_hold_up_others():
+    """Test that an execution waiting for its own caps does not block other types or services."""
+
+    scheduler = ExecutionScheduler(type_limits={"opentofu-plan": 1}, service_limits={"infra": 1})
+    await scheduler.acquire("opentofu-plan", "infra")
+    waiting = asyncio.ensure_future(scheduler.acquire("opentofu-plan", "other"))
+    await settle()
+
+    # Call the function
+    await asyncio.wait_for(scheduler.acquire("python-script", "report"), timeout=1)
+
+    # Assertions
+    assert not waiting.done()
+    assert scheduler.stats()["running"]["types"] == {"opentofu-plan": 1, "python-script": 1}
+    waiting.cancel()
+
+@pytest.mark.anyio
+async def test_service_limit():
+    """Test that a service's own limit applies whatever its type's limit."""
+
+    scheduler = ExecutionScheduler(service_limits={"deploy": 1})
+    await scheduler.acquire("ansible-playbook", "deploy")
+
+    # Call the function and expect an exception
+    with pytest.raises(ToreroBusyError):
+        await scheduler.acquire("ansible-playbook", "deploy", timeout=0.01)
+
+    # Assertions
+    await scheduler.acquire("ansible-playbook", "backup", timeout=0.01)
+    assert scheduler.stats()["waiting"] == {"high": 0, "normal": 0, "low": 0}
+    assert scheduler.stats()["running"]["services"] == {"deploy": 1, "backup": 1}
+
+@pytest.mark.anyio
+async def test_queued_job_reports_position_and_wait_time():
+    """Test that a job held back by the scheduler is queued with its position and wait time."""
+
+    scheduler = ExecutionScheduler(service_limits={"deploy": 1})
+    manager = JobManager()
+    await scheduler.acquire("ansible-playbook", "deploy")
+
+    async def run():
+        async with scheduler.slot("ansible-playbook", "deploy"):
+            return {"return_code": 0}
+
+    # Call the function
+    with patch("torero_api.core.jobs.execution_scheduler", scheduler):
+        first = manager.submit("deploy", "ansible-playbook", run)
+        second = manager.submit("deploy", "ansible-playbook", run, priority="high")
+        await settle()
+        queued = [first.to_dict(), second.to_dict()]
+
+        scheduler.release("ansible-playbook", "deploy")
+        await asyncio.gather(first.task, second.task)
+
+    # Assertions
+    assert [job["status"] for job in queued] == [QUEUED, QUEUED]
+    assert [job["queue_position"] for job in queued] == [2, 1]
+    assert queued[1]["priority"] == "high"
+    assert queued[0]["started_at"] is None and queued[0]["wait_time"] >= 0
+    assert first.status == second.status == COMPLETED
+    assert first.to_dict()["queue_position"] is None
+    assert first.started_at is not None and first.wait_time >= second.wait_time
+
+def test_parse_limits():
+    """Test parsing NAME=N limits from the environment and the command line."""
+
+    assert parse_limits("deploy=1, backup=4,") == {"deploy": 1, "backup": 4}
+    assert parse_concurrency_limits(["opentofu-plan=2"], ["deploy=1"]) == ({"opentofu-plan": 2}, {"deploy": 1})
+    with pytest.raises(ValueError):
+        parse_limits("deploy=0")
+    with pytest.raises(ValueError):
+        parse_concurrency_limits(["terraform=2"], [])
+
+@patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", new_callable=AsyncMock)
+def test_execution_endpoint_priority(mock_get_service):
+    """Test that the priority query parameter is validated and applied to jobs."""
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "python-script"
+    mock_get_service.return_value = service
+    client = TestClient(app)
+
+    # Call the API
+    invalid = client.post("/v1/execute/python-script/hello-python?priority=urgent")
+    with patch("torero_api.api.v1.endpoints.execution.job_manager") as mock_manager:
+        mock_manager.submit.return_value.to_dict.return_value = {
+            "id": "1", "service": "hello-python", "operation": "python-script", "priority": "low",
+            "status": "queued", "queue_position": 3, "wait_time": 0.0, "created_at": "2025-05-26T22:18:41Z"
+        }
+        accepted = client.post("/v1/execute/python-script/hello-python?async=true&priority=low")
+
+    # Assertions
+    assert invalid.status_code == 422
+    assert accepted.status_code == 202
+    assert accepted.json()["queue_position"] == 3
+    assert mock_manager.submit.call_args.args[3] == "low"
@@ -3,7 +3,7 @@ Test module for torero API secrets endpoints
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 from datetime import datetime
 
@@ -39,7 +39,7 @@ TEST_SECRETS = [
 ]
 
 # Direct patching for secret endpoints
-@patch("torero_api.api.v1.endpoints.secrets.get_secrets")
+@patch("torero_api.api.v1.endpoints.secrets.get_secrets_async", new_callable=AsyncMock)
 def test_list_secrets(mock_get_secrets):
     """Test listing all secrets with direct endpoint mocking."""
 
@@ -57,7 +57,7 @@ def test_list_secrets(mock_get_secrets):
     assert data[1]["name"] == "test-secret-2"
     assert data[2]["name"] == "test-secret-3"
 
-@patch("torero_api.api.v1.endpoints.secrets.get_secrets")
+@patch("torero_api.api.v1.endpoints.secrets.get_secrets_async", new_callable=AsyncMock)
 def test_list_secrets_filter_by_type(mock_get_secrets):
     """Test filtering secrets by type with direct endpoint mocking."""
 
@@ -74,7 +74,7 @@ def test_list_secrets_filter_by_type(mock_get_secrets):
     assert data[0]["name"] == "test-secret-2"
     assert data[0]["type"] == "api-key"
 
-@patch("torero_api.api.v1.endpoints.secrets.get_secrets")
+@patch("torero_api.api.v1.endpoints.secrets.get_secrets_async", new_callable=AsyncMock)
 def test_list_secret_types(mock_get_secrets):
     """Test listing secret types with direct endpoint mocking."""
 
@@ -92,7 +92,7 @@ def test_list_secret_types(mock_get_secrets):
     assert "api-key" in data
     assert "token" in data
 
-@patch("torero_api.api.v1.endpoints.secrets.get_secret_by_name")
+@patch("torero_api.api.v1.endpoints.secrets.get_secret_by_name_async", new_callable=AsyncMock)
 def test_get_secret_by_name_found(mock_get_secret_by_name):
     """Test getting a specific secret by name with direct endpoint mocking."""
 
@@ -109,7 +109,7 @@ def test_get_secret_by_name_found(mock_get_secret_by_name):
     assert data["type"] == "api-key"
     assert data["metadata"]["provider"] == "vault"
 
-@patch("torero_api.api.v1.endpoints.secrets.get_secret_by_name")
+@patch("torero_api.api.v1.endpoints.secrets.get_secret_by_name_async", new_callable=AsyncMock)
 def test_get_secret_by_name_not_found(mock_get_secret_by_name):
     """Test getting a non-existent secret with direct endpoint mocking."""
 
@@ -124,7 +124,7 @@ def test_get_secret_by_name_not_found(mock_get_secret_by_name):
     data = response.json()
     assert "not found" in data["detail"]
 
-@patch("torero_api.api.v1.endpoints.secrets.get_secrets")
+@patch("torero_api.api.v1.endpoints.secrets.get_secrets_async", new_callable=AsyncMock)
 def test_exception_handling(mock_get_secrets):
     """Test error handling with direct endpoint mocking."""
 
@@ -4,7 +4,7 @@ Test module for torero API server functionality
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from unittest.mock import patch, AsyncMock
 
 from torero_api.server import create_app, app
 
@@ -46,7 +46,7 @@ def test_docs_endpoint():
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
 
-@patch("torero_api.core.torero_executor.check_torero_available")
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
 def test_health_endpoint_healthy(mock_check_torero):
     """Test health endpoint when torero is available."""
 
@@ -58,7 +58,7 @@ def test_health_endpoint_healthy(mock_check_torero):
     assert data["status"] == "healthy"
     assert data["torero_available"] is True
 
-@patch("torero_api.core.torero_executor.check_torero_available")
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
 def test_health_endpoint_unhealthy(mock_check_torero):
     """Test health endpoint when torero is not available."""
 
@@ -71,7 +71,7 @@ def test_health_endpoint_unhealthy(mock_check_torero):
     assert data["torero_available"] is False
     assert data["reason"] == "torero not found"
 
-@patch("torero_api.core.torero_executor.check_torero_available")
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
 def test_health_endpoint_exception(mock_check_torero):
     """Test health endpoint when an exception occurs."""
 
@@ -3,11 +3,13 @@ Test module for torero API service description endpoint
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+import asyncio
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 
 from torero_api.server import app
 from torero_api.models.service import Service
+from tests.conftest import make_process
 
 # Create a test client using FastAPI's TestClient
 client = TestClient(app)
@@ -57,8 +59,8 @@ SAMPLE_SERVICE_DESCRIPTION = [
     }
 ]
 
-@patch("torero_api.api.v1.endpoints.services.get_service_by_name")
-@patch("torero_api.api.v1.endpoints.services.describe_service")
+@patch("torero_api.api.v1.endpoints.services.get_service_by_name_async", new_callable=AsyncMock)
+@patch("torero_api.api.v1.endpoints.services.describe_service_async", new_callable=AsyncMock)
 def test_describe_service_success(mock_describe_service, mock_get_service_by_name):
     """Test describing a service with success."""
     
@@ -80,7 +82,7 @@ def test_describe_service_success(mock_describe_service, mock_get_service_by_nam
     mock_get_service_by_name.assert_called_once_with("test-service")
     mock_describe_service.assert_called_once_with("test-service")
 
-@patch("torero_api.api.v1.endpoints.services.get_service_by_name")
+@patch("torero_api.api.v1.endpoints.services.get_service_by_name_async", new_callable=AsyncMock)
 def test_describe_service_not_found(mock_get_service_by_name):
     """Test describing a non-existent service."""
     
@@ -96,8 +98,8 @@ def test_describe_service_not_found(mock_get_service_by_name):
     assert "not found" in data["detail"]
     mock_get_service_by_name.assert_called_once_with("non-existent-service")
 
-@patch("torero_api.api.v1.endpoints.services.get_service_by_name")
-@patch("torero_api.api.v1.endpoints.services.describe_service")
+@patch("torero_api.api.v1.endpoints.services.get_service_by_name_async", new_callable=AsyncMock)
+@patch("torero_api.api.v1.endpoints.services.describe_service_async", new_callable=AsyncMock)
 def test_describe_service_error(mock_describe_service, mock_get_service_by_name):
     """Test error handling in describe service endpoint."""
     
@@ -116,17 +118,14 @@ def test_describe_service_error(mock_describe_service, mock_get_service_by_name)
     mock_get_service_by_name.assert_called_once_with("test-service")
     mock_describe_service.assert_called_once_with("test-service")
 
-@patch("torero_api.core.torero_executor.subprocess.run")
-def test_describe_service_executor(mock_run):
+@patch("torero_api.core.torero_executor.asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_describe_service_executor(mock_exec):
     """Test the describe_service function in the torero_executor module."""
     
     from torero_api.core.torero_executor import describe_service
     
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 0
-    process_mock.stdout = '[{"metadata": {"name": "test-service", "description": "Test service"}, "entity": {}, "type": "ansible-playbook"}]'
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(stdout='[{"metadata": {"name": "test-service", "description": "Test service"}, "entity": {}, "type": "ansible-playbook"}]')
     
     # Call the function
     result = describe_service("test-service")
@@ -136,25 +135,20 @@ def test_describe_service_executor(mock_run):
     assert len(result) == 1
     assert result[0]["metadata"]["name"] == "test-service"
     assert result[0]["type"] == "ansible-playbook"
-    mock_run.assert_called_once_with(
-        ["torero", "describe", "service", "test-service", "--raw"],
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=30
+    mock_exec.assert_called_once_with(
+        "torero", "describe", "service", "test-service", "--raw",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
     )
 
-@patch("torero_api.core.torero_executor.subprocess.run")
-def test_describe_service_executor_error(mock_run):
+@patch("torero_api.core.torero_executor.asyncio.create_subprocess_exec", new_callable=AsyncMock)
+def test_describe_service_executor_error(mock_exec):
     """Test error handling in the describe_service function."""
     
     from torero_api.core.torero_executor import describe_service
     
     # Set up the mock
-    process_mock = MagicMock()
-    process_mock.returncode = 1
-    process_mock.stderr = "Error: service not found"
-    mock_run.return_value = process_mock
+    mock_exec.return_value = make_process(returncode=1, stderr="Error: service not found")
     
     # Call the function and expect an exception
     with pytest.raises(RuntimeError) as excinfo:
@@ -162,4 +156,4 @@ def test_describe_service_executor_error(mock_run):
     
     # Assertions
     assert "torero error" in str(excinfo.value)
-    mock_run.assert_called_once()
\ No newline at end of file
+    mock_exec.assert_called_once()
\ No newline at end of file
@@ -3,7 +3,7 @@ Test module for torero API services with direct mocking approach
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi.testclient import TestClient
 
 from torero_api.server import app
@@ -38,7 +38,7 @@ TEST_SERVICES = [
 ]
 
 # Direct patching for service endpoints
-@patch("torero_api.api.v1.endpoints.services.get_services")
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
 def test_list_services(mock_get_services):
     """Test listing all services with direct endpoint mocking."""
 
@@ -56,7 +56,7 @@ def test_list_services(mock_get_services):
     assert data[1]["name"] == "test-service-2"
     assert data[2]["name"] == "test-service-3"
 
-@patch("torero_api.api.v1.endpoints.services.get_services")
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
 def test_list_services_filter_by_type(mock_get_services):
     """Test filtering services by type with direct endpoint mocking."""
 
@@ -73,7 +73,7 @@ def test_list_services_filter_by_type(mock_get_services):
     assert data[0]["name"] == "test-service-1"
     assert data[0]["type"] == "ansible-playbook"
 
-@patch("torero_api.api.v1.endpoints.services.get_services")
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
 def test_list_services_filter_by_tag(mock_get_services):
     """Test filtering services by tag with direct endpoint mocking."""
 
@@ -90,7 +90,7 @@ def test_list_services_filter_by_tag(mock_get_services):
     assert data[0]["name"] == "test-service-3"
     assert "python" in data[0]["tags"]
 
-@patch("torero_api.api.v1.endpoints.services.get_services")
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
 def test_list_service_types(mock_get_services):
     """Test listing service types with direct endpoint mocking."""
 
@@ -108,7 +108,7 @@ def test_list_service_types(mock_get_services):
     assert "opentofu-plan" in data
     assert "python-script" in data
 
-@patch("torero_api.api.v1.endpoints.services.get_services")
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
 def test_list_service_tags(mock_get_services):
     """Test listing service tags with direct endpoint mocking."""
 
@@ -130,7 +130,7 @@ def test_list_service_tags(mock_get_services):
     assert "python" in data
     assert "automation" in data
 
-@patch("torero_api.api.v1.endpoints.services.get_service_by_name")
+@patch("torero_api.api.v1.endpoints.services.get_service_by_name_async", new_callable=AsyncMock)
 def test_get_service_by_name_found(mock_get_service_by_name):
     """Test getting a specific service by name with direct endpoint mocking."""
 
@@ -147,7 +147,7 @@ def test_get_service_by_name_found(mock_get_service_by_name):
     assert data["type"] == "opentofu-plan"
     assert "cloud" in data["tags"]
 
-@patch("torero_api.api.v1.endpoints.services.get_service_by_name")
+@patch("torero_api.api.v1.endpoints.services.get_service_by_name_async", new_callable=AsyncMock)
 def test_get_service_by_name_not_found(mock_get_service_by_name):
     """Test getting a non-existent service with direct endpoint mocking."""
 
@@ -162,7 +162,7 @@ def test_get_service_by_name_not_found(mock_get_service_by_name):
     data = response.json()
     assert "not found" in data["detail"]
 
-@patch("torero_api.api.v1.endpoints.services.get_services")
+@patch("torero_api.api.v1.endpoints.services.get_services_async", new_callable=AsyncMock)
 def test_exception_handling(mock_get_services):
     """Test error handling with direct endpoint mocking."""
 
@@ -178,7 +178,7 @@ def test_exception_handling(mock_get_services):
     assert data["error_type"] == "http_error"
     assert "Test error" in data["detail"]
 
-@patch("torero_api.core.torero_executor.check_torero_available")
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
 def test_health_endpoint_success(mock_check_torero_available):
     """Test the health endpoint when torero is available."""
 
@@ -194,7 +194,7 @@ def test_health_endpoint_success(mock_check_torero_available):
     assert data["status"] == "healthy"
     assert data["torero_available"] is True
 
-@patch("torero_api.core.torero_executor.check_torero_available")
+@patch("torero_api.core.torero_executor.check_torero_available_async", new_callable=AsyncMock)
 def test_health_endpoint_failure(mock_check_torero_available):
     """Test the health endpoint when torero is not available."""
 
@@ -0,0 +1,31 @@
+"""
+Test module for reading settings from the environment
+"""
+
+import pytest
+
+from torero_api.core.settings import read_number
+
+@pytest.mark.parametrize("value, expected", [
+    (None, 7), ("", 7), ("3", 3), ("2.5", 7), ("abc", 7), ("-1", 7), ("0", 7),
+])
+def test_read_number_falls_back_to_the_default(monkeypatch, value, expected):
+    """Test that unset, malformed and non-positive values give the default."""
+
+    # Set up the environment
+    if value is None:
+        monkeypatch.delenv("TORERO_API_TEST_NUMBER", raising=False)
+    else:
+        monkeypatch.setenv("TORERO_API_TEST_NUMBER", value)
+
+    # Assertions
+    assert read_number("TORERO_API_TEST_NUMBER", 7, cast=int) == expected
+
+def test_read_number_zero_and_floats(monkeypatch):
+    """Test that 0 is accepted when allowed and floats are read by default."""
+
+    monkeypatch.setenv("TORERO_API_TEST_NUMBER", "0")
+    assert read_number("TORERO_API_TEST_NUMBER", 5.0, allow_zero=True) == 0.0
+
+    monkeypatch.setenv("TORERO_API_TEST_NUMBER", "0.25")
+    assert read_number("TORERO_API_TEST_NUMBER", 5.0) == 0.25
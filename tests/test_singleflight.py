@@ -0,0 +1,139 @@
+"""
+Test module for single-flight coalescing of torero calls
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from torero_api.core.singleflight import SingleFlight
+from torero_api.core.cache import inventory_cache
+from torero_api.core.torero_executor import (
+    get_services_async,
+    describe_service_async,
+    run_python_script_service_async
+)
+from tests.conftest import make_process
+
+def slow_process(stdout, delay=0.05):
+    """Build a mock process whose output arrives after a short delay."""
+
+    process_mock = make_process(stdout=stdout)
+    
+    async def communicate():
+        await asyncio.sleep(delay)
+        return stdout.encode(), b""
+    
+    process_mock.communicate.side_effect = communicate
+    
+    read = process_mock.stdout.read.side_effect
+    
+    async def delayed_read(n=-1):
+        await asyncio.sleep(delay)
+        return read(n)
+    
+    process_mock.stdout.read.side_effect = delayed_read
+    return process_mock
+
+@pytest.mark.anyio
+async def test_concurrent_calls_share_one_execution():
+    """Test that concurrent callers with the same key run the work once."""
+
+    group = SingleFlight()
+    calls = 0
+    
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+    
+    results = await asyncio.gather(*(group.do("key", work) for _ in range(10)))
+    
+    assert results == [1] * 10
+    assert calls == 1
+    assert group.in_flight() == 0
+
+@pytest.mark.anyio
+async def test_key_released_after_completion():
+    """Test that a call after completion starts a new execution."""
+
+    group = SingleFlight()
+    work = AsyncMock(side_effect=[1, 2])
+    
+    assert await group.do("key", work) == 1
+    assert await group.do("key", work) == 2
+
+@pytest.mark.anyio
+async def test_errors_propagate_to_all_callers():
+    """Test that every caller sees the shared exception."""
+
+    group = SingleFlight()
+    
+    async def work():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("torero error")
+    
+    results = await asyncio.gather(*(group.do("key", work) for _ in range(3)), return_exceptions=True)
+    
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert group.in_flight() == 0
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling one waiter leaves the shared call running."""
+
+    group = SingleFlight()
+    
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+    
+    first = asyncio.ensure_future(group.do("key", work))
+    second = asyncio.ensure_future(group.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    
+    assert await second == "done"
+
+@pytest.mark.anyio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_get_services_coalesced(mock_exec):
+    """Test that concurrent get_services calls spawn a single torero process."""
+
+    mock_exec.return_value = slow_process(json.dumps([{"name": "svc", "type": "python-script"}]))
+    
+    with patch.object(inventory_cache, "get_ttl", return_value=0):
+        results = await asyncio.gather(*(get_services_async() for _ in range(20)))
+    
+    assert all(r[0].name == "svc" for r in results)
+    mock_exec.assert_called_once()
+
+@pytest.mark.anyio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_describe_coalesced_per_name(mock_exec):
+    """Test that describe calls are coalesced by argv, not across names."""
+
+    mock_exec.side_effect = lambda *args, **kwargs: slow_process(json.dumps([{"metadata": {"name": args[3]}}]))
+    
+    results = await asyncio.gather(
+        describe_service_async("a"),
+        describe_service_async("a"),
+        describe_service_async("b")
+    )
+    
+    assert [r[0]["metadata"]["name"] for r in results] == ["a", "a", "b"]
+    assert mock_exec.call_count == 2
+
+@pytest.mark.anyio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_run_service_not_coalesced(mock_exec):
+    """Test that service executions are never coalesced."""
+
+    result = {"return_code": 0, "stdout": "", "stderr": "", "start_time": "", "end_time": "", "elapsed_time": 0}
+    mock_exec.side_effect = lambda *args, **kwargs: slow_process(json.dumps(result))
+    
+    await asyncio.gather(*(run_python_script_service_async("script") for _ in range(3)))
+    
+    assert mock_exec.call_count == 3
@@ -0,0 +1,156 @@
+"""
+Test module for streaming service execution output
+"""
+
+import sqlite3
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+
+from torero_api.api.v1.endpoints.execution import format_event
+from torero_api.core.backends import CommandResult, ToreroBackend
+from torero_api.core.history import execution_history
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.torero_executor import stream_service_execution
+from torero_api.server import app
+from tests.conftest import parse_events
+
+class FakeBackend(ToreroBackend):
+    """Backend answering every command with a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.commands = []
+
+    async def run(self, command, timeout):
+        self.commands.append(list(command))
+        return self.result
+
+@pytest.mark.anyio
+async def test_stream_service_execution_events():
+    """Test that an execution yields start, output lines and an end event."""
+
+    # Set up the mock
+    backend = FakeBackend(CommandResult(0, "PLAY [all]\nok: [localhost]\n", "warning\n"))
+
+    # Call the function
+    with patch("torero_api.core.torero_executor.get_backend", return_value=backend):
+        events = [event async for event in stream_service_execution("opentofu-plan", "infra", "apply")]
+
+    # Assertions
+    assert backend.commands == [["torero", "run", "service", "opentofu-plan", "apply", "infra"]]
+    assert events[0][0] == "start"
+    assert events[0][1]["operation"] == "opentofu-plan/apply"
+    assert events[1:4] == [("stdout", "PLAY [all]"), ("stdout", "ok: [localhost]"), ("stderr", "warning")]
+    assert events[-1][0] == "end"
+    assert events[-1][1]["return_code"] == 0
+    assert events[-1][1]["elapsed_time"] >= 0
+    records, _ = execution_history.query()
+    assert [(r["service"], r["operation"], r["status"]) for r in records] == [("infra", "opentofu-plan/apply", "succeeded")]
+
+@pytest.mark.anyio
+async def test_disconnect_is_recorded_in_the_background():
+    """Test that a stream closed by its client is recorded without a history failure masking the close."""
+
+    # Set up the mock
+    backend = FakeBackend(CommandResult(0, "line\n", ""))
+
+    with patch("torero_api.core.torero_executor.get_backend", return_value=backend):
+        # Call the function
+        events = stream_service_execution("python-script", "report")
+        assert (await events.__anext__())[0] == "start"
+        await events.aclose()
+        await execution_history.drain()
+
+        # A broken history is logged, and the generator still closes cleanly
+        with patch.object(execution_history, "record", side_effect=sqlite3.OperationalError("disk I/O error")):
+            events = stream_service_execution("python-script", "report")
+            await events.__anext__()
+            await events.aclose()
+            await execution_history.drain()
+
+    # Assertions
+    records, _ = execution_history.query()
+    assert [(r["service"], r["status"], r["error"]) for r in records] == [
+        ("report", "error", "Execution stopped: the client disconnected")
+    ]
+
+@pytest.mark.anyio
+async def test_stream_service_execution_rejects_unknown_type():
+    """Test that only executable service types are accepted."""
+
+    with pytest.raises(ValueError):
+        async for _ in stream_service_execution("unknown", "svc"):
+            pass
+
+def test_format_event():
+    """Test that payloads are encoded as SSE data fields."""
+
+    assert format_event("stdout", "hello") == "event: stdout\ndata: hello\n\n"
+    assert format_event("stdout", "") == "event: stdout\ndata: \n\n"
+    assert format_event("stdout", "a\rb") == "event: stdout\ndata: a\ndata: b\n\n"
+    assert format_event("end", {"return_code": 0}) == 'event: end\ndata: {"return_code": 0}\n\n'
+
+@patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", new_callable=AsyncMock)
+def test_execution_endpoint_streams_events(mock_get_service):
+    """Test that 'Accept: text/event-stream' relays the output as Server-Sent Events."""
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "python-script"
+    mock_get_service.return_value = service
+    backend = FakeBackend(CommandResult(2, "line 1\nline 2\n", "boom\n"))
+    client = TestClient(app)
+
+    # Call the API
+    with patch("torero_api.core.torero_executor.get_backend", return_value=backend):
+        response = client.post("/v1/execute/python-script/hello-python", headers={"Accept": "text/event-stream"})
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    assert [event for event, _ in events] == ["start", "stdout", "stdout", "stderr", "end"]
+    assert events[1][1] == "line 1"
+    assert '"return_code": 2' in events[-1][1]
+
+@patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", new_callable=AsyncMock)
+def test_execution_endpoint_stream_busy(mock_get_service):
+    """Test that a streaming request without a free process slot still gets 503."""
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "ansible-playbook"
+    mock_get_service.return_value = service
+    client = TestClient(app)
+
+    # Call the API
+    with patch("torero_api.core.torero_executor.process_limiter.slot", side_effect=ToreroBusyError("busy")):
+        response = client.post("/v1/execute/ansible-playbook/hello-ansible", headers={"Accept": "text/event-stream"})
+
+    # Assertions
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+
+@patch("torero_api.api.v1.endpoints.execution.get_service_by_name_async", new_callable=AsyncMock)
+def test_execution_endpoint_stream_reports_errors(mock_get_service):
+    """Test that an execution breaking off mid-stream ends with an error event."""
+
+    async def events(*args):
+        yield "start", {"service": "hello-python"}
+        yield "stdout", "partial"
+        raise RuntimeError("Service execution timed out after 5 minutes")
+
+    # Set up the mocks
+    service = MagicMock()
+    service.type = "python-script"
+    mock_get_service.return_value = service
+    client = TestClient(app)
+
+    # Call the API
+    with patch("torero_api.api.v1.endpoints.execution.stream_service_execution", side_effect=events):
+        response = client.post("/v1/execute/python-script/hello-python", headers={"Accept": "text/event-stream"})
+
+    # Assertions
+    events = parse_events(response.text)
+    assert events[-1] == ("error", '{"detail": "Service execution timed out after 5 minutes"}')
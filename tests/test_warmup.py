@@ -0,0 +1,131 @@
+"""
+Test module for the torero API startup warm-up
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from torero_api.core.warmup import Warmup, warmup_enabled, warmup_services, warmup_timeout
+from torero_api.server import app
+
+@pytest.mark.anyio
+async def test_warmup_loads_every_kind_concurrently():
+    """Test that the warm-up loads all kinds at once and then describes the configured services."""
+
+    in_flight = 0
+    peak = 0
+
+    async def load(kind):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    # Set up the mocks
+    with patch("torero_api.core.warmup.health_probe.check", AsyncMock(return_value={"available": True, "message": "ok"})), \
+         patch("torero_api.core.warmup.get_inventory_snapshot_async", side_effect=load) as mock_load, \
+         patch("torero_api.core.warmup.describe_many_async", AsyncMock(return_value={"svc": [{}]})) as mock_describe:
+        warmup = Warmup(kinds=("services", "secrets", "registries"), describe_services=["svc"])
+        assert not warmup.ready
+
+        # Call the function
+        await warmup.run()
+
+    # Assertions
+    assert warmup.ready
+    assert peak == 3
+    assert sorted(call.args[0] for call in mock_load.call_args_list) == ["registries", "secrets", "services"]
+    mock_describe.assert_awaited_once_with("services", ["svc"])
+    assert warmup.status()["errors"] == {}
+
+@pytest.mark.anyio
+async def test_warmup_records_errors_and_still_finishes():
+    """Test that failed steps are reported and do not keep the node from becoming ready."""
+
+    async def load(kind):
+        if kind == "services":
+            raise RuntimeError("torero error: boom")
+
+    # Set up the mocks
+    with patch("torero_api.core.warmup.health_probe.check", AsyncMock(return_value={"available": False, "message": "torero executable not found in PATH"})), \
+         patch("torero_api.core.warmup.get_inventory_snapshot_async", side_effect=load), \
+         patch("torero_api.core.warmup.describe_many_async", AsyncMock()) as mock_describe:
+        warmup = Warmup(kinds=("services", "secrets"), describe_services=["svc"])
+
+        # Call the function
+        await warmup.run()
+
+    # Assertions
+    status = warmup.status()
+    assert status["ready"]
+    assert status["errors"] == {"torero": "torero executable not found in PATH", "services": "torero error: boom"}
+    mock_describe.assert_not_awaited()
+
+@pytest.mark.anyio
+async def test_warmup_timeout():
+    """Test that a hanging warm-up marks the node ready once the timeout passes."""
+
+    async def hang(kind):
+        await asyncio.sleep(10)
+
+    # Set up the mocks
+    with patch("torero_api.core.warmup.health_probe.check", AsyncMock(return_value={"available": True, "message": "ok"})), \
+         patch("torero_api.core.warmup.get_inventory_snapshot_async", side_effect=hang):
+        warmup = Warmup(kinds=("services",), timeout=0.05)
+
+        # Call the function
+        await warmup.run()
+
+    # Assertions
+    assert warmup.ready
+    assert "did not finish" in warmup.status()["errors"]["warmup"]
+
+def test_warmup_settings(monkeypatch):
+    """Test reading the warm-up settings from the environment."""
+
+    monkeypatch.delenv("TORERO_API_WARMUP", raising=False)
+    monkeypatch.setenv("TORERO_API_WARMUP_SERVICES", "a, b,,c")
+    monkeypatch.setenv("TORERO_API_WARMUP_TIMEOUT", "-1")
+
+    assert warmup_enabled()
+    assert warmup_services() == ["a", "b", "c"]
+    assert warmup_timeout() == 60.0
+
+    monkeypatch.setenv("TORERO_API_WARMUP", "off")
+    assert not warmup_enabled()
+
+def test_ready_endpoint_gates_on_warmup():
+    """Test that /ready answers 503 until the warm-up has finished."""
+
+    client = TestClient(app)
+    warmup = Warmup(kinds=())
+
+    with patch.object(app.state, "warmup", warmup, create=True):
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+        with patch("torero_api.core.warmup.health_probe.check", AsyncMock(return_value={"available": True, "message": "ok"})):
+            asyncio.run(warmup.run())
+
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["ready"] is True
+
+def test_lifespan_runs_warmup(monkeypatch):
+    """Test that the application lifespan starts the warm-up unless it is disabled."""
+
+    monkeypatch.setenv("TORERO_API_REFRESH", "0")
+    monkeypatch.setenv("TORERO_API_WARMUP", "0")
+    with TestClient(app) as client:
+        assert app.state.warmup is None
+        assert client.get("/ready").status_code == 200
+
+    monkeypatch.delenv("TORERO_API_WARMUP")
+    with patch("torero_api.core.warmup.Warmup.start") as mock_start:
+        with TestClient(app):
+            assert isinstance(app.state.warmup, Warmup)
+        mock_start.assert_called_once()
@@ -0,0 +1,143 @@
+"""
+Test module for the torero state watcher
+"""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import patch
+
+from torero_api.core.cache import RESOURCE_KINDS, InventoryCache, inventory_cache
+from torero_api.core.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_watcher,
+    invalidate_changed,
+    kinds_for_path,
+    start_watcher,
+    stop_watcher
+)
+
+def test_kinds_for_path():
+    """Test mapping changed paths to resource kinds."""
+
+    root = "/home/user/.torero.d"
+
+    assert kinds_for_path(f"{root}/services/hello.yaml", root) == {"services"}
+    assert kinds_for_path(f"{root}/registries.json", root) == {"registries"}
+    assert kinds_for_path(f"{root}/repository/git-repo", root) == {"repositories"}
+    assert kinds_for_path(f"{root}/torero.db", root) == set(RESOURCE_KINDS)
+    assert kinds_for_path(f"{root}/services/.hello.yaml.swp", root) == set()
+
+def test_invalidate_changed_only_affected_kind():
+    """Test that a change invalidates only the affected kind."""
+
+    with patch.object(inventory_cache, "get_ttl", return_value=60):
+        inventory_cache.put("services", ["s"])
+        inventory_cache.put("secrets", ["x"])
+
+        kinds = invalidate_changed(["/data/services/svc.yaml"], "/data")
+
+        assert kinds == {"services"}
+        assert inventory_cache.get("services") is None
+        assert inventory_cache.get("secrets") == ["x"]
+
+def test_watched_cache_does_not_expire():
+    """Test that entries do not expire by age while the cache is watched."""
+
+    cache = InventoryCache(default_ttl=10)
+    with patch("torero_api.core.cache.time.monotonic", return_value=100.0):
+        cache.put("services", ["s"])
+
+    cache.set_watched(True)
+    with patch("torero_api.core.cache.time.monotonic", return_value=10000.0):
+        assert cache.get("services") == ["s"]
+        assert cache.status()["services"]["stale"] is False
+
+    cache.set_watched(False)
+    with patch("torero_api.core.cache.time.monotonic", return_value=10000.0):
+        assert cache.get("services") is None
+
+@pytest.mark.parametrize("value, expected", [("2.5", 2.5), ("fast", 1.0), ("-3", 1.0), ("", 1.0)])
+def test_polling_interval_from_environment(tmp_path, value, expected):
+    """Test that the polling interval is read from the environment, falling back to the default."""
+
+    # Set up the mock
+    with patch.object(InotifyWatcher, "available", return_value=False), \
+         patch.dict(os.environ, {"TORERO_API_WATCH_POLL_INTERVAL": value}):
+        # Call the function
+        watcher = create_watcher(str(tmp_path))
+
+    # Assertions
+    assert isinstance(watcher, PollingWatcher)
+    assert watcher.interval == expected
+
+@pytest.mark.anyio
+async def test_polling_watcher_reports_changes(tmp_path):
+    """Test that the polling watcher reports added, modified and removed files."""
+
+    services = tmp_path / "services"
+    services.mkdir()
+    existing = services / "a.yaml"
+    existing.write_text("a")
+
+    batches = []
+    watcher = PollingWatcher(str(tmp_path), batches.append, interval=60)
+    watcher.start()
+
+    try:
+        added = services / "b.yaml"
+        added.write_text("b")
+        os.utime(existing, ns=(0, 0))
+
+        assert watcher.poll() == {str(added), str(existing)}
+        await asyncio.sleep(0.1)
+
+        assert batches == [{str(added), str(existing)}]
+    finally:
+        await watcher.stop()
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not InotifyWatcher.available(), reason="inotify not available")
+async def test_inotify_watcher_reports_changes(tmp_path):
+    """Test that inotify reports changes, including in directories created later."""
+
+    batches = []
+    watcher = InotifyWatcher(str(tmp_path), batches.append)
+    watcher.start()
+
+    try:
+        secrets = tmp_path / "secrets"
+        secrets.mkdir()
+        await asyncio.sleep(0.1)
+        (secrets / "token").write_text("x")
+        await asyncio.sleep(0.1)
+
+        changed = set().union(*batches)
+        assert str(secrets) in changed
+        assert str(secrets / "token") in changed
+    finally:
+        await watcher.stop()
+
+@pytest.mark.anyio
+async def test_start_watcher_switches_cache_mode(tmp_path):
+    """Test that starting and stopping the watcher toggles watched mode."""
+
+    watcher = start_watcher(str(tmp_path))
+
+    try:
+        assert watcher is not None
+        assert inventory_cache.watched
+    finally:
+        await stop_watcher(watcher)
+
+    assert not inventory_cache.watched
+
+@pytest.mark.anyio
+async def test_start_watcher_missing_directory(tmp_path):
+    """Test that a missing directory leaves the cache on TTLs."""
+
+    watcher = start_watcher(str(tmp_path / "missing"))
+
+    assert watcher is None
+    assert not inventory_cache.watched
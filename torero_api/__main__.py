@@ -14,6 +14,16 @@ import atexit
 from pathlib import Path
 from torero_api.server import start_server
 from torero_api.core.torero_executor import check_torero_available, check_torero_version
+from torero_api.core.cache import RESOURCE_KINDS, configure_inventory_cache
+from torero_api.core.describe_cache import configure_describe_cache
+from torero_api.core.jobs import configure_job_manager
+from torero_api.core.idempotency import configure_idempotency_store
+from torero_api.core.outputs import configure_output_store
+from torero_api.core.history import configure_execution_history
+from torero_api.core.scheduler import SERVICE_TYPES, configure_execution_scheduler, parse_limits
+from torero_api.core.limiter import configure_process_limits
+from torero_api.core.backends import BACKENDS, configure_backend
+from torero_api.core.fastdecode import DECODERS, fast_decode_available
 
 # Configure logging
 logging.basicConfig(
@@ -172,6 +182,310 @@ def check_daemon_running(pid_file):
             pass
         return False, None
 
+def parse_kind_ttls(values):
+    """
+    Parse KIND=SECONDS cache TTL overrides from the command line.
+    
+    Args:
+        values: List of strings such as "services=30"
+        
+    Returns:
+        dict: Mapping of resource kind to TTL in seconds
+        
+    Raises:
+        ValueError: If a value is malformed, names an unknown kind, or is negative
+    """
+    ttls = {}
+    for value in values:
+        kind, sep, seconds = value.partition("=")
+        if not sep or kind not in RESOURCE_KINDS:
+            raise ValueError(
+                f"Invalid cache TTL override '{value}', expected KIND=SECONDS "
+                f"with KIND one of: {', '.join(RESOURCE_KINDS)}"
+            )
+        ttl = float(seconds)
+        if ttl < 0:
+            raise ValueError(f"Cache TTL for {kind} must not be negative")
+        ttls[kind] = ttl
+    return ttls
+
+def parse_concurrency_limits(type_values, service_values):
+    """
+    Parse TYPE=N and NAME=N execution concurrency limits from the command line.
+    
+    Args:
+        type_values: List of strings such as "opentofu-plan=2"
+        service_values: List of strings such as "infrastructure-deploy=1"
+        
+    Returns:
+        tuple: Mapping of service type to limit, and mapping of service name to limit
+        
+    Raises:
+        ValueError: If a value is malformed, names an unknown service type, or is not positive
+    """
+    type_limits = parse_limits(",".join(type_values))
+    for service_type in type_limits:
+        if service_type not in SERVICE_TYPES:
+            raise ValueError(
+                f"Invalid concurrency limit for '{service_type}', expected TYPE=N "
+                f"with TYPE one of: {', '.join(SERVICE_TYPES)}"
+            )
+    return type_limits, parse_limits(",".join(service_values))
+
+def apply_cache_settings(cache_ttl, kind_ttls, max_stale=None, refresh=True, watch=False, watch_dir=None):
+    """
+    Apply inventory cache settings from the command line.
+    
+    The settings are applied to the running process and exported as
+    environment variables so that reloader worker processes pick them up.
+    
+    Args:
+        cache_ttl: Default TTL in seconds, or None to keep the environment/default value
+        kind_ttls: Mapping of resource kind to TTL in seconds
+        max_stale: Seconds past the TTL to serve stale inventories, or None to keep the environment/default value
+        refresh: False to disable the background inventory refresher
+        watch: True to invalidate inventories when torero's data directory changes
+        watch_dir: Directory to watch, or None to keep the environment/default value
+    """
+    if cache_ttl is not None:
+        os.environ["TORERO_API_CACHE_TTL"] = str(cache_ttl)
+    for kind, ttl in kind_ttls.items():
+        os.environ[f"TORERO_API_CACHE_TTL_{kind.upper()}"] = str(ttl)
+    if max_stale is not None:
+        os.environ["TORERO_API_CACHE_MAX_STALE"] = str(max_stale)
+    if not refresh:
+        os.environ["TORERO_API_REFRESH"] = "0"
+    if watch:
+        os.environ["TORERO_API_WATCH"] = "1"
+    if watch_dir is not None:
+        os.environ["TORERO_API_WATCH_DIR"] = watch_dir
+    
+    configure_inventory_cache(default_ttl=cache_ttl, ttls=kind_ttls, max_stale=max_stale)
+
+def apply_describe_cache_settings(max_entries, max_bytes, concurrency=None):
+    """
+    Apply describe cache bounds from the command line.
+    
+    Like the cache settings, the values are applied to the running process and
+    exported as environment variables for reloader worker processes.
+    
+    Args:
+        max_entries: Maximum number of cached describe results, or None to keep the environment/default value
+        max_bytes: Maximum total size of cached describe results, or None to keep the environment/default value
+        concurrency: Describe commands a bulk describe runs at once, or None to keep the environment/default value
+    """
+    if max_entries is not None:
+        os.environ["TORERO_API_DESCRIBE_CACHE_ENTRIES"] = str(max_entries)
+    if max_bytes is not None:
+        os.environ["TORERO_API_DESCRIBE_CACHE_BYTES"] = str(max_bytes)
+    if concurrency is not None:
+        os.environ["TORERO_API_DESCRIBE_CONCURRENCY"] = str(concurrency)
+    
+    configure_describe_cache(max_entries=max_entries, max_bytes=max_bytes)
+
+def apply_job_settings(retention, max_jobs, max_wait=None):
+    """
+    Apply background job settings from the command line.
+    
+    The values are applied to the running process and exported as environment
+    variables for reloader worker processes.
+    
+    Args:
+        retention: Seconds finished jobs are kept, or None to keep the environment/default value
+        max_jobs: Maximum number of tracked jobs, or None to keep the environment/default value
+        max_wait: Seconds a job waits for a process slot, or None to keep the environment/default value
+    """
+    if retention is not None:
+        os.environ["TORERO_API_JOB_RETENTION"] = str(retention)
+    if max_jobs is not None:
+        os.environ["TORERO_API_MAX_JOBS"] = str(max_jobs)
+    if max_wait is not None:
+        os.environ["TORERO_API_JOB_MAX_WAIT"] = str(max_wait)
+    
+    configure_job_manager(retention=retention, max_jobs=max_jobs, max_wait=max_wait)
+
+def apply_idempotency_settings(retention, max_keys):
+    """
+    Apply idempotency key settings from the command line.
+    
+    The values are applied to the running process and exported as environment
+    variables for reloader worker processes.
+    
+    Args:
+        retention: Seconds finished executions are kept for repeated requests, or None to keep the environment/default value
+        max_keys: Maximum number of tracked idempotency keys, or None to keep the environment/default value
+    """
+    if retention is not None:
+        os.environ["TORERO_API_IDEMPOTENCY_RETENTION"] = str(retention)
+    if max_keys is not None:
+        os.environ["TORERO_API_IDEMPOTENCY_MAX_KEYS"] = str(max_keys)
+    
+    configure_idempotency_store(retention=retention, max_keys=max_keys)
+
+def apply_output_settings(spool_threshold, preview_bytes, retention, directory, max_outputs, max_bytes):
+    """
+    Apply execution output settings from the command line.
+    
+    The values are applied to the running process and exported as environment
+    variables for reloader worker processes.
+    
+    Args:
+        spool_threshold: Bytes of output per stream kept in memory before spooling to disk, or None to keep the environment/default value
+        preview_bytes: Bytes of head and of tail included in execution results, or None to keep the environment/default value
+        retention: Seconds complete outputs can be downloaded, or None to keep the environment/default value
+        directory: Directory for spool files, or None to keep the environment/default value
+        max_outputs: Maximum number of kept outputs, or None to keep the environment/default value
+        max_bytes: Maximum total size of kept outputs, or None to keep the environment/default value
+    """
+    if spool_threshold is not None:
+        os.environ["TORERO_API_OUTPUT_SPOOL_THRESHOLD"] = str(spool_threshold)
+    if preview_bytes is not None:
+        os.environ["TORERO_API_OUTPUT_PREVIEW_BYTES"] = str(preview_bytes)
+    if retention is not None:
+        os.environ["TORERO_API_OUTPUT_RETENTION"] = str(retention)
+    if directory is not None:
+        os.environ["TORERO_API_OUTPUT_DIR"] = directory
+    if max_outputs is not None:
+        os.environ["TORERO_API_OUTPUT_MAX_COUNT"] = str(max_outputs)
+    if max_bytes is not None:
+        os.environ["TORERO_API_OUTPUT_MAX_BYTES"] = str(max_bytes)
+    
+    configure_output_store(
+        spool_threshold=spool_threshold,
+        preview_bytes=preview_bytes,
+        retention=retention,
+        directory=directory,
+        max_outputs=max_outputs,
+        max_bytes=max_bytes
+    )
+
+def apply_scheduler_settings(type_limits, service_limits):
+    """
+    Apply execution scheduler settings from the command line.
+    
+    The values are applied to the running process and exported as environment
+    variables for reloader worker processes.
+    
+    Args:
+        type_limits: Mapping of service type to maximum concurrent executions
+        service_limits: Mapping of service name to maximum concurrent executions
+    """
+    for service_type, limit in type_limits.items():
+        os.environ[f"TORERO_API_MAX_CONCURRENT_{service_type.upper().replace('-', '_')}"] = str(limit)
+    if service_limits:
+        combined = parse_limits(os.environ.get("TORERO_API_SERVICE_CONCURRENCY", ""))
+        combined.update(service_limits)
+        os.environ["TORERO_API_SERVICE_CONCURRENCY"] = ",".join(f"{name}={limit}" for name, limit in combined.items())
+    
+    configure_execution_scheduler(type_limits=type_limits, service_limits=service_limits)
+
+def apply_batch_settings(concurrency):
+    """
+    Apply batch execution settings from the command line.
+    
+    The value is exported as an environment variable, which batch requests
+    read when they start, so reloader worker processes pick it up as well.
+    
+    Args:
+        concurrency: Executions a batch request runs at once
+    """
+    if concurrency is not None:
+        os.environ["TORERO_API_BATCH_CONCURRENCY"] = str(concurrency)
+
+def apply_history_settings(enabled, path):
+    """
+    Apply execution history settings from the command line.
+    
+    The values are applied to the running process and exported as environment
+    variables for reloader worker processes.
+    
+    Args:
+        enabled: False to stop recording executions
+        path: Path of the history database, or None to keep the environment/default value
+    """
+    if not enabled:
+        os.environ["TORERO_API_HISTORY"] = "0"
+    if path is not None:
+        os.environ["TORERO_API_HISTORY_DB"] = path
+    
+    configure_execution_history(path=path, enabled=False if not enabled else None)
+
+def apply_warmup_settings(warmup, warmup_services, warmup_timeout, health_interval=None):
+    """
+    Apply startup warm-up settings from the command line.
+    
+    The values are exported as environment variables, which the warm-up
+    reads when the application starts.
+    
+    Args:
+        warmup: False to skip the warm-up
+        warmup_services: Comma-separated names of services to describe, or None to keep the environment value
+        warmup_timeout: Maximum seconds of warm-up, or None to keep the environment/default value
+        health_interval: Seconds between background torero health checks, or None to keep the environment/default value
+    """
+    if not warmup:
+        os.environ["TORERO_API_WARMUP"] = "0"
+    if warmup_services is not None:
+        os.environ["TORERO_API_WARMUP_SERVICES"] = warmup_services
+    if warmup_timeout is not None:
+        os.environ["TORERO_API_WARMUP_TIMEOUT"] = str(warmup_timeout)
+    if health_interval is not None:
+        os.environ["TORERO_API_HEALTH_INTERVAL"] = str(health_interval)
+
+def apply_limit_settings(args):
+    """
+    Apply torero process limiter settings from the command line.
+    
+    Like the cache settings, the values are applied to the running process and
+    exported as environment variables for reloader worker processes.
+    
+    Args:
+        args: Parsed command-line arguments
+    """
+    settings = {
+        "TORERO_API_MAX_PROCESSES": args.max_processes,
+        "TORERO_API_MAX_READ_PROCESSES": args.max_read_processes,
+        "TORERO_API_MAX_EXECUTE_PROCESSES": args.max_execute_processes,
+        "TORERO_API_MAX_QUEUED": args.max_queued,
+        "TORERO_API_QUEUE_TIMEOUT": args.queue_timeout,
+    }
+    for variable, value in settings.items():
+        if value is not None:
+            os.environ[variable] = str(value)
+    
+    configure_process_limits(
+        max_processes=args.max_processes,
+        max_read_processes=args.max_read_processes,
+        max_execute_processes=args.max_execute_processes,
+        max_queued=args.max_queued,
+        queue_timeout=args.queue_timeout
+    )
+
+def apply_backend_settings(backend, server_address):
+    """
+    Select the torero executor backend from the command line.
+    
+    Like the cache settings, the values are applied to the running process and
+    exported as environment variables for reloader worker processes.
+    
+    Args:
+        backend: Backend name, or None to keep the environment/default value
+        server_address: torero server address, or None to keep the environment value
+        
+    Raises:
+        ValueError: If the server backend is selected without an address
+    """
+    if backend is not None:
+        os.environ["TORERO_API_BACKEND"] = backend
+    if server_address is not None:
+        os.environ["TORERO_API_SERVER_ADDRESS"] = server_address
+    
+    if backend is not None or server_address is not None:
+        configure_backend(
+            os.environ.get("TORERO_API_BACKEND", "cli"),
+            os.environ.get("TORERO_API_SERVER_ADDRESS")
+        )
+
 def main():
     """
     Main entry point for the torero API CLI.
@@ -199,9 +513,128 @@ def main():
     parser.add_argument("--pid-file", default="/tmp/torero-api.pid", help="PID file for daemon mode")
     parser.add_argument("--log-file", default="/tmp/torero-api.log", help="Log file for daemon mode")
     
+    # Inventory cache options
+    parser.add_argument("--cache-ttl", type=float, default=None,
+                        help="Seconds to cache torero inventories, 0 disables caching; unset uses TORERO_API_CACHE_TTL or 5")
+    parser.add_argument("--cache-ttl-kind", action="append", default=[], metavar="KIND=SECONDS",
+                        help="Cache TTL for a single resource kind, e.g. services=30 (repeatable)")
+    parser.add_argument("--cache-max-stale", type=float, default=None,
+                        help="Seconds past the TTL during which stale inventories are served while being refreshed; unset uses TORERO_API_CACHE_MAX_STALE or 300")
+    parser.add_argument("--no-refresh", action="store_true",
+                        help="Disable the background refresh of cached inventories")
+    parser.add_argument("--watch", action="store_true",
+                        help="Invalidate cached inventories when torero's data directory changes instead of relying on TTLs")
+    parser.add_argument("--watch-dir", default=None,
+                        help="torero data directory to watch; unset uses TORERO_API_WATCH_DIR or ~/.torero.d")
+    parser.add_argument("--describe-cache-entries", type=int, default=None,
+                        help="Maximum number of cached describe results, 0 disables the describe cache; unset uses TORERO_API_DESCRIBE_CACHE_ENTRIES or 1024")
+    parser.add_argument("--describe-cache-bytes", type=int, default=None,
+                        help="Maximum total size in bytes of cached describe results; unset uses TORERO_API_DESCRIBE_CACHE_BYTES or 16777216")
+    parser.add_argument("--describe-concurrency", type=int, default=None,
+                        help="Describe commands a bulk describe request runs at once; unset uses TORERO_API_DESCRIBE_CONCURRENCY or 8")
+    
+    # Startup warm-up options
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Skip preloading the inventories at startup; /ready then reports ready immediately")
+    parser.add_argument("--warmup-services", default=None, metavar="NAME[,NAME...]",
+                        help="Services to describe during the warm-up; unset uses TORERO_API_WARMUP_SERVICES")
+    parser.add_argument("--warmup-timeout", type=float, default=None,
+                        help="Maximum seconds the warm-up may take before the node reports ready anyway; unset uses TORERO_API_WARMUP_TIMEOUT or 60")
+    parser.add_argument("--health-interval", type=float, default=None,
+                        help="Seconds between background torero checks served by /health; unset uses TORERO_API_HEALTH_INTERVAL or 30")
+    
+    # Background job options
+    parser.add_argument("--job-retention", type=float, default=None,
+                        help="Seconds finished execution jobs are kept for GET /v1/jobs/{id}; unset uses TORERO_API_JOB_RETENTION or 3600")
+    parser.add_argument("--max-jobs", type=int, default=None,
+                        help="Maximum number of execution jobs tracked at once; unset uses TORERO_API_MAX_JOBS or 1000")
+    parser.add_argument("--job-max-wait", type=float, default=None,
+                        help="Seconds after its submission a job stops waiting for a torero process slot and fails; unset uses TORERO_API_JOB_MAX_WAIT or 3600")
+    
+    # Idempotency key options
+    parser.add_argument("--idempotency-retention", type=float, default=None,
+                        help="Seconds a finished execution is returned to requests repeating its Idempotency-Key; unset uses TORERO_API_IDEMPOTENCY_RETENTION or 3600")
+    parser.add_argument("--idempotency-max-keys", type=int, default=None,
+                        help="Maximum number of idempotency keys tracked at once; unset uses TORERO_API_IDEMPOTENCY_MAX_KEYS or 10000")
+    
+    # Execution output options
+    parser.add_argument("--output-spool-threshold", type=int, default=None,
+                        help="Bytes of execution output per stream kept in memory before spooling to disk; unset uses TORERO_API_OUTPUT_SPOOL_THRESHOLD or 1048576")
+    parser.add_argument("--output-preview-bytes", type=int, default=None,
+                        help="Bytes of the head and of the tail of long output included in execution results; unset uses TORERO_API_OUTPUT_PREVIEW_BYTES or 16384")
+    parser.add_argument("--output-retention", type=float, default=None,
+                        help="Seconds the complete output of truncated results can be downloaded; unset uses TORERO_API_OUTPUT_RETENTION or 3600")
+    parser.add_argument("--output-dir", default=None,
+                        help="Directory for spooled execution output; unset uses TORERO_API_OUTPUT_DIR or the system temporary directory")
+    parser.add_argument("--output-max-count", type=int, default=None,
+                        help="Maximum number of complete outputs kept for download, oldest dropped first; unset uses TORERO_API_OUTPUT_MAX_COUNT or 100")
+    parser.add_argument("--output-max-bytes", type=int, default=None,
+                        help="Maximum total size of complete outputs kept for download, oldest dropped first; unset uses TORERO_API_OUTPUT_MAX_BYTES or 1073741824")
+    
+    # Execution scheduler options
+    parser.add_argument("--type-concurrency", action="append", default=[], metavar="TYPE=N",
+                        help="Maximum concurrent executions of a service type, e.g. opentofu-plan=2 (repeatable); unset uses TORERO_API_MAX_CONCURRENT_<TYPE>")
+    parser.add_argument("--service-concurrency", action="append", default=[], metavar="NAME=N",
+                        help="Maximum concurrent executions of one service, e.g. infrastructure-deploy=1 (repeatable); unset uses TORERO_API_SERVICE_CONCURRENCY")
+    parser.add_argument("--batch-concurrency", type=int, default=None,
+                        help="Executions a batch execution request runs at once; unset uses TORERO_API_BATCH_CONCURRENCY or 8")
+    
+    # Execution history options
+    parser.add_argument("--no-history", action="store_true",
+                        help="Do not record executions in the execution history served at /v1/executions (recorded by default; unset uses TORERO_API_HISTORY)")
+    parser.add_argument("--history-db", default=None,
+                        help="Path of the execution history database; unset uses TORERO_API_HISTORY_DB or ~/.torero-api/history.db")
+    
+    # Process limiter options
+    parser.add_argument("--max-processes", type=int, default=None,
+                        help="Maximum concurrent torero processes; unset uses TORERO_API_MAX_PROCESSES or 32")
+    parser.add_argument("--max-read-processes", type=int, default=None,
+                        help="Maximum concurrent get/describe commands; unset uses TORERO_API_MAX_READ_PROCESSES or 16")
+    parser.add_argument("--max-execute-processes", type=int, default=None,
+                        help="Maximum concurrent service executions; unset uses TORERO_API_MAX_EXECUTE_PROCESSES or 16")
+    parser.add_argument("--max-queued", type=int, default=None,
+                        help="Maximum commands waiting for a process slot before requests get 503; unset uses TORERO_API_MAX_QUEUED or 256")
+    parser.add_argument("--queue-timeout", type=float, default=None,
+                        help="Maximum seconds a command waits for a process slot; unset uses TORERO_API_QUEUE_TIMEOUT or 30")
+    
+    # Executor backend options
+    parser.add_argument("--backend", default=None, choices=BACKENDS,
+                        help="How torero commands are run: spawn the CLI or use a torero server; unset uses TORERO_API_BACKEND or cli")
+    parser.add_argument("--torero-server", default=None, metavar="ADDRESS",
+                        help="torero server address for the server backend, HOST:PORT or unix:/path; unset uses TORERO_API_SERVER_ADDRESS")
+    parser.add_argument("--decoder", default=None, choices=DECODERS,
+                        help="How inventories are decoded: stream into models, or fast into compact records (requires msgspec); unset uses TORERO_API_DECODER or stream")
+    
     # Parse arguments
     args = parser.parse_args()
     
+    # Validate cache settings before doing anything else
+    if args.cache_ttl is not None and args.cache_ttl < 0:
+        parser.error("--cache-ttl must not be negative")
+    if args.cache_max_stale is not None and args.cache_max_stale < 0:
+        parser.error("--cache-max-stale must not be negative")
+    for option in ("describe_cache_entries", "describe_cache_bytes"):
+        value = getattr(args, option)
+        if value is not None and value < 0:
+            parser.error(f"--{option.replace('_', '-')} must not be negative")
+    try:
+        kind_ttls = parse_kind_ttls(args.cache_ttl_kind)
+        type_limits, service_limits = parse_concurrency_limits(args.type_concurrency, args.service_concurrency)
+    except ValueError as e:
+        parser.error(str(e))
+    for option in ("warmup_timeout", "health_interval", "describe_concurrency", "batch_concurrency", "job_retention", "max_jobs", "job_max_wait", "idempotency_retention", "idempotency_max_keys", "output_spool_threshold", "output_preview_bytes", "output_retention", "output_max_count", "output_max_bytes", "max_processes", "max_read_processes", "max_execute_processes", "max_queued", "queue_timeout"):
+        value = getattr(args, option)
+        if value is not None and value <= 0:
+            parser.error(f"--{option.replace('_', '-')} must be positive")
+    try:
+        apply_backend_settings(args.backend, args.torero_server)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.decoder == "fast" and not fast_decode_available():
+        parser.error("--decoder fast requires msgspec (pip install torero-api[fast])")
+    if args.decoder is not None:
+        os.environ["TORERO_API_DECODER"] = args.decoder
+    
     # Show version information if requested
     if args.version:
         from torero_api import __version__
@@ -252,11 +685,27 @@ def main():
         
         logger.info(f"Daemon started successfully (PID: {os.getpid()})")
     
-    # Check if torero is available before starting the server
-    available, message = check_torero_available()
-    if not available:
-        logger.warning(f"torero not available: {message}")
-        logger.warning("The API will start, but some functionality may not work correctly.")
+    # Apply inventory cache and process limiter settings
+    apply_cache_settings(
+        args.cache_ttl,
+        kind_ttls,
+        args.cache_max_stale,
+        refresh=not args.no_refresh,
+        watch=args.watch,
+        watch_dir=args.watch_dir
+    )
+    apply_describe_cache_settings(args.describe_cache_entries, args.describe_cache_bytes, args.describe_concurrency)
+    apply_limit_settings(args)
+    apply_job_settings(args.job_retention, args.max_jobs, args.job_max_wait)
+    apply_idempotency_settings(args.idempotency_retention, args.idempotency_max_keys)
+    apply_output_settings(args.output_spool_threshold, args.output_preview_bytes, args.output_retention, args.output_dir,
+                          args.output_max_count, args.output_max_bytes)
+    apply_scheduler_settings(type_limits, service_limits)
+    apply_batch_settings(args.batch_concurrency)
+    apply_history_settings(not args.no_history, args.history_db)
+    apply_warmup_settings(not args.no_warmup, args.warmup_services, args.warmup_timeout, args.health_interval)
+    
+    # torero availability is checked by the startup warm-up, off the critical path
     
     # Start the server
     try:
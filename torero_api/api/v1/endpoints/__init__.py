@@ -11,6 +11,10 @@ Current endpoints:
 - repositories: Endpoints for discovering and filtering torero repositories
 - secrets: Endpoints for discovering and filtering torero secrets
 - execution: Endpoints for executing torero services
+- jobs: Endpoints for following executions run as background jobs
+- outputs: Endpoints for downloading the complete output of executions
+- executions: Endpoints for listing past executions from the execution history
+- bulk: Shared support for the bulk describe endpoints
 
 All endpoints follow RESTful principles and provide comprehensive
 OpenAPI documentation for MCP compatibility.
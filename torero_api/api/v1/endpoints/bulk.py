@@ -0,0 +1,53 @@
+"""
+Bulk describe support for the torero API endpoints
+
+The services, decorators, repositories and secrets routers each expose a
+POST <kind>/describe endpoint that describes many items at once. This module
+holds the part they share: running the concurrent describes and turning each
+item's outcome into a DescribeResult with the status code the single-item
+describe endpoint would have returned.
+"""
+
+import logging
+from typing import Dict, List
+
+from torero_api.models.common import DescribeResult
+from torero_api.core.torero_executor import describe_many_async
+from torero_api.core.limiter import ToreroBusyError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+async def bulk_describe(kind: str, names: List[str]) -> Dict[str, DescribeResult]:
+    """
+    Describe several items of one kind concurrently.
+
+    Args:
+        kind: The resource kind, e.g. "services"
+        names: Names of the items to describe
+
+    Returns:
+        Dict[str, DescribeResult]: The outcome per name, in request order
+
+    Raises:
+        ToreroBusyError: If the inventory could not be loaded because torero is busy.
+        RuntimeError: If the inventory could not be loaded.
+    """
+    logger.info(f"Describing {len(names)} {kind}")
+    outcomes = await describe_many_async(kind, names)
+
+    results = {}
+    for name, outcome in outcomes.items():
+        if isinstance(outcome, LookupError):
+            results[name] = DescribeResult(status_code=404, error=str(outcome))
+        elif isinstance(outcome, ToreroBusyError):
+            results[name] = DescribeResult(status_code=503, error=str(outcome))
+        elif isinstance(outcome, Exception):
+            logger.error(f"Error describing {kind} '{name}': {str(outcome)}")
+            results[name] = DescribeResult(status_code=500, error=str(outcome))
+        else:
+            results[name] = DescribeResult(status_code=200, description=outcome)
+
+    failed = sum(1 for result in results.values() if result.status_code != 200)
+    logger.info(f"Described {len(results) - failed} of {len(results)} {kind}")
+    return results
@@ -4,12 +4,17 @@ Decorators endpoints for torero API
 This module defines the API endpoints for interacting with torero decorators.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path, Depends
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Body
+from typing import Optional, List, Union, Dict
 import logging
 
 from torero_api.models.decorator import Decorator
-from torero_api.core.torero_executor import get_decorators, get_decorator_by_name, describe_decorator
+from torero_api.models.common import FacetCount, BulkDescribeRequest, DescribeResult
+from torero_api.core.torero_executor import get_decorators_async, get_decorator_by_name_async, describe_decorator_async
+from torero_api.core.fastdecode import as_model, as_models
+from torero_api.core.inventory import facet_counts, select_items
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.api.v1.endpoints.bulk import bulk_describe
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -49,7 +54,7 @@ def common_parameters(
     - List all authentication decorators: GET /v1/decorators/?type=authentication
     """
 )
-def list_decorators(
+async def list_decorators(
     commons: dict = Depends(common_parameters),
     type: Optional[str] = Query(
         None, 
@@ -71,27 +76,29 @@ def list_decorators(
     """
     try:
         logger.info(f"Getting decorators with filter - type: {type}")
-        decorators = get_decorators()
+        decorators = await get_decorators_async()
         
-        # Apply filters if provided
-        if type:
-            decorators = [d for d in decorators if d.type == type]
-            
-        # Apply pagination
-        skip = commons["skip"]
-        limit = commons["limit"]
-        paginated_decorators = decorators[skip:skip + limit]
+        # Apply filters and pagination, using the inventory's type index
+        paginated_decorators = select_items(
+            decorators,
+            type=type or None,
+            skip=commons["skip"],
+            limit=commons["limit"]
+        )
         
         logger.info(f"Returning {len(paginated_decorators)} decorators after filtering")
-        return paginated_decorators
+        return as_models(paginated_decorators)
     
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_decorators: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
     "/types", 
-    response_model=List[str],
+    response_model=Union[List[str], List[FacetCount]],
     summary="List decorator types",
     description="""
     Return a list of unique decorator types used by registered decorators.
@@ -103,27 +110,40 @@ def list_decorators(
     - Building UI dropdown filters
     - Understanding what types of decorators are available
     - Validating type values for new decorators
+    
+    With `?counts=true`, each type is returned with the number of decorators
+    using it, e.g. for rendering histograms without fetching the full list.
     """
 )
-def list_decorator_types():
+async def list_decorator_types(
+    counts: bool = Query(False, description="Include the number of decorators per type")
+):
     """
     Return a list of unique decorator types used by registered decorators.
     
-    Retrieves all decorators and extracts the unique set of decorator types,
-    returning them as a sorted list.
+    Served from the type facet precomputed for the cached inventory snapshot.
+    
+    Args:
+        counts: Whether to include the number of decorators per type
     
     Returns:
         List[str]: Sorted list of unique decorator type strings
+        List[FacetCount]: With counts, each value and its number of items, sorted by value
     
     Raises:
         HTTPException: If an error occurs while retrieving decorators
     """
     try:
         logger.info("Getting decorator types")
-        decorators = get_decorators()
-        types = sorted(set(d.type for d in decorators))
+        decorators = await get_decorators_async()
+        types = facet_counts(decorators, "type")
         logger.info(f"Returning {len(types)} decorator types")
-        return types
+        if counts:
+            return [FacetCount(value=value, count=count) for value, count in types]
+        return [value for value, _ in types]
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_decorator_types: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -142,7 +162,7 @@ def list_decorator_types():
     If no decorator is found with the specified name, a 404 error is returned.
     """
 )
-def get_decorator(
+async def get_decorator(
     name: str = Path(
         ..., 
         description="Name of the decorator to retrieve"
@@ -162,11 +182,11 @@ def get_decorator(
     """
     try:
         logger.info(f"Getting decorator details for: {name}")
-        decorator = get_decorator_by_name(name)
+        decorator = await get_decorator_by_name_async(name)
         
         if decorator:
             logger.info(f"Found decorator: {name}")
-            return decorator
+            return as_model(decorator)
                 
         # If we get here, the decorator was not found
         logger.warning(f"Decorator not found: {name}")
@@ -175,6 +195,9 @@ def get_decorator(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error retrieving decorator: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -194,7 +217,7 @@ def get_decorator(
     If no decorator is found with the specified name, a 404 error is returned.
     """
 )
-def describe_decorator_detail(
+async def describe_decorator_detail(
     name: str = Path(
         ..., 
         description="Name of the decorator to describe",
@@ -228,13 +251,13 @@ def describe_decorator_detail(
         logger.info(f"Getting detailed description for decorator: {name}")
         
         # First verify the decorator exists
-        decorator = get_decorator_by_name(name)
+        decorator = await get_decorator_by_name_async(name)
         if not decorator:
             logger.warning(f"Decorator not found: {name}")
             raise HTTPException(status_code=404, detail=f"Decorator '{name}' not found")
         
         # Get detailed description
-        description = describe_decorator(name)
+        description = await describe_decorator_async(name)
         
         if description is None:
             logger.warning(f"Could not retrieve detailed description for decorator: {name}")
@@ -245,9 +268,53 @@ def describe_decorator_detail(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error getting detailed decorator description: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         logger.error(f"Error in get_decorator: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post(
+    "/describe",
+    response_model=Dict[str, DescribeResult],
+    summary="Describe several decorators",
+    description="""
+    Get the detailed descriptions of several decorators in one request.
+    
+    The describe commands run concurrently, a bounded number at a time
+    (TORERO_API_DESCRIBE_CONCURRENCY, default 8), instead of one request and
+    one torero process after another.
+    
+    The response maps each requested name to its result. Every result carries
+    the status code the single-item describe endpoint would have returned:
+    200 with the description, or 404/500/503 with an error message, so one
+    failing decorator does not fail the whole request.
+    """
+)
+async def describe_decorators_bulk(
+    request: BulkDescribeRequest = Body(..., description="Names of the decorators to describe")
+):
+    """
+    Get the detailed descriptions of several decorators.
+    
+    Args:
+        request: The names of the decorators to describe
+        
+    Returns:
+        Dict[str, DescribeResult]: The outcome per decorator name
+        
+    Raises:
+        HTTPException: If the decorators inventory cannot be retrieved
+    """
+    try:
+        return await bulk_describe("decorators", request.names)
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
+    except Exception as e:
+        logger.error(f"Error in describe_decorators_bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
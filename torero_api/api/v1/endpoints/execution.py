@@ -2,20 +2,64 @@
 Execution endpoints for torero API
 
 This module defines the API endpoints for executing torero services.
+
+Every execution endpoint runs the service synchronously by default and
+returns its result. With ?async=true (or a 'Prefer: respond-async' header)
+it answers 202 right away with a job instead, which is then polled at
+GET /v1/jobs/{id}; use this for long-running services.
+
+Requests sent with 'Accept: text/event-stream' get the execution's output
+live instead, as Server-Sent Events: a "start" event once torero runs, one
+"stdout" or "stderr" event per output line, and a final "end" event with
+the return code and timings (or an "error" event if the execution broke
+off). The output is relayed as it is produced and never buffered whole.
+
+Executions are admitted by the execution scheduler; ?priority=high|normal|low
+sets the priority class an execution waits in while other executions of the
+same type or service use up their concurrency caps.
+
+Synchronous and async requests may carry an Idempotency-Key header: repeats
+of a request with the same key attach to its execution (or get its stored
+result, or its job) instead of running the service again, and are marked
+with an 'Idempotent-Replayed: true' header.
+
+POST /v1/execute/batch runs many executions in one request: every item is
+checked against one services snapshot, then the valid ones run at most
+?concurrency at a time. Results are reported per item, as they complete when
+streamed; in async mode every item becomes a job of its own.
 """
 
-from fastapi import APIRouter, HTTPException, Path, Query
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Path, Query, Header, Depends
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from typing import Dict, Any, List, Literal, NamedTuple, Optional, Callable, Awaitable, AsyncIterator
+from contextlib import asynccontextmanager
+import asyncio
+import json
 import logging
 
-from torero_api.models.execution import ServiceExecutionResult
+from torero_api.models.execution import (
+    ServiceExecutionResult,
+    ExecutionJob,
+    BatchExecutionItem,
+    BatchExecutionRequest,
+    BatchExecutionResult
+)
 from torero_api.core.torero_executor import (
-    run_ansible_playbook_service, 
-    run_python_script_service,
-    run_opentofu_plan_apply_service,
-    run_opentofu_plan_destroy_service, 
-    get_service_by_name
+    run_ansible_playbook_service_async, 
+    run_python_script_service_async,
+    run_opentofu_plan_apply_service_async,
+    run_opentofu_plan_destroy_service_async, 
+    get_service_by_name_async,
+    stream_service_execution,
+    batch_concurrency,
+    plan_executions_async,
+    run_many_async,
+    run_service_async
 )
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.jobs import job_manager
+from torero_api.core.scheduler import DEFAULT_PRIORITY, current_ticket, schedule_context
+from torero_api.core.idempotency import IdempotencyKeyError, idempotency_store, request_fingerprint
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -23,9 +67,399 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter()
 
+# Documented alternative responses of the execution endpoints in streaming and async mode
+EXECUTION_RESPONSES = {
+    200: {
+        "content": {"text/event-stream": {"schema": {"type": "string"}}},
+        "description": "Execution result, or its live output as Server-Sent Events with 'Accept: text/event-stream'"
+    },
+    202: {
+        "model": ExecutionJob,
+        "description": "Execution accepted as a background job (async mode); poll the Location URL for the result"
+    },
+    422: {
+        "description": "Invalid parameters, or an Idempotency-Key already used for a different request"
+    }
+}
+
+# Documented alternative responses of the batch endpoint in streaming and async mode
+BATCH_RESPONSES = {
+    200: {
+        "content": {"text/event-stream": {"schema": {"type": "string"}}},
+        "description": "Per-item results, or one 'result' event per item as it completes with 'Accept: text/event-stream'"
+    },
+    202: {
+        "model": List[BatchExecutionResult],
+        "description": "Items accepted as background jobs (async mode); poll each job for its result"
+    }
+}
+
+def async_mode(
+    run_async: bool = Query(
+        False,
+        alias="async",
+        description="Run the service as a background job and return 202 with the job instead of waiting for the result"
+    ),
+    prefer: Optional[str] = Header(
+        None,
+        description="'respond-async' has the same effect as ?async=true"
+    )
+) -> bool:
+    """
+    Check whether the client asked for asynchronous execution.
+    
+    Args:
+        run_async: The async query parameter
+        prefer: The Prefer request header (RFC 7240)
+        
+    Returns:
+        bool: True if the execution should run as a background job
+    """
+    if run_async:
+        return True
+    return prefer is not None and "respond-async" in [p.strip().lower() for p in prefer.split(",")]
+
+def execution_priority(
+    priority: Literal["high", "normal", "low"] = Query(
+        DEFAULT_PRIORITY,
+        description="Priority class of the execution while it waits for other executions of its type or service"
+    )
+) -> str:
+    """
+    Get the priority class the client asked for.
+    
+    Args:
+        priority: The priority query parameter
+        
+    Returns:
+        str: "high", "normal" or "low"
+    """
+    return priority
+
+def idempotency_key_header(
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        description="Unique key of this request; repeats with the same key return the same execution instead of running the service again"
+    )
+) -> Optional[str]:
+    """
+    Get the idempotency key of the request.
+    
+    Args:
+        idempotency_key: The Idempotency-Key request header
+        
+    Returns:
+        Optional[str]: The key, or None if the request has none
+    """
+    return idempotency_key
+
+def idempotency_error(error: IdempotencyKeyError) -> HTTPException:
+    """
+    Turn an idempotency key error into an HTTP error.
+    
+    Args:
+        error: The error
+        
+    Returns:
+        HTTPException: 422 if the key belongs to another request, otherwise 400
+    """
+    return HTTPException(status_code=422 if error.conflict else 400, detail=str(error))
+
+def stream_mode(
+    accept: Optional[str] = Header(
+        None,
+        description="'text/event-stream' streams the output live as Server-Sent Events"
+    )
+) -> bool:
+    """
+    Check whether the client asked for the output as Server-Sent Events.
+    
+    Args:
+        accept: The Accept request header
+        
+    Returns:
+        bool: True if the output should be streamed
+    """
+    return accept is not None and "text/event-stream" in accept.lower()
+
+def format_event(event: str, data: Any) -> str:
+    """
+    Format one Server-Sent Event.
+    
+    Args:
+        event: The event name
+        data: The payload; anything but a string is sent as JSON
+        
+    Returns:
+        str: The event, terminated by a blank line
+    """
+    if not isinstance(data, str):
+        data = json.dumps(data)
+    # A line break in the payload would end the data field early
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n"
+
+async def stream_execution(
+    service_type: str,
+    name: str,
+    operation: Optional[str] = None,
+    idempotency_key: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Start an execution and relay its output as Server-Sent Events.
+    
+    torero is started before the response is returned, so a busy limiter
+    or a failure to start is still answered with a regular error status.
+    
+    Args:
+        service_type: The service type, e.g. "python-script"
+        name: The service name
+        operation: "apply" or "destroy" for OpenTofu plans, otherwise None
+        idempotency_key: The request's Idempotency-Key, which live output cannot honour
+        
+    Returns:
+        StreamingResponse: The event stream
+        
+    Raises:
+        HTTPException: If the request carries an idempotency key
+        ToreroBusyError: If no process slot became available in time
+        RuntimeError: If torero could not be started
+    """
+    if idempotency_key is not None:
+        # Live output cannot be replayed to a repeat, so the key could not be honoured
+        raise HTTPException(
+            status_code=400,
+            detail="Idempotency-Key is not supported for streamed executions; use async mode instead"
+        )
+    
+    events = stream_service_execution(service_type, name, operation)
+    first = await events.__anext__()
+    logger.info(f"Streaming {service_type} service {name}")
+    
+    async def body() -> AsyncIterator[str]:
+        try:
+            yield format_event(*first)
+            async for event, data in events:
+                yield format_event(event, data)
+        except Exception as e:
+            logger.error(f"Error streaming {service_type} service {name}: {str(e)}")
+            yield format_event("error", {"detail": str(e)})
+        finally:
+            await events.aclose()
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def submit_job(
+    name: str,
+    operation: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    priority: str = DEFAULT_PRIORITY,
+    idempotency_key: Optional[str] = None
+) -> JSONResponse:
+    """
+    Start an execution as a background job, once per idempotency key.
+    
+    Args:
+        name: The service name
+        operation: What is run, e.g. "ansible-playbook"
+        run: Coroutine function that executes the service
+        priority: Priority class of the execution
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        JSONResponse: 202 with the job and a Location header pointing at it
+        
+    Raises:
+        HTTPException: If the idempotency key is invalid or belongs to another request
+    """
+    headers = {}
+    if idempotency_key is None:
+        job = job_manager.submit(name, operation, run, priority)
+    else:
+        fingerprint = request_fingerprint(operation, name, mode="async")
+        try:
+            job, replayed = idempotency_store.submit(
+                idempotency_key, fingerprint, lambda: job_manager.submit(name, operation, run, priority)
+            )
+        except IdempotencyKeyError as e:
+            raise idempotency_error(e)
+        if replayed:
+            headers["Idempotent-Replayed"] = "true"
+    
+    logger.info(f"Accepted {operation} service {name} as job {job.id}")
+    headers["Location"] = f"/v1/jobs/{job.id}"
+    return JSONResponse(
+        status_code=202,
+        content=ExecutionJob(**job.to_dict()).model_dump(),
+        headers=headers
+    )
+
+class ExecutionRequest(NamedTuple):
+    """
+    How the client asked for a single execution to be run.
+    
+    Attributes:
+        run_async: Whether to run the service as a background job
+        stream: Whether to stream the output as Server-Sent Events
+        priority: Priority class of the execution
+        idempotency_key: The request's Idempotency-Key, if any
+        response: The response, to mark replayed results
+    """
+    run_async: bool
+    stream: bool
+    priority: str
+    idempotency_key: Optional[str]
+    response: Response
+
+def execution_request(
+    response: Response,
+    run_async: bool = Depends(async_mode),
+    stream: bool = Depends(stream_mode),
+    priority: str = Depends(execution_priority),
+    idempotency_key: Optional[str] = Depends(idempotency_key_header)
+) -> ExecutionRequest:
+    """
+    Collect the execution options of a request.
+    
+    Args:
+        response: The response, to mark replayed results
+        run_async: Whether to run the service as a background job
+        stream: Whether to stream the output as Server-Sent Events
+        priority: Priority class of the execution
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        ExecutionRequest: The options
+    """
+    return ExecutionRequest(run_async, stream, priority, idempotency_key, response)
+
+# Service type names used in the messages of the single execution endpoints
+SERVICE_TYPE_NAMES = {
+    "ansible-playbook": "an Ansible playbook",
+    "python-script": "a Python script",
+    "opentofu-plan": "an OpenTofu plan"
+}
+
+async def wait_for_execution(
+    name: str,
+    operation: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    response: Response,
+    priority: str = DEFAULT_PRIORITY,
+    idempotency_key: Optional[str] = None
+) -> ServiceExecutionResult:
+    """
+    Run an execution and wait for its result, once per idempotency key.
+    
+    Args:
+        name: The service name
+        operation: What is run, e.g. "ansible-playbook"
+        run: Coroutine function that executes the service
+        response: The response, to mark replayed results
+        priority: Priority class of the execution
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        ServiceExecutionResult: The results of the service execution
+        
+    Raises:
+        HTTPException: If the idempotency key is invalid or belongs to another request
+    """
+    with schedule_context(priority):
+        if idempotency_key is None:
+            result = await run()
+        else:
+            fingerprint = request_fingerprint(operation, name, mode="sync")
+            try:
+                result, replayed = await idempotency_store.execute(idempotency_key, fingerprint, run)
+            except IdempotencyKeyError as e:
+                raise idempotency_error(e)
+            if replayed:
+                response.headers["Idempotent-Replayed"] = "true"
+    
+    # Convert the result to the response model
+    return ServiceExecutionResult(**result)
+
+async def run_execution(
+    service_type: str,
+    name: str,
+    request: ExecutionRequest,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    action: Optional[str] = None
+):
+    """
+    Run a single service execution the way the client asked for.
+    
+    The service is checked first, then run as a background job, streamed
+    or awaited depending on the request.
+    
+    Args:
+        service_type: The type the service must have, e.g. "python-script"
+        name: The service name
+        request: The execution options of the request
+        run: Coroutine function that executes the service
+        action: "apply" or "destroy" for OpenTofu plans, otherwise None
+        
+    Returns:
+        ServiceExecutionResult: The results of the service execution
+        JSONResponse: In async mode, 202 with the submitted job
+        StreamingResponse: In streaming mode, the live output
+        
+    Raises:
+        HTTPException: If the service is not found, has another type, or execution fails
+        ToreroBusyError: If no process slot became available in time
+    """
+    operation = f"{service_type}/{action}" if action else service_type
+    try:
+        logger.info(f"Running {operation} service: {name}")
+        
+        # First, verify the service exists and has the expected type
+        service = await get_service_by_name_async(name)
+        if not service:
+            logger.warning(f"Service not found: {name}")
+            raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
+            
+        if service.type != service_type:
+            type_name = SERVICE_TYPE_NAMES[service_type]
+            logger.warning(f"Service {name} is not {type_name} (type: {service.type})")
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Service '{name}' is not {type_name} (type: {service.type})"
+            )
+        
+        # In async mode, run the service as a background job
+        if request.run_async:
+            return submit_job(name, operation, run, request.priority, request.idempotency_key)
+        
+        # Relay the output live if the client asked for an event stream
+        if request.stream:
+            with schedule_context(request.priority):
+                return await stream_execution(service_type, name, action, idempotency_key=request.idempotency_key)
+        
+        # Execute the service, once per idempotency key
+        return await wait_for_execution(
+            name, operation, run, request.response, request.priority, request.idempotency_key
+        )
+        
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
+    except Exception as e:
+        logger.error(f"Error running {operation} service {name}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post(
     "/ansible-playbook/{name}", 
     response_model=ServiceExecutionResult, 
+    responses=EXECUTION_RESPONSES,
     summary="Run Ansible playbook service", 
     description="""
     Execute a registered torero Ansible playbook service by name.
@@ -40,7 +474,7 @@ router = APIRouter()
     If no service is found with the specified name, a 404 error is returned.
     """
 )
-def run_ansible_service(
+async def run_ansible_service(
     name: str = Path(
         ..., 
         description="Name of the Ansible playbook service to run",
@@ -56,52 +490,30 @@ def run_ansible_service(
                 "value": "hello-ansible"
             }
         }
-    )
+    ),
+    request: ExecutionRequest = Depends(execution_request)
 ):
     """
     Execute a registered torero Ansible playbook service.
     
     Args:
         name: The name of the Ansible playbook service to run
+        request: The execution options of the request
         
     Returns:
         ServiceExecutionResult: The results of the service execution
+        JSONResponse: In async mode, 202 with the submitted job
+        StreamingResponse: In streaming mode, the live output
         
     Raises:
         HTTPException: If the service is not found, is not an Ansible playbook, or execution fails
     """
-    try:
-        logger.info(f"Running Ansible playbook service: {name}")
-        
-        # First, verify the service exists and is an Ansible playbook
-        service = get_service_by_name(name)
-        if not service:
-            logger.warning(f"Service not found: {name}")
-            raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
-            
-        if service.type != "ansible-playbook":
-            logger.warning(f"Service {name} is not an Ansible playbook (type: {service.type})")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Service '{name}' is not an Ansible playbook (type: {service.type})"
-            )
-        
-        # Execute the service
-        result = run_ansible_playbook_service(name)
-        
-        # Convert the result to the response model
-        return ServiceExecutionResult(**result)
-        
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f"Error running Ansible playbook service: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await run_execution("ansible-playbook", name, request, lambda: run_ansible_playbook_service_async(name))
 
 @router.post(
     "/python-script/{name}", 
     response_model=ServiceExecutionResult, 
+    responses=EXECUTION_RESPONSES,
     summary="Run Python script service", 
     description="""
     Execute a registered torero Python script service by name.
@@ -116,7 +528,7 @@ def run_ansible_service(
     If no service is found with the specified name, a 404 error is returned.
     """
 )
-def run_python_script(
+async def run_python_script(
     name: str = Path(
         ..., 
         description="Name of the Python script service to run",
@@ -132,52 +544,30 @@ def run_python_script(
                 "value": "data-processor"
             }
         }
-    )
+    ),
+    request: ExecutionRequest = Depends(execution_request)
 ):
     """
     Execute a registered torero Python script service.
     
     Args:
         name: The name of the Python script service to run
+        request: The execution options of the request
         
     Returns:
         ServiceExecutionResult: The results of the service execution
+        JSONResponse: In async mode, 202 with the submitted job
+        StreamingResponse: In streaming mode, the live output
         
     Raises:
         HTTPException: If the service is not found, is not a Python script, or execution fails
     """
-    try:
-        logger.info(f"Running Python script service: {name}")
-        
-        # First, verify the service exists and is a Python script
-        service = get_service_by_name(name)
-        if not service:
-            logger.warning(f"Service not found: {name}")
-            raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
-            
-        if service.type != "python-script":
-            logger.warning(f"Service {name} is not a Python script (type: {service.type})")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Service '{name}' is not a Python script (type: {service.type})"
-            )
-        
-        # Execute the service
-        result = run_python_script_service(name)
-        
-        # Convert the result to the response model
-        return ServiceExecutionResult(**result)
-        
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f"Error running Python script service: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await run_execution("python-script", name, request, lambda: run_python_script_service_async(name))
 
 @router.post(
     "/opentofu-plan/{name}/apply", 
     response_model=ServiceExecutionResult, 
+    responses=EXECUTION_RESPONSES,
     summary="Apply OpenTofu plan service", 
     description="""
     Execute a registered torero OpenTofu plan service to apply infrastructure changes.
@@ -192,7 +582,7 @@ def run_python_script(
     If no service is found with the specified name, a 404 error is returned.
     """
 )
-def apply_opentofu_plan(
+async def apply_opentofu_plan(
     name: str = Path(
         ..., 
         description="Name of the OpenTofu plan service to apply",
@@ -208,52 +598,30 @@ def apply_opentofu_plan(
                 "value": "cloud-resources"
             }
         }
-    )
+    ),
+    request: ExecutionRequest = Depends(execution_request)
 ):
     """
     Apply a registered torero OpenTofu plan service.
     
     Args:
         name: The name of the OpenTofu plan service to apply
+        request: The execution options of the request
         
     Returns:
         ServiceExecutionResult: The results of the service execution
+        JSONResponse: In async mode, 202 with the submitted job
+        StreamingResponse: In streaming mode, the live output
         
     Raises:
         HTTPException: If the service is not found, is not an OpenTofu plan, or execution fails
     """
-    try:
-        logger.info(f"Applying OpenTofu plan service: {name}")
-        
-        # First, verify the service exists and is an OpenTofu plan
-        service = get_service_by_name(name)
-        if not service:
-            logger.warning(f"Service not found: {name}")
-            raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
-            
-        if service.type != "opentofu-plan":
-            logger.warning(f"Service {name} is not an OpenTofu plan (type: {service.type})")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Service '{name}' is not an OpenTofu plan (type: {service.type})"
-            )
-        
-        # Execute the service
-        result = run_opentofu_plan_apply_service(name)
-        
-        # Convert the result to the response model
-        return ServiceExecutionResult(**result)
-        
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        logger.error(f"Error applying OpenTofu plan service: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await run_execution("opentofu-plan", name, request, lambda: run_opentofu_plan_apply_service_async(name), "apply")
 
 @router.post(
     "/opentofu-plan/{name}/destroy", 
     response_model=ServiceExecutionResult, 
+    responses=EXECUTION_RESPONSES,
     summary="Destroy OpenTofu plan service resources", 
     description="""
     Execute a registered torero OpenTofu plan service to destroy infrastructure resources.
@@ -270,7 +638,7 @@ def apply_opentofu_plan(
     WARNING: This operation will destroy infrastructure resources and cannot be undone.
     """
 )
-def destroy_opentofu_plan(
+async def destroy_opentofu_plan(
     name: str = Path(
         ..., 
         description="Name of the OpenTofu plan service to destroy",
@@ -286,45 +654,307 @@ def destroy_opentofu_plan(
                 "value": "cloud-resources"
             }
         }
-    )
+    ),
+    request: ExecutionRequest = Depends(execution_request)
 ):
     """
     Destroy resources managed by a registered torero OpenTofu plan service.
     
     Args:
         name: The name of the OpenTofu plan service to destroy
+        request: The execution options of the request
         
     Returns:
         ServiceExecutionResult: The results of the service execution
+        JSONResponse: In async mode, 202 with the submitted job
+        StreamingResponse: In streaming mode, the live output
         
     Raises:
         HTTPException: If the service is not found, is not an OpenTofu plan, or execution fails
     """
+    return await run_execution("opentofu-plan", name, request, lambda: run_opentofu_plan_destroy_service_async(name), "destroy")
+
+def batch_result(index: int, item: BatchExecutionItem, operation: Optional[str], outcome: Any) -> BatchExecutionResult:
+    """
+    Turn the outcome of one batch item into its result.
+    
+    Args:
+        index: Position of the item in the request
+        item: The item
+        operation: What was run, or None if the item was ruled out
+        outcome: torero's execution result, or the exception that prevented it
+        
+    Returns:
+        BatchExecutionResult: The result, with the status the single execution endpoint would have returned
+    """
+    if not isinstance(outcome, Exception):
+        return BatchExecutionResult(
+            index=index, service=item.service, operation=operation,
+            status_code=200, result=ServiceExecutionResult(**outcome)
+        )
+    
+    if isinstance(outcome, LookupError):
+        status_code = 404
+    elif isinstance(outcome, IdempotencyKeyError):
+        status_code = 422 if outcome.conflict else 400
+    elif isinstance(outcome, ValueError):
+        status_code = 400
+    elif isinstance(outcome, ToreroBusyError):
+        status_code = 503
+    else:
+        logger.error(f"Error running batch item {index} ({item.service}): {str(outcome)}")
+        status_code = 500
+    return BatchExecutionResult(
+        index=index, service=item.service, operation=operation,
+        status_code=status_code, error=str(outcome)
+    )
+
+def batch_run(
+    index: int,
+    item: BatchExecutionItem,
+    operation: str,
+    priority: str,
+    idempotency_key: Optional[str]
+) -> Callable[[], Awaitable[Dict[str, Any]]]:
+    """
+    Build the coroutine function that executes one batch item.
+    
+    With an idempotency key, each item runs once per key and position: its
+    key is the request's key followed by "/" and the item's index.
+    
+    Args:
+        index: Position of the item in the request
+        item: The item
+        operation: What to run, e.g. "ansible-playbook"
+        priority: Priority class of the execution
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        Callable: Coroutine function returning torero's execution result
+    """
+    run = lambda: run_service_async(operation, item.service, item.params)
+    
+    async def run_item() -> Dict[str, Any]:
+        with schedule_context(priority):
+            if idempotency_key is None:
+                return await run()
+            fingerprint = request_fingerprint(operation, item.service, mode="sync", params=item.params)
+            result, _ = await idempotency_store.execute(f"{idempotency_key}/{index}", fingerprint, run)
+            return result
+    
+    return run_item
+
+@asynccontextmanager
+async def batch_turn(semaphore: asyncio.Semaphore) -> AsyncIterator[None]:
+    """
+    Wait for a batch job's turn, showing the job as queued while it waits.
+    
+    Args:
+        semaphore: The batch's parallelism limit
+    """
+    ticket = current_ticket()
+    waiting = semaphore.locked() and ticket is not None
+    if waiting:
+        ticket.notify(True)
+    async with semaphore:
+        if waiting:
+            ticket.notify(False)
+        yield
+
+def submit_batch(
+    planned: List[tuple],
+    results: Dict[int, BatchExecutionResult],
+    concurrency: int,
+    priority: str,
+    idempotency_key: Optional[str]
+) -> JSONResponse:
+    """
+    Start every valid batch item as a background job of its own.
+    
+    The jobs share the batch's parallelism limit: the ones over it stay
+    queued until an earlier job of the batch finishes.
+    
+    Args:
+        planned: Per valid item, its index, the item and the operation to run
+        results: Results of the items ruled out, by index; the jobs are added
+        concurrency: Maximum jobs of the batch running at a time
+        priority: Priority class of the executions
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        JSONResponse: 202 with the per-item results, in request order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    for index, item, operation in planned:
+        async def run(item=item, operation=operation) -> Dict[str, Any]:
+            async with batch_turn(semaphore):
+                return await run_service_async(operation, item.service, item.params)
+        
+        submit = lambda run=run, item=item, operation=operation: job_manager.submit(item.service, operation, run, priority)
+        try:
+            if idempotency_key is None:
+                job = submit()
+            else:
+                fingerprint = request_fingerprint(operation, item.service, mode="async", params=item.params)
+                job, _ = idempotency_store.submit(f"{idempotency_key}/{index}", fingerprint, submit)
+        except Exception as e:
+            results[index] = batch_result(index, item, operation, e)
+            continue
+        results[index] = BatchExecutionResult(
+            index=index, service=item.service, operation=operation,
+            status_code=202, job=ExecutionJob(**job.to_dict())
+        )
+    
+    logger.info(f"Accepted batch of {len(results)} executions as jobs, {concurrency} at a time")
+    return JSONResponse(
+        status_code=202,
+        content=[results[index].model_dump() for index in sorted(results)]
+    )
+
+def stream_batch(
+    planned: List[tuple],
+    results: Dict[int, BatchExecutionResult],
+    concurrency: int,
+    priority: str,
+    idempotency_key: Optional[str]
+) -> StreamingResponse:
+    """
+    Run the valid batch items and send each result as a Server-Sent Event as soon as it is known.
+    
+    The items ruled out come first, then one "result" event per execution in
+    order of completion, and a final "end" event with the totals.
+    
+    Args:
+        planned: Per valid item, its index, the item and the operation to run
+        results: Results of the items ruled out, by index
+        concurrency: Maximum executions running at a time
+        priority: Priority class of the executions
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        StreamingResponse: The event stream
+    """
+    items = {index: (item, operation) for index, item, operation in planned}
+    runs = [(index, batch_run(index, item, operation, priority, idempotency_key)) for index, item, operation in planned]
+    
+    async def body() -> AsyncIterator[str]:
+        succeeded = 0
+        for result in results.values():
+            yield format_event("result", result.model_dump())
+        
+        outcomes = run_many_async(runs, concurrency)
+        try:
+            async for index, outcome in outcomes:
+                result = batch_result(index, *items[index], outcome)
+                if result.result is not None and result.result.return_code == 0:
+                    succeeded += 1
+                yield format_event("result", result.model_dump())
+        finally:
+            await outcomes.aclose()
+        
+        total = len(results) + len(runs)
+        yield format_event("end", {"total": total, "succeeded": succeeded, "failed": total - succeeded})
+    
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post(
+    "/batch",
+    response_model=List[BatchExecutionResult],
+    responses=BATCH_RESPONSES,
+    summary="Run a batch of services",
+    description="""
+    Execute many registered torero services in one request.
+    
+    Every item names a service, the operation for OpenTofu plans ("apply" or
+    "destroy") and optional parameters. All items are checked against one
+    snapshot of the services inventory first; items naming an unknown service
+    (404) or an operation that does not fit the service type (400) are
+    reported without affecting the others. The valid items then run at most
+    `concurrency` at a time, still subject to the execution scheduler's caps.
+    
+    The per-item results are returned in request order. With
+    'Accept: text/event-stream' each result is sent as a "result" event as soon
+    as its execution completes, followed by an "end" event with the totals.
+    With ?async=true every item becomes a background job and the job IDs are
+    returned right away (202).
+    
+    With an Idempotency-Key, each item runs once per key: a repeated batch
+    attaches to the earlier executions instead of running them again.
+    """
+)
+async def run_batch(
+    request: BatchExecutionRequest,
+    concurrency: Optional[int] = Query(
+        None,
+        ge=1,
+        le=1000,
+        description="Maximum executions of the batch running at a time (default TORERO_API_BATCH_CONCURRENCY, 8)"
+    ),
+    run_async: bool = Depends(async_mode),
+    stream: bool = Depends(stream_mode),
+    priority: str = Depends(execution_priority),
+    idempotency_key: Optional[str] = Depends(idempotency_key_header)
+):
+    """
+    Execute a batch of registered torero services.
+    
+    Args:
+        request: The items to execute
+        concurrency: Maximum executions running at a time, or None for the configured default
+        run_async: Whether to run every item as a background job
+        stream: Whether to send the results as Server-Sent Events as they complete
+        priority: Priority class of the executions
+        idempotency_key: The request's Idempotency-Key, if any
+        
+    Returns:
+        List[BatchExecutionResult]: The per-item results, in request order
+        JSONResponse: In async mode, 202 with the per-item jobs
+        StreamingResponse: In streaming mode, the results as they complete
+        
+    Raises:
+        HTTPException: If the services inventory cannot be loaded
+    """
     try:
-        logger.info(f"Destroying OpenTofu plan service: {name}")
+        items = request.items
+        limit = concurrency or batch_concurrency()
+        logger.info(f"Running batch of {len(items)} executions, {limit} at a time")
         
-        # First, verify the service exists and is an OpenTofu plan
-        service = get_service_by_name(name)
-        if not service:
-            logger.warning(f"Service not found: {name}")
-            raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
-            
-        if service.type != "opentofu-plan":
-            logger.warning(f"Service {name} is not an OpenTofu plan (type: {service.type})")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Service '{name}' is not an OpenTofu plan (type: {service.type})"
-            )
+        # Check every item against the same services snapshot
+        plans = await plan_executions_async([(item.service, item.operation) for item in items])
+        results: Dict[int, BatchExecutionResult] = {}
+        planned = []
+        for index, (item, plan) in enumerate(zip(items, plans)):
+            if isinstance(plan, Exception):
+                results[index] = batch_result(index, item, None, plan)
+            else:
+                planned.append((index, item, plan))
         
-        # Execute the service
-        result = run_opentofu_plan_destroy_service(name)
+        # In async mode, run every item as a background job
+        if run_async:
+            return submit_batch(planned, results, limit, priority, idempotency_key)
         
-        # Convert the result to the response model
-        return ServiceExecutionResult(**result)
+        # Send the results as they complete if the client asked for an event stream
+        if stream:
+            return stream_batch(planned, results, limit, priority, idempotency_key)
+        
+        runs = [(index, batch_run(index, item, operation, priority, idempotency_key)) for index, item, operation in planned]
+        items_by_index = {index: (item, operation) for index, item, operation in planned}
+        async for index, outcome in run_many_async(runs, limit):
+            results[index] = batch_result(index, *items_by_index[index], outcome)
+        
+        return [results[index] for index in sorted(results)]
         
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
-        logger.error(f"Error destroying OpenTofu plan service: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        logger.error(f"Error running batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,113 @@
+"""
+Execution history endpoints for torero API
+
+This module defines the API endpoints for listing and looking up past
+service executions recorded in the execution history.
+"""
+
+from fastapi import APIRouter, HTTPException, Path, Query
+from datetime import datetime, timezone
+from typing import Literal, Optional
+import logging
+
+from torero_api.models.execution import ExecutionHistoryPage, ExecutionRecord
+from torero_api.core.history import execution_history
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter()
+
+@router.get(
+    "/",
+    response_model=ExecutionHistoryPage,
+    summary="List past executions",
+    description="""
+    List recorded service executions, newest first.
+
+    Filter by service name, status (`succeeded`, `failed` for a non-zero
+    return code, or `error` when the execution could not be completed) and
+    finish time (`since`, an ISO 8601 timestamp; timestamps without a time
+    zone are taken as UTC).
+
+    Results are paged: pass the `next_cursor` of a page as `cursor` to get
+    the next one. Paging is stable while new executions are recorded.
+    """
+)
+async def list_executions(
+    service: Optional[str] = Query(None, description="Only executions of this service"),
+    status: Optional[Literal["succeeded", "failed", "error"]] = Query(None, description="Only executions with this status"),
+    since: Optional[datetime] = Query(None, description="Only executions that finished at or after this time"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of executions to return"),
+    cursor: Optional[str] = Query(None, description="The next_cursor of the previous page")
+):
+    """
+    List recorded executions.
+
+    Args:
+        service: Service name filter
+        status: Status filter
+        since: Finish time filter
+        limit: Page size
+        cursor: Cursor of the page to return
+
+    Returns:
+        ExecutionHistoryPage: The executions and the cursor of the next page
+
+    Raises:
+        HTTPException: If the cursor is invalid or the history cannot be read
+    """
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    try:
+        records, next_cursor = await execution_history.query_async(
+            service=service,
+            status=status,
+            since=since.timestamp() if since is not None else None,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Failed to read the execution history")
+        raise HTTPException(status_code=500, detail=f"Failed to read the execution history: {str(e)}")
+
+    return ExecutionHistoryPage(
+        items=[ExecutionRecord(**record) for record in records],
+        next_cursor=next_cursor
+    )
+
+@router.get(
+    "/{record_id}",
+    response_model=ExecutionRecord,
+    summary="Get past execution",
+    description="Get one recorded service execution by its ID."
+)
+async def get_execution(
+    record_id: int = Path(..., description="ID of the recorded execution")
+):
+    """
+    Get a recorded execution by ID.
+
+    Args:
+        record_id: The record ID
+
+    Returns:
+        ExecutionRecord: The recorded execution
+
+    Raises:
+        HTTPException: If there is no such record or the history cannot be read
+    """
+    try:
+        record = await execution_history.get_async(record_id)
+    except Exception as e:
+        logger.exception("Failed to read the execution history")
+        raise HTTPException(status_code=500, detail=f"Failed to read the execution history: {str(e)}")
+
+    if record is None:
+        logger.warning(f"Execution record not found: {record_id}")
+        raise HTTPException(status_code=404, detail=f"Execution record '{record_id}' not found")
+    return ExecutionRecord(**record)
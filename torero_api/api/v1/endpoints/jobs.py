@@ -0,0 +1,55 @@
+"""
+Job endpoints for torero API
+
+This module defines the API endpoints for following service executions
+that were submitted as background jobs.
+"""
+
+from fastapi import APIRouter, HTTPException, Path
+import logging
+
+from torero_api.models.execution import ExecutionJob
+from torero_api.core.jobs import job_manager
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter()
+
+@router.get(
+    "/{job_id}",
+    response_model=ExecutionJob,
+    summary="Get execution job",
+    description="""
+    Get the status of a service execution submitted with `?async=true`.
+    
+    The job is "queued" while it waits for its turn (see `queue_position`
+    and `wait_time`) or for a torero process slot, "running" while torero
+    executes the service, and then "completed" with the execution result or
+    "failed" with an error message.
+    
+    Finished jobs are kept for a limited time (TORERO_API_JOB_RETENTION);
+    unknown and expired jobs return a 404 error.
+    """
+)
+async def get_job(
+    job_id: str = Path(..., description="ID of the job, as returned when it was submitted")
+):
+    """
+    Get an execution job by ID.
+    
+    Args:
+        job_id: The job ID
+        
+    Returns:
+        ExecutionJob: The job's status and, once completed, its result
+        
+    Raises:
+        HTTPException: If the job is unknown or has expired
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        logger.warning(f"Job not found: {job_id}")
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return ExecutionJob(**job.to_dict())
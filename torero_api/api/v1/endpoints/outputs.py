@@ -0,0 +1,174 @@
+"""
+Output endpoints for torero API
+
+This module defines the API endpoints for downloading the complete output
+of service executions whose results only carry its head and tail.
+"""
+
+from fastapi import APIRouter, HTTPException, Path, Header, Request
+from fastapi.responses import Response, StreamingResponse
+from typing import Literal, Optional, Tuple
+import logging
+import re
+
+from torero_api.core.outputs import output_store
+from torero_api.models.execution import ExecutionOutput
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Create router
+router = APIRouter()
+
+# A single byte range: "bytes=START-END", "bytes=START-" or "bytes=-SUFFIX"
+_BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header holding a single byte range.
+    
+    Args:
+        header: The Range header value
+        size: Size of the output in bytes
+    
+    Returns:
+        Optional[Tuple[int, int]]: The first and last byte (inclusive), or None
+        if the header is not a single byte range and should be ignored
+    
+    Raises:
+        HTTPException: 416 if the range lies outside the output
+    """
+    match = _BYTE_RANGE.match(header.strip())
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+    
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    
+    if start >= size or end < start:
+        raise HTTPException(
+            status_code=416,
+            detail=f"Range not satisfiable, the output has {size} bytes",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+@router.get(
+    "/{output_id}",
+    response_model=ExecutionOutput,
+    summary="Get execution output",
+    description="""
+    Get a kept execution output: the size of its stdout and stderr and the
+    URLs they are downloaded from.
+    
+    This is the `output_url` of execution results whose output was
+    truncated. Outputs are kept for a limited time (TORERO_API_OUTPUT_RETENTION)
+    and may be dropped earlier to make room; unknown and expired outputs
+    return a 404 error.
+    """
+)
+async def get_output_info(
+    output_id: str = Path(..., description="ID of the output, from the execution result's output_url")
+) -> ExecutionOutput:
+    """
+    Describe a kept execution output.
+    
+    Args:
+        output_id: The output ID
+    
+    Returns:
+        ExecutionOutput: The sizes and download URLs of the output's streams
+    
+    Raises:
+        HTTPException: If the output is unknown or has expired
+    """
+    description = output_store.describe(output_id)
+    if description is None:
+        logger.warning(f"Output not found: {output_id}")
+        raise HTTPException(status_code=404, detail=f"Output '{output_id}' not found")
+    return ExecutionOutput(**description)
+
+@router.head("/{output_id}/{stream}", include_in_schema=False)
+@router.get(
+    "/{output_id}/{stream}",
+    response_class=StreamingResponse,
+    summary="Download execution output",
+    description="""
+    Download the complete stdout or stderr of a service execution.
+    
+    Execution results only carry the head and tail of long output, and
+    link to it through their `output_url`, which lists these URLs. The output is sent as
+    plain text and supports HTTP Range requests for a single byte range
+    (e.g. `Range: bytes=0-1048575` or `Range: bytes=-65536`), answered with
+    206 Partial Content; HEAD reports its size.
+    
+    Outputs are kept for a limited time (TORERO_API_OUTPUT_RETENTION);
+    unknown and expired outputs return a 404 error.
+    """,
+    responses={
+        200: {"content": {"text/plain": {}}, "description": "The complete output"},
+        206: {"content": {"text/plain": {}}, "description": "The requested byte range of the output"},
+        416: {"description": "The requested range lies outside the output"}
+    }
+)
+async def get_output(
+    request: Request,
+    output_id: str = Path(..., description="ID of the output, from the execution result's output_url"),
+    stream: Literal["stdout", "stderr"] = Path(..., description="The output stream"),
+    range: Optional[str] = Header(None, description="Single byte range to return, e.g. 'bytes=0-1023'")
+):
+    """
+    Download an execution's output stream, in whole or in part.
+    
+    Args:
+        request: The request, to tell GET from HEAD
+        output_id: The output ID
+        stream: "stdout" or "stderr"
+        range: The Range header
+    
+    Returns:
+        StreamingResponse: The output, or the requested range of it
+    
+    Raises:
+        HTTPException: If the output is unknown or has expired, or the range cannot be satisfied
+    """
+    output = output_store.get(output_id)
+    if output is None:
+        logger.warning(f"Output not found: {output_id}")
+        raise HTTPException(status_code=404, detail=f"Output '{output_id}' not found")
+    
+    spooled = output.streams[stream]
+    size = spooled.size
+    byte_range = parse_byte_range(range, size) if range else None
+    
+    headers = {"Accept-Ranges": "bytes"}
+    if byte_range is None:
+        status_code, (start, end) = 200, (0, size - 1)
+    else:
+        status_code, (start, end) = 206, byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type="text/plain; charset=utf-8")
+    
+    # The reader keeps the output open if it expires or is evicted during the download
+    reader = output.open_range(stream, start, end)
+    if reader is None:
+        logger.warning(f"Output expired: {output_id}")
+        raise HTTPException(status_code=404, detail=f"Output '{output_id}' not found")
+    
+    # Read in chunks from memory or disk; Starlette iterates this in a worker thread
+    return StreamingResponse(
+        reader,
+        status_code=status_code,
+        headers=headers,
+        media_type="text/plain; charset=utf-8"
+    )
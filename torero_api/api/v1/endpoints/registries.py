@@ -5,11 +5,15 @@ This module defines the API endpoints for managing torero registries.
 """
 
 from fastapi import APIRouter, HTTPException, Query, Path
-from typing import Optional, List
+from typing import Optional, List, Union
 import logging
 
 from torero_api.models.registry import Registry
-from torero_api.core.torero_executor import get_registries, get_registry_by_name
+from torero_api.models.common import FacetCount
+from torero_api.core.torero_executor import get_registries_async, get_registry_by_name_async
+from torero_api.core.fastdecode import as_model, as_models
+from torero_api.core.inventory import facet_counts, select_items
+from torero_api.core.limiter import ToreroBusyError
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -31,7 +35,7 @@ router = APIRouter()
     and retrieved, such as Ansible Galaxy or PyPI.
     """
 )
-def list_registries(
+async def list_registries(
     type: Optional[str] = Query(
         None, 
         description="Filter registries by type (e.g., 'ansible-galaxy', 'pypi')",
@@ -65,38 +69,50 @@ def list_registries(
         logger.info(f"Listing registries with type filter: {type}")
         
         # Get all registries from torero
-        registries = get_registries()
+        registries = await get_registries_async()
         
-        # Apply type filter if provided
+        # Apply type filter if provided, using the inventory's type index
         if type:
-            registries = [reg for reg in registries if reg.type == type]
+            registries = select_items(registries, type=type)
             logger.info(f"Filtered to {len(registries)} registries of type '{type}'")
         else:
             logger.info(f"Retrieved {len(registries)} registries")
         
-        return registries
+        return as_models(registries)
         
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error retrieving registries: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
     "/types",
-    response_model=List[str],
+    response_model=Union[List[str], List[FacetCount]],
     summary="List unique registry types",
     description="""
     Get a list of all unique registry types.
     
     This endpoint returns a deduplicated list of all registry types that are
     currently registered in torero, such as 'ansible-galaxy', 'pypi', etc.
+    
+    With `?counts=true`, each type is returned with the number of registries
+    using it, e.g. for rendering histograms without fetching the full list.
     """
 )
-def list_registry_types():
+async def list_registry_types(
+    counts: bool = Query(False, description="Include the number of registries per type")
+):
     """
     List all unique registry types.
     
+    Args:
+        counts: Whether to include the number of registries per type
+    
     Returns:
         List[str]: Sorted list of unique registry types
+        List[FacetCount]: With counts, each value and its number of items, sorted by value
         
     Raises:
         HTTPException: If there's an error retrieving registries
@@ -105,14 +121,19 @@ def list_registry_types():
         logger.info("Getting unique registry types")
         
         # Get all registries
-        registries = get_registries()
+        registries = await get_registries_async()
         
-        # Extract unique types
-        types = sorted(list(set(reg.type for reg in registries)))
+        # Unique types with their counts, precomputed per snapshot
+        types = facet_counts(registries, "type")
         
         logger.info(f"Found {len(types)} unique registry types")
-        return types
+        if counts:
+            return [FacetCount(value=value, count=count) for value, count in types]
+        return [value for value, _ in types]
         
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error retrieving registry types: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -132,7 +153,7 @@ def list_registry_types():
     If no registry is found with the specified name, a 404 error is returned.
     """
 )
-def get_registry(
+async def get_registry(
     name: str = Path(
         ..., 
         description="Name of the registry to retrieve",
@@ -166,11 +187,11 @@ def get_registry(
         logger.info(f"Retrieving registry: {name}")
         
         # Get the specific registry
-        registry = get_registry_by_name(name)
+        registry = await get_registry_by_name_async(name)
         
         if registry:
             logger.info(f"Found registry: {name}")
-            return registry
+            return as_model(registry)
                 
         # If we get here, the registry was not found
         logger.warning(f"Registry not found: {name}")
@@ -179,6 +200,9 @@ def get_registry(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error retrieving registry: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
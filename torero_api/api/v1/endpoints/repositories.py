@@ -4,12 +4,17 @@ Repositories endpoints for torero API
 This module defines the API endpoints for interacting with torero repositories.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path, Depends
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Body
+from typing import Optional, List, Union, Dict
 import logging
 
 from torero_api.models.repository import Repository
-from torero_api.core.torero_executor import get_repositories, get_repository_by_name, describe_repository
+from torero_api.models.common import FacetCount, BulkDescribeRequest, DescribeResult
+from torero_api.core.torero_executor import get_repositories_async, get_repository_by_name_async, describe_repository_async
+from torero_api.core.fastdecode import as_model, as_models
+from torero_api.core.inventory import facet_counts, select_items
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.api.v1.endpoints.bulk import bulk_describe
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -50,7 +55,7 @@ def common_parameters(
     - List all git repositories: GET /v1/repositories/?type=git
     """
 )
-def list_repositories(
+async def list_repositories(
     commons: dict = Depends(common_parameters),
     type: Optional[str] = Query(
         None, 
@@ -72,27 +77,29 @@ def list_repositories(
     """
     try:
         logger.info(f"Getting repositories with filter - type: {type}")
-        repositories = get_repositories()
+        repositories = await get_repositories_async()
         
-        # Apply filters if provided
-        if type:
-            repositories = [r for r in repositories if r.type == type]
-            
-        # Apply pagination
-        skip = commons["skip"]
-        limit = commons["limit"]
-        paginated_repositories = repositories[skip:skip + limit]
+        # Apply filters and pagination, using the inventory's type index
+        paginated_repositories = select_items(
+            repositories,
+            type=type or None,
+            skip=commons["skip"],
+            limit=commons["limit"]
+        )
         
         logger.info(f"Returning {len(paginated_repositories)} repositories after filtering")
-        return paginated_repositories
+        return as_models(paginated_repositories)
     
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_repositories: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
     "/types", 
-    response_model=List[str],
+    response_model=Union[List[str], List[FacetCount]],
     summary="List repository types",
     description="""
     Return a list of unique repository types used by registered repositories.
@@ -104,27 +111,40 @@ def list_repositories(
     - Building UI dropdown filters
     - Understanding what types of repositories are available
     - Validating type values for new repositories
+    
+    With `?counts=true`, each type is returned with the number of repositories
+    using it, e.g. for rendering histograms without fetching the full list.
     """
 )
-def list_repository_types():
+async def list_repository_types(
+    counts: bool = Query(False, description="Include the number of repositories per type")
+):
     """
     Return a list of unique repository types used by registered repositories.
     
-    Retrieves all repositories and extracts the unique set of repository types,
-    returning them as a sorted list.
+    Served from the type facet precomputed for the cached inventory snapshot.
+    
+    Args:
+        counts: Whether to include the number of repositories per type
     
     Returns:
         List[str]: Sorted list of unique repository type strings
+        List[FacetCount]: With counts, each value and its number of items, sorted by value
     
     Raises:
         HTTPException: If an error occurs while retrieving repositories
     """
     try:
         logger.info("Getting repository types")
-        repositories = get_repositories()
-        types = sorted(set(r.type for r in repositories))
+        repositories = await get_repositories_async()
+        types = facet_counts(repositories, "type")
         logger.info(f"Returning {len(types)} repository types")
-        return types
+        if counts:
+            return [FacetCount(value=value, count=count) for value, count in types]
+        return [value for value, _ in types]
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_repository_types: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -143,7 +163,7 @@ def list_repository_types():
     If no repository is found with the specified name, a 404 error is returned.
     """
 )
-def get_repository(
+async def get_repository(
     name: str = Path(
         ..., 
         description="Name of the repository to retrieve"
@@ -163,11 +183,11 @@ def get_repository(
     """
     try:
         logger.info(f"Getting repository details for: {name}")
-        repository = get_repository_by_name(name)
+        repository = await get_repository_by_name_async(name)
         
         if repository:
             logger.info(f"Found repository: {name}")
-            return repository
+            return as_model(repository)
                 
         # If we get here, the repository was not found
         logger.warning(f"Repository not found: {name}")
@@ -176,6 +196,9 @@ def get_repository(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error retrieving repository: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -196,7 +219,7 @@ def get_repository(
     If no repository is found with the specified name, a 404 error is returned.
     """
 )
-def describe_repository_detail(
+async def describe_repository_detail(
     name: str = Path(
         ..., 
         description="Name of the repository to describe",
@@ -230,13 +253,13 @@ def describe_repository_detail(
         logger.info(f"Getting detailed description for repository: {name}")
         
         # First verify the repository exists
-        repository = get_repository_by_name(name)
+        repository = await get_repository_by_name_async(name)
         if not repository:
             logger.warning(f"Repository not found: {name}")
             raise HTTPException(status_code=404, detail=f"Repository '{name}' not found")
         
         # Get detailed description
-        description = describe_repository(name)
+        description = await describe_repository_async(name)
         
         if description is None:
             logger.warning(f"Could not retrieve detailed description for repository: {name}")
@@ -247,9 +270,53 @@ def describe_repository_detail(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error getting detailed repository description: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         logger.error(f"Error in get_repository: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post(
+    "/describe",
+    response_model=Dict[str, DescribeResult],
+    summary="Describe several repositories",
+    description="""
+    Get the detailed descriptions of several repositories in one request.
+    
+    The describe commands run concurrently, a bounded number at a time
+    (TORERO_API_DESCRIBE_CONCURRENCY, default 8), instead of one request and
+    one torero process after another.
+    
+    The response maps each requested name to its result. Every result carries
+    the status code the single-item describe endpoint would have returned:
+    200 with the description, or 404/500/503 with an error message, so one
+    failing repository does not fail the whole request.
+    """
+)
+async def describe_repositories_bulk(
+    request: BulkDescribeRequest = Body(..., description="Names of the repositories to describe")
+):
+    """
+    Get the detailed descriptions of several repositories.
+    
+    Args:
+        request: The names of the repositories to describe
+        
+    Returns:
+        Dict[str, DescribeResult]: The outcome per repository name
+        
+    Raises:
+        HTTPException: If the repositories inventory cannot be retrieved
+    """
+    try:
+        return await bulk_describe("repositories", request.names)
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
+    except Exception as e:
+        logger.error(f"Error in describe_repositories_bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -4,12 +4,17 @@ Secrets endpoints for torero API
 This module defines the API endpoints for interacting with torero secrets.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path, Depends
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Body
+from typing import Optional, List, Union, Dict
 import logging
 
 from torero_api.models.secret import Secret
-from torero_api.core.torero_executor import get_secrets, get_secret_by_name, describe_secret
+from torero_api.models.common import FacetCount, BulkDescribeRequest, DescribeResult
+from torero_api.core.torero_executor import get_secrets_async, get_secret_by_name_async, describe_secret_async
+from torero_api.core.fastdecode import as_model, as_models
+from torero_api.core.inventory import facet_counts, select_items
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.api.v1.endpoints.bulk import bulk_describe
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -50,7 +55,7 @@ def common_parameters(
     - List all API key secrets: GET /v1/secrets/?type=api-key
     """
 )
-def list_secrets(
+async def list_secrets(
     commons: dict = Depends(common_parameters),
     type: Optional[str] = Query(
         None, 
@@ -72,27 +77,29 @@ def list_secrets(
     """
     try:
         logger.info(f"Getting secrets with filter - type: {type}")
-        secrets = get_secrets()
+        secrets = await get_secrets_async()
         
-        # Apply filters if provided
-        if type:
-            secrets = [s for s in secrets if s.type == type]
-            
-        # Apply pagination
-        skip = commons["skip"]
-        limit = commons["limit"]
-        paginated_secrets = secrets[skip:skip + limit]
+        # Apply filters and pagination, using the inventory's type index
+        paginated_secrets = select_items(
+            secrets,
+            type=type or None,
+            skip=commons["skip"],
+            limit=commons["limit"]
+        )
         
         logger.info(f"Returning {len(paginated_secrets)} secrets after filtering")
-        return paginated_secrets
+        return as_models(paginated_secrets)
     
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_secrets: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
     "/types", 
-    response_model=List[str],
+    response_model=Union[List[str], List[FacetCount]],
     summary="List secret types",
     description="""
     Return a list of unique secret types used by registered secrets.
@@ -104,27 +111,40 @@ def list_secrets(
     - Building UI dropdown filters
     - Understanding what types of secrets are available
     - Validating type values for new secrets
+    
+    With `?counts=true`, each type is returned with the number of secrets
+    using it, e.g. for rendering histograms without fetching the full list.
     """
 )
-def list_secret_types():
+async def list_secret_types(
+    counts: bool = Query(False, description="Include the number of secrets per type")
+):
     """
     Return a list of unique secret types used by registered secrets.
     
-    Retrieves all secrets and extracts the unique set of secret types,
-    returning them as a sorted list.
+    Served from the type facet precomputed for the cached inventory snapshot.
+    
+    Args:
+        counts: Whether to include the number of secrets per type
     
     Returns:
         List[str]: Sorted list of unique secret type strings
+        List[FacetCount]: With counts, each value and its number of items, sorted by value
     
     Raises:
         HTTPException: If an error occurs while retrieving secrets
     """
     try:
         logger.info("Getting secret types")
-        secrets = get_secrets()
-        types = sorted(set(s.type for s in secrets))
+        secrets = await get_secrets_async()
+        types = facet_counts(secrets, "type")
         logger.info(f"Returning {len(types)} secret types")
-        return types
+        if counts:
+            return [FacetCount(value=value, count=count) for value, count in types]
+        return [value for value, _ in types]
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_secret_types: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -145,7 +165,7 @@ def list_secret_types():
     If no secret is found with the specified name, a 404 error is returned.
     """
 )
-def get_secret(
+async def get_secret(
     name: str = Path(
         ..., 
         description="Name of the secret to retrieve"
@@ -165,11 +185,11 @@ def get_secret(
     """
     try:
         logger.info(f"Getting secret details for: {name}")
-        secret = get_secret_by_name(name)
+        secret = await get_secret_by_name_async(name)
         
         if secret:
             logger.info(f"Found secret: {name}")
-            return secret
+            return as_model(secret)
                 
         # If we get here, the secret was not found
         logger.warning(f"Secret not found: {name}")
@@ -178,6 +198,9 @@ def get_secret(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error retrieving secret: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -198,7 +221,7 @@ def get_secret(
     If no secret is found with the specified name, a 404 error is returned.
     """
 )
-def describe_secret_detail(
+async def describe_secret_detail(
     name: str = Path(
         ..., 
         description="Name of the secret to describe",
@@ -232,13 +255,13 @@ def describe_secret_detail(
         logger.info(f"Getting detailed description for secret: {name}")
         
         # First verify the secret exists
-        secret = get_secret_by_name(name)
+        secret = await get_secret_by_name_async(name)
         if not secret:
             logger.warning(f"Secret not found: {name}")
             raise HTTPException(status_code=404, detail=f"Secret '{name}' not found")
         
         # Get detailed description
-        description = describe_secret(name)
+        description = await describe_secret_async(name)
         
         if description is None:
             logger.warning(f"Could not retrieve detailed description for secret: {name}")
@@ -249,9 +272,53 @@ def describe_secret_detail(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error getting detailed secret description: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         logger.error(f"Error in get_secret: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post(
+    "/describe",
+    response_model=Dict[str, DescribeResult],
+    summary="Describe several secrets",
+    description="""
+    Get the detailed descriptions of several secrets in one request.
+    
+    The describe commands run concurrently, a bounded number at a time
+    (TORERO_API_DESCRIBE_CONCURRENCY, default 8), instead of one request and
+    one torero process after another.
+    
+    The response maps each requested name to its result. Every result carries
+    the status code the single-item describe endpoint would have returned:
+    200 with the description, or 404/500/503 with an error message, so one
+    failing secret does not fail the whole request.
+    """
+)
+async def describe_secrets_bulk(
+    request: BulkDescribeRequest = Body(..., description="Names of the secrets to describe")
+):
+    """
+    Get the detailed descriptions of several secrets.
+    
+    Args:
+        request: The names of the secrets to describe
+        
+    Returns:
+        Dict[str, DescribeResult]: The outcome per secret name
+        
+    Raises:
+        HTTPException: If the secrets inventory cannot be retrieved
+    """
+    try:
+        return await bulk_describe("secrets", request.names)
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
+    except Exception as e:
+        logger.error(f"Error in describe_secrets_bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -4,12 +4,17 @@ Services endpoints for torero API
 This module defines the API endpoints for interacting with torero services.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path, Depends
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, Body
+from typing import Optional, List, Union, Dict
 import logging
 
 from torero_api.models.service import Service, ServiceType
-from torero_api.core.torero_executor import get_services, get_service_by_name, describe_service
+from torero_api.models.common import FacetCount, BulkDescribeRequest, DescribeResult
+from torero_api.core.torero_executor import get_services_async, get_service_by_name_async, describe_service_async
+from torero_api.core.fastdecode import as_model, as_models
+from torero_api.core.inventory import facet_counts, select_items
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.api.v1.endpoints.bulk import bulk_describe
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -52,7 +57,7 @@ def common_parameters(
     - Combine filters: GET /v1/services/?type=ansible-playbook&tag=network
     """
 )
-def list_services(
+async def list_services(
     commons: dict = Depends(common_parameters),
     type: Optional[ServiceType] = Query(
         None, 
@@ -113,29 +118,30 @@ def list_services(
     """
     try:
         logger.info(f"Getting services with filters - type: {type}, tag: {tag}")
-        services = get_services()
+        services = await get_services_async()
         
-        # Apply filters if provided
-        if type:
-            services = [s for s in services if s.type == type]
-        if tag:
-            services = [s for s in services if tag in s.tags]
-            
-        # Apply pagination
-        skip = commons["skip"]
-        limit = commons["limit"]
-        paginated_services = services[skip:skip + limit]
+        # Apply filters and pagination, using the inventory's type and tag indexes
+        paginated_services = select_items(
+            services,
+            type=type or None,
+            tag=tag or None,
+            skip=commons["skip"],
+            limit=commons["limit"]
+        )
         
         logger.info(f"Returning {len(paginated_services)} services after filtering")
-        return paginated_services
+        return as_models(paginated_services)
     
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_services: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
     "/types", 
-    response_model=List[str],
+    response_model=Union[List[str], List[FacetCount]],
     summary="List service types",
     description="""
     Return a list of unique service types used by registered services.
@@ -147,34 +153,47 @@ def list_services(
     - Building UI dropdown filters
     - Understanding what types of services are available
     - Validating type values for new services
+    
+    With `?counts=true`, each type is returned with the number of services
+    using it, e.g. for rendering histograms without fetching the full list.
     """
 )
-def list_service_types():
+async def list_service_types(
+    counts: bool = Query(False, description="Include the number of services per type")
+):
     """
     Return a list of unique service types used by registered services.
     
-    Retrieves all services and extracts the unique set of service types,
-    returning them as a sorted list.
+    Served from the type facet precomputed for the cached inventory snapshot.
+    
+    Args:
+        counts: Whether to include the number of services per type
     
     Returns:
         List[str]: Sorted list of unique service type strings
+        List[FacetCount]: With counts, each value and its number of items, sorted by value
     
     Raises:
         HTTPException: If an error occurs while retrieving services
     """
     try:
         logger.info("Getting service types")
-        services = get_services()
-        types = sorted(set(s.type for s in services))
+        services = await get_services_async()
+        types = facet_counts(services, "type")
         logger.info(f"Returning {len(types)} service types")
-        return types
+        if counts:
+            return [FacetCount(value=value, count=count) for value, count in types]
+        return [value for value, _ in types]
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_service_types: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get(
     "/tags", 
-    response_model=List[str],
+    response_model=Union[List[str], List[FacetCount]],
     summary="List service tags",
     description="""
     Return a list of unique tags used across all registered services.
@@ -187,27 +206,40 @@ def list_service_types():
     - Building tag clouds or filter interfaces
     - Understanding how services are categorized
     - Discovering available service categories
+    
+    With `?counts=true`, each tag is returned with the number of services
+    tagged with it, e.g. for rendering histograms without fetching the full list.
     """
 )
-def list_service_tags():
+async def list_service_tags(
+    counts: bool = Query(False, description="Include the number of services per tag")
+):
     """
     Return a list of unique tags used across all registered services.
     
-    Retrieves all services, extracts all tags from each service,
-    and returns the unique set of tags as a sorted list.
+    Served from the tag facet precomputed for the cached inventory snapshot.
+    
+    Args:
+        counts: Whether to include the number of services per tag
     
     Returns:
         List[str]: Sorted list of unique tag strings
+        List[FacetCount]: With counts, each value and its number of items, sorted by value
     
     Raises:
         HTTPException: If an error occurs while retrieving services
     """
     try:
         logger.info("Getting service tags")
-        services = get_services()
-        tags = sorted(set(tag for s in services for tag in s.tags))
+        services = await get_services_async()
+        tags = facet_counts(services, "tag")
         logger.info(f"Returning {len(tags)} service tags")
-        return tags
+        if counts:
+            return [FacetCount(value=value, count=count) for value, count in tags]
+        return [value for value, _ in tags]
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in list_service_tags: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -226,7 +258,7 @@ def list_service_tags():
     If no service is found with the specified name, a 404 error is returned.
     """
 )
-def get_service(
+async def get_service(
     name: str = Path(
         ..., 
         description="Name of the service to retrieve",
@@ -263,11 +295,11 @@ def get_service(
     """
     try:
         logger.info(f"Getting service details for: {name}")
-        service = get_service_by_name(name)
+        service = await get_service_by_name_async(name)
         
         if service:
             logger.info(f"Found service: {name}")
-            return service
+            return as_model(service)
                 
         # If we get here, the service was not found
         logger.warning(f"Service not found: {name}")
@@ -276,6 +308,9 @@ def get_service(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except Exception as e:
         logger.error(f"Error in get_service: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -293,7 +328,7 @@ def get_service(
     If no service is found with the specified name, a 404 error is returned.
     """
 )
-def describe_service_endpoint(
+async def describe_service_endpoint(
     name: str = Path(
         ..., 
         description="Name of the service to describe",
@@ -322,13 +357,13 @@ def describe_service_endpoint(
         logger.info(f"Getting detailed description for service: {name}")
         
         # First verify the service exists
-        service = get_service_by_name(name)
+        service = await get_service_by_name_async(name)
         if not service:
             logger.warning(f"Service not found: {name}")
             raise HTTPException(status_code=404, detail=f"Service '{name}' not found")
         
         # Get detailed description
-        description = describe_service(name)
+        description = await describe_service_async(name)
         
         if description:
             logger.info(f"Found detailed description for service: {name}")
@@ -341,6 +376,9 @@ def describe_service_endpoint(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
     except RuntimeError as e:
         # Handle specific RuntimeError from describe_service
         if "not found" in str(e).lower() or "404" in str(e):
@@ -351,4 +389,45 @@ def describe_service_endpoint(
             raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         logger.error(f"Error in describe_service_endpoint: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post(
+    "/describe",
+    response_model=Dict[str, DescribeResult],
+    summary="Describe several services",
+    description="""
+    Get the detailed descriptions of several services in one request.
+    
+    The describe commands run concurrently, a bounded number at a time
+    (TORERO_API_DESCRIBE_CONCURRENCY, default 8), instead of one request and
+    one torero process after another.
+    
+    The response maps each requested name to its result. Every result carries
+    the status code the single-item describe endpoint would have returned:
+    200 with the description, or 404/500/503 with an error message, so one
+    failing service does not fail the whole request.
+    """
+)
+async def describe_services_bulk(
+    request: BulkDescribeRequest = Body(..., description="Names of the services to describe")
+):
+    """
+    Get the detailed descriptions of several services.
+    
+    Args:
+        request: The names of the services to describe
+        
+    Returns:
+        Dict[str, DescribeResult]: The outcome per service name
+        
+    Raises:
+        HTTPException: If the services inventory cannot be retrieved
+    """
+    try:
+        return await bulk_describe("services", request.names)
+    except ToreroBusyError:
+        # Re-raise busy errors so they are answered with 503 and Retry-After
+        raise
+    except Exception as e:
+        logger.error(f"Error in describe_services_bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -9,8 +9,23 @@ with torero, allowing the API layer to focus on request handling and
 response formatting.
 
 Components:
+- inventory: Indexed snapshots of torero inventories
+- cache: Per-kind TTL cache for inventory snapshots, with stale-while-revalidate
+- describe_cache: Size-bounded LRU cache of describe results, tied to their inventory
+- health: Background torero availability and version checks served by /health
+- warmup: Startup task that preloads the caches before the API reports ready
+- outputs: Disk-spooled execution output, downloadable with Range requests
+- history: SQLite record of past executions, listed at /v1/executions
+- scheduler: Admission of executions by priority under per-type and per-service caps
+- idempotency: Executions shared by requests carrying the same Idempotency-Key
+- jobs: Service executions run as background jobs polled at /v1/jobs/{id}
+- refresher: Background task that refreshes cached inventories before they expire
+- settings: Shared reader for the TORERO_API_* numeric settings
+- backends: Transports for running torero commands (CLI processes or a
+  persistent connection to a torero command server)
 - torero_executor: Interface for executing torero CLI commands and
-  parsing their output into structured data
+  parsing their output into structured data. Each operation is available
+  as a coroutine (``*_async``) and as a synchronous wrapper.
 """
 
 # Re-export core components for easier imports
@@ -27,5 +42,32 @@ from torero_api.core.torero_executor import (
     get_secrets,
     get_secret_by_name,
     run_ansible_playbook_service,
-    run_python_script_service
-)
\ No newline at end of file
+    run_python_script_service,
+    run_service,
+    get_inventory_snapshot_async,
+    refresh_inventory,
+    refresh_inventory_async,
+    check_torero_available_async,
+    check_torero_version_async,
+    get_services_async,
+    get_service_by_name_async,
+    describe_service_async,
+    get_decorators_async,
+    get_decorator_by_name_async,
+    get_repositories_async,
+    get_repository_by_name_async,
+    get_secrets_async,
+    get_secret_by_name_async,
+    run_ansible_playbook_service_async,
+    run_python_script_service_async,
+    run_service_async
+)
+from torero_api.core.cache import invalidate_inventory, configure_inventory_cache
+from torero_api.core.describe_cache import configure_describe_cache
+from torero_api.core.jobs import configure_job_manager
+from torero_api.core.outputs import configure_output_store
+from torero_api.core.history import configure_execution_history
+from torero_api.core.scheduler import configure_execution_scheduler
+from torero_api.core.idempotency import configure_idempotency_store
+from torero_api.core.inventory import InventorySnapshot
+from torero_api.core.backends import configure_backend, get_backend
@@ -0,0 +1,714 @@
+"""
+Executor backends for the torero API
+
+A backend is the transport the executor uses to run torero commands. Two
+backends are available:
+
+- cli: spawns the torero binary for every command (the default)
+- server: sends commands over a long-lived connection to a torero command
+  server, avoiding the fork/exec and runtime start-up cost on every call
+
+The server backend speaks a small line-delimited JSON protocol. Each request
+is one line:
+
+    {"id": 1, "args": ["get", "services", "--raw"], "timeout": 30}
+
+and the server answers, in any order, with one line per request:
+
+    {"id": 1, "return_code": 0, "stdout": "...", "stderr": ""}
+
+or, if it could not run the command at all:
+
+    {"id": 1, "error": "reason"}
+
+Requests are multiplexed over a single connection per event loop, and the
+connection is re-established transparently after it drops.
+
+Besides run(), backends offer stream(), which hands out stdout in chunks as
+it is produced so large inventories can be parsed incrementally, and
+output(), which hands out stdout and stderr line by line as they are
+produced so service executions can be followed live. The CLI backend reads
+the child's pipes directly; the server backend receives the output in one
+response and hands it out once the command has finished.
+
+The backend is selected from the environment when it is first used and can
+be replaced at runtime with configure_backend():
+
+- TORERO_API_BACKEND: "cli" (default) or "server"
+- TORERO_API_SERVER_ADDRESS: "host:port" or "unix:/path/to/socket" for the server backend
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import subprocess
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Union
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Available backend names
+BACKENDS = ("cli", "server")
+
+# Largest single response line accepted from a torero server
+MAX_MESSAGE_SIZE = 256 * 1024 * 1024
+
+# Size of the stdout chunks handed out by stream()
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Longest line handed out by output(); longer lines are split
+MAX_LINE_SIZE = 64 * 1024
+
+# Lines output() reads ahead of its consumer before the pipes are left to fill up
+OUTPUT_QUEUE_SIZE = 256
+
+class CommandResult:
+    """
+    Result of a torero command.
+
+    Standard output is kept as the backend received it, and only decoded if
+    stdout is read, so callers that parse it as bytes avoid a decoded copy.
+
+    Attributes:
+        return_code: Exit code of the command
+        stderr: Decoded standard error
+    """
+
+    __slots__ = ("return_code", "stderr", "_stdout", "_stdout_bytes")
+
+    def __init__(self, return_code: int, stdout: Union[str, bytes], stderr: str):
+        """
+        Initialize the result.
+
+        Args:
+            return_code: Exit code of the command
+            stdout: Standard output, raw or decoded
+            stderr: Decoded standard error
+        """
+        self.return_code = return_code
+        self.stderr = stderr
+        self._stdout: Optional[str] = stdout if isinstance(stdout, str) else None
+        self._stdout_bytes: Optional[bytes] = stdout if isinstance(stdout, bytes) else None
+
+    @property
+    def stdout(self) -> str:
+        """Decoded standard output."""
+        if self._stdout is None:
+            self._stdout = self._stdout_bytes.decode("utf-8", errors="replace")
+        return self._stdout
+
+    @property
+    def stdout_bytes(self) -> bytes:
+        """Standard output as UTF-8 bytes; no copy is made if the backend received bytes."""
+        if self._stdout_bytes is None:
+            self._stdout_bytes = self._stdout.encode("utf-8")
+        return self._stdout_bytes
+
+class CommandStream:
+    """
+    Output of a running torero command, read incrementally.
+
+    Iterate over the stream to receive stdout in chunks. The return code and
+    stderr are available once stdout has been read to the end, or after
+    finish() has been awaited.
+
+    Attributes:
+        return_code: Exit code of the command, None while it is running
+        stderr: Decoded standard error, empty while the command is running
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        """
+        Initialize the stream.
+
+        Args:
+            chunks: Async iterator over stdout; it sets return_code and stderr when exhausted
+        """
+        self._chunks = chunks
+        self.return_code: Optional[int] = None
+        self.stderr = ""
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._chunks
+
+    async def finish(self) -> int:
+        """
+        Discard any unread output and wait for the command to exit.
+
+        Returns:
+            int: The return code of the command
+        """
+        async for _ in self._chunks:
+            pass
+        return self.return_code
+
+class OutputLine(NamedTuple):
+    """
+    One line of output of a running torero command.
+
+    Attributes:
+        channel: "stdout" or "stderr"
+        text: The decoded line, without its line terminator
+    """
+    channel: str
+    text: str
+
+class CommandOutput:
+    """
+    Output of a running torero command, read line by line.
+
+    Iterate over the output to receive OutputLine objects from stdout and
+    stderr in the order they are produced. The return code is available once
+    the output has been read to the end.
+
+    Attributes:
+        return_code: Exit code of the command, None while it is running
+    """
+
+    def __init__(self, lines: AsyncIterator[OutputLine]):
+        """
+        Initialize the output.
+
+        Args:
+            lines: Async iterator over the output lines; it sets return_code when exhausted
+        """
+        self._lines = lines
+        self.return_code: Optional[int] = None
+
+    def __aiter__(self) -> AsyncIterator[OutputLine]:
+        return self._lines
+
+def _split_lines(channel: str, text: str) -> List[OutputLine]:
+    """
+    Split complete command output into lines.
+
+    Args:
+        channel: "stdout" or "stderr"
+        text: The decoded output
+
+    Returns:
+        List[OutputLine]: One entry per line
+    """
+    return [OutputLine(channel, line) for line in text.splitlines()]
+
+async def _read_lines(reader: asyncio.StreamReader, channel: str, queue: asyncio.Queue) -> None:
+    """
+    Read a pipe to its end and put its lines on a queue, followed by None.
+
+    Args:
+        reader: The pipe to read
+        channel: "stdout" or "stderr"
+        queue: Queue receiving OutputLine objects
+    """
+    async def put(line: bytes) -> None:
+        # Hand out overlong lines in pieces rather than buffering them whole
+        for start in range(0, max(len(line), 1), MAX_LINE_SIZE):
+            piece = line[start:start + MAX_LINE_SIZE]
+            await queue.put(OutputLine(channel, piece.rstrip(b"\r").decode("utf-8", errors="replace")))
+
+    buffer = b""
+    try:
+        while True:
+            chunk = await reader.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                await put(line)
+            if len(buffer) >= MAX_LINE_SIZE:
+                cut = len(buffer) - len(buffer) % MAX_LINE_SIZE
+                await put(buffer[:cut])
+                buffer = buffer[cut:]
+        if buffer:
+            await put(buffer)
+    finally:
+        await queue.put(None)
+
+class ToreroBackend(ABC):
+    """
+    Abstract base class for executor backends.
+
+    Subclasses must implement run() to execute a torero argv and return its output,
+    and may override stream() to hand out stdout while the command runs.
+    """
+
+    # Name used for configuration and logging
+    name = "base"
+
+    # Whether the backend needs the torero binary on the local PATH
+    requires_local_binary = False
+
+    @abstractmethod
+    async def run(self, command: Sequence[str], timeout: float) -> CommandResult:
+        """
+        Run a torero command.
+
+        Args:
+            command: The full argument vector, starting with the torero executable
+            timeout: Maximum number of seconds to wait for the command to finish
+
+        Returns:
+            CommandResult: The return code and output of the command
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish within the timeout.
+        """
+
+    @asynccontextmanager
+    async def stream(self, command: Sequence[str], timeout: float) -> AsyncIterator[CommandStream]:
+        """
+        Run a torero command and read its stdout in chunks.
+
+        The default implementation runs the command to completion with run()
+        and hands out its output as a single chunk.
+
+        Args:
+            command: The full argument vector, starting with the torero executable
+            timeout: Maximum number of seconds the whole command may take
+
+        Yields:
+            CommandStream: The command's output
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish within the timeout.
+        """
+        result = await self.run(command, timeout)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            if result.stdout_bytes:
+                yield result.stdout_bytes
+            stream.return_code = result.return_code
+            stream.stderr = result.stderr
+
+        stream = CommandStream(chunks())
+        yield stream
+
+    @asynccontextmanager
+    async def output(self, command: Sequence[str], timeout: float) -> AsyncIterator[CommandOutput]:
+        """
+        Run a torero command and read its stdout and stderr line by line.
+
+        The default implementation runs the command to completion with run()
+        and then hands out its stdout lines followed by its stderr lines.
+
+        Args:
+            command: The full argument vector, starting with the torero executable
+            timeout: Maximum number of seconds the whole command may take
+
+        Yields:
+            CommandOutput: The command's output
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish within the timeout.
+        """
+        result = await self.run(command, timeout)
+
+        async def lines() -> AsyncIterator[OutputLine]:
+            for line in _split_lines("stdout", result.stdout) + _split_lines("stderr", result.stderr):
+                yield line
+            output.return_code = result.return_code
+
+        output = CommandOutput(lines())
+        yield output
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+class CLIBackend(ToreroBackend):
+    """
+    Backend that spawns the torero binary for every command.
+    """
+
+    name = "cli"
+    requires_local_binary = True
+
+    async def run(self, command: Sequence[str], timeout: float) -> CommandResult:
+        """
+        Run a torero command as a child process.
+
+        See ToreroBackend.run(). The child process is killed when the timeout expires.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(list(command), timeout)
+
+        return CommandResult(
+            proc.returncode,
+            stdout,
+            stderr.decode("utf-8", errors="replace")
+        )
+
+    @asynccontextmanager
+    async def stream(self, command: Sequence[str], timeout: float) -> AsyncIterator[CommandStream]:
+        """
+        Run a torero command as a child process and read its stdout pipe in chunks.
+
+        See ToreroBackend.stream(). The child process is killed when the
+        timeout expires or when the caller leaves the block before the
+        command has finished.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        # Drain stderr concurrently so a chatty child cannot block on a full pipe
+        stderr_task = loop.create_task(proc.stderr.read())
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                while True:
+                    chunk = await asyncio.wait_for(proc.stdout.read(STREAM_CHUNK_SIZE), deadline - loop.time())
+                    if not chunk:
+                        break
+                    yield chunk
+                stream.return_code = await asyncio.wait_for(proc.wait(), max(0, deadline - loop.time()))
+                stream.stderr = (await stderr_task).decode("utf-8", errors="replace")
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(list(command), timeout)
+
+        stream = CommandStream(chunks())
+        try:
+            yield stream
+        finally:
+            if stream.return_code is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+    @asynccontextmanager
+    async def output(self, command: Sequence[str], timeout: float) -> AsyncIterator[CommandOutput]:
+        """
+        Run a torero command as a child process and read both of its pipes line by line.
+
+        See ToreroBackend.output(). Lines are handed out as soon as the child
+        writes them. Only a bounded number of lines is read ahead of the
+        caller, so a slow reader makes the child wait instead of the output
+        piling up in memory. The child process is killed when the timeout
+        expires or when the caller leaves the block before the command has
+        finished.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+        readers = [
+            loop.create_task(_read_lines(proc.stdout, "stdout", queue)),
+            loop.create_task(_read_lines(proc.stderr, "stderr", queue)),
+        ]
+
+        async def lines() -> AsyncIterator[OutputLine]:
+            try:
+                open_pipes = len(readers)
+                while open_pipes:
+                    line = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                    if line is None:
+                        open_pipes -= 1
+                        continue
+                    yield line
+                output.return_code = await asyncio.wait_for(proc.wait(), max(0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired(list(command), timeout)
+
+        output = CommandOutput(lines())
+        try:
+            yield output
+        finally:
+            if output.return_code is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await proc.wait()
+            for reader in readers:
+                if not reader.done():
+                    reader.cancel()
+
+class _ServerConnection:
+    """
+    One multiplexed connection to a torero command server.
+
+    Requests are tagged with an ID and matched with responses by a reader
+    task, so many commands can be in flight on the same connection.
+    """
+
+    def __init__(self, address: str):
+        self.address = address
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection is currently usable."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        """
+        Open the connection unless it is already open.
+
+        Raises:
+            ConnectionError: If the server cannot be reached.
+        """
+        async with self._connect_lock:
+            if self.connected:
+                return
+
+            try:
+                if self.address.startswith("unix:"):
+                    reader, writer = await asyncio.open_unix_connection(
+                        self.address[len("unix:"):], limit=MAX_MESSAGE_SIZE
+                    )
+                else:
+                    host, _, port = self.address.rpartition(":")
+                    reader, writer = await asyncio.open_connection(
+                        host or "localhost", int(port), limit=MAX_MESSAGE_SIZE
+                    )
+            except (OSError, ValueError) as e:
+                raise ConnectionError(f"Cannot connect to torero server at {self.address}: {e}")
+
+            self._reader, self._writer = reader, writer
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_responses(reader))
+            logger.info(f"Connected to torero server at {self.address}")
+
+    async def request(self, args: List[str], timeout: float) -> CommandResult:
+        """
+        Send one command and wait for its response.
+
+        Args:
+            args: torero arguments without the executable name
+            timeout: Maximum number of seconds to wait for the response
+
+        Returns:
+            CommandResult: The result reported by the server
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives in time.
+            ConnectionError: If the connection drops before the response arrives.
+            RuntimeError: If the server reports that it could not run the command.
+        """
+        await self.connect()
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        try:
+            message = {"id": request_id, "args": args, "timeout": timeout}
+            self._writer.write(json.dumps(message).encode("utf-8") + b"\n")
+            await self._writer.drain()
+            response = await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(["torero", *args], timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "error" in response:
+            raise RuntimeError(f"torero server error: {response['error']}")
+
+        return CommandResult(
+            int(response.get("return_code", 1)),
+            response.get("stdout", ""),
+            response.get("stderr", "")
+        )
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        """Dispatch responses to the waiting requests until the connection closes."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.error(f"Invalid response from torero server: {line[:200]!r}")
+                    continue
+
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+            logger.error(f"torero server connection failed: {e}")
+        finally:
+            self._drop(ConnectionError(f"Connection to torero server at {self.address} closed"))
+
+    def _drop(self, error: Exception) -> None:
+        """Close the transport and fail every pending request."""
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+        self._reader = None
+
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        self._drop(ConnectionError("torero server connection closed by client"))
+
+class ServerBackend(ToreroBackend):
+    """
+    Backend that keeps a persistent connection to a torero command server.
+
+    One connection is kept per event loop, since asyncio streams cannot be
+    shared between loops.
+    """
+
+    name = "server"
+
+    def __init__(self, address: str):
+        """
+        Initialize the backend.
+
+        Args:
+            address: "host:port" or "unix:/path/to/socket"
+        """
+        self.address = address
+        self._connections: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ServerConnection]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _connection(self) -> _ServerConnection:
+        """Get the connection for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            connection = self._connections.get(loop)
+            if connection is None:
+                connection = _ServerConnection(self.address)
+                self._connections[loop] = connection
+            return connection
+
+    async def run(self, command: Sequence[str], timeout: float) -> CommandResult:
+        """
+        Run a torero command on the server.
+
+        See ToreroBackend.run(). The executable name in command[0] is not sent;
+        the server decides how to run torero.
+
+        Raises:
+            ConnectionError: If the server cannot be reached or the connection drops.
+            RuntimeError: If the server reports that it could not run the command.
+        """
+        return await self._connection().request(list(command[1:]), timeout)
+
+    async def close(self) -> None:
+        """Close the connection of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            connection = self._connections.pop(loop, None)
+        if connection is not None:
+            await connection.close()
+
+def create_backend(name: str, server_address: Optional[str] = None) -> ToreroBackend:
+    """
+    Create a backend by name.
+
+    Args:
+        name: "cli" or "server"
+        server_address: Address of the torero server, required for the server backend
+
+    Returns:
+        ToreroBackend: The new backend
+
+    Raises:
+        ValueError: If the name is unknown or the server address is missing
+    """
+    if name == "cli":
+        return CLIBackend()
+    if name == "server":
+        if not server_address:
+            raise ValueError("The server backend requires a torero server address")
+        return ServerBackend(server_address)
+    raise ValueError(f"Unknown backend: {name}, expected one of: {', '.join(BACKENDS)}")
+
+_backend: Optional[ToreroBackend] = None
+_backend_lock = threading.Lock()
+
+def get_backend() -> ToreroBackend:
+    """
+    Get the backend used by the executor, creating it from the environment on first use.
+
+    Returns:
+        ToreroBackend: The active backend
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            name = os.environ.get("TORERO_API_BACKEND", "cli")
+            _backend = create_backend(name, os.environ.get("TORERO_API_SERVER_ADDRESS"))
+            logger.info(f"Using torero {_backend.name} backend")
+        return _backend
+
+def set_backend(backend: Optional[ToreroBackend]) -> Optional[ToreroBackend]:
+    """
+    Replace the backend used by the executor.
+
+    Args:
+        backend: The new backend, or None to recreate it from the environment on next use
+
+    Returns:
+        Optional[ToreroBackend]: The previous backend
+    """
+    global _backend
+    with _backend_lock:
+        previous = _backend
+        _backend = backend
+        return previous
+
+def configure_backend(name: str, server_address: Optional[str] = None) -> ToreroBackend:
+    """
+    Select the backend used by the executor.
+
+    Args:
+        name: "cli" or "server"
+        server_address: Address of the torero server, required for the server backend
+
+    Returns:
+        ToreroBackend: The new backend
+
+    Raises:
+        ValueError: If the name is unknown or the server address is missing
+    """
+    backend = create_backend(name, server_address)
+    set_backend(backend)
+    return backend
@@ -0,0 +1,473 @@
+"""
+Inventory cache for the torero API
+
+This module provides an in-memory, time-based cache for the inventories
+returned by 'torero get <kind> --raw'. Each resource kind (services,
+decorators, repositories, secrets and registries) has its own TTL so that
+frequently polled endpoints can be served from memory instead of spawning
+a torero process on every request.
+
+TTLs are read from the environment when the module is imported and can be
+changed at runtime with configure_inventory_cache():
+
+- TORERO_API_CACHE_TTL: default TTL in seconds for every kind
+- TORERO_API_CACHE_TTL_<KIND>: TTL override for a single kind,
+  e.g. TORERO_API_CACHE_TTL_SERVICES=30
+
+A TTL of 0 disables caching for that kind.
+
+Expired entries are not dropped straight away. For up to
+TORERO_API_CACHE_MAX_STALE seconds (default 300) past its TTL an entry is
+still returned instantly while a fresh copy is loaded in the background
+(stale-while-revalidate). If a reload fails, the last good value is served
+whatever its age, and the error is recorded and reported by status().
+
+When a watcher reports torero's on-disk changes (see core.watcher), the
+cache is switched to watched mode: entries then no longer expire by age and
+are only dropped when the watcher invalidates their kind.
+
+Every invalidation bumps the generation of its kind. A load that started
+in an earlier generation still returns its value to its caller, but never
+stores it, so data from before a change cannot overwrite the invalidation.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from torero_api.core.describe_cache import describe_cache
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Resource kinds that can be cached, named after the 'torero get' sub-command
+RESOURCE_KINDS = ("services", "decorators", "repositories", "secrets", "registries")
+
+# Default TTL in seconds when nothing is configured
+DEFAULT_CACHE_TTL = 5.0
+
+# Default number of seconds past the TTL during which stale entries are served
+# without waiting for the reload
+DEFAULT_MAX_STALE = 300.0
+
+T = TypeVar("T")
+
+class InventoryCache:
+    """
+    Per-kind TTL cache for torero inventories.
+
+    Entries are stored together with the monotonic time at which they were
+    loaded. get() returns the cached value only while it is younger than the
+    TTL configured for its kind; get_or_load() also serves older entries
+    while it reloads them (see the module documentation).
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        max_stale: float = DEFAULT_MAX_STALE
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            default_ttl: TTL in seconds for kinds without an explicit override
+            ttls: Optional per-kind TTL overrides in seconds
+            max_stale: Seconds past the TTL during which stale entries are served
+                while being reloaded in the background; 0 makes callers wait for the reload
+        """
+        self._default_ttl = default_ttl
+        self._ttls: Dict[str, float] = dict(ttls or {})
+        self._max_stale = max_stale
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._errors: Dict[str, Tuple[float, str]] = {}
+        self._accessed: Dict[str, float] = {}
+        self._refreshing: Set[Tuple[asyncio.AbstractEventLoop, str]] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._generations: Dict[str, int] = {}
+        self._watched = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "InventoryCache":
+        """
+        Create a cache configured from TORERO_API_CACHE_TTL* environment variables.
+
+        Returns:
+            InventoryCache: A new cache instance
+        """
+        default_ttl = read_number("TORERO_API_CACHE_TTL", DEFAULT_CACHE_TTL, allow_zero=True)
+        ttls = {}
+        for kind in RESOURCE_KINDS:
+            variable = f"TORERO_API_CACHE_TTL_{kind.upper()}"
+            if os.environ.get(variable):
+                ttls[kind] = read_number(variable, default_ttl, allow_zero=True)
+        max_stale = read_number("TORERO_API_CACHE_MAX_STALE", DEFAULT_MAX_STALE, allow_zero=True)
+        return cls(default_ttl=default_ttl, ttls=ttls, max_stale=max_stale)
+
+    def configure(
+        self,
+        default_ttl: Optional[float] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        max_stale: Optional[float] = None
+    ) -> None:
+        """
+        Update the TTL configuration.
+
+        Args:
+            default_ttl: New default TTL in seconds, or None to keep the current one
+            ttls: Per-kind TTL overrides to merge into the current configuration
+            max_stale: New stale serving window in seconds, or None to keep the current one
+
+        Raises:
+            ValueError: If an unknown kind or a negative TTL is given
+        """
+        with self._lock:
+            if default_ttl is not None:
+                if default_ttl < 0:
+                    raise ValueError("Cache TTL must not be negative")
+                self._default_ttl = default_ttl
+            if max_stale is not None:
+                if max_stale < 0:
+                    raise ValueError("Maximum staleness must not be negative")
+                self._max_stale = max_stale
+            for kind, ttl in (ttls or {}).items():
+                if kind not in RESOURCE_KINDS:
+                    raise ValueError(f"Unknown resource kind: {kind}")
+                if ttl < 0:
+                    raise ValueError("Cache TTL must not be negative")
+                self._ttls[kind] = ttl
+
+    def get_ttl(self, kind: str) -> float:
+        """
+        Get the TTL in seconds for a resource kind.
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            float: The TTL in seconds
+        """
+        return self._ttls.get(kind, self._default_ttl)
+
+    @property
+    def watched(self) -> bool:
+        """Whether entries are kept until invalidated instead of expiring by age."""
+        return self._watched
+
+    def set_watched(self, watched: bool) -> None:
+        """
+        Switch watched mode on or off.
+
+        Only enable watched mode while something reliably calls invalidate()
+        when torero's state changes.
+
+        Args:
+            watched: True to keep entries until they are invalidated
+        """
+        self._watched = watched
+        logger.info(f"Inventory cache {'is' if watched else 'is no longer'} driven by change notifications")
+
+    def is_stale(self, kind: str, age: float) -> bool:
+        """
+        Check whether data of the given age is past its TTL.
+
+        Args:
+            kind: The resource kind
+            age: Age of the data in seconds
+
+        Returns:
+            bool: True if the data has expired
+        """
+        ttl = self.get_ttl(kind)
+        return 0 < ttl <= age and not self._watched
+
+    def get(self, kind: str) -> Optional[Any]:
+        """
+        Get the cached value for a kind if it has not expired.
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            Optional[Any]: The cached value, or None if missing or expired
+        """
+        ttl = self.get_ttl(kind)
+        if ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(kind)
+
+        if entry is None:
+            return None
+
+        loaded_at, value = entry
+        if self.is_stale(kind, time.monotonic() - loaded_at):
+            return None
+        return value
+
+    def peek(self, kind: str) -> Optional[Any]:
+        """
+        Get the cached value for a kind whatever its age.
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            Optional[Any]: The cached value, or None if there is no entry
+        """
+        with self._lock:
+            entry = self._entries.get(kind)
+        return entry[1] if entry is not None else None
+
+    def generation(self, kind: str) -> int:
+        """
+        Get the number of times a kind has been invalidated.
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            int: The current generation of the kind
+        """
+        with self._lock:
+            return self._generations.get(kind, 0)
+
+    def put(self, kind: str, value: Any, generation: Optional[int] = None) -> bool:
+        """
+        Store a freshly loaded value for a kind.
+
+        Args:
+            kind: The resource kind
+            value: The value to cache
+            generation: Generation of the kind when the load started, or None to store unconditionally
+
+        Returns:
+            bool: False if the value was not stored because the kind was invalidated since
+        """
+        if self.get_ttl(kind) <= 0:
+            return True
+
+        with self._lock:
+            if generation is not None and self._generations.get(kind, 0) != generation:
+                return False
+            self._entries[kind] = (time.monotonic(), value)
+            return True
+
+    def age(self, kind: str) -> Optional[float]:
+        """
+        Get the age of the cached entry for a kind, expired or not.
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            Optional[float]: Seconds since the entry was loaded, or None if there is no entry
+        """
+        with self._lock:
+            entry = self._entries.get(kind)
+        if entry is None:
+            return None
+        return time.monotonic() - entry[0]
+
+    def idle_time(self, kind: str) -> Optional[float]:
+        """
+        Get the time since a kind was last read through get_or_load().
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            Optional[float]: Seconds since the last read, or None if it was never read
+        """
+        with self._lock:
+            accessed = self._accessed.get(kind)
+        if accessed is None:
+            return None
+        return time.monotonic() - accessed
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Drop cached values so the next lookup reloads them from torero.
+
+        Args:
+            kind: The resource kind to invalidate, or None to invalidate every kind
+        """
+        with self._lock:
+            kinds = set(RESOURCE_KINDS) | set(self._generations) if kind is None else {kind}
+            for invalidated in kinds:
+                self._generations[invalidated] = self._generations.get(invalidated, 0) + 1
+                self._entries.pop(invalidated, None)
+                self._errors.pop(invalidated, None)
+        logger.debug(f"Invalidated inventory cache: {kind or 'all kinds'}")
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Describe the state of every resource kind.
+
+        Returns:
+            dict: Per kind, the TTL, the age of the cached entry (None if not loaded),
+            whether it is stale, and the last reload error (None after a successful reload)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entries = dict(self._entries)
+            errors = dict(self._errors)
+
+        status = {}
+        for kind in RESOURCE_KINDS:
+            ttl = self.get_ttl(kind)
+            entry = entries.get(kind)
+            age = now - entry[0] if entry is not None else None
+            error = errors.get(kind)
+            status[kind] = {
+                "ttl": ttl,
+                "age": age,
+                "stale": age is not None and self.is_stale(kind, age),
+                "last_error": error[1] if error else None,
+                "last_error_age": now - error[0] if error else None,
+            }
+        return status
+
+    async def refresh(self, kind: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Reload the value for a kind now, whatever the age of the cached entry.
+
+        If the reload fails and a previous value is cached, the error is
+        recorded and the previous value is returned instead. If the kind is
+        invalidated while the reload runs, its value is returned but not cached.
+
+        Args:
+            kind: The resource kind
+            loader: Coroutine function that fetches the value from torero
+
+        Returns:
+            The freshly loaded value, or the last good value if the reload failed
+
+        Raises:
+            Exception: Whatever the loader raised, if there is no previous value to fall back to.
+        """
+        generation = self.generation(kind)
+        try:
+            value = await loader()
+        except Exception as e:
+            with self._lock:
+                if self._generations.get(kind, 0) == generation:
+                    self._errors[kind] = (time.monotonic(), str(e))
+                entry = self._entries.get(kind)
+            if entry is None:
+                raise
+            logger.warning(f"Failed to refresh {kind} inventory, serving stale data: {str(e)}")
+            return entry[1]
+
+        if not self.put(kind, value, generation):
+            logger.debug(f"Not caching {kind} inventory loaded before it was invalidated")
+            return value
+        with self._lock:
+            self._errors.pop(kind, None)
+        return value
+
+    def _refresh_in_background(self, kind: str, loader: Callable[[], Awaitable[T]]) -> None:
+        """Start a background reload of a kind unless one is already running on this loop."""
+        loop = asyncio.get_running_loop()
+        refresh_key = (loop, kind)
+        with self._lock:
+            if refresh_key in self._refreshing:
+                return
+            self._refreshing.add(refresh_key)
+
+        async def run() -> None:
+            try:
+                await self.refresh(kind, loader)
+            except Exception:
+                # Already recorded by refresh(); there is no caller to report to
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(refresh_key)
+
+        # The loop only keeps weak references to tasks; hold on to the refresh until it is done
+        task = loop.create_task(run())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def get_or_load(self, kind: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the cached value for a kind, loading it on a miss.
+
+        Entries that expired less than max_stale seconds ago are returned
+        immediately and reloaded in the background. Older entries are reloaded
+        before returning, falling back to the old value if the reload fails.
+        Failed loads are never cached; without a previous value the exception
+        propagates to the caller.
+
+        Args:
+            kind: The resource kind
+            loader: Coroutine function that fetches the value from torero
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        ttl = self.get_ttl(kind)
+        if ttl <= 0:
+            return await loader()
+
+        with self._lock:
+            entry = self._entries.get(kind)
+            self._accessed[kind] = time.monotonic()
+
+        if entry is not None:
+            loaded_at, value = entry
+            age = time.monotonic() - loaded_at
+            if not self.is_stale(kind, age):
+                logger.debug(f"Inventory cache hit: {kind}")
+                return value
+            if age < ttl + self._max_stale:
+                logger.debug(f"Inventory cache stale hit: {kind}, revalidating")
+                self._refresh_in_background(kind, loader)
+                return value
+
+        logger.debug(f"Inventory cache miss: {kind}")
+        return await self.refresh(kind, loader)
+
+# Shared cache instance used by the executor
+inventory_cache = InventoryCache.from_env()
+
+def invalidate_inventory(kind: Optional[str] = None) -> None:
+    """
+    Invalidate the shared inventory cache.
+
+    Call this after changing torero state (for example after creating or
+    deleting a service) so the next request sees the change immediately.
+    The cached describe results of the kind are dropped as well, since a
+    change may alter them without changing the inventory listing.
+
+    Args:
+        kind: The resource kind to invalidate, or None to invalidate every kind
+    """
+    inventory_cache.invalidate(kind)
+    describe_cache.invalidate(kind)
+
+def configure_inventory_cache(
+    default_ttl: Optional[float] = None,
+    ttls: Optional[Dict[str, float]] = None,
+    max_stale: Optional[float] = None
+) -> None:
+    """
+    Update the TTL configuration of the shared inventory cache.
+
+    Args:
+        default_ttl: New default TTL in seconds, or None to keep the current one
+        ttls: Per-kind TTL overrides in seconds
+        max_stale: Stale serving window in seconds, or None to keep the current one
+
+    Raises:
+        ValueError: If an unknown kind or a negative TTL is given
+    """
+    inventory_cache.configure(default_ttl=default_ttl, ttls=ttls, max_stale=max_stale)
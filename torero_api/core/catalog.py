@@ -0,0 +1,179 @@
+"""
+Compact service catalog for the torero API
+
+Large torero installations register tens of thousands of services that
+mostly share a handful of types and a small tag vocabulary. Held as Pydantic
+models, every service carries its own copies of those strings and its own
+tags list.
+
+A ServiceCatalog stores each service as a slotted ServiceEntry instead:
+
+- type strings are interned, so all services of a type share one string
+- tags are stored as small integer IDs into the catalog's shared TagTable
+- identical tag combinations share a single tuple of IDs
+
+Entries expose the same attributes as :class:`torero_api.models.service.Service`
+(name, description, type, tags, registries), so the executor's cache and the
+endpoint filters use them unchanged, and to_model() turns an entry back into
+the Pydantic model at the API boundary. Each inventory snapshot builds its own
+catalog, so tags that disappear from torero do not linger in the tag table.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from torero_api.models.service import Service
+
+class TagTable:
+    """
+    Shared table of interned tag strings, addressed by small integer IDs.
+
+    Attributes:
+        names: Tag strings, indexed by tag ID
+    """
+
+    __slots__ = ("names", "_ids")
+
+    def __init__(self):
+        """Initialize an empty tag table."""
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def id_for(self, tag: str) -> int:
+        """
+        Get the ID of a tag, adding it to the table if needed.
+
+        Args:
+            tag: The tag string
+
+        Returns:
+            int: The tag's ID
+        """
+        tag_id = self._ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self.names)
+            self.names.append(sys.intern(tag))
+            self._ids[tag] = tag_id
+        return tag_id
+
+    def get(self, tag: str) -> Optional[int]:
+        """
+        Look up the ID of a tag without adding it.
+
+        Args:
+            tag: The tag string
+
+        Returns:
+            Optional[int]: The tag's ID, or None if no entry has the tag
+        """
+        return self._ids.get(tag)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+class ServiceEntry:
+    """
+    Compact form of :class:`torero_api.models.service.Service`.
+
+    Attributes:
+        name: Unique identifier for the service
+        description: Human-readable explanation of the service's purpose
+        type: Interned service type
+        tag_ids: IDs of the service's tags in the catalog's tag table
+        registries: Optional metadata about where the service is registered
+    """
+
+    __slots__ = ("name", "description", "type", "tag_ids", "registries", "_table")
+
+    def __init__(self, name: str, description: Optional[str], type: str, tag_ids: Tuple[int, ...],
+                 registries: Optional[Dict[str, Any]], table: TagTable):
+        self.name = name
+        self.description = description
+        self.type = type
+        self.tag_ids = tag_ids
+        self.registries = registries
+        self._table = table
+
+    @property
+    def tags(self) -> List[str]:
+        """The service's tags, resolved from the tag table."""
+        names = self._table.names
+        return [names[tag_id] for tag_id in self.tag_ids]
+
+    def has_tag(self, tag: str) -> bool:
+        """
+        Check whether the service has a tag without resolving all its tags.
+
+        Args:
+            tag: The tag string
+
+        Returns:
+            bool: True if the service has the tag
+        """
+        tag_id = self._table.get(tag)
+        return tag_id is not None and tag_id in self.tag_ids
+
+    def to_model(self) -> Service:
+        """
+        Convert the entry to its Pydantic model.
+
+        Returns:
+            Service: The service model
+        """
+        return Service(
+            name=self.name,
+            description=self.description,
+            type=self.type,
+            tags=self.tags,
+            registries=self.registries
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ServiceEntry):
+            return NotImplemented
+        return (self.name, self.description, self.type, self.tags, self.registries) == \
+            (other.name, other.description, other.type, other.tags, other.registries)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ServiceEntry(name={self.name!r}, type={self.type!r}, tags={self.tags!r})"
+
+class ServiceCatalog:
+    """
+    Builder for the compact entries of one services inventory.
+
+    Attributes:
+        tags: The tag table shared by all entries of the catalog
+    """
+
+    __slots__ = ("tags", "_tag_sets")
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self.tags = TagTable()
+        self._tag_sets: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+
+    def add(self, service: Any) -> ServiceEntry:
+        """
+        Build the compact entry for a service.
+
+        Args:
+            service: Any object with the attributes of a Service, e.g. the
+                Pydantic model or a fast-decoder record
+
+        Returns:
+            ServiceEntry: The compact entry
+        """
+        id_for = self.tags.id_for
+        tag_ids = tuple(id_for(tag) for tag in service.tags or ())
+        tag_ids = self._tag_sets.setdefault(tag_ids, tag_ids)
+
+        return ServiceEntry(
+            name=service.name,
+            description=service.description,
+            type=sys.intern(service.type),
+            tag_ids=tag_ids,
+            registries=service.registries,
+            table=self.tags
+        )
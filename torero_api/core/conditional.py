@@ -0,0 +1,72 @@
+"""
+Conditional request support for the torero API
+
+Read endpoints under /v1/<kind>/ are answered from the cached inventory
+snapshot of that kind, so their responses only change when the snapshot's
+content digest does. Their strong ETags are derived from that digest plus
+the request path and query string, which lets the server answer
+If-None-Match with 304 from the cached snapshot alone, before the endpoint
+runs: no torero call and no response serialization.
+
+Describe endpoints share the ETag scheme, so a describe result is
+considered unchanged for as long as its parent inventory is.
+"""
+
+import hashlib
+from typing import Optional
+
+from torero_api.core.cache import RESOURCE_KINDS
+
+def kind_for_path(path: str) -> Optional[str]:
+    """
+    Get the inventory kind a request path reads from.
+
+    Args:
+        path: The request path, e.g. "/v1/services/types"
+
+    Returns:
+        Optional[str]: The resource kind, or None for paths outside the inventories
+    """
+    parts = path.split("/", 3)
+    if len(parts) >= 3 and parts[1] == "v1" and parts[2] in RESOURCE_KINDS:
+        return parts[2]
+    return None
+
+def make_etag(digest: str, path: str, query: str = "") -> str:
+    """
+    Build the strong ETag of a response derived from an inventory snapshot.
+
+    Args:
+        digest: The snapshot's content digest
+        path: The request path
+        query: The raw query string
+
+    Returns:
+        str: The quoted ETag value
+    """
+    tag = hashlib.blake2b(f"{digest}\n{path}\n{query}".encode(), digest_size=16).hexdigest()
+    return f'"{tag}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    W/-prefixed validators match too.
+
+    Args:
+        if_none_match: The header value: "*" or a comma-separated list of ETags
+        etag: The current ETag
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(value: str) -> str:
+        value = value.strip()
+        return value[2:] if value.startswith("W/") else value
+
+    current = opaque(etag)
+    return any(opaque(candidate) == current for candidate in if_none_match.split(","))
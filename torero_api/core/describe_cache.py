@@ -0,0 +1,222 @@
+"""
+Describe cache for the torero API
+
+'torero describe <kind> <name> --raw' spawns a process per call, and MCP
+tool discovery asks for the same few names over and over. This module keeps
+the parsed describe results in a size-bounded LRU cache keyed by resource
+kind and name.
+
+A describe result is only valid for as long as the inventory it belongs to:
+every entry records the digest of the parent inventory snapshot it was
+loaded under, and a lookup only hits while the cached snapshot of that kind
+still has the same digest. Invalidating or replacing the inventory with
+different content therefore invalidates its describe results as well.
+
+The bounds are read from the environment when the module is imported and can
+be changed at runtime with configure_describe_cache():
+
+- TORERO_API_DESCRIBE_CACHE_ENTRIES: maximum number of results (default 1024)
+- TORERO_API_DESCRIBE_CACHE_BYTES: maximum total size of the results, measured
+  as their JSON encoding (default 16 MiB)
+
+Setting either bound to 0 disables the cache.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Defaults used when nothing is configured
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+class DescribeCache:
+    """
+    LRU cache of describe results, bounded by entry count and total size.
+
+    Entries map (kind, name) to the result, the digest of the parent
+    inventory snapshot and the result's size in bytes. Results are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of the cached results in bytes
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "DescribeCache":
+        """
+        Create a cache configured from TORERO_API_DESCRIBE_CACHE_* environment variables.
+
+        Returns:
+            DescribeCache: A new cache instance
+        """
+        return cls(
+            max_entries=read_number("TORERO_API_DESCRIBE_CACHE_ENTRIES", DEFAULT_MAX_ENTRIES, cast=int, allow_zero=True),
+            max_bytes=read_number("TORERO_API_DESCRIBE_CACHE_BYTES", DEFAULT_MAX_BYTES, cast=int, allow_zero=True)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self._max_entries > 0 and self._max_bytes > 0
+
+    def configure(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+        """
+        Update the bounds, evicting entries that no longer fit.
+
+        Args:
+            max_entries: New maximum number of results, or None to keep the current one
+            max_bytes: New maximum total size in bytes, or None to keep the current one
+
+        Raises:
+            ValueError: If a bound is negative
+        """
+        with self._lock:
+            if max_entries is not None:
+                if max_entries < 0:
+                    raise ValueError("Describe cache entry limit must not be negative")
+                self._max_entries = max_entries
+            if max_bytes is not None:
+                if max_bytes < 0:
+                    raise ValueError("Describe cache size limit must not be negative")
+                self._max_bytes = max_bytes
+            self._evict()
+
+    def get(self, kind: str, name: str, digest: Optional[str]) -> Tuple[bool, Any]:
+        """
+        Look up a describe result.
+
+        Args:
+            kind: The resource kind, e.g. "services"
+            name: The resource name
+            digest: Digest of the current inventory snapshot of the kind, or
+                None if no snapshot is cached
+
+        Returns:
+            tuple: (True, result) on a hit, (False, None) on a miss
+        """
+        key = (kind, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or digest is None or entry[0] != digest:
+                if entry is not None:
+                    # Loaded under an inventory that is gone or has changed
+                    self._drop(key)
+                    self._invalidations += 1
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[1]
+
+    def put(self, kind: str, name: str, digest: Optional[str], value: Any) -> None:
+        """
+        Store a describe result.
+
+        Results are not stored without a parent snapshot digest, while the
+        cache is disabled, or when a single result exceeds the size bound.
+
+        Args:
+            kind: The resource kind
+            name: The resource name
+            digest: Digest of the inventory snapshot the result was loaded under
+            value: The parsed describe result
+        """
+        if digest is None or not self.enabled:
+            return
+
+        size = len(json.dumps(value, default=str))
+        key = (kind, name)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self._max_bytes:
+                logger.debug(f"Not caching describe result of {kind}/{name}: {size} bytes")
+                return
+            self._entries[key] = (digest, value, size)
+            self._bytes += size
+            self._evict()
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            kind: The resource kind to invalidate, or None to invalidate every kind
+        """
+        with self._lock:
+            keys = [key for key in self._entries if kind is None or key[0] == kind]
+            for key in keys:
+                self._drop(key)
+            self._invalidations += len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the usage of the cache.
+
+        Returns:
+            dict: Number and total size of cached results, the bounds, and
+            the hit, miss, eviction and invalidation counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        """Remove an entry; the caller holds the lock."""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until both bounds hold; the caller holds the lock."""
+        while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+            key = next(iter(self._entries))
+            self._drop(key)
+            self._evictions += 1
+
+# Shared cache instance used by the executor
+describe_cache = DescribeCache.from_env()
+
+def configure_describe_cache(max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> None:
+    """
+    Update the bounds of the shared describe cache.
+
+    Args:
+        max_entries: Maximum number of cached results, or None to keep the current one
+        max_bytes: Maximum total size in bytes, or None to keep the current one
+
+    Raises:
+        ValueError: If a bound is negative
+    """
+    describe_cache.configure(max_entries=max_entries, max_bytes=max_bytes)
@@ -0,0 +1,296 @@
+"""
+Fast typed decoding of torero inventories
+
+With the default "stream" decoder, every item of a 'torero get <kind> --raw'
+document is parsed into a dict and validated into its Pydantic model (see
+torero_api.core.jsonstream). On large inventories that per-item validation
+dominates CPU time.
+
+The optional "fast" decoder uses msgspec (``pip install torero-api[fast]``)
+to decode torero's raw output straight into compact typed records in a single
+pass. Records replace the Pydantic models inside the API: they are what the
+inventory cache holds and what endpoints filter on. They expose the same
+attributes as the models they stand for (name, type, tags, ...), and
+to_model() turns them into the Pydantic model, which endpoints do only for
+the items they actually return. Services are compacted further into
+catalog entries (see torero_api.core.catalog) whichever decoder is used.
+
+The fast decoder reads the complete output before decoding it, so it trades
+the one-item memory bound of the stream decoder for speed; the records
+themselves are much smaller than the equivalent models.
+
+Environment variables:
+    TORERO_API_DECODER: "stream" (default) or "fast"
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DECODERS = ("stream", "fast")
+
+def fast_decode_available() -> bool:
+    """Whether msgspec is installed, which the fast decoder requires."""
+    return msgspec is not None
+
+def decoder_name() -> str:
+    """
+    Get the inventory decoder selected by TORERO_API_DECODER.
+
+    Falls back to "stream" with a warning when "fast" is selected but msgspec
+    is not installed.
+
+    Returns:
+        str: "stream" or "fast"
+    """
+    name = os.environ.get("TORERO_API_DECODER", "stream")
+    if name not in DECODERS:
+        logger.warning(f"Unknown decoder {name!r} in TORERO_API_DECODER, using 'stream'")
+        return "stream"
+    if name == "fast" and not fast_decode_available():
+        logger.warning("The fast decoder requires msgspec (pip install torero-api[fast]), using 'stream'")
+        return "stream"
+    return name
+
+def as_model(item: Any) -> Any:
+    """
+    Convert an inventory item to its Pydantic model.
+
+    Args:
+        item: A record from the fast decoder, or an item that already is a model
+
+    Returns:
+        The Pydantic model for the item
+    """
+    if item is None or isinstance(item, BaseModel):
+        return item
+    return item.to_model()
+
+def as_models(items: List[Any]) -> List[Any]:
+    """
+    Convert inventory items to their Pydantic models.
+
+    Args:
+        items: Records from the fast decoder and/or models
+
+    Returns:
+        List: The Pydantic models, in the same order
+    """
+    return [as_model(item) for item in items]
+
+if msgspec is not None:
+
+    class ServiceRecord(msgspec.Struct, gc=False):
+        """Compact form of :class:`torero_api.models.service.Service`."""
+
+        name: str
+        type: str
+        description: Optional[str] = None
+        tags: Optional[List[str]] = None
+        registries: Optional[Dict[str, Any]] = None
+
+        def __post_init__(self):
+            if self.tags is None:
+                self.tags = []
+
+        def to_model(self) -> "Service":
+            from torero_api.models.service import Service
+
+            return Service(
+                name=self.name,
+                description=self.description,
+                type=self.type,
+                tags=self.tags,
+                registries=self.registries
+            )
+
+    class DecoratorRecord(msgspec.Struct, gc=False):
+        """Compact form of :class:`torero_api.models.decorator.Decorator`."""
+
+        name: str = "unknown"
+        description: Optional[str] = None
+        type: str = "decorator"
+        parameters: Optional[Dict[str, Any]] = None
+        schema: Optional[Dict[str, Any]] = None
+        id: Any = None
+        created: Any = None
+        tags: Optional[List[str]] = None
+
+        def __post_init__(self):
+            # The CLI uses "schema" but our model expects "parameters"
+            self.description = self.description or None
+            self.parameters = self.schema or self.parameters
+            self.schema = None
+
+        @property
+        def registries(self) -> Dict[str, Any]:
+            return {
+                "metadata": {
+                    "id": self.id,
+                    "created": self.created,
+                    "tags": self.tags if self.tags is not None else []
+                }
+            }
+
+        def to_model(self) -> "Decorator":
+            from torero_api.models.decorator import Decorator
+
+            return Decorator(
+                name=self.name,
+                description=self.description,
+                type=self.type,
+                parameters=self.parameters,
+                registries=self.registries
+            )
+
+    class RepositoryRecord(msgspec.Struct, gc=False):
+        """Compact form of :class:`torero_api.models.repository.Repository`."""
+
+        name: str = "unknown"
+        description: Optional[str] = None
+        type: Optional[str] = None
+        location: Optional[str] = None
+        url: Optional[str] = None
+        reference: Optional[str] = None
+        tags: Optional[List[str]] = None
+        private_key_name: Optional[str] = ""
+
+        def __post_init__(self):
+            # The CLI reports a URL; the type is derived from it when missing
+            if not self.type:
+                self.type = "git" if (self.url or "").endswith(".git") else "unknown"
+            self.location = self.url or self.location or "unknown"
+            self.url = None
+
+        @property
+        def metadata(self) -> Dict[str, Any]:
+            return {
+                "reference": self.reference,
+                "tags": self.tags if self.tags is not None else [],
+                "private_key_name": self.private_key_name
+            }
+
+        def to_model(self) -> "Repository":
+            from torero_api.models.repository import Repository
+
+            return Repository(
+                name=self.name,
+                description=self.description,
+                type=self.type,
+                location=self.location,
+                metadata=self.metadata
+            )
+
+    class SecretRecord(msgspec.Struct, gc=False):
+        """Compact form of :class:`torero_api.models.secret.Secret`."""
+
+        name: str
+        type: str
+        description: Optional[str] = None
+        created_at: Optional[str] = None
+        metadata: Optional[Dict[str, Any]] = None
+
+        def to_model(self) -> "Secret":
+            from torero_api.models.secret import Secret
+
+            return Secret(
+                name=self.name,
+                description=self.description,
+                type=self.type,
+                created_at=self.created_at,
+                metadata=self.metadata
+            )
+
+    class RegistryRecord(msgspec.Struct, gc=False):
+        """Compact form of :class:`torero_api.models.registry.Registry`."""
+
+        name: str = "unknown"
+        description: Optional[str] = None
+        type: str = "unknown"
+        url: str = ""
+        id: Optional[str] = None
+        created: Optional[str] = None
+        tags: Optional[List[str]] = None
+        credentials: Optional[str] = None
+
+        @property
+        def metadata(self) -> Dict[str, Any]:
+            return {
+                "id": self.id,
+                "created": self.created,
+                "tags": self.tags if self.tags is not None else [],
+                "credentials": self.credentials
+            }
+
+        def to_model(self) -> "Registry":
+            from torero_api.models.registry import Registry
+
+            return Registry(
+                name=self.name,
+                description=self.description,
+                type=self.type,
+                url=self.url,
+                metadata=self.metadata
+            )
+
+    def _make_decoder(record: type, array_keys: Tuple[str, ...]) -> Tuple["msgspec.json.Decoder", Tuple[str, ...]]:
+        """Build the decoder for a top-level array or an object wrapping one under array_keys."""
+        wrapped = msgspec.defstruct(
+            f"Wrapped{record.__name__}",
+            [(key, Optional[List[record]], None) for key in array_keys]
+        )
+        return msgspec.json.Decoder(Union[List[record], wrapped]), array_keys
+
+    _DECODERS = {
+        "services": _make_decoder(ServiceRecord, ("items",)),
+        "decorators": _make_decoder(DecoratorRecord, ("decorators", "items")),
+        "repositories": _make_decoder(RepositoryRecord, ("items",)),
+        "secrets": _make_decoder(SecretRecord, ("items",)),
+        "registries": _make_decoder(RegistryRecord, ("items",))
+    }
+
+def decode_inventory(kind: str, data: Union[bytes, str]) -> List[Any]:
+    """
+    Decode a 'torero get <kind> --raw' document into records.
+
+    Args:
+        kind: The resource kind, e.g. "services"
+        data: The complete raw output
+
+    Returns:
+        List: One record per inventory item, in the order returned by torero
+
+    Raises:
+        RuntimeError: If msgspec is not installed.
+        ValueError: If the kind is unknown or the document is invalid.
+    """
+    if msgspec is None:
+        raise RuntimeError("The fast decoder requires msgspec (pip install torero-api[fast])")
+    if kind not in _DECODERS:
+        raise ValueError(f"Unknown inventory kind: {kind}")
+
+    decoder, array_keys = _DECODERS[kind]
+    try:
+        result = decoder.decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e))
+
+    if isinstance(result, list):
+        return result
+    for key in array_keys:
+        items = getattr(result, key)
+        if items is not None:
+            return items
+
+    keys = " or ".join(repr(key) for key in array_keys)
+    raise ValueError(f"Unexpected JSON structure: expected an array or an object with {keys}")
@@ -0,0 +1,163 @@
+"""
+torero health probe for the torero API
+
+Load balancer and Kubernetes probes hit /health every few seconds. Checking
+torero on every probe would run 'torero version' each time, so the probe
+result is kept in memory instead: a background task re-checks torero's
+availability and version every TORERO_API_HEALTH_INTERVAL seconds (default
+30) and /health answers from the last result.
+
+A live check can be requested explicitly (/health?deep=true). Concurrent
+live checks, including the background one, share a single torero call.
+
+If the background task is not running (e.g. when the app is used without
+its lifespan), results older than twice the interval are not served and the
+next probe runs a live check instead.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from torero_api.core.settings import read_number
+from torero_api.core.singleflight import SingleFlight
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default number of seconds between background checks
+DEFAULT_HEALTH_INTERVAL = 30.0
+
+def health_interval() -> float:
+    """
+    Get the number of seconds between background health checks.
+
+    Returns:
+        float: Seconds from TORERO_API_HEALTH_INTERVAL, or DEFAULT_HEALTH_INTERVAL
+    """
+    return read_number("TORERO_API_HEALTH_INTERVAL", DEFAULT_HEALTH_INTERVAL)
+
+class HealthProbe:
+    """
+    In-memory torero availability and version, refreshed in the background.
+    """
+
+    def __init__(self, interval: float = DEFAULT_HEALTH_INTERVAL):
+        """
+        Initialize the probe.
+
+        Args:
+            interval: Seconds between background checks
+        """
+        self._interval = interval
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at: Optional[float] = None
+        self._flights = SingleFlight()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> "HealthProbe":
+        """
+        Create a probe configured from TORERO_API_HEALTH_INTERVAL.
+
+        Returns:
+            HealthProbe: A new probe
+        """
+        return cls(interval=health_interval())
+
+    @property
+    def running(self) -> bool:
+        """Whether the background check task is running."""
+        return self._task is not None and not self._task.done()
+
+    def cached(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the last check result if it is recent enough to serve.
+
+        Returns:
+            Optional[dict]: The result (see check()), or None if there is none or it is
+            older than twice the check interval
+        """
+        if self._result is None or self._checked_at is None:
+            return None
+        age = time.monotonic() - self._checked_at
+        if age > 2 * self._interval:
+            return None
+        return {**self._result, "age": age}
+
+    async def check(self) -> Dict[str, Any]:
+        """
+        Check torero now, joining a check that is already running.
+
+        Returns:
+            dict: available (bool), message (str), version (str, or None if torero
+            is not available) and age (seconds since the check, i.e. 0)
+        """
+        await self._flights.do("torero", self._check)
+        return {**self._result, "age": time.monotonic() - self._checked_at}
+
+    async def _check(self) -> None:
+        """Run the torero checks and store the result."""
+        from torero_api.core import torero_executor
+
+        try:
+            available, message = await torero_executor.check_torero_available_async()
+        except Exception as e:
+            available, message = False, f"Error checking torero: {str(e)}"
+        version = await torero_executor.check_torero_version_async() if available else None
+
+        if self._result is not None and self._result["available"] != available:
+            logger.warning(f"torero is {'now' if available else 'no longer'} available: {message}")
+        self._result = {"available": available, "message": message, "version": version}
+        self._checked_at = time.monotonic()
+
+    async def get(self, deep: bool = False) -> Dict[str, Any]:
+        """
+        Get torero's health, from memory unless a live check is requested or needed.
+
+        Args:
+            deep: True to run a live check even if a recent result is cached
+
+        Returns:
+            dict: The check result (see check())
+        """
+        if not deep:
+            result = self.cached()
+            if result is not None:
+                return result
+        return await self.check()
+
+    def reset(self) -> None:
+        """Forget the last check result."""
+        self._result = None
+        self._checked_at = None
+
+    def start(self) -> None:
+        """Start the background check task on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background check task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Check loop."""
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                logger.error(f"Health check error: {str(e)}")
+            await asyncio.sleep(self._interval)
+
+# Shared probe used by the health endpoint and the warm-up
+health_probe = HealthProbe.from_env()
@@ -0,0 +1,452 @@
+"""
+Persistent execution history for the torero API
+
+Every service execution run through the API is recorded in an embedded
+SQLite database: the service, what was run, the outcome, torero's timings
+and the ID of the full output if it was kept. The history survives
+restarts, so past runs can be looked up instead of being re-run. Kept
+outputs expire long before their records do (see torero_api.core.outputs):
+records only carry an output_url while the output can still be downloaded.
+
+Records are listed newest first and paged with a cursor (keyset
+pagination) rather than an offset, and every supported filter (service,
+status, since) is backed by an index that also provides the sort order, so
+a page costs the same whether the table holds a hundred rows or millions.
+
+Statuses:
+
+- succeeded: torero ran the service and it returned 0
+- failed: torero ran the service and it returned another code
+- error: the execution could not be completed (torero error, invalid result, timeout)
+
+The history is on by default. Settings are read from the environment:
+
+- TORERO_API_HISTORY: set to 0 to disable the history (default 1)
+- TORERO_API_HISTORY_DB: path of the database file (default ~/.torero-api/history.db)
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from torero_api.core.outputs import OUTPUT_URL_PREFIX, output_store
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default location of the history database
+DEFAULT_HISTORY_DB = os.path.join("~", ".torero-api", "history.db")
+
+# Execution outcomes
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+ERROR = "error"
+EXECUTION_STATUSES = (SUCCEEDED, FAILED, ERROR)
+
+# Columns returned for each record, in order
+_COLUMNS = (
+    "id", "service", "operation", "status", "return_code", "start_time", "end_time",
+    "elapsed_time", "finished_at", "output_id", "error"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    service TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    status TEXT NOT NULL,
+    return_code INTEGER,
+    start_time TEXT,
+    end_time TEXT,
+    elapsed_time REAL,
+    finished_at REAL NOT NULL,
+    output_id TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS executions_by_time ON executions (finished_at, id);
+CREATE INDEX IF NOT EXISTS executions_by_service ON executions (service, finished_at, id);
+CREATE INDEX IF NOT EXISTS executions_by_status ON executions (status, finished_at, id);
+"""
+
+def history_enabled() -> bool:
+    """
+    Check whether executions are recorded.
+
+    Returns:
+        bool: False if TORERO_API_HISTORY is set to 0, false, no or off
+    """
+    return os.environ.get("TORERO_API_HISTORY", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def history_path() -> str:
+    """
+    Get the path of the history database.
+
+    Returns:
+        str: TORERO_API_HISTORY_DB, or DEFAULT_HISTORY_DB
+    """
+    return os.environ.get("TORERO_API_HISTORY_DB") or DEFAULT_HISTORY_DB
+
+def encode_cursor(finished_at: float, record_id: int) -> str:
+    """
+    Build the cursor pointing after a record.
+
+    Args:
+        finished_at: The record's finish time (seconds since the epoch)
+        record_id: The record's ID
+
+    Returns:
+        str: An opaque cursor
+    """
+    return f"{finished_at!r}_{record_id}"
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Parse a cursor built by encode_cursor().
+
+    Args:
+        cursor: The cursor
+
+    Returns:
+        Tuple[float, int]: The finish time and ID of the last record of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    finished_at, sep, record_id = cursor.partition("_")
+    if not sep:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return float(finished_at), int(record_id)
+
+def _iso(timestamp: float) -> str:
+    """Format seconds since the epoch as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+class ExecutionHistory:
+    """
+    SQLite-backed record of service executions.
+
+    The database is opened on first use. Calls are serialized on one
+    connection; the *_async methods run them in a worker thread so the event
+    loop is not blocked.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_DB, enabled: bool = True):
+        """
+        Initialize the history.
+
+        Args:
+            path: Path of the database file, or ":memory:"
+            enabled: False to record and list nothing
+        """
+        self._path = path
+        self._enabled = enabled
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ExecutionHistory":
+        """
+        Create a history configured from TORERO_API_HISTORY and TORERO_API_HISTORY_DB.
+
+        Returns:
+            ExecutionHistory: A new history
+        """
+        return cls(path=history_path(), enabled=history_enabled())
+
+    @property
+    def enabled(self) -> bool:
+        """Whether executions are recorded."""
+        return self._enabled
+
+    def configure(self, path: Optional[str] = None, enabled: Optional[bool] = None) -> None:
+        """
+        Change the database or turn the history on or off.
+
+        Args:
+            path: New database path, or None to keep the current one
+            enabled: Whether to record executions, or None to keep the current setting
+        """
+        with self._lock:
+            if path is not None and path != self._path:
+                self._close()
+                self._path = path
+            if enabled is not None:
+                self._enabled = enabled
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed; the caller holds the lock."""
+        if self._connection is None:
+            path = self._path
+            if path != ":memory:":
+                path = os.path.expanduser(path)
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._migrate(connection)
+            self._connection = connection
+            logger.info(f"Recording execution history in {path}")
+        return self._connection
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection) -> None:
+        """Bring a database written by an older version up to the current schema."""
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(executions)")}
+        if "output_id" not in columns:
+            # Records used to keep the output URL, which goes stale; keep the ID instead
+            with connection:
+                connection.execute("ALTER TABLE executions ADD COLUMN output_id TEXT")
+                connection.execute(
+                    "UPDATE executions SET output_id = substr(output_url, ?) WHERE output_url LIKE ?",
+                    (len(OUTPUT_URL_PREFIX) + 1, f"{OUTPUT_URL_PREFIX}%")
+                )
+
+    def record(
+        self,
+        service: str,
+        operation: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        finished_at: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Record one execution.
+
+        Args:
+            service: Name of the executed service
+            operation: What was run, e.g. "ansible-playbook" or "opentofu-plan/apply"
+            result: torero's execution result, if the execution completed
+            error: Why the execution could not be completed, if it could not
+            finished_at: When the execution finished (seconds since the epoch), or None for now
+
+        Returns:
+            Optional[int]: The ID of the new record, or None if the history is disabled
+        """
+        if not self._enabled:
+            return None
+
+        result = result or {}
+        return_code = result.get("return_code")
+        if error is not None or return_code is None:
+            status = ERROR
+        else:
+            status = SUCCEEDED if return_code == 0 else FAILED
+
+        output_url = result.get("output_url")
+        output_id = output_url[len(OUTPUT_URL_PREFIX):] if output_url else None
+        row = (
+            service, operation, status, return_code, result.get("start_time"), result.get("end_time"),
+            result.get("elapsed_time"), finished_at or time.time(), output_id, error
+        )
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO executions (service, operation, status, return_code, start_time, end_time, "
+                    "elapsed_time, finished_at, output_id, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row
+                )
+            return cursor.lastrowid
+
+    async def record_async(
+        self,
+        service: str,
+        operation: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Record one execution without blocking the event loop.
+
+        Failures to write the history are logged and never raised, so they
+        cannot fail the execution being recorded.
+
+        See record() for arguments and return value.
+        """
+        if not self._enabled:
+            return None
+        finished_at = time.time()
+        try:
+            return await asyncio.to_thread(self.record, service, operation, result, error, finished_at)
+        except Exception as e:
+            logger.error(f"Could not record execution of {service} in the history: {str(e)}")
+            return None
+
+    def record_in_background(
+        self,
+        service: str,
+        operation: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Record one execution without waiting for the write.
+
+        For code that cannot await, such as a generator that is being
+        closed. The write runs as a task of its own in a worker thread; failures
+        are logged and never raised. Without a running event loop the
+        record is written in place.
+
+        See record() for arguments.
+        """
+        if not self._enabled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                self.record(service, operation, result, error)
+            except Exception as e:
+                logger.error(f"Could not record execution of {service} in the history: {str(e)}")
+            return
+
+        task = loop.create_task(self.record_async(service, operation, result, error))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for the records written in the background."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def query(
+        self,
+        service: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List recorded executions, newest first.
+
+        Args:
+            service: Only executions of this service
+            status: Only executions with this status
+            since: Only executions that finished at or after this time (seconds since the epoch)
+            limit: Maximum number of records to return
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Tuple[List[dict], Optional[str]]: The records, and the cursor of the
+            next page, or None if this is the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if not self._enabled:
+            return [], None
+
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if service is not None:
+            conditions.append("service = ?")
+            parameters.append(service)
+        if status is not None:
+            conditions.append("status = ?")
+            parameters.append(status)
+        if since is not None:
+            conditions.append("finished_at >= ?")
+            parameters.append(since)
+        if cursor is not None:
+            finished_at, record_id = decode_cursor(cursor)
+            # The first term bounds the index range, the second skips rows already returned
+            conditions.append("finished_at <= ? AND (finished_at < ? OR id < ?)")
+            parameters.extend((finished_at, finished_at, record_id))
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (
+            f"SELECT {', '.join(_COLUMNS)} FROM executions {where} "
+            f"ORDER BY finished_at DESC, id DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._connect().execute(sql, (*parameters, limit + 1)).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][8], rows[-1][0])
+        return [self._to_record(row) for row in rows], next_cursor
+
+    async def query_async(
+        self,
+        service: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List recorded executions without blocking the event loop.
+
+        See query() for arguments, return value and exceptions.
+        """
+        return await asyncio.to_thread(self.query, service, status, since, limit, cursor)
+
+    def get(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up one recorded execution.
+
+        Args:
+            record_id: The record's ID
+
+        Returns:
+            Optional[dict]: The record, or None if there is none with this ID
+        """
+        if not self._enabled:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM executions WHERE id = ?", (record_id,)
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    async def get_async(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up one recorded execution without blocking the event loop.
+
+        See get() for arguments and return value.
+        """
+        return await asyncio.to_thread(self.get, record_id)
+
+    @staticmethod
+    def _to_record(row: tuple) -> Dict[str, Any]:
+        """Turn a database row into a record dict, linking the output only while it is kept."""
+        record = dict(zip(_COLUMNS, row))
+        record["finished_at"] = _iso(record["finished_at"])
+        output_id = record["output_id"]
+        available = output_id is not None and output_store.get(output_id) is not None
+        record["output_available"] = available
+        record["output_url"] = f"{OUTPUT_URL_PREFIX}{output_id}" if available else None
+        return record
+
+    def close(self) -> None:
+        """Close the database connection; it is reopened on next use."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        """Close the connection; the caller holds the lock."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+# Shared history used by the executor and the history endpoints
+execution_history = ExecutionHistory.from_env()
+
+def configure_execution_history(path: Optional[str] = None, enabled: Optional[bool] = None) -> None:
+    """
+    Update the settings of the shared execution history.
+
+    Args:
+        path: Path of the database file, or None to keep the current one
+        enabled: Whether to record executions, or None to keep the current setting
+    """
+    execution_history.configure(path=path, enabled=enabled)
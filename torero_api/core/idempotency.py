@@ -0,0 +1,318 @@
+"""
+Idempotency keys for service executions
+
+When a proxy times out a long execution request, clients retry it, and
+without further care the service runs a second time. Execution requests
+may therefore carry an Idempotency-Key header: the first request with a key
+runs the service, and every repeat with the same key and the same request
+within the retention window gets that execution instead of a new one:
+
+- while the execution is still running, the repeat waits for it and
+  receives the same result
+- once it has finished, the stored result (or error) is returned right away
+- for background jobs, the repeat receives the same job
+
+Executions run as tasks of their own, so a first request whose client went
+away does not stop the execution that later repeats attach to. Executions
+rejected for lack of capacity (ToreroBusyError) never ran and are
+forgotten, so a retry runs them. A key reused for a different request is
+rejected.
+
+Settings are read from the environment:
+
+- TORERO_API_IDEMPOTENCY_RETENTION: seconds a finished execution is kept for repeats (default 3600)
+- TORERO_API_IDEMPOTENCY_MAX_KEYS: maximum number of keys tracked at once (default 10000)
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Defaults used when nothing is configured
+DEFAULT_IDEMPOTENCY_RETENTION = 3600.0
+DEFAULT_MAX_KEYS = 10000
+
+# Longest accepted key
+MAX_KEY_LENGTH = 255
+
+class IdempotencyKeyError(ValueError):
+    """
+    Raised when an idempotency key is malformed or was used for a different request.
+
+    Attributes:
+        conflict: True if the key is valid but belongs to another request
+    """
+
+    def __init__(self, message: str, conflict: bool = False):
+        super().__init__(message)
+        self.conflict = conflict
+
+def request_fingerprint(operation: str, service: str, **params: Any) -> str:
+    """
+    Fingerprint an execution request, to tell a repeat from a different request.
+
+    Args:
+        operation: What is run, e.g. "ansible-playbook" or "opentofu-plan/apply"
+        service: Name of the service
+        **params: Everything else that changes what is run or how it is answered
+
+    Returns:
+        str: Hex digest of the request
+    """
+    document = json.dumps({"operation": operation, "service": service, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+class IdempotentExecution:
+    """
+    The execution started for one idempotency key.
+
+    Attributes:
+        key: The idempotency key
+        fingerprint: Fingerprint of the request that used the key first
+        task: The running or finished execution, for synchronous requests
+        job: The background job, for asynchronous requests
+    """
+
+    def __init__(self, key: str, fingerprint: str):
+        """
+        Initialize an execution record.
+
+        Args:
+            key: The idempotency key
+            fingerprint: Fingerprint of the request
+        """
+        self.key = key
+        self.fingerprint = fingerprint
+        self.task: Optional[asyncio.Task] = None
+        self.job: Any = None
+        self._finished_monotonic: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the execution has finished."""
+        if self.job is not None:
+            return self.job.done
+        return self.task is not None and self.task.done()
+
+class IdempotencyStore:
+    """
+    Executions by idempotency key, kept for a retention window after they finish.
+    """
+
+    def __init__(self, retention: float = DEFAULT_IDEMPOTENCY_RETENTION, max_keys: int = DEFAULT_MAX_KEYS):
+        """
+        Initialize the store.
+
+        Args:
+            retention: Seconds finished executions are kept for repeats
+            max_keys: Maximum number of keys tracked at a time
+        """
+        self._retention = retention
+        self._max_keys = max_keys
+        self._executions: Dict[str, IdempotentExecution] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "IdempotencyStore":
+        """
+        Create a store configured from TORERO_API_IDEMPOTENCY_RETENTION and TORERO_API_IDEMPOTENCY_MAX_KEYS.
+
+        Returns:
+            IdempotencyStore: A new store
+        """
+        return cls(
+            retention=read_number("TORERO_API_IDEMPOTENCY_RETENTION", DEFAULT_IDEMPOTENCY_RETENTION),
+            max_keys=read_number("TORERO_API_IDEMPOTENCY_MAX_KEYS", DEFAULT_MAX_KEYS, cast=int)
+        )
+
+    def configure(self, retention: Optional[float] = None, max_keys: Optional[int] = None) -> None:
+        """
+        Update the retention and the key limit.
+
+        Args:
+            retention: New seconds finished executions are kept, or None to keep the current one
+            max_keys: New maximum number of tracked keys, or None to keep the current one
+
+        Raises:
+            ValueError: If a value is not positive
+        """
+        with self._lock:
+            if retention is not None:
+                if retention <= 0:
+                    raise ValueError("Idempotency retention must be positive")
+                self._retention = retention
+            if max_keys is not None:
+                if max_keys <= 0:
+                    raise ValueError("Idempotency key limit must be positive")
+                self._max_keys = max_keys
+
+    def _claim(self, key: str, fingerprint: str) -> Tuple[IdempotentExecution, bool]:
+        """
+        Find the execution of a key or register a new one; the caller holds the lock.
+
+        Returns:
+            Tuple[IdempotentExecution, bool]: The execution, and whether it already existed
+
+        Raises:
+            IdempotencyKeyError: If the key is malformed or belongs to another request
+            ToreroBusyError: If the maximum number of keys is reached and none can be dropped
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise IdempotencyKeyError(f"Idempotency-Key must be between 1 and {MAX_KEY_LENGTH} characters")
+
+        self._prune()
+        execution = self._executions.get(key)
+        if execution is not None:
+            if execution.fingerprint != fingerprint:
+                raise IdempotencyKeyError(
+                    f"Idempotency-Key '{key}' was already used for a different request",
+                    conflict=True
+                )
+            return execution, True
+
+        self._prune(make_room=True)
+        if len(self._executions) >= self._max_keys:
+            raise ToreroBusyError(f"Too many executions with idempotency keys in progress (limit {self._max_keys})")
+        execution = IdempotentExecution(key, fingerprint)
+        self._executions[key] = execution
+        return execution, False
+
+    async def execute(
+        self,
+        key: str,
+        fingerprint: str,
+        run: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Run an execution once per key and share its outcome with every repeat.
+
+        Args:
+            key: The idempotency key
+            fingerprint: Fingerprint of the request, from request_fingerprint()
+            run: Coroutine function that executes the service and returns torero's result
+
+        Returns:
+            Tuple[dict, bool]: The execution result, and True if it belongs to an earlier request
+
+        Raises:
+            IdempotencyKeyError: If the key is malformed or belongs to another request
+            ToreroBusyError: If the key limit is reached, or the execution could not get capacity
+            Exception: Whatever the execution raised, for the first request and its repeats
+        """
+        with self._lock:
+            execution, replayed = self._claim(key, fingerprint)
+            if not replayed:
+                # A task of its own keeps the execution going if this request is abandoned
+                execution.task = asyncio.get_running_loop().create_task(run())
+                execution.task.add_done_callback(functools.partial(self._finished, execution))
+
+        if replayed:
+            logger.info(f"Request with Idempotency-Key '{key}' attached to its earlier execution")
+        return await asyncio.shield(execution.task), replayed
+
+    def submit(self, key: str, fingerprint: str, submit: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Submit a background job once per key and return it to every repeat.
+
+        Args:
+            key: The idempotency key
+            fingerprint: Fingerprint of the request, from request_fingerprint()
+            submit: Function that submits the job and returns it
+
+        Returns:
+            Tuple[Job, bool]: The job, and True if it belongs to an earlier request
+
+        Raises:
+            IdempotencyKeyError: If the key is malformed or belongs to another request
+            ToreroBusyError: If the key limit is reached or the job could not be submitted
+        """
+        with self._lock:
+            execution, replayed = self._claim(key, fingerprint)
+            if not replayed:
+                try:
+                    execution.job = submit()
+                except BaseException:
+                    del self._executions[key]
+                    raise
+
+        if replayed:
+            logger.info(f"Request with Idempotency-Key '{key}' attached to job {execution.job.id}")
+        return execution.job, replayed
+
+    def _finished(self, execution: IdempotentExecution, task: asyncio.Task) -> None:
+        """Keep a finished execution for repeats, or forget it if it never ran."""
+        error = None if task.cancelled() else task.exception()
+        with self._lock:
+            if task.cancelled() or isinstance(error, ToreroBusyError):
+                if self._executions.get(execution.key) is execution:
+                    del self._executions[execution.key]
+                return
+            execution._finished_monotonic = time.monotonic()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count the tracked keys.
+
+        Returns:
+            dict: Number of keys with running and with finished executions
+        """
+        with self._lock:
+            self._prune()
+            finished = sum(1 for execution in self._executions.values() if execution.done)
+            return {"running": len(self._executions) - finished, "finished": finished}
+
+    async def shutdown(self) -> None:
+        """Cancel running executions and forget every key."""
+        with self._lock:
+            tasks = [e.task for e in self._executions.values() if e.task is not None and not e.task.done()]
+            self._executions.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _prune(self, make_room: bool = False) -> None:
+        """Drop expired executions, and with make_room the oldest finished ones when full; the caller holds the lock."""
+        now = time.monotonic()
+        finished: List[IdempotentExecution] = []
+        for execution in list(self._executions.values()):
+            if not execution.done:
+                continue
+            if execution._finished_monotonic is None:
+                # Jobs finish on their own; start the retention when we notice
+                execution._finished_monotonic = now
+            if now - execution._finished_monotonic >= self._retention:
+                del self._executions[execution.key]
+            else:
+                finished.append(execution)
+
+        excess = len(self._executions) - self._max_keys + 1
+        if make_room and excess > 0:
+            for execution in sorted(finished, key=lambda e: e._finished_monotonic)[:excess]:
+                del self._executions[execution.key]
+
+# Shared store used by the execution endpoints
+idempotency_store = IdempotencyStore.from_env()
+
+def configure_idempotency_store(retention: Optional[float] = None, max_keys: Optional[int] = None) -> None:
+    """
+    Update the retention and the key limit of the shared idempotency store.
+
+    Args:
+        retention: Seconds finished executions are kept, or None to keep the current value
+        max_keys: Maximum number of tracked keys, or None to keep the current value
+
+    Raises:
+        ValueError: If a value is not positive
+    """
+    idempotency_store.configure(retention=retention, max_keys=max_keys)
@@ -0,0 +1,284 @@
+"""
+Inventory snapshots for the torero API
+
+An inventory snapshot is the parsed result of a single 'torero get <kind> --raw'
+call. Besides the items themselves it carries lookup structures that are
+built once when the snapshot is created, so that per-request operations
+such as finding an item by name do not have to scan the whole inventory.
+
+Snapshots also keep inverted indexes from type and tag to item positions.
+select() uses them to filter and paginate while touching only the matching
+items, and select_items() falls back to a linear scan for plain lists. The
+type and tag facets (distinct values with their item counts) are derived
+from the same indexes once per snapshot; see facet_counts().
+
+Every snapshot has a digest of its content, taken from torero's raw output
+when the fetcher supplies one (see InventoryItems). It only changes when the
+inventory does, so it can be used to build validators such as HTTP ETags.
+
+Snapshots also record when they were loaded. While a request is being
+handled inside track_snapshots(), every snapshot it reads is recorded so the
+API can report how old the data in the response is.
+"""
+
+import hashlib
+import time
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Fields with an inverted index, and therefore a facet
+FACET_FIELDS = ("type", "tag")
+
+# Snapshots read while handling the current request, if tracking is enabled
+_used_snapshots: ContextVar[Optional[List["InventorySnapshot"]]] = ContextVar("used_snapshots", default=None)
+
+class InventoryItems(list):
+    """
+    List of parsed inventory items together with the digest of torero's raw output.
+
+    Attributes:
+        digest: Hex digest of the raw 'torero get <kind> --raw' output, if known
+    """
+
+    def __init__(self, items: Iterable = (), digest: Optional[str] = None):
+        """
+        Initialize the list.
+
+        Args:
+            items: The parsed inventory items
+            digest: Hex digest of the raw output the items were parsed from
+        """
+        super().__init__(items)
+        self.digest = digest
+
+class InventorySnapshot(Generic[T]):
+    """
+    Immutable view of one torero inventory.
+
+    Attributes:
+        kind: The resource kind (e.g. "services")
+        items: The inventory items in the order returned by torero
+        by_name: Mapping of item name to item for constant-time lookups
+        by_type: Mapping of item type to the ascending positions of its items
+        by_tag: Mapping of tag to the ascending positions of the items that have it
+        digest: Hex digest identifying the snapshot's content
+        loaded_at: Wall-clock time (seconds since the epoch) at which the snapshot was built
+    """
+
+    __slots__ = ("kind", "items", "by_name", "by_type", "by_tag", "digest", "loaded_at", "_facets")
+
+    def __init__(self, kind: str, items: Iterable[T], digest: Optional[str] = None):
+        """
+        Build a snapshot and its indexes.
+
+        Args:
+            kind: The resource kind
+            items: The parsed inventory items; each item must have ``name`` and
+                ``type`` attributes, and may have ``tags``
+            digest: Digest of the content; defaults to the digest carried by
+                InventoryItems, or else a hash of the items' representations
+        """
+        self.kind = kind
+        self.items: Tuple[T, ...] = tuple(items)
+        self.loaded_at = time.time()
+
+        if digest is None:
+            digest = getattr(items, "digest", None)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            for item in self.items:
+                hasher.update(repr(item).encode())
+            digest = hasher.hexdigest()
+        self.digest = digest
+
+        # Keep the first item for duplicate names, matching a linear scan
+        by_name: Dict[str, T] = {}
+        by_type: Dict[str, array] = {}
+        by_tag: Dict[str, array] = {}
+        for position, item in enumerate(self.items):
+            by_name.setdefault(item.name, item)
+            by_type.setdefault(item.type, array("I")).append(position)
+            for tag in set(getattr(item, "tags", None) or ()):
+                by_tag.setdefault(tag, array("I")).append(position)
+        self.by_name = by_name
+        self.by_type = by_type
+        self.by_tag = by_tag
+        self._facets: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+
+    def get(self, name: str) -> Optional[T]:
+        """
+        Look up an item by name.
+
+        Args:
+            name: The exact (case-sensitive) item name
+
+        Returns:
+            Optional[T]: The item if found, None otherwise
+        """
+        return self.by_name.get(name)
+
+    def select(self, type: Optional[str] = None, tag: Optional[str] = None,
+               skip: int = 0, limit: Optional[int] = None) -> List[T]:
+        """
+        Filter the items by type and/or tag and return one page of the matches.
+
+        The smaller of the matching index entries drives the scan, and the
+        scan stops as soon as the page is complete.
+
+        Args:
+            type: Only return items of this type
+            tag: Only return items with this tag
+            skip: Number of matching items to skip
+            limit: Maximum number of items to return, None for all
+
+        Returns:
+            List[T]: The matching items, in inventory order
+        """
+        end = None if limit is None else skip + limit
+        if type is None and tag is None:
+            return list(self.items[skip:end])
+
+        by_type = self.by_type.get(type, ()) if type is not None else None
+        by_tag = self.by_tag.get(tag, ()) if tag is not None else None
+        if by_tag is None or by_type is None:
+            positions = by_type if by_tag is None else by_tag
+            return [self.items[position] for position in positions[skip:end]]
+
+        # Both filters: walk the shorter position list and check the other filter
+        if len(by_type) <= len(by_tag):
+            matches = (item for item in map(self.items.__getitem__, by_type) if tag in item.tags)
+        else:
+            matches = (item for item in map(self.items.__getitem__, by_tag) if item.type == type)
+        return list(islice(matches, skip, end))
+
+    def facet(self, field: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get the distinct values of a field with their item counts.
+
+        Computed from the indexes on first use and kept with the snapshot.
+
+        Args:
+            field: "type" or "tag"
+
+        Returns:
+            Tuple[Tuple[str, int], ...]: (value, count) pairs sorted by value
+
+        Raises:
+            ValueError: If the field is not indexed.
+        """
+        facet = self._facets.get(field)
+        if facet is None:
+            if field not in FACET_FIELDS:
+                raise ValueError(f"Unknown facet: {field}, expected one of: {', '.join(FACET_FIELDS)}")
+            index = self.by_type if field == "type" else self.by_tag
+            facet = tuple(sorted((value, len(positions)) for value, positions in index.items()))
+            self._facets[field] = facet
+        return facet
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was built."""
+        return max(0.0, time.time() - self.loaded_at)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __repr__(self) -> str:
+        return f"InventorySnapshot(kind={self.kind!r}, items={len(self.items)})"
+
+def select_items(items: Iterable[T], type: Optional[str] = None, tag: Optional[str] = None,
+                 skip: int = 0, limit: Optional[int] = None) -> List[T]:
+    """
+    Filter items by type and/or tag and return one page of the matches.
+
+    Snapshots answer from their indexes (see InventorySnapshot.select); any
+    other iterable of items is scanned.
+
+    Args:
+        items: An inventory snapshot, or any iterable of items
+        type: Only return items of this type
+        tag: Only return items with this tag
+        skip: Number of matching items to skip
+        limit: Maximum number of items to return, None for all
+
+    Returns:
+        List[T]: The matching items, in order
+    """
+    if isinstance(items, InventorySnapshot):
+        return items.select(type=type, tag=tag, skip=skip, limit=limit)
+
+    matches = (
+        item for item in items
+        if (type is None or item.type == type) and (tag is None or tag in item.tags)
+    )
+    return list(islice(matches, skip, None if limit is None else skip + limit))
+
+def facet_counts(items: Iterable[T], field: str) -> Sequence[Tuple[str, int]]:
+    """
+    Get the distinct values of a field with the number of items having each.
+
+    Snapshots answer from their precomputed facets (see InventorySnapshot.facet);
+    any other iterable of items is counted. An item is counted once per tag
+    even if it lists the tag twice.
+
+    Args:
+        items: An inventory snapshot, or any iterable of items
+        field: "type" or "tag"
+
+    Returns:
+        Sequence[Tuple[str, int]]: (value, count) pairs sorted by value
+
+    Raises:
+        ValueError: If the field is not "type" or "tag".
+    """
+    if isinstance(items, InventorySnapshot):
+        return items.facet(field)
+
+    if field == "type":
+        counts = Counter(item.type for item in items)
+    elif field == "tag":
+        counts = Counter(tag for item in items for tag in set(item.tags or ()))
+    else:
+        raise ValueError(f"Unknown facet: {field}, expected one of: {', '.join(FACET_FIELDS)}")
+    return sorted(counts.items())
+
+@contextmanager
+def track_snapshots() -> Iterator[List[InventorySnapshot]]:
+    """
+    Record the snapshots read within the block.
+
+    The returned list is shared with tasks started inside the block, so it
+    also collects snapshots read by code running in a copied context.
+
+    Yields:
+        List[InventorySnapshot]: The snapshots read so far, in order
+    """
+    used: List[InventorySnapshot] = []
+    token = _used_snapshots.set(used)
+    try:
+        yield used
+    finally:
+        _used_snapshots.reset(token)
+
+def record_snapshot_use(snapshot: InventorySnapshot) -> None:
+    """
+    Record that a snapshot was read, if tracking is enabled.
+
+    Args:
+        snapshot: The snapshot that was read
+    """
+    used = _used_snapshots.get()
+    if used is not None:
+        used.append(snapshot)
@@ -0,0 +1,367 @@
+"""
+Background execution jobs for the torero API
+
+Service executions can take minutes (OpenTofu applies may run for up to ten),
+far longer than proxies keep an idle HTTP request open. Instead of holding
+the request for the whole run, an execution can be submitted as a job: the
+API answers 202 with the job ID straight away, the execution runs as a
+managed task on the server's event loop, and clients poll GET /v1/jobs/{id}
+for its status and final result.
+
+Jobs are "queued" while the execution scheduler (see ``core.scheduler``)
+holds them back, and report their priority, their position in the scheduler's
+queue and how long they have waited. Jobs that cannot get a torero process
+slot (ToreroBusyError) also stay queued and retry after the suggested delay
+instead of failing, until TORERO_API_JOB_MAX_WAIT seconds (default 3600) have
+passed since their submission; then they fail. Finished jobs are kept
+for TORERO_API_JOB_RETENTION seconds (default 3600); at most
+TORERO_API_MAX_JOBS jobs (default 1000) are tracked at a time, and the oldest
+finished jobs are dropped first to make room. Running jobs are cancelled
+when the API shuts down.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.scheduler import DEFAULT_PRIORITY, ScheduleTicket, execution_scheduler, schedule_context
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+JOB_STATES = (QUEUED, RUNNING, COMPLETED, FAILED)
+
+# Defaults used when nothing is configured
+DEFAULT_JOB_RETENTION = 3600.0
+DEFAULT_MAX_JOBS = 1000
+DEFAULT_JOB_MAX_WAIT = 3600.0
+
+def _utc_now() -> str:
+    """Get the current time as an ISO 8601 UTC timestamp."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+class Job:
+    """
+    One background service execution.
+
+    Attributes:
+        id: Unique job identifier
+        service: Name of the executed service
+        operation: What is run, e.g. "ansible-playbook" or "opentofu-plan/apply"
+        priority: Priority class of the execution: "high", "normal" or "low"
+        status: One of "queued", "running", "completed" or "failed"
+        created_at: ISO 8601 timestamp of the submission
+        started_at: ISO 8601 timestamp at which torero was started, if it was
+        finished_at: ISO 8601 timestamp at which the job finished, if it has
+        result: torero's execution result once the job has completed
+        error: Error message if the job failed
+        ticket: The job's handle in the execution scheduler
+    """
+
+    def __init__(self, service: str, operation: str, priority: str = DEFAULT_PRIORITY):
+        """
+        Initialize a queued job.
+
+        Args:
+            service: Name of the service to execute
+            operation: What is run, e.g. "python-script"
+            priority: Priority class of the execution
+
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        self.id = uuid.uuid4().hex
+        self.service = service
+        self.operation = operation
+        self.priority = priority
+        self.ticket = ScheduleTicket(priority, on_change=self._on_schedule)
+        self.status = QUEUED
+        self.created_at = _utc_now()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+        self._created_monotonic = time.monotonic()
+        self._started_monotonic: Optional[float] = None
+        self._finished_monotonic: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has completed or failed."""
+        return self.status in (COMPLETED, FAILED)
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds the job waited before torero was started, so far if it is still waiting."""
+        end = self._started_monotonic or self._finished_monotonic or time.monotonic()
+        return max(end - self._created_monotonic, 0.0)
+
+    def mark_running(self) -> None:
+        """Record that torero is being started for the job."""
+        self.status = RUNNING
+        self.started_at = _utc_now()
+        self._started_monotonic = time.monotonic()
+
+    def mark_queued(self) -> None:
+        """Record that the job is waiting again."""
+        self.status = QUEUED
+        self.started_at = None
+        self._started_monotonic = None
+
+    def _on_schedule(self, waiting: bool) -> None:
+        """Follow the job's execution through the scheduler's queue."""
+        if waiting:
+            self.mark_queued()
+        else:
+            self.mark_running()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the public state of the job.
+
+        Returns:
+            dict: The job attributes, with the queue position while the job waits for the scheduler
+        """
+        return {
+            "id": self.id,
+            "service": self.service,
+            "operation": self.operation,
+            "priority": self.priority,
+            "status": self.status,
+            "queue_position": execution_scheduler.position(self.ticket) if self.status == QUEUED else None,
+            "wait_time": round(self.wait_time, 3),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+class JobManager:
+    """
+    Registry and runner of background execution jobs.
+    """
+
+    def __init__(
+        self,
+        retention: float = DEFAULT_JOB_RETENTION,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        max_wait: float = DEFAULT_JOB_MAX_WAIT
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            retention: Seconds finished jobs are kept for retrieval
+            max_jobs: Maximum number of jobs tracked at a time
+            max_wait: Seconds after its submission a job stops waiting for a process slot
+        """
+        self._retention = retention
+        self._max_jobs = max_jobs
+        self._max_wait = max_wait
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "JobManager":
+        """
+        Create a manager configured from TORERO_API_JOB_RETENTION, TORERO_API_MAX_JOBS
+        and TORERO_API_JOB_MAX_WAIT.
+
+        Returns:
+            JobManager: A new manager
+        """
+        return cls(
+            retention=read_number("TORERO_API_JOB_RETENTION", DEFAULT_JOB_RETENTION),
+            max_jobs=read_number("TORERO_API_MAX_JOBS", DEFAULT_MAX_JOBS, cast=int),
+            max_wait=read_number("TORERO_API_JOB_MAX_WAIT", DEFAULT_JOB_MAX_WAIT)
+        )
+
+    def configure(
+        self,
+        retention: Optional[float] = None,
+        max_jobs: Optional[int] = None,
+        max_wait: Optional[float] = None
+    ) -> None:
+        """
+        Update the retention, the job limit and the maximum wait for a process slot.
+
+        Args:
+            retention: New seconds finished jobs are kept, or None to keep the current one
+            max_jobs: New maximum number of tracked jobs, or None to keep the current one
+            max_wait: New seconds a job waits for a process slot, or None to keep the current one
+
+        Raises:
+            ValueError: If a value is not positive
+        """
+        with self._lock:
+            if retention is not None:
+                if retention <= 0:
+                    raise ValueError("Job retention must be positive")
+                self._retention = retention
+            if max_jobs is not None:
+                if max_jobs <= 0:
+                    raise ValueError("Job limit must be positive")
+                self._max_jobs = max_jobs
+            if max_wait is not None:
+                if max_wait <= 0:
+                    raise ValueError("Job maximum wait must be positive")
+                self._max_wait = max_wait
+
+    def submit(
+        self,
+        service: str,
+        operation: str,
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        priority: str = DEFAULT_PRIORITY
+    ) -> Job:
+        """
+        Start a job on the running event loop.
+
+        Args:
+            service: Name of the service to execute
+            operation: What is run, e.g. "python-script"
+            run: Coroutine function that executes the service and returns torero's result
+            priority: Priority class of the execution
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            ToreroBusyError: If the maximum number of jobs is reached and none can be dropped
+            ValueError: If the priority is unknown
+        """
+        job = Job(service, operation, priority)
+        with self._lock:
+            self._prune(make_room=True)
+            if len(self._jobs) >= self._max_jobs:
+                raise ToreroBusyError(f"Too many jobs in progress (limit {self._max_jobs})")
+            self._jobs[job.id] = job
+
+        job.task = asyncio.get_running_loop().create_task(self._run(job, run))
+        logger.info(f"Submitted job {job.id}: {operation} {service}")
+        return job
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        """Run a job, waiting for a process slot while torero is busy, up to the maximum wait."""
+        try:
+            with schedule_context(job.priority, job.ticket):
+                while True:
+                    job.mark_running()
+                    try:
+                        job.result = await run()
+                        job.status = COMPLETED
+                        break
+                    except ToreroBusyError as e:
+                        # No process slot yet: stay queued and try again until the maximum wait
+                        job.mark_queued()
+                        remaining = self._max_wait - job.wait_time
+                        if remaining <= 0:
+                            raise RuntimeError(
+                                f"No torero process slot became available within {self._max_wait:g} seconds: {str(e)}"
+                            ) from e
+                        await asyncio.sleep(min(e.retry_after, remaining))
+        except asyncio.CancelledError:
+            job.status = FAILED
+            job.error = "Job was cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {str(e)}")
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = _utc_now()
+            job._finished_monotonic = time.monotonic()
+            job.task = None
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: The job ID
+
+        Returns:
+            Optional[Job]: The job, or None if it is unknown or has expired
+        """
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Count the tracked jobs per state.
+
+        Returns:
+            dict: Number of jobs per state
+        """
+        with self._lock:
+            counts = {state: 0 for state in JOB_STATES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+    async def shutdown(self) -> None:
+        """Cancel every unfinished job and wait for them to stop."""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.task is not None]
+        tasks = [job.task for job in jobs]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Tasks cancelled before they started never ran their own cleanup
+        for job in jobs:
+            if not job.done:
+                job.status = FAILED
+                job.error = "Job was cancelled"
+                job.finished_at = _utc_now()
+                job._finished_monotonic = time.monotonic()
+                job.task = None
+
+    def _prune(self, make_room: bool = False) -> None:
+        """Drop expired finished jobs, and with make_room the oldest finished ones when full; the caller holds the lock."""
+        now = time.monotonic()
+        finished: List[Job] = [job for job in self._jobs.values() if job.done]
+        for job in finished:
+            if now - job._finished_monotonic >= self._retention:
+                del self._jobs[job.id]
+
+        excess = len(self._jobs) - self._max_jobs + 1
+        if make_room and excess > 0:
+            remaining = sorted((job for job in finished if job.id in self._jobs), key=lambda job: job._finished_monotonic)
+            for job in remaining[:excess]:
+                del self._jobs[job.id]
+
+# Shared job manager used by the execution endpoints
+job_manager = JobManager.from_env()
+
+def configure_job_manager(
+    retention: Optional[float] = None,
+    max_jobs: Optional[int] = None,
+    max_wait: Optional[float] = None
+) -> None:
+    """
+    Update the retention, the job limit and the maximum wait of the shared job manager.
+
+    Args:
+        retention: Seconds finished jobs are kept, or None to keep the current value
+        max_jobs: Maximum number of tracked jobs, or None to keep the current value
+        max_wait: Seconds a job waits for a process slot, or None to keep the current value
+
+    Raises:
+        ValueError: If a value is not positive
+    """
+    job_manager.configure(retention=retention, max_jobs=max_jobs, max_wait=max_wait)
@@ -0,0 +1,405 @@
+"""
+Incremental JSON item parser for torero output
+
+'torero get <kind> --raw' prints the whole inventory as one JSON document,
+either a top-level array or an object wrapping the array (e.g. {"items": [...]}).
+For very large inventories, reading the complete output, parsing it into a
+dict tree and then building models keeps several copies of the inventory in
+memory at once.
+
+JSONItemParser consumes the output in chunks as it arrives and hands out
+the array elements one at a time, so only the current chunk and the item
+being decoded are held by the parser. Values outside the wanted array are
+decoded and discarded.
+
+'torero run service ... --raw' prints one JSON object whose "stdout" and
+"stderr" strings can be huge. JSONFieldStreamer hands out such string
+fields in decoded pieces as they arrive, and decodes the other (small)
+fields normally.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Tuple
+
+# Parser states
+_START = "start"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_ARRAY = "array"
+_STRING = "string"
+_DONE = "done"
+
+_WHITESPACE = " \t\n\r"
+
+# Marker for a value that continues in the next chunk
+_INCOMPLETE = object()
+
+# End of a run of plain characters inside a JSON string
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+def _may_continue_number(buffer: str, end: int) -> bool:
+    """Check whether a number decoded up to end may continue in the next chunk, e.g. "1500." or "2e"."""
+    return all(char in "0123456789.eE+-" for char in buffer[end:])
+
+class JSONStreamError(ValueError):
+    """Raised when the streamed document is not valid JSON or has an unexpected structure."""
+
+class JSONItemParser:
+    """
+    Push parser that yields the elements of a JSON array as they complete.
+
+    The array is either the top-level value or the value of the first key
+    in array_keys of a top-level object.
+    """
+
+    def __init__(self, array_keys: Iterable[str] = ("items",)):
+        """
+        Initialize the parser.
+
+        Args:
+            array_keys: Keys of a top-level object whose array value holds the items
+        """
+        self._array_keys = tuple(array_keys)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+        self._top_level_array = False
+        self._found = False
+        self._eof = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            data: Raw bytes of the document
+
+        Returns:
+            List[Any]: The items completed by this chunk, in order
+
+        Raises:
+            JSONStreamError: If the document is invalid.
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(data)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the document.
+
+        Returns:
+            List[Any]: Items completed by the remaining input
+
+        Raises:
+            JSONStreamError: If the document is incomplete, invalid or contains no item array.
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        items = self._parse()
+
+        if self._state == _START:
+            raise JSONStreamError("Expecting value: empty document")
+        if self._state != _DONE:
+            raise JSONStreamError("Unexpected end of document")
+        if not self._found:
+            keys = " or ".join(repr(key) for key in self._array_keys)
+            raise JSONStreamError(f"Unexpected JSON structure: expected an array or an object with {keys}")
+        return items
+
+    def _decode_value(self) -> Any:
+        """Decode the value at the current position, or return _INCOMPLETE if it is cut off."""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if self._eof:
+                raise JSONStreamError(str(e))
+            return _INCOMPLETE
+
+        # A number at the end of the buffer may continue in the next chunk
+        if not self._eof and isinstance(value, (int, float)) and _may_continue_number(self._buffer, end):
+            return _INCOMPLETE
+
+        self._pos = end
+        return value
+
+    def _parse(self) -> List[Any]:
+        """Advance through the buffer as far as the input allows."""
+        items = []
+        buffer = self._buffer
+
+        while True:
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos >= len(buffer):
+                break
+            char = buffer[self._pos]
+
+            if self._state == _START:
+                if char == "[":
+                    self._pos += 1
+                    self._state = _ARRAY
+                    self._top_level_array = True
+                    self._found = True
+                elif char == "{":
+                    self._pos += 1
+                    self._state = _KEY
+                else:
+                    raise JSONStreamError("Unexpected JSON structure: expected an array or an object")
+
+            elif self._state == _KEY:
+                if char == ",":
+                    self._pos += 1
+                elif char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                elif char == '"':
+                    key = self._decode_value()
+                    if key is _INCOMPLETE:
+                        break
+                    self._key = key
+                    self._state = _COLON
+                else:
+                    raise JSONStreamError(f"Expecting property name at position {self._pos}")
+
+            elif self._state == _COLON:
+                if char != ":":
+                    raise JSONStreamError(f"Expecting ':' delimiter at position {self._pos}")
+                self._pos += 1
+                self._state = _VALUE
+
+            elif self._state == _VALUE:
+                if char == "[" and not self._found and self._key in self._array_keys:
+                    self._pos += 1
+                    self._state = _ARRAY
+                    self._found = True
+                else:
+                    # Values outside the item array are decoded and dropped
+                    if self._decode_value() is _INCOMPLETE:
+                        break
+                    self._state = _KEY
+
+            elif self._state == _ARRAY:
+                if char == ",":
+                    self._pos += 1
+                elif char == "]":
+                    self._pos += 1
+                    self._state = _DONE if self._top_level_array else _KEY
+                else:
+                    item = self._decode_value()
+                    if item is _INCOMPLETE:
+                        break
+                    items.append(item)
+
+            else:
+                raise JSONStreamError(f"Extra data at position {self._pos}")
+
+        return items
+
+class JSONFieldStreamer:
+    """
+    Push parser for a top-level JSON object whose large string fields are handed out in pieces.
+
+    String values of stream_keys are decoded as they arrive and returned as
+    consecutive text pieces, so they are never held whole. Every other field
+    is decoded normally and collected in fields.
+    """
+
+    def __init__(self, stream_keys: Iterable[str]):
+        """
+        Initialize the parser.
+
+        Args:
+            stream_keys: Keys of the string fields to hand out in pieces
+        """
+        self._stream_keys = frozenset(stream_keys)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+        self._eof = False
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, data: bytes) -> List[Tuple[str, str]]:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            data: Raw bytes of the document
+
+        Returns:
+            List[Tuple[str, str]]: (key, text) pieces of the streamed fields completed by this chunk
+
+        Raises:
+            JSONStreamError: If the document is invalid.
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(data)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Tuple[str, str]]:
+        """
+        Signal the end of the document.
+
+        Returns:
+            List[Tuple[str, str]]: Pieces completed by the remaining input
+
+        Raises:
+            JSONStreamError: If the document is incomplete or not an object.
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        pieces = self._parse()
+
+        if self._state == _START:
+            raise JSONStreamError("Expecting value: empty document")
+        if self._state != _DONE:
+            raise JSONStreamError("Unexpected end of document")
+        return pieces
+
+    def _decode_value(self) -> Any:
+        """Decode the value at the current position, or return _INCOMPLETE if it is cut off."""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if self._eof:
+                raise JSONStreamError(str(e))
+            return _INCOMPLETE
+
+        # A number at the end of the buffer may continue in the next chunk
+        if not self._eof and isinstance(value, (int, float)) and _may_continue_number(self._buffer, end):
+            return _INCOMPLETE
+
+        self._pos = end
+        return value
+
+    def _decode_escape(self) -> Any:
+        """Decode the escape sequence at the current position, or return _INCOMPLETE if it is cut off."""
+        buffer = self._buffer
+        length = 6 if buffer.startswith("\\u", self._pos) else 2
+        # A high surrogate is only decodable together with the low surrogate following it
+        if length == 6 and buffer[self._pos + 2:self._pos + 3].lower() == "d" and \
+                buffer[self._pos + 3:self._pos + 4].lower() in ("8", "9", "a", "b"):
+            if len(buffer) - self._pos < 8 and not self._eof:
+                return _INCOMPLETE
+            if buffer.startswith("\\u", self._pos + 6):
+                length = 12
+        if len(buffer) - self._pos < length:
+            if self._eof:
+                raise JSONStreamError(f"Unterminated string starting at position {self._pos}")
+            return _INCOMPLETE
+
+        sequence = buffer[self._pos:self._pos + length]
+        try:
+            text = json.loads(f'"{sequence}"')
+        except json.JSONDecodeError:
+            raise JSONStreamError(f"Invalid escape sequence {sequence!r}")
+        self._pos += length
+        return text
+
+    def _parse(self) -> List[Tuple[str, str]]:
+        """Advance through the buffer as far as the input allows."""
+        pieces: List[Tuple[str, str]] = []
+        buffer = self._buffer
+
+        while True:
+            if self._state == _STRING:
+                # Hand out the string's text up to its end, or as far as it has arrived
+                match = _STRING_SPECIAL.search(buffer, self._pos)
+                end = match.start() if match else len(buffer)
+                if end > self._pos:
+                    pieces.append((self._key, buffer[self._pos:end]))
+                    self._pos = end
+                if match is None:
+                    break
+                if buffer[end] == '"':
+                    self._pos += 1
+                    self._state = _KEY
+                    continue
+                text = self._decode_escape()
+                if text is _INCOMPLETE:
+                    break
+                pieces.append((self._key, text))
+                continue
+
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos >= len(buffer):
+                break
+            char = buffer[self._pos]
+
+            if self._state == _START:
+                if char != "{":
+                    raise JSONStreamError("Unexpected JSON structure: expected an object")
+                self._pos += 1
+                self._state = _KEY
+
+            elif self._state == _KEY:
+                if char == ",":
+                    self._pos += 1
+                elif char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                elif char == '"':
+                    key = self._decode_value()
+                    if key is _INCOMPLETE:
+                        break
+                    self._key = key
+                    self._state = _COLON
+                else:
+                    raise JSONStreamError(f"Expecting property name at position {self._pos}")
+
+            elif self._state == _COLON:
+                if char != ":":
+                    raise JSONStreamError(f"Expecting ':' delimiter at position {self._pos}")
+                self._pos += 1
+                self._state = _VALUE
+
+            elif self._state == _VALUE:
+                if char == '"' and self._key in self._stream_keys:
+                    self._pos += 1
+                    self._state = _STRING
+                    # Report streamed fields even when they are empty
+                    pieces.append((self._key, ""))
+                else:
+                    value = self._decode_value()
+                    if value is _INCOMPLETE:
+                        break
+                    self.fields[self._key] = value
+                    self._state = _KEY
+
+            else:
+                raise JSONStreamError(f"Extra data at position {self._pos}")
+
+        return pieces
+
+async def iter_json_items(chunks: AsyncIterable[bytes], array_keys: Iterable[str] = ("items",)) -> AsyncIterator[Any]:
+    """
+    Yield the items of a JSON document streamed in chunks.
+
+    Args:
+        chunks: The raw document, in chunks of any size
+        array_keys: Keys of a top-level object whose array value holds the items
+
+    Yields:
+        The decoded array elements, in order
+
+    Raises:
+        JSONStreamError: If the document is invalid or contains no item array.
+    """
+    parser = JSONItemParser(array_keys)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -0,0 +1,333 @@
+"""
+Process limiter for the torero API
+
+This module bounds the number of torero child processes the API runs at
+the same time. There is a global limit plus a limit per command class:
+
+- read: inventory and describe commands ('torero get ...', 'torero describe ...')
+- execute: service executions ('torero run service ...')
+
+Callers that cannot start immediately wait in a bounded FIFO queue. When the
+queue is full, or a caller has waited longer than the queue timeout, a
+ToreroBusyError is raised so the API can answer quickly with 503 and a
+Retry-After header instead of piling up more work.
+
+The 'torero version' calls of the health checks do not take a slot, so
+/health keeps answering while executions hold every slot.
+
+Limits are read from the environment when the module is imported and can be
+changed at runtime with configure_process_limits():
+
+- TORERO_API_MAX_PROCESSES: global limit (default 32)
+- TORERO_API_MAX_READ_PROCESSES: limit for read commands (default 16)
+- TORERO_API_MAX_EXECUTE_PROCESSES: limit for service executions (default 16)
+- TORERO_API_MAX_QUEUED: maximum number of waiting callers (default 256)
+- TORERO_API_QUEUE_TIMEOUT: maximum seconds a caller waits for a slot (default 30)
+- TORERO_API_RETRY_AFTER: seconds suggested to rejected clients (default 1)
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List, Optional
+
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Command classes
+READ = "read"
+EXECUTE = "execute"
+COMMAND_CLASSES = (READ, EXECUTE)
+
+# Defaults used when nothing is configured
+DEFAULT_MAX_PROCESSES = 32
+DEFAULT_CLASS_LIMITS = {READ: 16, EXECUTE: 16}
+DEFAULT_MAX_QUEUED = 256
+DEFAULT_QUEUE_TIMEOUT = 30.0
+DEFAULT_RETRY_AFTER = 1.0
+
+class ToreroBusyError(RuntimeError):
+    """
+    Raised when no torero process slot is available.
+
+    Attributes:
+        retry_after: Seconds after which the client may retry
+    """
+
+    def __init__(self, message: str, retry_after: float = DEFAULT_RETRY_AFTER):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class _Waiter:
+    """A caller waiting for a process slot."""
+
+    __slots__ = ("loop", "future", "command_class")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future, command_class: str):
+        self.loop = loop
+        self.future = future
+        self.command_class = command_class
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a waiter's future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+class ProcessLimiter:
+    """
+    Global and per-class concurrency limiter with a bounded wait queue.
+
+    The limiter is safe to share between event loops (the API loop and the
+    loops created by the synchronous executor wrappers): its state is guarded
+    by a thread lock and waiters are woken on their own loop.
+    """
+
+    def __init__(
+        self,
+        max_processes: int = DEFAULT_MAX_PROCESSES,
+        class_limits: Optional[Dict[str, int]] = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+        retry_after: float = DEFAULT_RETRY_AFTER
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_processes: Maximum number of concurrent torero processes
+            class_limits: Maximum number of concurrent processes per command class
+            max_queued: Maximum number of callers waiting for a slot
+            queue_timeout: Maximum seconds a caller waits for a slot
+            retry_after: Seconds suggested to clients that were turned away
+        """
+        self._lock = threading.Lock()
+        self._waiters: Deque[_Waiter] = deque()
+        self._active: Dict[str, int] = {command_class: 0 for command_class in COMMAND_CLASSES}
+        self._total_active = 0
+        self._class_limits = dict(DEFAULT_CLASS_LIMITS)
+        self.configure(
+            max_processes=max_processes,
+            class_limits=class_limits,
+            max_queued=max_queued,
+            queue_timeout=queue_timeout,
+            retry_after=retry_after
+        )
+
+    @classmethod
+    def from_env(cls) -> "ProcessLimiter":
+        """
+        Create a limiter configured from TORERO_API_* environment variables.
+
+        Returns:
+            ProcessLimiter: A new limiter
+        """
+        return cls(
+            max_processes=read_number("TORERO_API_MAX_PROCESSES", DEFAULT_MAX_PROCESSES, cast=int),
+            class_limits={
+                READ: read_number("TORERO_API_MAX_READ_PROCESSES", DEFAULT_CLASS_LIMITS[READ], cast=int),
+                EXECUTE: read_number("TORERO_API_MAX_EXECUTE_PROCESSES", DEFAULT_CLASS_LIMITS[EXECUTE], cast=int),
+            },
+            max_queued=read_number("TORERO_API_MAX_QUEUED", DEFAULT_MAX_QUEUED, cast=int),
+            queue_timeout=read_number("TORERO_API_QUEUE_TIMEOUT", DEFAULT_QUEUE_TIMEOUT),
+            retry_after=read_number("TORERO_API_RETRY_AFTER", DEFAULT_RETRY_AFTER)
+        )
+
+    def configure(
+        self,
+        max_processes: Optional[int] = None,
+        class_limits: Optional[Dict[str, int]] = None,
+        max_queued: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Update the limits. Arguments left as None keep their current value.
+
+        Raises:
+            ValueError: If a limit is not positive or a command class is unknown
+        """
+        for name, value in (("max_processes", max_processes), ("max_queued", max_queued),
+                            ("queue_timeout", queue_timeout), ("retry_after", retry_after)):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+        for command_class, limit in (class_limits or {}).items():
+            if command_class not in COMMAND_CLASSES:
+                raise ValueError(f"Unknown command class: {command_class}")
+            if limit <= 0:
+                raise ValueError(f"Limit for {command_class} commands must be positive")
+
+        with self._lock:
+            if max_processes is not None:
+                self._max_processes = max_processes
+            if max_queued is not None:
+                self._max_queued = max_queued
+            if queue_timeout is not None:
+                self._queue_timeout = queue_timeout
+            if retry_after is not None:
+                self._retry_after = retry_after
+            self._class_limits.update(class_limits or {})
+
+            # Raised limits may let queued callers start right away
+            self._grant_waiters()
+
+    @property
+    def queue_timeout(self) -> float:
+        """Maximum seconds a caller waits for a slot."""
+        return self._queue_timeout
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get the current usage of the limiter.
+
+        Returns:
+            dict: Active processes per class, total active processes and queue length
+        """
+        with self._lock:
+            return {
+                "active": dict(self._active),
+                "total_active": self._total_active,
+                "queued": len(self._waiters),
+                "max_processes": self._max_processes,
+                "class_limits": dict(self._class_limits),
+                "max_queued": self._max_queued,
+            }
+
+    def _has_capacity(self, command_class: str) -> bool:
+        """Check whether a process of the given class may start now (lock held)."""
+        return (
+            self._total_active < self._max_processes
+            and self._active[command_class] < self._class_limits[command_class]
+        )
+
+    def _take(self, command_class: str) -> None:
+        """Account for a started process (lock held)."""
+        self._active[command_class] += 1
+        self._total_active += 1
+
+    def _grant_waiters(self) -> None:
+        """Hand free slots to queued callers in FIFO order (lock held)."""
+        granted: List[_Waiter] = []
+        for waiter in self._waiters:
+            if self._has_capacity(waiter.command_class):
+                self._take(waiter.command_class)
+                granted.append(waiter)
+
+        for waiter in granted:
+            self._waiters.remove(waiter)
+            waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+    async def acquire(self, command_class: str) -> None:
+        """
+        Wait for a process slot of the given class.
+
+        Args:
+            command_class: READ or EXECUTE
+
+        Raises:
+            ToreroBusyError: If the wait queue is full or the queue timeout expires.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            queued_same_class = any(w.command_class == command_class for w in self._waiters)
+            if not queued_same_class and self._has_capacity(command_class):
+                self._take(command_class)
+                return
+
+            if len(self._waiters) >= self._max_queued:
+                logger.warning(f"torero process queue is full, rejecting {command_class} command")
+                raise ToreroBusyError(
+                    "Too many torero commands in progress, please retry later",
+                    retry_after=self._retry_after
+                )
+
+            waiter = _Waiter(loop, loop.create_future(), command_class)
+            self._waiters.append(waiter)
+            queue_timeout = self._queue_timeout
+            retry_after = self._retry_after
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout=queue_timeout)
+        except BaseException as e:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    granted = False
+                except ValueError:
+                    granted = True
+
+            # A slot handed over while we were giving up must be returned
+            if granted:
+                self.release(command_class)
+
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning(f"Timed out waiting for a torero process slot ({command_class})")
+                raise ToreroBusyError(
+                    f"Timed out after {queue_timeout:g}s waiting for a torero process slot",
+                    retry_after=retry_after
+                )
+            raise
+
+    def release(self, command_class: str) -> None:
+        """
+        Return a process slot and wake queued callers.
+
+        Args:
+            command_class: The class the slot was acquired for
+        """
+        with self._lock:
+            self._active[command_class] -= 1
+            self._total_active -= 1
+            self._grant_waiters()
+
+    @asynccontextmanager
+    async def slot(self, command_class: str) -> AsyncIterator[None]:
+        """
+        Context manager that holds a process slot for the duration of the block.
+
+        Args:
+            command_class: READ or EXECUTE
+
+        Raises:
+            ToreroBusyError: If no slot could be obtained.
+        """
+        await self.acquire(command_class)
+        try:
+            yield
+        finally:
+            self.release(command_class)
+
+# Shared limiter instance used by the executor
+process_limiter = ProcessLimiter.from_env()
+
+def configure_process_limits(
+    max_processes: Optional[int] = None,
+    max_read_processes: Optional[int] = None,
+    max_execute_processes: Optional[int] = None,
+    max_queued: Optional[int] = None,
+    queue_timeout: Optional[float] = None
+) -> None:
+    """
+    Update the limits of the shared process limiter.
+
+    Arguments left as None keep their current value.
+
+    Raises:
+        ValueError: If a limit is not positive
+    """
+    class_limits = {}
+    if max_read_processes is not None:
+        class_limits[READ] = max_read_processes
+    if max_execute_processes is not None:
+        class_limits[EXECUTE] = max_execute_processes
+
+    process_limiter.configure(
+        max_processes=max_processes,
+        class_limits=class_limits,
+        max_queued=max_queued,
+        queue_timeout=queue_timeout
+    )
@@ -0,0 +1,580 @@
+"""
+Spooled execution output for the torero API
+
+A chatty service can print hundreds of megabytes. Instead of holding its
+output in memory (and copying it into the response), the executor writes
+stdout and stderr to spool files while torero's result is being read:
+output stays in memory up to TORERO_API_OUTPUT_SPOOL_THRESHOLD bytes per
+stream and moves to a temporary file beyond that.
+
+Execution responses then carry at most TORERO_API_OUTPUT_PREVIEW_BYTES of
+the head and of the tail of each stream. When anything was left out, the
+full output is kept for TORERO_API_OUTPUT_RETENTION seconds and can be
+downloaded, in whole or in byte ranges, from the output_url in the result
+(GET /v1/outputs/{id} lists GET /v1/outputs/{id}/stdout and /stderr). Outputs that fit in the preview
+are returned inline and not kept. At most TORERO_API_OUTPUT_MAX_COUNT
+outputs of together TORERO_API_OUTPUT_MAX_BYTES are kept; beyond that the
+oldest are dropped early. An output that is dropped while it is being
+downloaded stays readable until the download has finished.
+
+Settings are read from the environment:
+
+- TORERO_API_OUTPUT_SPOOL_THRESHOLD: bytes per stream kept in memory before spooling to disk (default 1048576)
+- TORERO_API_OUTPUT_PREVIEW_BYTES: bytes of head and of tail included in responses (default 16384)
+- TORERO_API_OUTPUT_RETENTION: seconds full outputs can be downloaded (default 3600)
+- TORERO_API_OUTPUT_MAX_COUNT: maximum number of kept outputs (default 100)
+- TORERO_API_OUTPUT_MAX_BYTES: maximum total size of kept outputs (default 1 GiB)
+- TORERO_API_OUTPUT_DIR: directory for spool files (default: the system temporary directory)
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, Optional
+
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Output streams of an execution
+OUTPUT_STREAMS = ("stdout", "stderr")
+
+# Defaults used when nothing is configured
+DEFAULT_SPOOL_THRESHOLD = 1024 * 1024
+DEFAULT_PREVIEW_BYTES = 16 * 1024
+DEFAULT_OUTPUT_RETENTION = 3600.0
+DEFAULT_MAX_OUTPUTS = 100
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024 * 1024
+
+# URL path under which kept outputs are served
+OUTPUT_URL_PREFIX = "/v1/outputs/"
+
+# Size of the chunks handed out when an output is downloaded
+READ_CHUNK_SIZE = 64 * 1024
+
+class SpooledOutput:
+    """
+    One output stream, in memory up to a threshold and in a temporary file beyond it.
+    """
+
+    def __init__(self, spool_threshold: int, directory: Optional[str] = None):
+        """
+        Initialize an empty output.
+
+        Args:
+            spool_threshold: Bytes kept in memory before the output moves to disk
+            directory: Directory for the temporary file, or None for the system default
+        """
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_threshold, dir=directory)
+        self._spool_threshold = spool_threshold
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written."""
+        return self._size
+
+    @property
+    def on_disk(self) -> bool:
+        """Whether the output has been moved to a temporary file."""
+        return self._size > self._spool_threshold
+
+    def write(self, text: str) -> None:
+        """
+        Append text to the output.
+
+        Args:
+            text: The text to append; it is stored UTF-8 encoded
+        """
+        self._append(text.encode("utf-8", errors="replace"))
+
+    async def write_async(self, text: str) -> None:
+        """
+        Append text to the output without blocking the event loop on disk I/O.
+
+        Writes that stay in memory are done right away; once the output
+        moves to its temporary file, the write is done in a worker thread.
+
+        Args:
+            text: The text to append; it is stored UTF-8 encoded
+        """
+        data = text.encode("utf-8", errors="replace")
+        if self._size + len(data) > self._spool_threshold:
+            await asyncio.to_thread(self._append, data)
+        else:
+            self._append(data)
+
+    def _append(self, data: bytes) -> None:
+        """Append encoded bytes to the output."""
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(data)
+            self._size += len(data)
+
+    def read(self, start: int, length: int) -> bytes:
+        """
+        Read a byte range.
+
+        Args:
+            start: Offset of the first byte
+            length: Maximum number of bytes to read
+
+        Returns:
+            bytes: The bytes read; empty once the output is closed
+        """
+        with self._lock:
+            if self._file.closed:
+                return b""
+            self._file.seek(start)
+            return self._file.read(length)
+
+    def iter_range(self, start: int, end: int) -> Iterator[bytes]:
+        """
+        Read a byte range in chunks.
+
+        Args:
+            start: Offset of the first byte
+            end: Offset of the last byte (inclusive)
+
+        Yields:
+            bytes: Consecutive chunks of the range
+        """
+        position = start
+        while position <= end:
+            chunk = self.read(position, min(READ_CHUNK_SIZE, end - position + 1))
+            if not chunk:
+                return
+            position += len(chunk)
+            yield chunk
+
+    def preview(self, limit: int) -> str:
+        """
+        Get the whole output, or its head and tail if it is longer than twice the limit.
+
+        Args:
+            limit: Bytes of head and of tail to include
+
+        Returns:
+            str: The text, with a marker where bytes were left out
+        """
+        if self._size <= 2 * limit:
+            return self.read(0, self._size).decode("utf-8", errors="replace")
+
+        # Bytes at the cut may belong to a character split in two; drop them
+        head = self.read(0, limit).decode("utf-8", errors="ignore")
+        tail = self.read(self._size - limit, limit).decode("utf-8", errors="ignore")
+        return f"{head}\n[... {self._size - 2 * limit} bytes omitted ...]\n{tail}"
+
+    def close(self) -> None:
+        """Release the memory or the temporary file."""
+        with self._lock:
+            self._file.close()
+
+class ExecutionOutput:
+    """
+    The spooled stdout and stderr of one execution.
+
+    Attributes:
+        id: Unique output identifier
+        streams: The spooled output per stream name
+    """
+
+    def __init__(self, spool_threshold: int, directory: Optional[str] = None):
+        """
+        Initialize empty outputs.
+
+        Args:
+            spool_threshold: Bytes per stream kept in memory before moving to disk
+            directory: Directory for temporary files, or None for the system default
+        """
+        self.id = uuid.uuid4().hex
+        self.streams: Dict[str, SpooledOutput] = {
+            stream: SpooledOutput(spool_threshold, directory) for stream in OUTPUT_STREAMS
+        }
+        self._kept_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._readers = 0
+        self._closing = False
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written to all streams."""
+        return sum(output.size for output in self.streams.values())
+
+    def write(self, stream: str, text: str) -> None:
+        """
+        Append text to one stream.
+
+        Args:
+            stream: "stdout" or "stderr"
+            text: The text to append
+        """
+        self.streams[stream].write(text)
+
+    async def write_async(self, stream: str, text: str) -> None:
+        """
+        Append text to one stream without blocking the event loop on disk I/O.
+
+        Args:
+            stream: "stdout" or "stderr"
+            text: The text to append
+        """
+        await self.streams[stream].write_async(text)
+
+    def open_range(self, stream: str, start: int, end: int) -> Optional["OutputReader"]:
+        """
+        Start reading a byte range of one stream.
+
+        The outputs are not released while the reader is open, even if they
+        expire or are evicted in the meantime.
+
+        Args:
+            stream: "stdout" or "stderr"
+            start: Offset of the first byte
+            end: Offset of the last byte (inclusive)
+
+        Returns:
+            Optional[OutputReader]: The reader, or None if the outputs were already released
+        """
+        with self._lock:
+            if self._closing:
+                return None
+            self._readers += 1
+        return OutputReader(self, self.streams[stream].iter_range(start, end))
+
+    def release(self) -> None:
+        """Let go of a reader, releasing the streams if they were closed while it was open."""
+        with self._lock:
+            self._readers -= 1
+            release = self._closing and self._readers == 0
+        if release:
+            self._close_streams()
+
+    def close(self) -> None:
+        """Release all streams, once the readers still open are done."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            release = self._readers == 0
+        if release:
+            self._close_streams()
+
+    def _close_streams(self) -> None:
+        """Release the memory or temporary files of all streams."""
+        for output in self.streams.values():
+            output.close()
+
+class OutputReader:
+    """
+    Chunks of a byte range of a kept output, holding the output open until they are consumed.
+    """
+
+    def __init__(self, output: ExecutionOutput, chunks: Iterator[bytes]):
+        """
+        Initialize the reader; the caller has registered it with the output.
+
+        Args:
+            output: The outputs being read
+            chunks: The chunks of the range
+        """
+        self._output = output
+        self._chunks = chunks
+        self._done = False
+
+    def __iter__(self) -> "OutputReader":
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop reading and let go of the output."""
+        if self._done:
+            return
+        self._done = True
+        self._output.release()
+
+    def __del__(self):
+        # A download abandoned before it started never reaches the end of the chunks
+        self.close()
+
+class OutputStore:
+    """
+    Registry of execution outputs that are too large to return inline.
+    """
+
+    def __init__(
+        self,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        preview_bytes: int = DEFAULT_PREVIEW_BYTES,
+        retention: float = DEFAULT_OUTPUT_RETENTION,
+        directory: Optional[str] = None,
+        max_outputs: int = DEFAULT_MAX_OUTPUTS,
+        max_bytes: int = DEFAULT_MAX_OUTPUT_BYTES
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            spool_threshold: Bytes per stream kept in memory before moving to disk
+            preview_bytes: Bytes of head and of tail included in responses
+            retention: Seconds kept outputs can be downloaded
+            directory: Directory for temporary files, or None for the system default
+            max_outputs: Maximum number of kept outputs
+            max_bytes: Maximum total size of the kept outputs in bytes
+        """
+        self._spool_threshold = spool_threshold
+        self._preview_bytes = preview_bytes
+        self._retention = retention
+        self._directory = directory
+        self._max_outputs = max_outputs
+        self._max_bytes = max_bytes
+        self._outputs: Dict[str, ExecutionOutput] = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "OutputStore":
+        """
+        Create a store configured from the TORERO_API_OUTPUT_* environment variables.
+
+        Returns:
+            OutputStore: A new store
+        """
+        return cls(
+            spool_threshold=read_number("TORERO_API_OUTPUT_SPOOL_THRESHOLD", DEFAULT_SPOOL_THRESHOLD, cast=int),
+            preview_bytes=read_number("TORERO_API_OUTPUT_PREVIEW_BYTES", DEFAULT_PREVIEW_BYTES, cast=int),
+            retention=read_number("TORERO_API_OUTPUT_RETENTION", DEFAULT_OUTPUT_RETENTION),
+            directory=os.environ.get("TORERO_API_OUTPUT_DIR") or None,
+            max_outputs=read_number("TORERO_API_OUTPUT_MAX_COUNT", DEFAULT_MAX_OUTPUTS, cast=int),
+            max_bytes=read_number("TORERO_API_OUTPUT_MAX_BYTES", DEFAULT_MAX_OUTPUT_BYTES, cast=int)
+        )
+
+    def configure(
+        self,
+        spool_threshold: Optional[int] = None,
+        preview_bytes: Optional[int] = None,
+        retention: Optional[float] = None,
+        directory: Optional[str] = None,
+        max_outputs: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Update the settings, evicting kept outputs that no longer fit; outputs already written keep theirs.
+
+        Args:
+            spool_threshold: New in-memory bytes per stream, or None to keep the current value
+            preview_bytes: New bytes of head and tail in responses, or None to keep the current value
+            retention: New seconds outputs are kept, or None to keep the current value
+            directory: New directory for temporary files, or None to keep the current one
+            max_outputs: New maximum number of kept outputs, or None to keep the current value
+            max_bytes: New maximum total size of kept outputs, or None to keep the current value
+
+        Raises:
+            ValueError: If a number is not positive
+        """
+        for label, value in (("spool threshold", spool_threshold), ("preview size", preview_bytes), ("retention", retention),
+                             ("count limit", max_outputs), ("size limit", max_bytes)):
+            if value is not None and value <= 0:
+                raise ValueError(f"Output {label} must be positive")
+        with self._lock:
+            if spool_threshold is not None:
+                self._spool_threshold = spool_threshold
+            if preview_bytes is not None:
+                self._preview_bytes = preview_bytes
+            if retention is not None:
+                self._retention = retention
+            if directory is not None:
+                self._directory = directory
+            if max_outputs is not None:
+                self._max_outputs = max_outputs
+            if max_bytes is not None:
+                self._max_bytes = max_bytes
+            self._evict()
+
+    def create(self) -> ExecutionOutput:
+        """
+        Create empty outputs for an execution.
+
+        Returns:
+            ExecutionOutput: The outputs, to be passed to finish() or closed
+        """
+        return ExecutionOutput(self._spool_threshold, self._directory)
+
+    def finish(self, output: ExecutionOutput, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add the outputs to an execution result, keeping them if they do not fit in it.
+
+        Args:
+            output: The execution's outputs
+            result: torero's result without stdout and stderr
+
+        Returns:
+            dict: The result with stdout and stderr (whole, or head and tail),
+            their sizes, whether they were truncated and, if so, the URL of the
+            full output
+        """
+        result = dict(result)
+        truncated = False
+        for stream, spooled in output.streams.items():
+            result[stream] = spooled.preview(self._preview_bytes)
+            result[f"{stream}_size"] = spooled.size
+            truncated = truncated or spooled.size > 2 * self._preview_bytes
+        result["truncated"] = truncated
+
+        if not truncated:
+            output.close()
+            return result
+
+        size = output.size
+        with self._lock:
+            kept = size <= self._max_bytes
+            if kept:
+                self._prune()
+                output._kept_at = time.monotonic()
+                self._outputs[output.id] = output
+                self._bytes += size
+                self._evict()
+        if not kept:
+            logger.warning(f"Not keeping output {output.id}: {size} bytes exceed the limit of {self._max_bytes}")
+            output.close()
+            return result
+        logger.info(
+            f"Kept output {output.id} ({result['stdout_size']} bytes stdout, "
+            f"{result['stderr_size']} bytes stderr) for {self._retention:g}s"
+        )
+        result["output_url"] = f"{OUTPUT_URL_PREFIX}{output.id}"
+        return result
+
+    def get(self, output_id: str) -> Optional[ExecutionOutput]:
+        """
+        Look up kept outputs.
+
+        Args:
+            output_id: The output ID
+
+        Returns:
+            Optional[ExecutionOutput]: The outputs, or None if they are unknown or have expired
+        """
+        with self._lock:
+            self._prune()
+            return self._outputs.get(output_id)
+
+    def describe(self, output_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe kept outputs and where their streams are downloaded from.
+
+        Args:
+            output_id: The output ID
+
+        Returns:
+            Optional[dict]: The ID, the size and download URL of each stream and
+            the seconds until the outputs expire, or None if they are unknown or have expired
+        """
+        with self._lock:
+            self._prune()
+            output = self._outputs.get(output_id)
+            if output is None:
+                return None
+            expires_in = max(self._retention - (time.monotonic() - output._kept_at), 0.0)
+        description: Dict[str, Any] = {"id": output.id}
+        for stream, spooled in output.streams.items():
+            description[f"{stream}_size"] = spooled.size
+            description[f"{stream}_url"] = f"{OUTPUT_URL_PREFIX}{output.id}/{stream}"
+        description["expires_in"] = expires_in
+        return description
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report the kept outputs.
+
+        Returns:
+            dict: Number of kept outputs, their total size, how many streams are
+            on disk, the limits and the number of outputs evicted early
+        """
+        with self._lock:
+            spooled = [s for output in self._outputs.values() for s in output.streams.values()]
+            return {
+                "outputs": len(self._outputs),
+                "bytes": self._bytes,
+                "on_disk": sum(1 for s in spooled if s.on_disk),
+                "max_outputs": self._max_outputs,
+                "max_bytes": self._max_bytes,
+                "evictions": self._evictions,
+            }
+
+    def clear(self) -> None:
+        """Drop every kept output."""
+        with self._lock:
+            outputs = list(self._outputs.values())
+            self._outputs.clear()
+            self._bytes = 0
+        for output in outputs:
+            output.close()
+
+    def _prune(self) -> None:
+        """Drop expired outputs; the caller holds the lock."""
+        now = time.monotonic()
+        for output in list(self._outputs.values()):
+            if now - output._kept_at >= self._retention:
+                self._drop(output)
+
+    def _evict(self) -> None:
+        """Drop the oldest outputs until the limits are met; the caller holds the lock."""
+        while self._outputs and (len(self._outputs) > self._max_outputs or self._bytes > self._max_bytes):
+            output = next(iter(self._outputs.values()))
+            self._drop(output)
+            self._evictions += 1
+            logger.debug(f"Evicted output {output.id} to stay within the output store limits")
+
+    def _drop(self, output: ExecutionOutput) -> None:
+        """Forget a kept output and close it; the caller holds the lock."""
+        del self._outputs[output.id]
+        self._bytes -= output.size
+        output.close()
+
+# Shared store used by the executor and the output endpoints
+output_store = OutputStore.from_env()
+
+def configure_output_store(
+    spool_threshold: Optional[int] = None,
+    preview_bytes: Optional[int] = None,
+    retention: Optional[float] = None,
+    directory: Optional[str] = None,
+    max_outputs: Optional[int] = None,
+    max_bytes: Optional[int] = None
+) -> None:
+    """
+    Update the settings of the shared output store.
+
+    Args:
+        spool_threshold: Bytes per stream kept in memory, or None to keep the current value
+        preview_bytes: Bytes of head and tail in responses, or None to keep the current value
+        retention: Seconds outputs are kept, or None to keep the current value
+        directory: Directory for temporary files, or None to keep the current one
+        max_outputs: Maximum number of kept outputs, or None to keep the current value
+        max_bytes: Maximum total size of kept outputs, or None to keep the current value
+
+    Raises:
+        ValueError: If a number is not positive
+    """
+    output_store.configure(
+        spool_threshold=spool_threshold,
+        preview_bytes=preview_bytes,
+        retention=retention,
+        directory=directory,
+        max_outputs=max_outputs,
+        max_bytes=max_bytes
+    )
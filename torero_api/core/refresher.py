@@ -0,0 +1,170 @@
+"""
+Background inventory refresher for the torero API
+
+The refresher runs inside the API's event loop for the lifetime of the
+application. It watches the inventory cache and re-fetches every cached
+resource kind shortly before its TTL runs out, so request handlers keep
+getting a fresh snapshot from memory instead of waiting for torero.
+
+Only kinds that are actually in use are refreshed: a kind is picked up once
+a request has loaded it, and dropped again when nobody has read it for a
+while. Failed refreshes keep the previous snapshot (see
+InventoryCache.refresh) and are retried with an increasing back-off.
+
+The refresher is enabled by default and can be turned off with
+TORERO_API_REFRESH=0 (or --no-refresh on the command line).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from torero_api.core.cache import RESOURCE_KINDS, InventoryCache
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Fraction of the TTL after which a snapshot is refreshed
+DEFAULT_REFRESH_AHEAD = 0.8
+
+# Kinds that have not been read for this many seconds are no longer refreshed
+DEFAULT_IDLE_AFTER = 600.0
+
+# Shortest and longest pause of the refresh loop, and the longest back-off after failures
+MIN_INTERVAL = 0.5
+IDLE_INTERVAL = 1.0
+MAX_BACKOFF = 60.0
+
+def refresher_enabled() -> bool:
+    """
+    Check whether the background refresher is enabled.
+
+    Returns:
+        bool: False if TORERO_API_REFRESH is set to 0, false, no or off
+    """
+    return os.environ.get("TORERO_API_REFRESH", "1").strip().lower() not in ("0", "false", "no", "off")
+
+class InventoryRefresher:
+    """
+    Background task that refreshes cached inventories before they expire.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], Awaitable[Any]],
+        cache: InventoryCache,
+        kinds: Iterable[str] = RESOURCE_KINDS,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+        idle_after: float = DEFAULT_IDLE_AFTER
+    ):
+        """
+        Initialize the refresher.
+
+        Args:
+            refresh: Coroutine function that reloads one kind into the cache
+            cache: The cache whose entries are kept fresh
+            kinds: The resource kinds to refresh
+            refresh_ahead: Fraction of the TTL after which a kind is refreshed
+            idle_after: Seconds without reads after which a kind is no longer refreshed
+        """
+        self._refresh = refresh
+        self._cache = cache
+        self._kinds = tuple(kinds)
+        self._refresh_ahead = refresh_ahead
+        self._idle_after = idle_after
+        self._backoff: Dict[str, float] = {}
+        self._next_attempt: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the refresher task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the refresher task on the running event loop."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("Inventory refresher started")
+
+    async def stop(self) -> None:
+        """Stop the refresher task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Inventory refresher stopped")
+
+    def due_in(self, kind: str) -> Optional[float]:
+        """
+        Get the number of seconds until a kind should be refreshed.
+
+        Args:
+            kind: The resource kind
+
+        Returns:
+            Optional[float]: Seconds until the refresh is due (0 or less means now),
+            or None if the kind is not cached, caching is disabled, the kind is idle
+            or the cache is kept up to date by a watcher
+        """
+        ttl = self._cache.get_ttl(kind)
+        age = self._cache.age(kind)
+        if ttl <= 0 or age is None or self._cache.watched:
+            return None
+
+        idle = self._cache.idle_time(kind)
+        if idle is not None and idle >= self._idle_after:
+            return None
+
+        due = ttl * self._refresh_ahead - age
+        retry = self._next_attempt.get(kind)
+        if retry is not None:
+            due = max(due, retry - time.monotonic())
+        return due
+
+    async def refresh_due(self) -> None:
+        """Refresh every kind whose refresh is due, concurrently."""
+        due = []
+        for kind in self._kinds:
+            due_in = self.due_in(kind)
+            if due_in is not None and due_in <= 0:
+                due.append(kind)
+        if due:
+            await asyncio.gather(*(self._refresh_kind(kind) for kind in due))
+
+    async def _refresh_kind(self, kind: str) -> None:
+        """Refresh one kind and schedule a retry with back-off if it failed."""
+        try:
+            await self._refresh(kind)
+            failed = (self._cache.age(kind) or 0) >= self._cache.get_ttl(kind) * self._refresh_ahead
+        except Exception as e:
+            logger.warning(f"Background refresh of {kind} failed: {str(e)}")
+            failed = True
+
+        if failed:
+            backoff = min(MAX_BACKOFF, self._backoff.get(kind, MIN_INTERVAL) * 2)
+            self._backoff[kind] = backoff
+            self._next_attempt[kind] = time.monotonic() + backoff
+        else:
+            self._backoff.pop(kind, None)
+            self._next_attempt.pop(kind, None)
+
+    async def _run(self) -> None:
+        """Refresh loop."""
+        while True:
+            try:
+                await self.refresh_due()
+            except Exception as e:
+                logger.error(f"Inventory refresher error: {str(e)}")
+
+            # Wake up at least every IDLE_INTERVAL to pick up newly loaded kinds
+            waits = [due for due in map(self.due_in, self._kinds) if due is not None]
+            delay = min(waits, default=IDLE_INTERVAL)
+            await asyncio.sleep(min(IDLE_INTERVAL, max(MIN_INTERVAL, delay)))
@@ -0,0 +1,445 @@
+"""
+Execution scheduler for the torero API
+
+Service executions differ wildly in cost: a python-script run may take a
+second, an OpenTofu apply ten minutes of heavy CPU. Before an execution gets
+a torero process slot (see ``core.limiter``) it is admitted by this
+scheduler, which caps how many executions of each service type and of each
+individual service run at the same time, and hands free capacity to waiting
+executions by priority class:
+
+- high: served before everything else
+- normal: the default
+- low: only runs when nothing of higher priority is waiting for the same capacity
+
+Within a class, executions start in submission order. A waiting execution
+that is blocked by its own caps does not hold up executions of other types
+or services behind it.
+
+Background jobs wait as long as needed and report their queue position;
+other callers give up after the process limiter's queue timeout with a
+ToreroBusyError, like callers waiting for a process slot.
+
+Limits are read from the environment when the module is imported and can be
+changed at runtime with configure_execution_scheduler():
+
+- TORERO_API_MAX_CONCURRENT_<TYPE>: limit for a service type, e.g.
+  TORERO_API_MAX_CONCURRENT_OPENTOFU_PLAN=2 (defaults: 8 for ansible-playbook
+  and python-script, 4 for opentofu-plan)
+- TORERO_API_SERVICE_CONCURRENCY: per-service limits as NAME=N pairs
+  separated by commas, e.g. "infrastructure-deploy=1,nightly-backup=4"
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Priority classes, highest first
+HIGH = "high"
+NORMAL = "normal"
+LOW = "low"
+PRIORITIES = (HIGH, NORMAL, LOW)
+DEFAULT_PRIORITY = NORMAL
+
+# Service types the scheduler knows limits for
+SERVICE_TYPES = ("ansible-playbook", "python-script", "opentofu-plan")
+
+# Concurrency per service type when nothing is configured
+DEFAULT_TYPE_LIMITS = {"ansible-playbook": 8, "python-script": 8, "opentofu-plan": 4}
+
+# Priority and ticket of the execution started in the current context
+_current_priority: ContextVar[str] = ContextVar("execution_priority", default=DEFAULT_PRIORITY)
+_current_ticket: ContextVar[Optional["ScheduleTicket"]] = ContextVar("execution_ticket", default=None)
+
+def _type_variable(service_type: str) -> str:
+    """Get the environment variable holding the limit of a service type."""
+    return f"TORERO_API_MAX_CONCURRENT_{service_type.upper().replace('-', '_')}"
+
+def parse_limits(value: str) -> Dict[str, int]:
+    """
+    Parse NAME=N limits separated by commas.
+
+    Args:
+        value: The limits, e.g. "deploy=1,backup=4"
+
+    Returns:
+        dict: Mapping of name to limit
+
+    Raises:
+        ValueError: If a pair is malformed or a limit is not a positive integer
+    """
+    limits = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        name, sep, limit = pair.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            raise ValueError(f"Invalid concurrency limit '{pair.strip()}', expected NAME=N")
+        number = int(limit)
+        if number <= 0:
+            raise ValueError(f"Concurrency limit for {name} must be positive")
+        limits[name] = number
+    return limits
+
+def _read_type_limits() -> Dict[str, int]:
+    """Read the per-type limits from the environment, falling back to the defaults."""
+    return {
+        service_type: read_number(_type_variable(service_type), DEFAULT_TYPE_LIMITS[service_type], cast=int)
+        for service_type in SERVICE_TYPES
+    }
+
+def _read_service_limits() -> Dict[str, int]:
+    """Read the per-service limits from TORERO_API_SERVICE_CONCURRENCY."""
+    value = os.environ.get("TORERO_API_SERVICE_CONCURRENCY", "")
+    try:
+        return parse_limits(value)
+    except ValueError as e:
+        logger.warning(f"Ignoring invalid TORERO_API_SERVICE_CONCURRENCY: {str(e)}")
+        return {}
+
+class ScheduleTicket:
+    """
+    Handle on the scheduling of one execution, used to follow a background job.
+
+    Attributes:
+        priority: The priority class
+        on_change: Called with True when the execution starts waiting and with False when it is admitted
+    """
+
+    def __init__(self, priority: str = DEFAULT_PRIORITY, on_change: Optional[Callable[[bool], None]] = None):
+        """
+        Initialize a ticket.
+
+        Args:
+            priority: The priority class
+            on_change: Callback told when the execution waits and when it is admitted
+
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        self.priority = priority
+        self.on_change = on_change
+
+    def notify(self, waiting: bool) -> None:
+        """Report a state change to the callback, if any."""
+        if self.on_change is not None:
+            self.on_change(waiting)
+
+class _Waiter:
+    """An execution waiting to be admitted."""
+
+    __slots__ = ("rank", "seq", "service_type", "service", "ticket", "loop", "future", "enqueued_at")
+
+    def __init__(self, rank: int, seq: int, service_type: str, service: str,
+                 ticket: Optional[ScheduleTicket], loop: asyncio.AbstractEventLoop):
+        self.rank = rank
+        self.seq = seq
+        self.service_type = service_type
+        self.service = service
+        self.ticket = ticket
+        self.loop = loop
+        self.future = loop.create_future()
+        self.enqueued_at = time.monotonic()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.rank, self.seq) < (other.rank, other.seq)
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a waiter's future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+@contextmanager
+def schedule_context(priority: str = DEFAULT_PRIORITY, ticket: Optional[ScheduleTicket] = None) -> Iterator[None]:
+    """
+    Set the priority (and ticket) of executions started within the block.
+
+    Tasks created inside the block inherit the settings.
+
+    Args:
+        priority: The priority class
+        ticket: Ticket of the background job running the execution, if any
+
+    Raises:
+        ValueError: If the priority is unknown
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority: {priority}")
+    priority_token = _current_priority.set(priority)
+    ticket_token = _current_ticket.set(ticket)
+    try:
+        yield
+    finally:
+        _current_ticket.reset(ticket_token)
+        _current_priority.reset(priority_token)
+
+class ExecutionScheduler:
+    """
+    Admission of service executions by priority, under per-type and per-service caps.
+
+    Like the process limiter, the scheduler is safe to share between event
+    loops: its state is guarded by a thread lock and waiters are woken on
+    their own loop.
+    """
+
+    def __init__(
+        self,
+        type_limits: Optional[Dict[str, int]] = None,
+        service_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            type_limits: Maximum concurrent executions per service type; types without a limit are not capped
+            service_limits: Maximum concurrent executions per service name; services without a limit are not capped
+        """
+        self._lock = threading.Lock()
+        self._type_limits: Dict[str, int] = {}
+        self._service_limits: Dict[str, int] = {}
+        self._active_types: Dict[str, int] = {}
+        self._active_services: Dict[str, int] = {}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self.configure(type_limits=type_limits, service_limits=service_limits)
+
+    @classmethod
+    def from_env(cls) -> "ExecutionScheduler":
+        """
+        Create a scheduler configured from the environment.
+
+        Returns:
+            ExecutionScheduler: A new scheduler
+        """
+        return cls(type_limits=_read_type_limits(), service_limits=_read_service_limits())
+
+    def configure(
+        self,
+        type_limits: Optional[Dict[str, int]] = None,
+        service_limits: Optional[Dict[str, int]] = None
+    ) -> None:
+        """
+        Update limits. Types and services not mentioned keep their current limit.
+
+        Args:
+            type_limits: New limits per service type
+            service_limits: New limits per service name
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        for name, limit in {**(type_limits or {}), **(service_limits or {})}.items():
+            if limit <= 0:
+                raise ValueError(f"Concurrency limit for {name} must be positive")
+
+        with self._lock:
+            self._type_limits.update(type_limits or {})
+            self._service_limits.update(service_limits or {})
+
+            # Raised limits may let waiting executions start right away
+            self._admit_waiters()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get the current usage of the scheduler.
+
+        Returns:
+            dict: Running executions per type and per service, waiting executions per priority, and the limits
+        """
+        with self._lock:
+            waiting = {priority: 0 for priority in PRIORITIES}
+            for waiter in self._waiters:
+                waiting[PRIORITIES[waiter.rank]] += 1
+            return {
+                "running": {
+                    "types": {name: count for name, count in self._active_types.items() if count},
+                    "services": {name: count for name, count in self._active_services.items() if count},
+                },
+                "waiting": waiting,
+                "type_limits": dict(self._type_limits),
+                "service_limits": dict(self._service_limits),
+            }
+
+    def position(self, ticket: ScheduleTicket) -> Optional[int]:
+        """
+        Get the position of a job's execution in the wait queue.
+
+        Args:
+            ticket: The job's ticket
+
+        Returns:
+            Optional[int]: 1 for the next execution to be considered, or None if it is not waiting
+        """
+        with self._lock:
+            for index, waiter in enumerate(self._waiters):
+                if waiter.ticket is ticket:
+                    return index + 1
+        return None
+
+    def _has_capacity(self, service_type: str, service: str) -> bool:
+        """Check whether an execution may start now (lock held)."""
+        type_limit = self._type_limits.get(service_type)
+        if type_limit is not None and self._active_types.get(service_type, 0) >= type_limit:
+            return False
+        service_limit = self._service_limits.get(service)
+        if service_limit is not None and self._active_services.get(service, 0) >= service_limit:
+            return False
+        return True
+
+    def _take(self, service_type: str, service: str) -> None:
+        """Account for a started execution (lock held)."""
+        self._active_types[service_type] = self._active_types.get(service_type, 0) + 1
+        self._active_services[service] = self._active_services.get(service, 0) + 1
+
+    def _admit_waiters(self) -> None:
+        """Admit waiting executions by priority, skipping those blocked by their caps (lock held)."""
+        admitted: List[_Waiter] = []
+        for waiter in self._waiters:
+            if self._has_capacity(waiter.service_type, waiter.service):
+                self._take(waiter.service_type, waiter.service)
+                admitted.append(waiter)
+
+        if admitted:
+            self._waiters = [waiter for waiter in self._waiters if waiter not in admitted]
+        for waiter in admitted:
+            waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+
+    async def acquire(self, service_type: str, service: str, timeout: Optional[float] = None) -> None:
+        """
+        Wait until an execution may start.
+
+        The priority and ticket are taken from the current schedule_context().
+
+        Args:
+            service_type: Type of the service, e.g. "opentofu-plan"
+            service: Name of the service
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Raises:
+            ToreroBusyError: If the timeout expires
+        """
+        priority = _current_priority.get()
+        ticket = _current_ticket.get()
+        rank = PRIORITIES.index(priority)
+
+        with self._lock:
+            if not self._waiters and self._has_capacity(service_type, service):
+                self._take(service_type, service)
+                return
+
+            # Queue up, then admit in priority order so nobody overtakes an eligible waiter
+            waiter = _Waiter(rank, next(self._seq), service_type, service, ticket, asyncio.get_running_loop())
+            bisect.insort(self._waiters, waiter)
+            self._admit_waiters()
+            if waiter not in self._waiters:
+                return
+
+        logger.info(f"Execution of {service_type} service {service} is waiting ({priority} priority)")
+        if ticket is not None:
+            ticket.notify(True)
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout=timeout)
+        except BaseException as e:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    admitted = False
+                except ValueError:
+                    admitted = True
+
+            # Capacity handed over while we were giving up must be returned
+            if admitted:
+                self.release(service_type, service)
+
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning(f"Timed out waiting to execute {service_type} service {service}")
+                raise ToreroBusyError(
+                    f"Timed out after {timeout:g}s waiting for other executions of {service} or {service_type} services"
+                )
+            raise
+
+        logger.info(
+            f"Execution of {service_type} service {service} admitted after "
+            f"{time.monotonic() - waiter.enqueued_at:.3f}s"
+        )
+        if ticket is not None:
+            ticket.notify(False)
+
+    def release(self, service_type: str, service: str) -> None:
+        """
+        Account for a finished execution and admit waiting ones.
+
+        Args:
+            service_type: Type of the service
+            service: Name of the service
+        """
+        with self._lock:
+            self._active_types[service_type] -= 1
+            self._active_services[service] -= 1
+            if not self._active_services[service]:
+                del self._active_services[service]
+            self._admit_waiters()
+
+    @asynccontextmanager
+    async def slot(self, service_type: str, service: str, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Context manager that admits an execution for the duration of the block.
+
+        Args:
+            service_type: Type of the service
+            service: Name of the service
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Raises:
+            ToreroBusyError: If the timeout expires
+        """
+        await self.acquire(service_type, service, timeout=timeout)
+        try:
+            yield
+        finally:
+            self.release(service_type, service)
+
+def current_ticket() -> Optional[ScheduleTicket]:
+    """
+    Get the ticket of the background job running in the current context.
+
+    Returns:
+        Optional[ScheduleTicket]: The ticket, or None outside background jobs
+    """
+    return _current_ticket.get()
+
+# Shared scheduler used by the executor
+execution_scheduler = ExecutionScheduler.from_env()
+
+def configure_execution_scheduler(
+    type_limits: Optional[Dict[str, int]] = None,
+    service_limits: Optional[Dict[str, int]] = None
+) -> None:
+    """
+    Update the limits of the shared execution scheduler.
+
+    Args:
+        type_limits: New limits per service type
+        service_limits: New limits per service name
+
+    Raises:
+        ValueError: If a limit is not positive
+    """
+    execution_scheduler.configure(type_limits=type_limits, service_limits=service_limits)
@@ -0,0 +1,39 @@
+"""
+Environment settings for the torero API
+
+Most components read their limits, intervals and sizes from TORERO_API_*
+environment variables when they are created. This module holds the reader
+they share, so an unset, malformed or out-of-range value is handled (and
+reported) the same way everywhere: it is logged and the default is used.
+"""
+
+import logging
+import os
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+def read_number(variable: str, default, cast=float, allow_zero: bool = False):
+    """
+    Read a positive number from an environment variable.
+
+    Args:
+        variable: Name of the environment variable
+        default: Value to use if the variable is unset or invalid
+        cast: Type to convert the value to
+        allow_zero: Whether 0 is a valid value, e.g. to disable a cache
+
+    Returns:
+        The configured value, or the default
+    """
+    value = os.environ.get(variable)
+    if not value:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        number = -1
+    if number < 0 or (number == 0 and not allow_zero):
+        logger.warning(f"Ignoring invalid value for {variable}: {value!r}")
+        return default
+    return number
@@ -0,0 +1,92 @@
+"""
+Single-flight call coalescing for the torero API
+
+When many requests ask for the same torero data at the same moment, there is
+no point in starting one torero process per request. A SingleFlight group
+lets concurrent callers that use the same key share a single in-flight call:
+the first caller starts the work, later callers wait for the same result,
+and the key is released as soon as the call completes so the next caller
+starts a fresh one.
+
+Only idempotent read operations should be coalesced. Service executions
+must never share a flight.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """
+    Group of keyed calls where concurrent callers with the same key share one execution.
+
+    Each call runs in its own task, and callers wait on it through
+    asyncio.shield(), so a caller that is cancelled (for example because its
+    client disconnected) does not cancel the work for everybody else.
+    Calls are scoped to the running event loop.
+    """
+
+    def __init__(self):
+        """Initialize an empty group."""
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        """
+        Get the number of calls currently in flight.
+
+        Returns:
+            int: Number of distinct keys with a running call
+        """
+        with self._lock:
+            return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func, or join an identical call that is already running.
+
+        Args:
+            key: Identity of the call, e.g. the torero argv as a tuple
+            func: Coroutine function that performs the work
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised, re-raised in every caller.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+
+        with self._lock:
+            task = self._calls.get(flight_key)
+            if task is None:
+                task = loop.create_task(func())
+                self._calls[flight_key] = task
+                task.add_done_callback(lambda t: self._release(flight_key, t))
+            else:
+                logger.debug(f"Joining in-flight call: {key}")
+
+        return await asyncio.shield(task)
+
+    def _release(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task) -> None:
+        """
+        Forget a completed call so the next caller starts a new one.
+
+        Args:
+            flight_key: The internal key of the call
+            task: The completed task
+        """
+        with self._lock:
+            if self._calls.get(flight_key) is task:
+                del self._calls[flight_key]
+
+        # Mark the exception as retrieved in case every caller went away
+        if not task.cancelled():
+            task.exception()
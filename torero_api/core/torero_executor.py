@@ -3,16 +3,61 @@ torero executor module
 
 This module provides functions to interact with the torero CLI.
 It's responsible for executing torero commands and parsing their output.
+
+Every operation is implemented as a coroutine (suffixed with ``_async``) that
+runs torero through the configured backend (see ``core.backends``), so API
+handlers can await torero without tying up a worker thread. The original synchronous
+functions are kept as thin wrappers around these coroutines for callers that
+are not running inside an event loop (CLI, scripts, tests).
+
+Read commands (get/describe) are coalesced: concurrent callers running the
+same torero argv share a single subprocess. Service executions never are.
+Service executions do not hold torero's output in memory: the stdout and
+stderr fields of its result are spooled (see ``core.outputs``) while the
+result is parsed, and only their head and tail are returned inline.
+Before it gets a process slot, every execution is admitted by the execution
+scheduler (see ``core.scheduler``), which applies priorities and per-type and
+per-service concurrency caps. Every execution is recorded in the execution
+history (see ``core.history``).
+Service executions can also be followed live: stream_service_execution()
+runs a service without --raw and yields its output line by line while it
+runs. Describe results are also kept in a bounded LRU cache (see
+``core.describe_cache``) for as long as their parent inventory is unchanged,
+and describe_many_async() describes many items of a kind concurrently.
+Batches of executions are checked against one services snapshot by
+plan_executions_async() and run with bounded parallelism by
+run_many_async(), which yields each outcome as soon as it is known.
+
+Inventories ('torero get <kind> --raw') are parsed incrementally while
+torero's output is read, building one model per item as it arrives instead
+of holding the raw document, its parsed tree and the models all at once.
 """
 
+import asyncio
+import functools
+import hashlib
+from contextlib import asynccontextmanager
 import json
 import logging
 import subprocess
 import shutil
-from typing import List, Tuple, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, List, Sequence, Tuple, Optional, TypeVar
 from datetime import datetime
 
 from torero_api.models.service import Service
+from torero_api.core.backends import CommandOutput, CommandStream, get_backend
+from torero_api.core.cache import inventory_cache
+from torero_api.core.inventory import InventoryItems, InventorySnapshot, record_snapshot_use
+from torero_api.core.catalog import ServiceCatalog
+from torero_api.core.describe_cache import describe_cache
+from torero_api.core.fastdecode import as_model, as_models, decode_inventory, decoder_name
+from torero_api.core.jsonstream import JSONFieldStreamer, JSONStreamError, iter_json_items
+from torero_api.core.singleflight import SingleFlight
+from torero_api.core.limiter import READ, EXECUTE, ToreroBusyError, process_limiter
+from torero_api.core.outputs import OUTPUT_STREAMS, output_store
+from torero_api.core.history import execution_history
+from torero_api.core.scheduler import current_ticket, execution_scheduler
+from torero_api.core.settings import read_number
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -20,32 +65,494 @@ logger = logging.getLogger(__name__)
 # torero command
 TORERO_COMMAND = 'torero'
 
-def check_torero_available() -> Tuple[bool, str]:
+# Default number of describe commands a bulk describe runs at once
+DEFAULT_DESCRIBE_CONCURRENCY = 8
+
+# Default number of executions a batch runs at once
+DEFAULT_BATCH_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+# Concurrent identical read commands (get/describe) share one torero process.
+# Service executions are never coalesced.
+_read_flights = SingleFlight()
+
+def _coalesced_read(verb: str, kind: str) -> Callable:
+    """
+    Decorator that coalesces concurrent calls of a read-only executor coroutine.
+    
+    Calls are keyed by the torero argv they run, i.e.
+    ``torero <verb> <kind> [args...] --raw``, so concurrent callers asking for
+    the same data share one subprocess and its parsed result.
+    
+    Args:
+        verb: The torero verb, e.g. "describe"
+        kind: The resource kind, e.g. "service"
+        
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: str) -> T:
+            key = (TORERO_COMMAND, verb, kind, *args, "--raw")
+            return await _read_flights.do(key, lambda: func(*args))
+        return wrapper
+    return decorator
+
+def _cached_describe(kind: str) -> Callable:
     """
-    Check if torero is available in the system PATH.
+    Decorator that serves a describe coroutine from the describe cache.
+    
+    Results are cached under the digest of the currently cached inventory
+    snapshot of ``kind``, so they are dropped as soon as that inventory is
+    invalidated or reloaded with different content. Without a cached
+    inventory the describe command always runs.
+    
+    Args:
+        kind: The parent inventory kind, e.g. "services"
+        
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable[[str], Awaitable[T]]) -> Callable[[str], Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(name: str) -> T:
+            digest = getattr(inventory_cache.peek(kind), "digest", None)
+            found, value = describe_cache.get(kind, name, digest)
+            if found:
+                logger.debug(f"Describe cache hit: {kind}/{name}")
+                return value
+            
+            value = await func(name)
+            if value is not None:
+                describe_cache.put(kind, name, digest, value)
+            return value
+        return wrapper
+    return decorator
+
+def _recorded(operation: str) -> Callable:
+    """
+    Decorator that records every call of a service execution coroutine in the execution history.
+    
+    Executions rejected by the process limiter never ran and are not recorded.
+    
+    Args:
+        operation: What is run, e.g. "ansible-playbook" or "opentofu-plan/apply"
+        
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        @functools.wraps(func)
+        async def wrapper(name: str, **kwargs) -> Dict[str, Any]:
+            try:
+                result = await func(name, **kwargs)
+            except ToreroBusyError:
+                raise
+            except Exception as e:
+                await execution_history.record_async(name, operation, error=str(e))
+                raise
+            await execution_history.record_async(name, operation, result=result)
+            return result
+        return wrapper
+    return decorator
+
+def _admission_timeout() -> Optional[float]:
+    """
+    Get how long an execution may wait for the scheduler.
+    
+    Returns:
+        Optional[float]: None for background jobs, which wait as long as needed,
+        otherwise the process limiter's queue timeout
+    """
+    return None if current_ticket() is not None else process_limiter.queue_timeout
+
+def _scheduled(service_type: str) -> Callable:
+    """
+    Decorator that admits every call of a service execution coroutine through the execution scheduler.
+    
+    Args:
+        service_type: Type of the executed services, e.g. "opentofu-plan"
+        
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        @functools.wraps(func)
+        async def wrapper(name: str, **kwargs) -> Dict[str, Any]:
+            async with execution_scheduler.slot(service_type, name, timeout=_admission_timeout()):
+                return await func(name, **kwargs)
+        return wrapper
+    return decorator
+
+async def _run_command(command: List[str], timeout: float, command_class: Optional[str] = READ) -> Tuple[int, str, str]:
+    """
+    Run a torero command through the configured backend without blocking the event loop.
+    
+    The command waits for a slot in the shared process limiter before it is
+    handed to the backend, so the number of concurrent torero commands stays bounded.
+    
+    Args:
+        command: The full argument vector, starting with the torero executable
+        timeout: Maximum number of seconds to wait for the command to finish
+        command_class: The limiter class of the command, READ or EXECUTE, or
+            None to run it without waiting for a slot (health checks only)
+        
+    Returns:
+        Tuple[int, str, str]: The return code, decoded stdout and decoded stderr
+        
+    Raises:
+        ToreroBusyError: If no process slot became available in time.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+            With the CLI backend the child process is killed before the exception is raised.
+    """
+    if command_class is None:
+        result = await get_backend().run(command, timeout)
+    else:
+        async with process_limiter.slot(command_class):
+            result = await get_backend().run(command, timeout)
+    
+    return result.return_code, result.stdout, result.stderr
+
+async def _run_command_bytes(command: List[str], timeout: float, command_class: str = READ) -> Tuple[int, bytes, str]:
+    """
+    Run a torero command like _run_command(), but return stdout undecoded.
+    
+    Args:
+        command: The full argument vector, starting with the torero executable
+        timeout: Maximum number of seconds to wait for the command to finish
+        command_class: The limiter class of the command, READ or EXECUTE
+        
+    Returns:
+        Tuple[int, bytes, str]: The return code, raw stdout and decoded stderr
+        
+    Raises:
+        ToreroBusyError: If no process slot became available in time.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+    """
+    async with process_limiter.slot(command_class):
+        result = await get_backend().run(command, timeout)
+    
+    return result.return_code, result.stdout_bytes, result.stderr
+
+@asynccontextmanager
+async def _stream_command(command: List[str], timeout: float, command_class: str = READ) -> AsyncIterator[CommandStream]:
+    """
+    Run a torero command through the configured backend and read its stdout incrementally.
+    
+    Like _run_command(), the command holds a slot in the shared process limiter
+    for as long as its output is being read.
+    
+    Args:
+        command: The full argument vector, starting with the torero executable
+        timeout: Maximum number of seconds the whole command may take
+        command_class: The limiter class of the command, READ or EXECUTE
+        
+    Yields:
+        CommandStream: The command's output
+        
+    Raises:
+        ToreroBusyError: If no process slot became available in time.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+    """
+    async with process_limiter.slot(command_class):
+        async with get_backend().stream(command, timeout) as stream:
+            yield stream
+
+@asynccontextmanager
+async def _output_command(command: List[str], timeout: float, command_class: str = READ) -> AsyncIterator[CommandOutput]:
+    """
+    Run a torero command through the configured backend and read its output line by line.
+    
+    Like _run_command(), the command holds a slot in the shared process limiter
+    for as long as its output is being read.
+    
+    Args:
+        command: The full argument vector, starting with the torero executable
+        timeout: Maximum number of seconds the whole command may take
+        command_class: The limiter class of the command, READ or EXECUTE
+        
+    Yields:
+        CommandOutput: The command's stdout and stderr lines
+        
+    Raises:
+        ToreroBusyError: If no process slot became available in time.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+    """
+    async with process_limiter.slot(command_class):
+        async with get_backend().output(command, timeout) as output:
+            yield output
+
+async def _execute_service(command: List[str], timeout: float) -> Dict[str, Any]:
+    """
+    Run a 'torero run service ... --raw' command, spooling the service's output.
+    
+    torero's result is parsed while it is read: the (potentially huge)
+    stdout and stderr strings are written to the output store piece by
+    piece, and the other fields are decoded normally. Neither the raw
+    document nor the complete output is ever held in memory.
+    
+    Args:
+        command: The full argument vector, starting with the torero executable
+        timeout: Maximum number of seconds the execution may take
+        
+    Returns:
+        dict: torero's result, with stdout and stderr as returned by
+        OutputStore.finish()
+        
+    Raises:
+        RuntimeError: If torero's output is not a valid JSON result.
+        ToreroBusyError: If no process slot became available in time.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+    """
+    output = output_store.create()
+    try:
+        parser = JSONFieldStreamer(OUTPUT_STREAMS)
+        parse_error: Optional[JSONStreamError] = None
+        
+        async with _stream_command(command, timeout=timeout, command_class=EXECUTE) as stream:
+            try:
+                async for chunk in stream:
+                    for key, text in parser.feed(chunk):
+                        await output.write_async(key, text)
+                for key, text in parser.close():
+                    await output.write_async(key, text)
+            except JSONStreamError as e:
+                parse_error = e
+            returncode = await stream.finish()
+        
+        if parse_error is not None:
+            error_msg = f"Invalid JSON from torero run service: {parse_error}"
+            logger.error(error_msg)
+            
+            # If we can't parse JSON but have a non-zero return code, it's likely an error
+            if returncode != 0:
+                error_msg = f"Service execution failed with code {returncode}: {stream.stderr.strip()}"
+            
+            raise RuntimeError(error_msg)
+    except BaseException:
+        output.close()
+        raise
+    
+    return output_store.finish(output, parser.fields)
+
+async def _read_inventory_items(kind: str, command: List[str], array_keys: Tuple[str, ...], build: Callable[[Any], Any],
+                                compact: Optional[Callable[[Any], T]] = None) -> List[T]:
+    """
+    Run a 'torero get <kind> --raw' command and build one object per inventory item.
+    
+    With the default stream decoder the output is parsed incrementally while
+    it is being read, and each raw item is turned into its model as soon as
+    it is complete, so the raw document is never held in memory as a whole.
+    With the fast decoder (TORERO_API_DECODER=fast) the output is decoded in
+    one pass into compact records instead (see torero_api.core.fastdecode).
+    
+    Args:
+        kind: The resource kind, e.g. "services"
+        command: The full argument vector, starting with the torero executable
+        array_keys: Keys of a top-level object whose array holds the items;
+            a top-level array is accepted as well
+        build: Function turning one raw item into its model; the fast
+            decoder's records apply the same mapping themselves, so it is
+            only used by the stream decoder
+        compact: Optional function turning each model or fast-decoder record
+            into the compact form kept in the inventory cache
+        
+    Returns:
+        List[T]: The built objects, in the order returned by torero, as
+        InventoryItems carrying the digest of torero's raw output
+        
+    Raises:
+        RuntimeError: If torero fails or its output is not valid JSON.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+    """
+    if decoder_name() == "fast":
+        records = await _decode_inventory_records(kind, command)
+        return InventoryItems(map(compact, records), records.digest) if compact else records
+    
+    items: List[T] = []
+    parse_error: Optional[JSONStreamError] = None
+    digest = hashlib.blake2b(digest_size=16)
+    
+    async def hashed(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        # Fingerprint torero's raw output as it passes to the parser
+        async for chunk in chunks:
+            digest.update(chunk)
+            yield chunk
+    
+    async with _stream_command(command, timeout=30) as stream:
+        try:
+            async for raw_item in iter_json_items(hashed(stream), array_keys):
+                item = build(raw_item)
+                items.append(compact(item) if compact else item)
+        except JSONStreamError as e:
+            parse_error = e
+        returncode = await stream.finish()
+    
+    # A failed command usually prints nothing on stdout, so report its error first
+    if returncode != 0:
+        error_msg = f"torero error: {stream.stderr.strip()}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+    
+    if parse_error is not None:
+        error_msg = f"Invalid JSON from torero: {parse_error}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+    
+    return InventoryItems(items, digest.hexdigest())
+
+async def _decode_inventory_records(kind: str, command: List[str]) -> InventoryItems:
+    """
+    Run a 'torero get <kind> --raw' command and decode its output into records.
+    
+    Args:
+        kind: The resource kind, e.g. "services"
+        command: The full argument vector, starting with the torero executable
+        
+    Returns:
+        InventoryItems: One fast-decoder record per inventory item
+        
+    Raises:
+        RuntimeError: If torero fails or its output is not valid JSON.
+        subprocess.TimeoutExpired: If the command does not finish within the timeout.
+    """
+    # msgspec decodes the raw bytes and the digest is taken over them, so the output is never copied
+    returncode, stdout, stderr = await _run_command_bytes(command, timeout=30)
+    
+    if returncode != 0:
+        error_msg = f"torero error: {stderr.strip()}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+    
+    try:
+        records = decode_inventory(kind, stdout)
+    except ValueError as e:
+        error_msg = f"Invalid JSON from torero: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+    
+    return InventoryItems(records, hashlib.blake2b(stdout, digest_size=16).hexdigest())
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run an executor coroutine to completion from synchronous code.
+    
+    Args:
+        coro: The coroutine to run
+        
+    Returns:
+        The result of the coroutine
+        
+    Raises:
+        RuntimeError: If called from a thread that is already running an event loop;
+            async code should await the ``_async`` variant instead.
+    """
+    return asyncio.run(coro)
+
+def _snapshot_loader(kind: str) -> Callable[[], Awaitable[InventorySnapshot]]:
+    """
+    Build the loader that fetches and indexes a fresh snapshot of a resource kind.
+    
+    Concurrent loads of the same kind share a single 'torero get <kind> --raw'
+    call, as long as the kind has not been invalidated in between: a load
+    started after an invalidation never joins one started before it.
+    
+    Args:
+        kind: The resource kind
+        
+    Returns:
+        Callable: Coroutine function returning a new InventorySnapshot
+        
+    Raises:
+        ValueError: If the kind is unknown.
+    """
+    fetcher = _INVENTORY_FETCHERS.get(kind)
+    if fetcher is None:
+        raise ValueError(f"Unknown resource kind: {kind}")
+    
+    async def load() -> InventorySnapshot:
+        return InventorySnapshot(kind, await fetcher())
+    
+    def start() -> Awaitable[InventorySnapshot]:
+        key = (TORERO_COMMAND, "get", kind, "--raw", inventory_cache.generation(kind))
+        return _read_flights.do(key, load)
+    
+    return start
+
+async def get_inventory_snapshot_async(kind: str) -> InventorySnapshot:
+    """
+    Get the current inventory snapshot for a resource kind.
+    
+    The snapshot is served from the inventory cache when it is fresh or
+    recently expired (in which case it is refreshed in the background);
+    otherwise it is fetched with 'torero get <kind> --raw' and indexed once
+    before being cached. If fetching fails, the last good snapshot is served.
+    
+    Args:
+        kind: The resource kind, one of "services", "decorators", "repositories",
+            "secrets" or "registries"
+        
+    Returns:
+        InventorySnapshot: The inventory items together with their name index
+        
+    Raises:
+        ValueError: If the kind is unknown.
+        RuntimeError: If the torero command fails or returns invalid JSON and
+            there is no previous snapshot to fall back to.
+    """
+    snapshot = await inventory_cache.get_or_load(kind, _snapshot_loader(kind))
+    record_snapshot_use(snapshot)
+    return snapshot
+
+async def refresh_inventory_async(kind: str) -> InventorySnapshot:
+    """
+    Fetch a fresh snapshot of a resource kind and store it in the inventory cache.
+    
+    Used by the background refresher to replace snapshots before they expire.
+    If fetching fails, the error is recorded in the cache status and the
+    previous snapshot is kept and returned.
+    
+    Args:
+        kind: The resource kind
+        
+    Returns:
+        InventorySnapshot: The new snapshot, or the previous one if fetching failed
+        
+    Raises:
+        ValueError: If the kind is unknown.
+        RuntimeError: If fetching fails and there is no previous snapshot.
+    """
+    return await inventory_cache.refresh(kind, _snapshot_loader(kind))
+
+def refresh_inventory(kind: str) -> InventorySnapshot:
+    """
+    Synchronous wrapper around :func:`refresh_inventory_async`.
+    
+    See :func:`refresh_inventory_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(refresh_inventory_async(kind))
+
+async def check_torero_available_async() -> Tuple[bool, str]:
+    """
+    Check if torero is available through the configured backend.
     
     Returns:
         Tuple[bool, str]: A tuple containing a boolean indicating whether torero is available
                         and a message with more details
     """
 
-    # Check if torero executable is in PATH
-    torero_path = shutil.which(TORERO_COMMAND)
-    if not torero_path:
+    # Check if torero executable is in PATH when the backend spawns it locally
+    if get_backend().requires_local_binary and not shutil.which(TORERO_COMMAND):
         return False, f"{TORERO_COMMAND} executable not found in PATH"
     
-    # Check if torero can be executed
+    # Check if torero can be executed; outside the limiter, so a busy API still reports itself healthy
     try:
-        result = subprocess.run(
-            [TORERO_COMMAND, "version"],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=5
-        )
+        returncode, stdout, stderr = await _run_command([TORERO_COMMAND, "version"], timeout=5, command_class=None)
         
-        if result.returncode != 0:
-            return False, f"{TORERO_COMMAND} command failed: {result.stderr.strip()}"
+        if returncode != 0:
+            return False, f"{TORERO_COMMAND} command failed: {stderr.strip()}"
         
         return True, f"{TORERO_COMMAND} is available"
     except subprocess.TimeoutExpired:
@@ -53,7 +560,15 @@ def check_torero_available() -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Error checking {TORERO_COMMAND}: {str(e)}"
 
-def check_torero_version() -> str:
+def check_torero_available() -> Tuple[bool, str]:
+    """
+    Synchronous wrapper around :func:`check_torero_available_async`.
+    
+    See :func:`check_torero_available_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(check_torero_available_async())
+
+async def check_torero_version_async() -> str:
     """
     Get the version of torero installed.
     
@@ -61,20 +576,14 @@ def check_torero_version() -> str:
         str: The version of torero, or "unknown" if it couldn't be determined
     """
     try:
-        result = subprocess.run(
-            [TORERO_COMMAND, "version"],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=5
-        )
-        
-        if result.returncode != 0:
+        returncode, stdout, stderr = await _run_command([TORERO_COMMAND, "version"], timeout=5, command_class=None)
+        
+        if returncode != 0:
             return "unknown"
         
         # Parse the version from the output
         # Example output: "torero version 1.3.1"
-        output_lines = result.stdout.strip().split("\n")
+        output_lines = stdout.strip().split("\n")
         for line in output_lines:
             if line.startswith("torero"):
                 parts = line.split()
@@ -85,16 +594,45 @@ def check_torero_version() -> str:
     except Exception:
         return "unknown"
 
-def get_services() -> List[Service]:
+def check_torero_version() -> str:
+    """
+    Synchronous wrapper around :func:`check_torero_version_async`.
+    
+    See :func:`check_torero_version_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(check_torero_version_async())
+
+async def get_services_async() -> InventorySnapshot:
+    """
+    Get all services, served from the inventory cache when possible.
+    
+    The services inventory is fetched with 'torero get services --raw' on a cache
+    miss and reused until its TTL expires (see torero_api.core.cache).
+    
+    The items are compact catalog entries with the same attributes as Service
+    (see torero_api.core.catalog); convert them with
+    torero_api.core.fastdecode.as_models().
+    
+    Returns:
+        InventorySnapshot: Read-only inventory snapshot of all registered torero services.
+        Filter and paginate it with torero_api.core.inventory.select_items(),
+        which uses the snapshot's type and tag indexes.
+    
+    Raises:
+        RuntimeError: If the torero command fails or returns invalid JSON.
+    """
+    return await get_inventory_snapshot_async("services")
+
+async def _fetch_services_async() -> List[Service]:
     """
     Execute torero CLI command to get all services.
     
     Makes a system call to 'torero get services --raw' to retrieve the raw JSON
     data of all registered services, then parses and validates this data into
-    Service objects.
+    Service objects and stores them as compact catalog entries.
     
     Returns:
-        List[Service]: List of Service objects representing all registered torero services.
+        List[Service]: Entries for all registered torero services.
     
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
@@ -103,42 +641,17 @@ def get_services() -> List[Service]:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        try:
-            # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
-            
-            # Handle the case where services are wrapped in an "items" array
-            if isinstance(raw_output, dict) and "items" in raw_output:
-                services_data = raw_output["items"]
-            elif isinstance(raw_output, list):
-                services_data = raw_output
-            else:
-                raise RuntimeError(f"Unexpected JSON structure from torero: {type(raw_output)}")
-            
-            # Create Service objects
-            services = [Service(**svc) for svc in services_data]
-            logger.debug(f"Retrieved {len(services)} services from torero")
-            return services
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")  # Log first 1000 chars
-            raise RuntimeError(error_msg)
+        # Stream the output and build Service objects one item at a time,
+        # keeping only their compact catalog entries; services may be wrapped
+        # in an "items" array
+        catalog = ServiceCatalog()
+        services = await _read_inventory_items("services", command, ("items",), lambda svc: Service(**svc), catalog.add)
+        logger.debug(f"Retrieved {len(services)} services from torero")
+        return services
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero command timed out"
         logger.error(error_msg)
@@ -147,33 +660,63 @@ def get_services() -> List[Service]:
         logger.exception(f"Unexpected error executing torero command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero command: {str(e)}")
 
-def get_service_by_name(name: str) -> Optional[Service]:
+def get_services() -> List[Service]:
+    """
+    Synchronous wrapper around :func:`get_services_async`.
+    
+    Unlike the coroutine, returns a new list of Service models rather than
+    the shared inventory snapshot.
+    
+    See :func:`get_services_async` for exceptions.
+    
+    Returns:
+        List[Service]: All registered torero services
+    """
+    return as_models(list(_run_sync(get_services_async())))
+
+async def get_service_by_name_async(name: str) -> Optional[Any]:
     """
     Get a specific service by name.
     
+    Uses the name index of the cached inventory snapshot, so the lookup does
+    not scan the inventory and only spawns torero when the snapshot is stale.
+    The item is a compact catalog entry; convert it with
+    torero_api.core.fastdecode.as_model().
+    
     Args:
         name: The name of the service to retrieve
         
     Returns:
-        Optional[Service]: The service if found, None otherwise
+        Optional[Any]: The service's inventory entry if found, None otherwise
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
     """
-    services = get_services()
+    snapshot = await get_inventory_snapshot_async("services")
+    return snapshot.get(name)
+
+def get_service_by_name(name: str) -> Optional[Service]:
+    """
+    Synchronous wrapper around :func:`get_service_by_name_async`.
+    
+    Unlike the coroutine, returns the Service model rather than its inventory entry.
     
-    for service in services:
-        if service.name == name:
-            return service
+    See :func:`get_service_by_name_async` for arguments and exceptions.
     
-    return None
+    Returns:
+        Optional[Service]: The service if found, None otherwise
+    """
+    return as_model(_run_sync(get_service_by_name_async(name)))
 
-def describe_service(name: str) -> Optional[dict]:
+@_cached_describe("services")
+@_coalesced_read("describe", "service")
+async def describe_service_async(name: str) -> Optional[dict]:
     """
     Get detailed description of a specific service by name.
     
     Makes a system call to 'torero describe service <n> --raw' to retrieve
-    detailed information about a specific service.
+    detailed information about a specific service. Results are cached while the
+    services inventory is unchanged; treat them as read-only.
     
     Args:
         name: The name of the service to describe
@@ -189,22 +732,16 @@ def describe_service(name: str) -> Optional[dict]:
     
     try:
         # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
+        returncode, stdout, stderr = await _run_command(command, timeout=30)
+
+        if returncode != 0:
+            error_msg = f"torero error: {stderr.strip()}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
         try:
             # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
+            raw_output = json.loads(stdout)
             
             # The describe command returns an array, return the full response
             if isinstance(raw_output, list):
@@ -220,9 +757,12 @@ def describe_service(name: str) -> Optional[dict]:
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON from torero describe: {e}"
             logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
+            logger.debug(f"Raw output: {stdout[:1000]}...")
             raise RuntimeError(error_msg)
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero describe command timed out"
         logger.error(error_msg)
@@ -231,7 +771,35 @@ def describe_service(name: str) -> Optional[dict]:
         logger.exception(f"Unexpected error executing torero describe command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero describe command: {str(e)}")
 
-def get_decorators() -> List['Decorator']:
+def describe_service(name: str) -> Optional[dict]:
+    """
+    Synchronous wrapper around :func:`describe_service_async`.
+    
+    See :func:`describe_service_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(describe_service_async(name))
+
+async def get_decorators_async() -> InventorySnapshot:
+    """
+    Get all decorators, served from the inventory cache when possible.
+    
+    The decorators inventory is fetched with 'torero get decorators --raw' on a cache
+    miss and reused until its TTL expires (see torero_api.core.cache).
+    
+    With the fast decoder the items are compact records with the same
+    attributes; convert them with torero_api.core.fastdecode.as_models().
+    
+    Returns:
+        InventorySnapshot: Read-only inventory snapshot of all registered torero decorators.
+        Filter and paginate it with torero_api.core.inventory.select_items(),
+        which uses the snapshot's type and tag indexes.
+    
+    Raises:
+        RuntimeError: If the torero command fails or returns invalid JSON.
+    """
+    return await get_inventory_snapshot_async("decorators")
+
+async def _fetch_decorators_async() -> List['Decorator']:
     """
     Execute torero CLI command to get all decorators.
     
@@ -249,65 +817,35 @@ def get_decorators() -> List['Decorator']:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        try:
-            # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
-            
-            # Handle the case where decorators are wrapped in a "decorators" array
-            if isinstance(raw_output, dict) and "decorators" in raw_output:
-                decorators_data = raw_output["decorators"]
-            elif isinstance(raw_output, dict) and "items" in raw_output:
-                decorators_data = raw_output["items"]
-            elif isinstance(raw_output, list):
-                decorators_data = raw_output
-            else:
-                raise RuntimeError(f"Unexpected JSON structure from torero: {type(raw_output)}")
-            
-            # Create Decorator objects
-            from torero_api.models.decorator import Decorator
-            decorators = []
-            
-            for decorator_data in decorators_data:
-                # Map torero CLI fields to Decorator model fields
-                # The CLI uses "schema" but our model expects "parameters"
-                decorator_info = {
-                    "name": decorator_data.get("name", "unknown"),
-                    "description": decorator_data.get("description") or None,
-                    "type": decorator_data.get("type", "decorator"),  # Use provided type or default to "decorator"
-                    "parameters": decorator_data.get("schema") or decorator_data.get("parameters"),  # Map schema to parameters, fallback to parameters
-                    "registries": {
-                        "metadata": {
-                            "id": decorator_data.get("id"),
-                            "created": decorator_data.get("created"),
-                            "tags": decorator_data.get("tags", [])
-                        }
+        from torero_api.models.decorator import Decorator
+        
+        def build(decorator_data: dict) -> 'Decorator':
+            # Map torero CLI fields to Decorator model fields
+            # The CLI uses "schema" but our model expects "parameters"
+            decorator_info = {
+                "name": decorator_data.get("name", "unknown"),
+                "description": decorator_data.get("description") or None,
+                "type": decorator_data.get("type", "decorator"),  # Use provided type or default to "decorator"
+                "parameters": decorator_data.get("schema") or decorator_data.get("parameters"),  # Map schema to parameters, fallback to parameters
+                "registries": {
+                    "metadata": {
+                        "id": decorator_data.get("id"),
+                        "created": decorator_data.get("created"),
+                        "tags": decorator_data.get("tags") or []
                     }
                 }
-                
-                decorators.append(Decorator(**decorator_info))
-            
-            logger.debug(f"Retrieved {len(decorators)} decorators from torero")
-            return decorators
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
-            raise RuntimeError(error_msg)
+            }
+            return Decorator(**decorator_info)
+        
+        # Stream the output and build Decorator objects one item at a time;
+        # decorators may be wrapped in a "decorators" or "items" array
+        decorators = await _read_inventory_items("decorators", command, ("decorators", "items"), build)
+        logger.debug(f"Retrieved {len(decorators)} decorators from torero")
+        return decorators
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero command timed out"
         logger.error(error_msg)
@@ -316,28 +854,75 @@ def get_decorators() -> List['Decorator']:
         logger.exception(f"Unexpected error executing torero command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero command: {str(e)}")
 
-def get_decorator_by_name(name: str) -> Optional['Decorator']:
+def get_decorators() -> List['Decorator']:
+    """
+    Synchronous wrapper around :func:`get_decorators_async`.
+    
+    Unlike the coroutine, returns a new list of Decorator models rather than
+    the shared inventory snapshot.
+    
+    See :func:`get_decorators_async` for exceptions.
+    
+    Returns:
+        List[Decorator]: All registered torero decorators
+    """
+    return as_models(list(_run_sync(get_decorators_async())))
+
+async def get_decorator_by_name_async(name: str) -> Optional[Any]:
     """
     Get a specific decorator by name.
     
+    Uses the name index of the cached inventory snapshot, so the lookup does
+    not scan the inventory and only spawns torero when the snapshot is stale.
+    With the fast decoder the item is a compact record; convert it with
+    torero_api.core.fastdecode.as_model().
+    
     Args:
         name: The name of the decorator to retrieve
         
     Returns:
-        Optional[Decorator]: The decorator if found, None otherwise
+        Optional[Any]: The decorator's inventory entry if found, None otherwise
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
     """
-    decorators = get_decorators()
+    snapshot = await get_inventory_snapshot_async("decorators")
+    return snapshot.get(name)
+
+def get_decorator_by_name(name: str) -> Optional['Decorator']:
+    """
+    Synchronous wrapper around :func:`get_decorator_by_name_async`.
+    
+    Unlike the coroutine, returns the Decorator model rather than its inventory entry.
     
-    for decorator in decorators:
-        if decorator.name == name:
-            return decorator
+    See :func:`get_decorator_by_name_async` for arguments and exceptions.
     
-    return None
+    Returns:
+        Optional[Decorator]: The decorator if found, None otherwise
+    """
+    return as_model(_run_sync(get_decorator_by_name_async(name)))
 
-def get_repositories() -> List['Repository']:
+async def get_repositories_async() -> InventorySnapshot:
+    """
+    Get all repositories, served from the inventory cache when possible.
+    
+    The repositories inventory is fetched with 'torero get repositories --raw' on a cache
+    miss and reused until its TTL expires (see torero_api.core.cache).
+    
+    With the fast decoder the items are compact records with the same
+    attributes; convert them with torero_api.core.fastdecode.as_models().
+    
+    Returns:
+        InventorySnapshot: Read-only inventory snapshot of all registered torero repositories.
+        Filter and paginate it with torero_api.core.inventory.select_items(),
+        which uses the snapshot's type and tag indexes.
+    
+    Raises:
+        RuntimeError: If the torero command fails or returns invalid JSON.
+    """
+    return await get_inventory_snapshot_async("repositories")
+
+async def _fetch_repositories_async() -> List['Repository']:
     """
     Execute torero CLI command to get all repositories.
     
@@ -355,60 +940,32 @@ def get_repositories() -> List['Repository']:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        try:
-            # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
-            
-            # Handle the case where repositories are wrapped in an "items" array
-            if isinstance(raw_output, dict) and "items" in raw_output:
-                repositories_data = raw_output["items"]
-            elif isinstance(raw_output, list):
-                repositories_data = raw_output
-            else:
-                raise RuntimeError(f"Unexpected JSON structure from torero: {type(raw_output)}")
-            
-            # Create Repository objects
-            from torero_api.models.repository import Repository
-            repositories = []
-            
-            for repo_data in repositories_data:
-                # Map torero CLI fields to Repository model fields
-                repository_info = {
-                    "name": repo_data.get("name", "unknown"),
-                    "description": repo_data.get("description"),
-                    "type": repo_data.get("type") or ("git" if repo_data.get("url", "").endswith(".git") else "unknown"),
-                    "location": repo_data.get("url") or repo_data.get("location", "unknown"),
-                    "metadata": {
-                        "reference": repo_data.get("reference"),
-                        "tags": repo_data.get("tags", []),
-                        "private_key_name": repo_data.get("private_key_name", "")
-                    }
+        from torero_api.models.repository import Repository
+        
+        def build(repo_data: dict) -> 'Repository':
+            # Map torero CLI fields to Repository model fields
+            repository_info = {
+                "name": repo_data.get("name", "unknown"),
+                "description": repo_data.get("description"),
+                "type": repo_data.get("type") or ("git" if (repo_data.get("url") or "").endswith(".git") else "unknown"),
+                "location": repo_data.get("url") or repo_data.get("location") or "unknown",
+                "metadata": {
+                    "reference": repo_data.get("reference"),
+                    "tags": repo_data.get("tags") or [],
+                    "private_key_name": repo_data.get("private_key_name", "")
                 }
-                
-                repositories.append(Repository(**repository_info))
-            
-            logger.debug(f"Retrieved {len(repositories)} repositories from torero")
-            return repositories
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
-            raise RuntimeError(error_msg)
+            }
+            return Repository(**repository_info)
+        
+        # Stream the output and build Repository objects one item at a time;
+        # repositories may be wrapped in an "items" array
+        repositories = await _read_inventory_items("repositories", command, ("items",), build)
+        logger.debug(f"Retrieved {len(repositories)} repositories from torero")
+        return repositories
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero command timed out"
         logger.error(error_msg)
@@ -417,28 +974,75 @@ def get_repositories() -> List['Repository']:
         logger.exception(f"Unexpected error executing torero command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero command: {str(e)}")
 
-def get_repository_by_name(name: str) -> Optional['Repository']:
+def get_repositories() -> List['Repository']:
+    """
+    Synchronous wrapper around :func:`get_repositories_async`.
+    
+    Unlike the coroutine, returns a new list of Repository models rather than
+    the shared inventory snapshot.
+    
+    See :func:`get_repositories_async` for exceptions.
+    
+    Returns:
+        List[Repository]: All registered torero repositories
+    """
+    return as_models(list(_run_sync(get_repositories_async())))
+
+async def get_repository_by_name_async(name: str) -> Optional[Any]:
     """
     Get a specific repository by name.
     
+    Uses the name index of the cached inventory snapshot, so the lookup does
+    not scan the inventory and only spawns torero when the snapshot is stale.
+    With the fast decoder the item is a compact record; convert it with
+    torero_api.core.fastdecode.as_model().
+    
     Args:
         name: The name of the repository to retrieve
         
     Returns:
-        Optional[Repository]: The repository if found, None otherwise
+        Optional[Any]: The repository's inventory entry if found, None otherwise
         
     Raises:
         RuntimeError: If the torero command fails.
     """
-    repositories = get_repositories()
+    snapshot = await get_inventory_snapshot_async("repositories")
+    return snapshot.get(name)
+
+def get_repository_by_name(name: str) -> Optional['Repository']:
+    """
+    Synchronous wrapper around :func:`get_repository_by_name_async`.
     
-    for repository in repositories:
-        if repository.name == name:
-            return repository
+    Unlike the coroutine, returns the Repository model rather than its inventory entry.
     
-    return None
+    See :func:`get_repository_by_name_async` for arguments and exceptions.
+    
+    Returns:
+        Optional[Repository]: The repository if found, None otherwise
+    """
+    return as_model(_run_sync(get_repository_by_name_async(name)))
 
-def get_secrets() -> List['Secret']:
+async def get_secrets_async() -> InventorySnapshot:
+    """
+    Get all secrets, served from the inventory cache when possible.
+    
+    The secrets inventory is fetched with 'torero get secrets --raw' on a cache
+    miss and reused until its TTL expires (see torero_api.core.cache).
+    
+    With the fast decoder the items are compact records with the same
+    attributes; convert them with torero_api.core.fastdecode.as_models().
+    
+    Returns:
+        InventorySnapshot: Read-only inventory snapshot of all registered torero secrets.
+        Filter and paginate it with torero_api.core.inventory.select_items(),
+        which uses the snapshot's type and tag indexes.
+    
+    Raises:
+        RuntimeError: If the torero command fails or returns invalid JSON.
+    """
+    return await get_inventory_snapshot_async("secrets")
+
+async def _fetch_secrets_async() -> List['Secret']:
     """
     Execute torero CLI command to get all secrets.
     
@@ -452,47 +1056,21 @@ def get_secrets() -> List['Secret']:
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
     """
-    command = [TORERO_COMMAND, "get", "secrets", "--raw"]
-    logger.debug(f"Executing command: {' '.join(command)}")
-    
-    try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        try:
-            # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
-            
-            # Handle the case where secrets are wrapped in an "items" array
-            if isinstance(raw_output, dict) and "items" in raw_output:
-                secrets_data = raw_output["items"]
-            elif isinstance(raw_output, list):
-                secrets_data = raw_output
-            else:
-                raise RuntimeError(f"Unexpected JSON structure from torero: {type(raw_output)}")
-            
-            # Create Secret objects
-            from torero_api.models.secret import Secret
-            secrets = [Secret(**secret) for secret in secrets_data]
-            logger.debug(f"Retrieved {len(secrets)} secrets from torero")
-            return secrets
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
-            raise RuntimeError(error_msg)
+    command = [TORERO_COMMAND, "get", "secrets", "--raw"]
+    logger.debug(f"Executing command: {' '.join(command)}")
+    
+    try:
+        from torero_api.models.secret import Secret
+        
+        # Stream the output and build Secret objects one item at a time;
+        # secrets may be wrapped in an "items" array
+        secrets = await _read_inventory_items("secrets", command, ("items",), lambda secret: Secret(**secret))
+        logger.debug(f"Retrieved {len(secrets)} secrets from torero")
+        return secrets
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero command timed out"
         logger.error(error_msg)
@@ -501,28 +1079,57 @@ def get_secrets() -> List['Secret']:
         logger.exception(f"Unexpected error executing torero command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero command: {str(e)}")
 
-def get_secret_by_name(name: str) -> Optional['Secret']:
+def get_secrets() -> List['Secret']:
+    """
+    Synchronous wrapper around :func:`get_secrets_async`.
+    
+    Unlike the coroutine, returns a new list of Secret models rather than
+    the shared inventory snapshot.
+    
+    See :func:`get_secrets_async` for exceptions.
+    
+    Returns:
+        List[Secret]: All registered torero secrets
+    """
+    return as_models(list(_run_sync(get_secrets_async())))
+
+async def get_secret_by_name_async(name: str) -> Optional[Any]:
     """
     Get a specific secret by name.
     
+    Uses the name index of the cached inventory snapshot, so the lookup does
+    not scan the inventory and only spawns torero when the snapshot is stale.
+    With the fast decoder the item is a compact record; convert it with
+    torero_api.core.fastdecode.as_model().
+    
     Args:
         name: The name of the secret to retrieve
         
     Returns:
-        Optional[Secret]: The secret if found, None otherwise
+        Optional[Any]: The secret's inventory entry if found, None otherwise
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
     """
-    secrets = get_secrets()
+    snapshot = await get_inventory_snapshot_async("secrets")
+    return snapshot.get(name)
+
+def get_secret_by_name(name: str) -> Optional['Secret']:
+    """
+    Synchronous wrapper around :func:`get_secret_by_name_async`.
+    
+    Unlike the coroutine, returns the Secret model rather than its inventory entry.
     
-    for secret in secrets:
-        if secret.name == name:
-            return secret
+    See :func:`get_secret_by_name_async` for arguments and exceptions.
     
-    return None
+    Returns:
+        Optional[Secret]: The secret if found, None otherwise
+    """
+    return as_model(_run_sync(get_secret_by_name_async(name)))
 
-def run_ansible_playbook_service(name: str, **kwargs) -> dict:
+@_recorded("ansible-playbook")
+@_scheduled("ansible-playbook")
+async def run_ansible_playbook_service_async(name: str, **kwargs) -> dict:
     """
     Execute an Ansible playbook service using torero.
     
@@ -534,7 +1141,8 @@ def run_ansible_playbook_service(name: str, **kwargs) -> dict:
         **kwargs: Additional parameters to pass to the service
         
     Returns:
-        dict: Execution results including return code, stdout, stderr, and timing information
+        dict: Execution results including return code, stdout, stderr, and timing information;
+        long output is cut to its head and tail, with a URL for the full output
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
@@ -549,31 +1157,14 @@ def run_ansible_playbook_service(name: str, **kwargs) -> dict:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=300  # 5 minute timeout for playbook execution
-        )
-
-        try:
-            # Parse the output as JSON
-            result = json.loads(proc.stdout)
-            logger.debug(f"Successfully executed Ansible playbook service: {name}")
-            return result
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero run service: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")  # Log first 1000 chars
-            
-            # If we can't parse JSON but have a non-zero return code, it's likely an error
-            if proc.returncode != 0:
-                error_msg = f"Service execution failed with code {proc.returncode}: {proc.stderr.strip()}"
-            
-            raise RuntimeError(error_msg)
+        # Run the torero command, spooling the service's output
+        result = await _execute_service(command, timeout=300)  # 5 minute timeout for playbook execution
+        logger.debug(f"Successfully executed Ansible playbook service: {name}")
+        return result
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "Service execution timed out after 5 minutes"
         logger.error(error_msg)
@@ -582,7 +1173,17 @@ def run_ansible_playbook_service(name: str, **kwargs) -> dict:
         logger.exception(f"Unexpected error executing service: {str(e)}")
         raise RuntimeError(f"Failed to execute service: {str(e)}")
 
-def run_python_script_service(name: str, **kwargs) -> dict:
+def run_ansible_playbook_service(name: str, **kwargs) -> dict:
+    """
+    Synchronous wrapper around :func:`run_ansible_playbook_service_async`.
+    
+    See :func:`run_ansible_playbook_service_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(run_ansible_playbook_service_async(name, **kwargs))
+
+@_recorded("python-script")
+@_scheduled("python-script")
+async def run_python_script_service_async(name: str, **kwargs) -> dict:
     """
     Execute a Python script service using torero.
     
@@ -594,7 +1195,8 @@ def run_python_script_service(name: str, **kwargs) -> dict:
         **kwargs: Additional parameters to pass to the service
         
     Returns:
-        dict: Execution results including return code, stdout, stderr, and timing information
+        dict: Execution results including return code, stdout, stderr, and timing information;
+        long output is cut to its head and tail, with a URL for the full output
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
@@ -609,31 +1211,14 @@ def run_python_script_service(name: str, **kwargs) -> dict:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=300  # 5 minute timeout for script execution
-        )
-
-        try:
-            # Parse the output as JSON
-            result = json.loads(proc.stdout)
-            logger.debug(f"Successfully executed Python script service: {name}")
-            return result
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero run service: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")  # Log first 1000 chars
-            
-            # If we can't parse JSON but have a non-zero return code, it's likely an error
-            if proc.returncode != 0:
-                error_msg = f"Service execution failed with code {proc.returncode}: {proc.stderr.strip()}"
-            
-            raise RuntimeError(error_msg)
+        # Run the torero command, spooling the service's output
+        result = await _execute_service(command, timeout=300)  # 5 minute timeout for script execution
+        logger.debug(f"Successfully executed Python script service: {name}")
+        return result
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "Service execution timed out after 5 minutes"
         logger.error(error_msg)
@@ -642,7 +1227,17 @@ def run_python_script_service(name: str, **kwargs) -> dict:
         logger.exception(f"Unexpected error executing service: {str(e)}")
         raise RuntimeError(f"Failed to execute service: {str(e)}")
 
-def run_opentofu_plan_apply_service(name: str, **kwargs) -> dict:
+def run_python_script_service(name: str, **kwargs) -> dict:
+    """
+    Synchronous wrapper around :func:`run_python_script_service_async`.
+    
+    See :func:`run_python_script_service_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(run_python_script_service_async(name, **kwargs))
+
+@_recorded("opentofu-plan/apply")
+@_scheduled("opentofu-plan")
+async def run_opentofu_plan_apply_service_async(name: str, **kwargs) -> dict:
     """
     Execute an OpenTofu plan apply service using torero.
     
@@ -654,7 +1249,8 @@ def run_opentofu_plan_apply_service(name: str, **kwargs) -> dict:
         **kwargs: Additional parameters to pass to the service
         
     Returns:
-        dict: Execution results including return code, stdout, stderr, and timing information
+        dict: Execution results including return code, stdout, stderr, and timing information;
+        long output is cut to its head and tail, with a URL for the full output
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
@@ -669,31 +1265,14 @@ def run_opentofu_plan_apply_service(name: str, **kwargs) -> dict:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=600  # 10 minute timeout for plan apply
-        )
-
-        try:
-            # Parse the output as JSON
-            result = json.loads(proc.stdout)
-            logger.debug(f"Successfully applied OpenTofu plan service: {name}")
-            return result
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero run service: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")  # Log first 1000 chars
-            
-            # If we can't parse JSON but have a non-zero return code, it's likely an error
-            if proc.returncode != 0:
-                error_msg = f"Service execution failed with code {proc.returncode}: {proc.stderr.strip()}"
-            
-            raise RuntimeError(error_msg)
+        # Run the torero command, spooling the service's output
+        result = await _execute_service(command, timeout=600)  # 10 minute timeout for plan apply
+        logger.debug(f"Successfully applied OpenTofu plan service: {name}")
+        return result
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "Service execution timed out after 10 minutes"
         logger.error(error_msg)
@@ -702,12 +1281,23 @@ def run_opentofu_plan_apply_service(name: str, **kwargs) -> dict:
         logger.exception(f"Unexpected error executing service: {str(e)}")
         raise RuntimeError(f"Failed to execute service: {str(e)}")
 
-def describe_repository(name: str) -> Optional[dict]:
+def run_opentofu_plan_apply_service(name: str, **kwargs) -> dict:
+    """
+    Synchronous wrapper around :func:`run_opentofu_plan_apply_service_async`.
+    
+    See :func:`run_opentofu_plan_apply_service_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(run_opentofu_plan_apply_service_async(name, **kwargs))
+
+@_cached_describe("repositories")
+@_coalesced_read("describe", "repository")
+async def describe_repository_async(name: str) -> Optional[dict]:
     """
     Get detailed description of a specific repository by name.
     
     Makes a system call to 'torero describe repository <name> --raw' to retrieve
-    detailed information about a specific repository.
+    detailed information about a specific repository. Results are cached while the
+    repositories inventory is unchanged; treat them as read-only.
     
     Args:
         name: The name of the repository to describe
@@ -723,22 +1313,16 @@ def describe_repository(name: str) -> Optional[dict]:
     
     try:
         # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
+        returncode, stdout, stderr = await _run_command(command, timeout=30)
+
+        if returncode != 0:
+            error_msg = f"torero error: {stderr.strip()}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
         try:
             # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
+            raw_output = json.loads(stdout)
             
             # The describe command returns detailed info, return the full response
             logger.debug(f"Retrieved detailed description for repository: {name}")
@@ -747,9 +1331,12 @@ def describe_repository(name: str) -> Optional[dict]:
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON from torero describe: {e}"
             logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
+            logger.debug(f"Raw output: {stdout[:1000]}...")
             raise RuntimeError(error_msg)
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero describe command timed out"
         logger.error(error_msg)
@@ -758,12 +1345,23 @@ def describe_repository(name: str) -> Optional[dict]:
         logger.exception(f"Unexpected error executing torero describe command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero describe command: {str(e)}")
 
-def describe_secret(name: str) -> Optional[dict]:
+def describe_repository(name: str) -> Optional[dict]:
+    """
+    Synchronous wrapper around :func:`describe_repository_async`.
+    
+    See :func:`describe_repository_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(describe_repository_async(name))
+
+@_cached_describe("secrets")
+@_coalesced_read("describe", "secret")
+async def describe_secret_async(name: str) -> Optional[dict]:
     """
     Get detailed description of a specific secret by name.
     
     Makes a system call to 'torero describe secret <name> --raw' to retrieve
-    detailed information about a specific secret.
+    detailed information about a specific secret. Results are cached while the
+    secrets inventory is unchanged; treat them as read-only.
     
     Args:
         name: The name of the secret to describe
@@ -779,22 +1377,16 @@ def describe_secret(name: str) -> Optional[dict]:
     
     try:
         # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
+        returncode, stdout, stderr = await _run_command(command, timeout=30)
+
+        if returncode != 0:
+            error_msg = f"torero error: {stderr.strip()}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
         try:
             # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
+            raw_output = json.loads(stdout)
             
             # The describe command returns detailed info, return the full response
             logger.debug(f"Retrieved detailed description for secret: {name}")
@@ -803,9 +1395,12 @@ def describe_secret(name: str) -> Optional[dict]:
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON from torero describe: {e}"
             logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
+            logger.debug(f"Raw output: {stdout[:1000]}...")
             raise RuntimeError(error_msg)
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero describe command timed out"
         logger.error(error_msg)
@@ -814,7 +1409,35 @@ def describe_secret(name: str) -> Optional[dict]:
         logger.exception(f"Unexpected error executing torero describe command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero describe command: {str(e)}")
 
-def get_registries() -> List['Registry']:
+def describe_secret(name: str) -> Optional[dict]:
+    """
+    Synchronous wrapper around :func:`describe_secret_async`.
+    
+    See :func:`describe_secret_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(describe_secret_async(name))
+
+async def get_registries_async() -> InventorySnapshot:
+    """
+    Get all registries, served from the inventory cache when possible.
+    
+    The registries inventory is fetched with 'torero get registries --raw' on a cache
+    miss and reused until its TTL expires (see torero_api.core.cache).
+    
+    With the fast decoder the items are compact records with the same
+    attributes; convert them with torero_api.core.fastdecode.as_models().
+    
+    Returns:
+        InventorySnapshot: Read-only inventory snapshot of all registered torero registries.
+        Filter and paginate it with torero_api.core.inventory.select_items(),
+        which uses the snapshot's type and tag indexes.
+    
+    Raises:
+        RuntimeError: If the torero command fails or returns invalid JSON.
+    """
+    return await get_inventory_snapshot_async("registries")
+
+async def _fetch_registries_async() -> List['Registry']:
     """
     Execute torero CLI command to get all registries.
     
@@ -832,61 +1455,33 @@ def get_registries() -> List['Registry']:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
-        try:
-            # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
-            
-            # Handle the case where registries are wrapped in an "items" array
-            if isinstance(raw_output, dict) and "items" in raw_output:
-                registries_data = raw_output["items"]
-            elif isinstance(raw_output, list):
-                registries_data = raw_output
-            else:
-                raise RuntimeError(f"Unexpected JSON structure from torero: {type(raw_output)}")
-            
-            # Create Registry objects
-            from torero_api.models.registry import Registry
-            registries = []
-            
-            for reg_data in registries_data:
-                # Map torero CLI fields to Registry model fields
-                registry_info = {
-                    "name": reg_data.get("name", "unknown"),
-                    "description": reg_data.get("description"),
-                    "type": reg_data.get("type", "unknown"),
-                    "url": reg_data.get("url", ""),
-                    "metadata": {
-                        "id": reg_data.get("id"),
-                        "created": reg_data.get("created"),
-                        "tags": reg_data.get("tags", []),
-                        "credentials": reg_data.get("credentials")
-                    }
+        from torero_api.models.registry import Registry
+        
+        def build(reg_data: dict) -> 'Registry':
+            # Map torero CLI fields to Registry model fields
+            registry_info = {
+                "name": reg_data.get("name", "unknown"),
+                "description": reg_data.get("description"),
+                "type": reg_data.get("type", "unknown"),
+                "url": reg_data.get("url", ""),
+                "metadata": {
+                    "id": reg_data.get("id"),
+                    "created": reg_data.get("created"),
+                    "tags": reg_data.get("tags") or [],
+                    "credentials": reg_data.get("credentials")
                 }
-                
-                registries.append(Registry(**registry_info))
-            
-            logger.debug(f"Retrieved {len(registries)} registries from torero")
-            return registries
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
-            raise RuntimeError(error_msg)
+            }
+            return Registry(**registry_info)
+        
+        # Stream the output and build Registry objects one item at a time;
+        # registries may be wrapped in an "items" array
+        registries = await _read_inventory_items("registries", command, ("items",), build)
+        logger.debug(f"Retrieved {len(registries)} registries from torero")
+        return registries
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero command timed out"
         logger.error(error_msg)
@@ -895,33 +1490,63 @@ def get_registries() -> List['Registry']:
         logger.exception(f"Unexpected error executing torero command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero command: {str(e)}")
 
-def get_registry_by_name(name: str) -> Optional['Registry']:
+def get_registries() -> List['Registry']:
+    """
+    Synchronous wrapper around :func:`get_registries_async`.
+    
+    Unlike the coroutine, returns a new list of Registry models rather than
+    the shared inventory snapshot.
+    
+    See :func:`get_registries_async` for exceptions.
+    
+    Returns:
+        List[Registry]: All registered torero registries
+    """
+    return as_models(list(_run_sync(get_registries_async())))
+
+async def get_registry_by_name_async(name: str) -> Optional[Any]:
     """
     Get a specific registry by name.
     
+    Uses the name index of the cached inventory snapshot, so the lookup does
+    not scan the inventory and only spawns torero when the snapshot is stale.
+    With the fast decoder the item is a compact record; convert it with
+    torero_api.core.fastdecode.as_model().
+    
     Args:
         name: The name of the registry to retrieve
         
     Returns:
-        Optional[Registry]: The registry if found, None otherwise
+        Optional[Any]: The registry's inventory entry if found, None otherwise
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
     """
-    registries = get_registries()
+    snapshot = await get_inventory_snapshot_async("registries")
+    return snapshot.get(name)
+
+def get_registry_by_name(name: str) -> Optional['Registry']:
+    """
+    Synchronous wrapper around :func:`get_registry_by_name_async`.
     
-    for registry in registries:
-        if registry.name == name:
-            return registry
+    Unlike the coroutine, returns the Registry model rather than its inventory entry.
     
-    return None
+    See :func:`get_registry_by_name_async` for arguments and exceptions.
+    
+    Returns:
+        Optional[Registry]: The registry if found, None otherwise
+    """
+    return as_model(_run_sync(get_registry_by_name_async(name)))
 
-def describe_decorator(name: str) -> Optional[dict]:
+@_cached_describe("decorators")
+@_coalesced_read("describe", "decorator")
+async def describe_decorator_async(name: str) -> Optional[dict]:
     """
     Get detailed description of a specific decorator by name.
     
     Makes a system call to 'torero describe decorator <name> --raw' to retrieve
-    detailed information about a specific decorator.
+    detailed information about a specific decorator. Results are cached while the
+    decorators inventory is unchanged; treat them as read-only.
     
     Args:
         name: The name of the decorator to describe
@@ -937,22 +1562,16 @@ def describe_decorator(name: str) -> Optional[dict]:
     
     try:
         # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if proc.returncode != 0:
-            error_msg = f"torero error: {proc.stderr.strip()}"
+        returncode, stdout, stderr = await _run_command(command, timeout=30)
+
+        if returncode != 0:
+            error_msg = f"torero error: {stderr.strip()}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
         try:
             # Parse the output as JSON
-            raw_output = json.loads(proc.stdout)
+            raw_output = json.loads(stdout)
             
             # The describe command returns detailed info, return the full response
             logger.debug(f"Retrieved detailed description for decorator: {name}")
@@ -961,9 +1580,12 @@ def describe_decorator(name: str) -> Optional[dict]:
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON from torero describe: {e}"
             logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
+            logger.debug(f"Raw output: {stdout[:1000]}...")
             raise RuntimeError(error_msg)
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "torero describe command timed out"
         logger.error(error_msg)
@@ -972,7 +1594,17 @@ def describe_decorator(name: str) -> Optional[dict]:
         logger.exception(f"Unexpected error executing torero describe command: {str(e)}")
         raise RuntimeError(f"Failed to execute torero describe command: {str(e)}")
 
-def run_opentofu_plan_destroy_service(name: str, **kwargs) -> dict:
+def describe_decorator(name: str) -> Optional[dict]:
+    """
+    Synchronous wrapper around :func:`describe_decorator_async`.
+    
+    See :func:`describe_decorator_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(describe_decorator_async(name))
+
+@_recorded("opentofu-plan/destroy")
+@_scheduled("opentofu-plan")
+async def run_opentofu_plan_destroy_service_async(name: str, **kwargs) -> dict:
     """
     Execute an OpenTofu plan destroy service using torero.
     
@@ -984,7 +1616,8 @@ def run_opentofu_plan_destroy_service(name: str, **kwargs) -> dict:
         **kwargs: Additional parameters to pass to the service
         
     Returns:
-        dict: Execution results including return code, stdout, stderr, and timing information
+        dict: Execution results including return code, stdout, stderr, and timing information;
+        long output is cut to its head and tail, with a URL for the full output
         
     Raises:
         RuntimeError: If the torero command fails or returns invalid JSON.
@@ -999,35 +1632,354 @@ def run_opentofu_plan_destroy_service(name: str, **kwargs) -> dict:
     logger.debug(f"Executing command: {' '.join(command)}")
     
     try:
-        # Run the torero command
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=600
-        )
-
-        try:
-            # Parse the output as JSON
-            result = json.loads(proc.stdout)
-            logger.debug(f"Successfully destroyed OpenTofu plan service: {name}")
-            return result
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON from torero run service: {e}"
-            logger.error(error_msg)
-            logger.debug(f"Raw output: {proc.stdout[:1000]}...")
-            
-            # If we can't parse JSON but have a non-zero return code, it's likely an error
-            if proc.returncode != 0:
-                error_msg = f"Service execution failed with code {proc.returncode}: {proc.stderr.strip()}"
-            
-            raise RuntimeError(error_msg)
+        # Run the torero command, spooling the service's output
+        result = await _execute_service(command, timeout=600)
+        logger.debug(f"Successfully destroyed OpenTofu plan service: {name}")
+        return result
             
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
     except subprocess.TimeoutExpired:
         error_msg = "Service execution timed out after 10 minutes"
         logger.error(error_msg)
         raise RuntimeError(error_msg)
     except Exception as e:
         logger.exception(f"Unexpected error executing service: {str(e)}")
-        raise RuntimeError(f"Failed to execute service: {str(e)}")
\ No newline at end of file
+        raise RuntimeError(f"Failed to execute service: {str(e)}")
+
+def run_opentofu_plan_destroy_service(name: str, **kwargs) -> dict:
+    """
+    Synchronous wrapper around :func:`run_opentofu_plan_destroy_service_async`.
+    
+    See :func:`run_opentofu_plan_destroy_service_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(run_opentofu_plan_destroy_service_async(name, **kwargs))
+
+# Maximum seconds a service execution may take, per service type
+EXECUTION_TIMEOUTS = {
+    "ansible-playbook": 300,
+    "python-script": 300,
+    "opentofu-plan": 600,
+}
+
+async def stream_service_execution(service_type: str, name: str, operation: Optional[str] = None,
+                                   **kwargs) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Execute a service and yield its output while it runs.
+    
+    Runs 'torero run service <type> [<operation>] <name>' without --raw, so
+    torero passes the service's output through as it is produced instead of
+    collecting it into one JSON document at the end. Lines are yielded as
+    they arrive and are not kept, so the output is never held in memory as
+    a whole.
+    
+    This is an async generator yielding (event, data) tuples:
+    
+    - ("start", dict) once torero has been started, with service, operation
+      and start_time
+    - ("stdout", str) and ("stderr", str) for every output line
+    - ("end", dict) last, with return_code, start_time, end_time and
+      elapsed_time like the result of the run_*_service functions
+    
+    Args:
+        service_type: The service type: "ansible-playbook", "python-script" or "opentofu-plan"
+        name: The name of the service to run
+        operation: "apply" or "destroy" for OpenTofu plans, otherwise None
+        **kwargs: Additional parameters to pass to the service
+        
+    Yields:
+        Tuple[str, Any]: The events described above
+        
+    Raises:
+        ValueError: If the service type cannot be executed.
+        ToreroBusyError: If no process slot became available in time.
+        RuntimeError: If torero cannot be run or the execution times out.
+    """
+    timeout = EXECUTION_TIMEOUTS.get(service_type)
+    if timeout is None:
+        raise ValueError(f"Cannot execute service type: {service_type}")
+    
+    command = [TORERO_COMMAND, "run", "service", service_type]
+    if operation:
+        command.append(operation)
+    command.append(name)
+    
+    # Add any additional parameters as command arguments
+    for key, value in kwargs.items():
+        if value is not None:
+            command.append(f"--{key}={value}")
+    
+    logger.debug(f"Streaming command: {' '.join(command)}")
+    
+    label = f"{service_type}/{operation}" if operation else service_type
+    started = None
+    try:
+        async with execution_scheduler.slot(service_type, name, timeout=_admission_timeout()):
+            async with _output_command(command, timeout=timeout, command_class=EXECUTE) as output:
+                started = datetime.now()
+                yield "start", {
+                    "service": name,
+                    "operation": label,
+                    "start_time": started.isoformat()
+                }
+                
+                async for line in output:
+                    yield line.channel, line.text
+                
+                finished = datetime.now()
+                result = {
+                    "return_code": output.return_code,
+                    "start_time": started.isoformat(),
+                    "end_time": finished.isoformat(),
+                    "elapsed_time": (finished - started).total_seconds()
+                }
+        await execution_history.record_async(name, label, result=result)
+        yield "end", result
+    except ToreroBusyError:
+        # Re-raise busy errors unchanged
+        raise
+    except subprocess.TimeoutExpired:
+        error_msg = f"Service execution timed out after {timeout // 60} minutes"
+        logger.error(error_msg)
+        await execution_history.record_async(name, label, error=error_msg)
+        raise RuntimeError(error_msg)
+    except OSError as e:
+        error_msg = f"Failed to execute service: {str(e)}"
+        logger.error(error_msg)
+        await execution_history.record_async(name, label, error=error_msg)
+        raise RuntimeError(error_msg)
+    except (asyncio.CancelledError, GeneratorExit):
+        # The client went away and the service was stopped; an exiting
+        # generator cannot await, so this record is written in the background
+        if started is not None:
+            execution_history.record_in_background(name, label, error="Execution stopped: the client disconnected")
+        raise
+
+# Fetchers used to (re)build each inventory snapshot; resolved at call time
+_INVENTORY_FETCHERS = {
+    "services": lambda: _fetch_services_async(),
+    "decorators": lambda: _fetch_decorators_async(),
+    "repositories": lambda: _fetch_repositories_async(),
+    "secrets": lambda: _fetch_secrets_async(),
+    "registries": lambda: _fetch_registries_async(),
+}
+# Describe coroutines and item labels per resource kind; resolved at call time
+_DESCRIBERS = {
+    "services": ("Service", lambda name: describe_service_async(name)),
+    "decorators": ("Decorator", lambda name: describe_decorator_async(name)),
+    "repositories": ("Repository", lambda name: describe_repository_async(name)),
+    "secrets": ("Secret", lambda name: describe_secret_async(name)),
+}
+
+def describe_concurrency() -> int:
+    """
+    Get the number of describe commands a bulk describe may run at once.
+    
+    Read from TORERO_API_DESCRIBE_CONCURRENCY, defaulting to
+    DEFAULT_DESCRIBE_CONCURRENCY. The process limiter still bounds the
+    total number of torero processes across all requests.
+    
+    Returns:
+        int: The parallelism limit (always positive)
+    """
+    return read_number("TORERO_API_DESCRIBE_CONCURRENCY", DEFAULT_DESCRIBE_CONCURRENCY, cast=int)
+
+async def describe_many_async(kind: str, names: Sequence[str], concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Describe several items of one kind concurrently.
+    
+    Names are checked against the cached inventory snapshot first; the
+    describe commands for the existing ones then run concurrently, at most
+    ``concurrency`` at a time, so N items take roughly N/concurrency times the
+    latency of one describe instead of N times. Failures are reported per item
+    and do not affect the other items.
+    
+    Args:
+        kind: The resource kind: "services", "decorators", "repositories" or "secrets"
+        names: Names of the items to describe; duplicates are described once
+        concurrency: Maximum describe commands in flight, or None for describe_concurrency()
+        
+    Returns:
+        Dict[str, Any]: Per name, in request order, the describe result or the
+        exception that prevented it: LookupError if the item does not exist or
+        has no description, ToreroBusyError or RuntimeError if torero failed
+        
+    Raises:
+        ValueError: If the kind cannot be described.
+        RuntimeError: If the inventory of the kind cannot be loaded.
+    """
+    if kind not in _DESCRIBERS:
+        raise ValueError(f"Cannot describe resource kind: {kind}")
+    label, describe = _DESCRIBERS[kind]
+    
+    snapshot = await get_inventory_snapshot_async(kind)
+    limit = concurrency or describe_concurrency()
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def describe_one(name: str) -> Any:
+        if snapshot.get(name) is None:
+            return LookupError(f"{label} '{name}' not found")
+        async with semaphore:
+            try:
+                description = await describe(name)
+            except Exception as e:
+                return e
+        if description is None:
+            return LookupError(f"Could not retrieve detailed description for {label.lower()} '{name}'")
+        return description
+    
+    unique_names = list(dict.fromkeys(names))
+    logger.debug(f"Describing {len(unique_names)} {kind}, {limit} at a time")
+    outcomes = await asyncio.gather(*(describe_one(name) for name in unique_names))
+    return dict(zip(unique_names, outcomes))
+
+def describe_many(kind: str, names: Sequence[str], concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around :func:`describe_many_async`.
+    
+    See :func:`describe_many_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(describe_many_async(kind, names, concurrency))
+
+# Execution coroutines per operation; resolved at call time
+_EXECUTORS = {
+    "ansible-playbook": lambda name, **params: run_ansible_playbook_service_async(name, **params),
+    "python-script": lambda name, **params: run_python_script_service_async(name, **params),
+    "opentofu-plan/apply": lambda name, **params: run_opentofu_plan_apply_service_async(name, **params),
+    "opentofu-plan/destroy": lambda name, **params: run_opentofu_plan_destroy_service_async(name, **params),
+}
+
+def batch_concurrency() -> int:
+    """
+    Get the number of executions a batch may run at once.
+    
+    Read from TORERO_API_BATCH_CONCURRENCY, defaulting to
+    DEFAULT_BATCH_CONCURRENCY. The execution scheduler and the process
+    limiter still bound the executions across all requests.
+    
+    Returns:
+        int: The parallelism limit (always positive)
+    """
+    return read_number("TORERO_API_BATCH_CONCURRENCY", DEFAULT_BATCH_CONCURRENCY, cast=int)
+
+async def run_service_async(operation: str, name: str, params: Optional[Dict[str, Any]] = None) -> dict:
+    """
+    Execute a service by operation.
+    
+    Args:
+        operation: What to run: "ansible-playbook", "python-script",
+            "opentofu-plan/apply" or "opentofu-plan/destroy"
+        name: The name of the service
+        params: Additional parameters to pass to the service as --key=value
+            arguments, or None for none
+        
+    Returns:
+        dict: Execution results, as returned by the operation's run function
+        
+    Raises:
+        ValueError: If the operation is unknown.
+        ToreroBusyError: If the execution could not get capacity in time.
+        RuntimeError: If the torero command fails or returns invalid JSON.
+    """
+    if operation not in _EXECUTORS:
+        raise ValueError(f"Unknown operation: {operation}")
+    return await _EXECUTORS[operation](name, **(params or {}))
+
+def run_service(operation: str, name: str, params: Optional[Dict[str, Any]] = None) -> dict:
+    """
+    Synchronous wrapper around :func:`run_service_async`.
+    
+    See :func:`run_service_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(run_service_async(operation, name, params))
+
+async def plan_executions_async(items: Sequence[Tuple[str, Optional[str]]]) -> List[Any]:
+    """
+    Check a batch of executions against one services snapshot.
+    
+    Every item is looked up in the same snapshot, so a batch is validated
+    against one consistent inventory with a single torero call at most,
+    however many items it has.
+    
+    Args:
+        items: Per execution, the service name and "apply" or "destroy" for
+            OpenTofu plans (None for other service types)
+        
+    Returns:
+        List[Any]: Per item, in request order, the operation to run (e.g.
+        "python-script" or "opentofu-plan/apply") or the exception that rules
+        the item out: LookupError if the service does not exist, ValueError if
+        the operation does not fit the service type
+        
+    Raises:
+        RuntimeError: If the services inventory cannot be loaded.
+    """
+    snapshot = await get_inventory_snapshot_async("services")
+    plans: List[Any] = []
+    for name, operation in items:
+        service = snapshot.get(name)
+        if service is None:
+            plans.append(LookupError(f"Service '{name}' not found"))
+            continue
+        if service.type == "opentofu-plan":
+            if operation not in ("apply", "destroy"):
+                plans.append(ValueError(f"Service '{name}' is an OpenTofu plan; operation must be 'apply' or 'destroy'"))
+                continue
+            plans.append(f"{service.type}/{operation}")
+            continue
+        if operation is not None:
+            plans.append(ValueError(f"Operation '{operation}' does not apply to service '{name}' (type: {service.type})"))
+            continue
+        if service.type not in _EXECUTORS:
+            plans.append(ValueError(f"Service '{name}' cannot be executed (type: {service.type})"))
+            continue
+        plans.append(service.type)
+    return plans
+
+def plan_executions(items: Sequence[Tuple[str, Optional[str]]]) -> List[Any]:
+    """
+    Synchronous wrapper around :func:`plan_executions_async`.
+    
+    See :func:`plan_executions_async` for arguments, return value and exceptions.
+    """
+    return _run_sync(plan_executions_async(items))
+
+async def run_many_async(
+    runs: Sequence[Tuple[Any, Callable[[], Awaitable[T]]]],
+    concurrency: Optional[int] = None
+) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Run coroutine functions concurrently and yield their outcomes as they complete.
+    
+    At most ``concurrency`` runs are in flight at a time; the others wait
+    their turn in order. A failure is yielded as the run's outcome and does
+    not affect the other runs. Runs still pending when the iteration is
+    abandoned (e.g. the client of a streamed batch went away) are cancelled.
+    
+    Args:
+        runs: Pairs of a key identifying the run and the coroutine function to call
+        concurrency: Maximum runs in flight, or None for batch_concurrency()
+        
+    Yields:
+        Tuple[Any, Any]: The run's key and its result, or the exception it raised
+    """
+    limit = concurrency or batch_concurrency()
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run_one(key: Any, run: Callable[[], Awaitable[T]]) -> Tuple[Any, Any]:
+        async with semaphore:
+            try:
+                return key, await run()
+            except Exception as e:
+                return key, e
+    
+    logger.debug(f"Running {len(runs)} executions, {limit} at a time")
+    tasks = [asyncio.ensure_future(run_one(key, run)) for key, run in runs]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,186 @@
+"""
+Startup warm-up for the torero API
+
+Right after a restart the inventory cache is empty, so the first wave of
+requests would all wait for torero at once. The warm-up runs as a background
+task started by the application lifespan and, concurrently:
+
+- checks that torero is available (see core.health)
+- loads every inventory kind into the cache
+- optionally describes a configured list of frequently used services, so
+  their results are in the describe cache as well
+
+Until the warm-up has finished, the /ready endpoint answers 503 so load
+balancers do not route traffic to a cold node. /health is not gated: it
+reports whether the process and torero are up, not whether the caches are.
+
+Failures do not keep the node out of rotation forever: once every step has
+been attempted (or the warm-up timeout has passed) the node is ready, and
+the errors are reported by status(). Requests for a kind that failed to load
+simply load it on demand.
+
+Settings are read from the environment:
+
+- TORERO_API_WARMUP: set to 0 to skip the warm-up and be ready immediately
+- TORERO_API_WARMUP_SERVICES: comma-separated names of services to describe
+- TORERO_API_WARMUP_TIMEOUT: maximum seconds the warm-up may take (default 60)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from torero_api.core.cache import RESOURCE_KINDS
+from torero_api.core.health import health_probe
+from torero_api.core.settings import read_number
+from torero_api.core.torero_executor import describe_many_async, get_inventory_snapshot_async
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default maximum duration of the warm-up in seconds
+DEFAULT_WARMUP_TIMEOUT = 60.0
+
+def warmup_enabled() -> bool:
+    """
+    Check whether the startup warm-up is enabled.
+
+    Returns:
+        bool: False if TORERO_API_WARMUP is set to 0, false, no or off
+    """
+    return os.environ.get("TORERO_API_WARMUP", "1").strip().lower() not in ("0", "false", "no", "off")
+
+def warmup_services() -> List[str]:
+    """
+    Get the services to describe during the warm-up.
+
+    Returns:
+        List[str]: Service names from TORERO_API_WARMUP_SERVICES
+    """
+    value = os.environ.get("TORERO_API_WARMUP_SERVICES", "")
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+def warmup_timeout() -> float:
+    """
+    Get the maximum duration of the warm-up.
+
+    Returns:
+        float: Seconds from TORERO_API_WARMUP_TIMEOUT, or DEFAULT_WARMUP_TIMEOUT
+    """
+    return read_number("TORERO_API_WARMUP_TIMEOUT", DEFAULT_WARMUP_TIMEOUT)
+
+class Warmup:
+    """
+    Background task that preloads the caches before the node reports ready.
+    """
+
+    def __init__(
+        self,
+        kinds: Iterable[str] = RESOURCE_KINDS,
+        describe_services: Iterable[str] = (),
+        timeout: float = DEFAULT_WARMUP_TIMEOUT
+    ):
+        """
+        Initialize the warm-up.
+
+        Args:
+            kinds: The inventory kinds to load
+            describe_services: Names of services to describe once the services inventory is loaded
+            timeout: Maximum seconds the warm-up may take
+        """
+        self._kinds = tuple(kinds)
+        self._describe_services = list(describe_services)
+        self._timeout = timeout
+        self._errors: Dict[str, str] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls) -> "Warmup":
+        """
+        Create a warm-up configured from TORERO_API_WARMUP_* environment variables.
+
+        Returns:
+            Warmup: A new warm-up
+        """
+        return cls(describe_services=warmup_services(), timeout=warmup_timeout())
+
+    @property
+    def ready(self) -> bool:
+        """Whether the warm-up has finished."""
+        return self._finished_at is not None
+
+    def start(self) -> None:
+        """Start the warm-up task on the running event loop."""
+        if self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel the warm-up task if it is still running."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self) -> None:
+        """Run the warm-up to completion or until the timeout, then mark the node ready."""
+        self._started_at = time.monotonic()
+        logger.info(f"Warming up: {', '.join(self._kinds)}")
+        try:
+            await asyncio.wait_for(self._warm_up(), self._timeout)
+        except asyncio.TimeoutError:
+            self._errors["warmup"] = f"Warm-up did not finish within {self._timeout:g} seconds"
+        except Exception as e:
+            self._errors["warmup"] = str(e)
+        finally:
+            self._finished_at = time.monotonic()
+
+        elapsed = self._finished_at - self._started_at
+        if self._errors:
+            logger.warning(f"Warm-up finished in {elapsed:.1f}s with errors: {self._errors}")
+        else:
+            logger.info(f"Warm-up finished in {elapsed:.1f}s")
+
+    async def _warm_up(self) -> None:
+        """Check torero and load the inventories concurrently, then describe the configured services."""
+
+        async def check() -> None:
+            # Also gives /health its first result
+            result = await health_probe.check()
+            if not result["available"]:
+                self._errors["torero"] = result["message"]
+
+        async def load(kind: str) -> None:
+            try:
+                await get_inventory_snapshot_async(kind)
+            except Exception as e:
+                self._errors[kind] = str(e)
+
+        await asyncio.gather(check(), *(load(kind) for kind in self._kinds))
+
+        if self._describe_services and "services" not in self._errors:
+            outcomes = await describe_many_async("services", self._describe_services)
+            for name, outcome in outcomes.items():
+                if isinstance(outcome, Exception):
+                    self._errors[f"services/{name}"] = str(outcome)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the progress of the warm-up.
+
+        Returns:
+            dict: Whether the node is ready, seconds spent warming up (None before
+            the start), and the errors of the steps that failed
+        """
+        elapsed = None
+        if self._started_at is not None:
+            elapsed = (self._finished_at or time.monotonic()) - self._started_at
+        return {"ready": self.ready, "elapsed": elapsed, "errors": dict(self._errors)}
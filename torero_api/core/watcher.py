@@ -0,0 +1,484 @@
+"""
+Change watcher for torero's on-disk state
+
+torero keeps its services, decorators, repositories, secrets and registries
+under its data directory (~/.torero.d by default). Instead of re-reading
+inventories on a timer, the API can watch that directory and invalidate a
+cached inventory as soon as the files behind it change. While a watcher is
+running the inventory cache is switched to watched mode, so unchanged
+inventories are served from memory indefinitely.
+
+Two implementations are available:
+
+- InotifyWatcher: Linux inotify through ctypes, reporting changes within milliseconds
+- PollingWatcher: periodic scan of file modification times, used everywhere else
+
+A changed path is mapped to the resource kinds whose name appears in it
+(e.g. ".../services/hello.yaml" only invalidates services). Changes that
+cannot be attributed to a kind, such as a shared database file, invalidate
+every kind. Lock, log and temporary files are ignored.
+
+The watcher is optional and configured from the environment:
+
+- TORERO_API_WATCH: set to 1 to enable the watcher (default off)
+- TORERO_API_WATCH_DIR: directory to watch (default ~/.torero.d)
+- TORERO_API_WATCH_POLL_INTERVAL: seconds between scans of the polling watcher (default 1)
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from torero_api.core.cache import RESOURCE_KINDS, invalidate_inventory, inventory_cache
+from torero_api.core.settings import read_number
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Default torero data directory
+DEFAULT_WATCH_DIR = os.path.join("~", ".torero.d")
+
+# Default seconds between scans of the polling watcher
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Changes arriving within this many seconds are reported together
+DEBOUNCE = 0.05
+
+# Files that never hold inventory data (locks, logs, editor and temporary files)
+_IGNORED_SUFFIXES = (".lock", ".log", ".tmp", ".swp", "~")
+
+# Name fragments identifying each resource kind in a path
+_KIND_MARKERS = {
+    "services": ("service",),
+    "decorators": ("decorator",),
+    "repositories": ("repositor",),
+    "secrets": ("secret",),
+    "registries": ("registr",),
+}
+
+def kinds_for_path(path: str, root: str) -> Set[str]:
+    """
+    Map a changed path to the resource kinds it may affect.
+
+    Args:
+        path: The changed file or directory
+        root: The watched directory
+
+    Returns:
+        Set[str]: The affected kinds; every kind if the path matches none of them,
+        and no kind for lock, log and temporary files
+    """
+    relative = os.path.relpath(path, root).lower()
+    if relative.endswith(_IGNORED_SUFFIXES):
+        return set()
+    kinds = {
+        kind for kind, markers in _KIND_MARKERS.items()
+        if any(marker in relative for marker in markers)
+    }
+    return kinds or set(RESOURCE_KINDS)
+
+def invalidate_changed(paths: Iterable[str], root: str) -> Set[str]:
+    """
+    Invalidate the cached inventories affected by changed paths.
+
+    Args:
+        paths: The changed files or directories
+        root: The watched directory
+
+    Returns:
+        Set[str]: The kinds that were invalidated
+    """
+    kinds: Set[str] = set()
+    for path in paths:
+        kinds |= kinds_for_path(path, root)
+
+    for kind in sorted(kinds):
+        invalidate_inventory(kind)
+    if kinds:
+        logger.info(f"torero state changed, invalidated: {', '.join(sorted(kinds))}")
+    return kinds
+
+class Watcher:
+    """
+    Base class for directory watchers.
+
+    Subclasses detect changes below root and pass the changed paths to
+    _changed(); the watcher batches them for DEBOUNCE seconds and then calls
+    on_change with the whole batch.
+    """
+
+    # Name used for logging
+    name = "base"
+
+    def __init__(self, root: str, on_change: Callable[[Set[str]], None]):
+        """
+        Initialize the watcher.
+
+        Args:
+            root: The directory to watch
+            on_change: Called with the set of changed paths
+        """
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self._on_change = on_change
+        self._pending: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """
+        Start watching on the running event loop.
+
+        Raises:
+            OSError: If the directory cannot be watched.
+        """
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self) -> None:
+        """Stop watching and report changes that are still pending."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush()
+
+    def _changed(self, paths: Iterable[str]) -> None:
+        """Queue changed paths for the next batch."""
+        self._pending.update(paths)
+        if self._flush_handle is None and self._pending:
+            self._flush_handle = self._loop.call_later(DEBOUNCE, self._flush)
+
+    def _flush(self) -> None:
+        """Report the queued batch of changes."""
+        self._flush_handle = None
+        paths, self._pending = self._pending, set()
+        if paths:
+            try:
+                self._on_change(paths)
+            except Exception as e:
+                logger.error(f"Error handling torero state change: {str(e)}")
+
+class PollingWatcher(Watcher):
+    """
+    Watcher that scans the directory tree for modification time and size changes.
+    """
+
+    name = "polling"
+
+    def __init__(self, root: str, on_change: Callable[[Set[str]], None], interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialize the watcher.
+
+        Args:
+            root: The directory to watch
+            on_change: Called with the set of changed paths
+            interval: Seconds between scans
+        """
+        super().__init__(root, on_change)
+        self.interval = interval
+        self._state: Dict[str, Tuple[int, int]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Record the modification time and size of every file below root.
+
+        Returns:
+            dict: Mapping of path to (mtime in nanoseconds, size)
+        """
+        state = {}
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def _compare(self, state: Dict[str, Tuple[int, int]]) -> Set[str]:
+        """Replace the recorded state and report the paths that differ from it."""
+        previous, self._state = self._state, state
+        changed = {path for path in state.keys() | previous.keys() if state.get(path) != previous.get(path)}
+        if changed:
+            self._changed(changed)
+        return changed
+
+    def poll(self) -> Set[str]:
+        """
+        Scan once and report the paths that changed since the previous scan.
+
+        Returns:
+            Set[str]: Added, removed or modified paths
+        """
+        return self._compare(self.scan())
+
+    def start(self) -> None:
+        """Take the initial scan and start polling."""
+        if not os.path.isdir(self.root):
+            raise OSError(errno.ENOENT, "Watch directory does not exist", self.root)
+        super().start()
+        self._state = self.scan()
+        self._task = self._loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Polling loop."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                # Walking a large tree must not stall request handling
+                state = await self._loop.run_in_executor(None, self.scan)
+            except Exception as e:
+                logger.error(f"Error scanning {self.root}: {str(e)}")
+                continue
+            self._compare(state)
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await super().stop()
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc if it provides inotify, otherwise return None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+class InotifyWatcher(Watcher):
+    """
+    Watcher based on Linux inotify.
+
+    Every directory below root gets its own watch; directories created later
+    are added as they appear. Events are read on the event loop through
+    add_reader(), so no thread is needed.
+    """
+
+    name = "inotify"
+
+    def __init__(self, root: str, on_change: Callable[[Set[str]], None]):
+        """
+        Initialize the watcher.
+
+        Args:
+            root: The directory to watch
+            on_change: Called with the set of changed paths
+
+        Raises:
+            OSError: If inotify is not available on this system.
+        """
+        super().__init__(root, on_change)
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, str] = {}
+
+    @staticmethod
+    def available() -> bool:
+        """Check whether inotify can be used on this system."""
+        return _load_libc() is not None
+
+    def _add_watch(self, directory: str) -> None:
+        """Watch a directory and, recursively, its subdirectories."""
+        for current, subdirectories, _ in os.walk(directory):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(current), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if current == self.root:
+                    raise OSError(error, os.strerror(error), current)
+                logger.warning(f"Cannot watch {current}: {os.strerror(error)}")
+                continue
+            self._watches[wd] = current
+
+    def start(self) -> None:
+        """Create the inotify instance, watch the tree and register the reader."""
+        if not os.path.isdir(self.root):
+            raise OSError(errno.ENOENT, "Watch directory does not exist", self.root)
+        super().start()
+
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._fd = fd
+
+        try:
+            self._add_watch(self.root)
+        except OSError:
+            os.close(fd)
+            self._fd = None
+            raise
+        self._loop.add_reader(fd, self._read_events)
+
+    def _read_events(self) -> None:
+        """Read and dispatch the pending inotify events."""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.error(f"Error reading inotify events: {str(e)}")
+            return
+
+        changed: Set[str] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost, so every kind may have changed
+                changed.add(self.root)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            changed.add(path)
+
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_watch(path)
+
+        if changed:
+            self._changed(changed)
+
+    async def stop(self) -> None:
+        """Remove the reader and close the inotify instance."""
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+        await super().stop()
+
+def watch_enabled() -> bool:
+    """
+    Check whether the watcher is enabled.
+
+    Returns:
+        bool: True if TORERO_API_WATCH is set to 1, true, yes or on
+    """
+    return os.environ.get("TORERO_API_WATCH", "").strip().lower() in ("1", "true", "yes", "on")
+
+def create_watcher(
+    root: Optional[str] = None,
+    on_change: Optional[Callable[[Set[str]], None]] = None,
+    poll_interval: Optional[float] = None
+) -> Watcher:
+    """
+    Create the best available watcher for torero's data directory.
+
+    Args:
+        root: Directory to watch; defaults to TORERO_API_WATCH_DIR or ~/.torero.d
+        on_change: Called with changed paths; defaults to invalidating the affected inventories
+        poll_interval: Seconds between scans if polling is used; defaults to
+            TORERO_API_WATCH_POLL_INTERVAL or 1
+
+    Returns:
+        Watcher: An inotify watcher on Linux, a polling watcher elsewhere
+    """
+    root = root or os.environ.get("TORERO_API_WATCH_DIR") or DEFAULT_WATCH_DIR
+    root = os.path.abspath(os.path.expanduser(root))
+    if on_change is None:
+        on_change = lambda paths: invalidate_changed(paths, root)
+
+    if InotifyWatcher.available():
+        return InotifyWatcher(root, on_change)
+    return _polling_watcher(root, on_change, poll_interval)
+
+def _polling_watcher(root: str, on_change: Callable[[Set[str]], None], poll_interval: Optional[float]) -> PollingWatcher:
+    """Create a polling watcher, reading the interval from the environment if not given."""
+    if poll_interval is None:
+        poll_interval = read_number("TORERO_API_WATCH_POLL_INTERVAL", DEFAULT_POLL_INTERVAL)
+    return PollingWatcher(root, on_change, interval=max(0.1, poll_interval))
+
+def start_watcher(root: Optional[str] = None) -> Optional[Watcher]:
+    """
+    Start watching torero's data directory and switch the inventory cache to watched mode.
+
+    Falls back to polling if inotify cannot watch the directory (for example
+    when the inotify watch limit is reached). Must be called from a running
+    event loop.
+
+    Args:
+        root: Directory to watch; defaults to TORERO_API_WATCH_DIR or ~/.torero.d
+
+    Returns:
+        Optional[Watcher]: The running watcher, or None if the directory cannot be watched
+    """
+    watcher = create_watcher(root)
+    try:
+        watcher.start()
+    except OSError as e:
+        if not isinstance(watcher, InotifyWatcher):
+            logger.warning(f"Cannot watch {watcher.root}, inventories will expire by TTL: {str(e)}")
+            return None
+        logger.warning(f"inotify failed for {watcher.root}, falling back to polling: {str(e)}")
+        watcher = _polling_watcher(watcher.root, watcher._on_change, None)
+        try:
+            watcher.start()
+        except OSError as e:
+            logger.warning(f"Cannot watch {watcher.root}, inventories will expire by TTL: {str(e)}")
+            return None
+
+    # Entries cached before the watch started may already be outdated
+    invalidate_inventory()
+    inventory_cache.set_watched(True)
+    logger.info(f"Watching {watcher.root} for torero changes ({watcher.name})")
+    return watcher
+
+async def stop_watcher(watcher: Optional[Watcher]) -> None:
+    """
+    Stop a watcher started with start_watcher() and let cached inventories expire by TTL again.
+
+    Args:
+        watcher: The watcher, or None
+    """
+    if watcher is None:
+        return
+    inventory_cache.set_watched(False)
+    await watcher.stop()
@@ -14,8 +14,13 @@ Models:
 - Repository: Represents a torero repository with its metadata
 - Secret: Represents a torero secret with its metadata
 - ErrorResponse: Standard error response format
+- FacetCount: Number of items sharing a type or tag value
+- BulkDescribeRequest, DescribeResult: Request and per-item result of bulk describes
 - APIInfo: Information about the API and available endpoints
 - ServiceExecutionResult: Result of a service execution
+- ExecutionJob: State of a service execution running as a background job
+- ExecutionRecord, ExecutionHistoryPage: Recorded past executions and a page of them
+- BatchExecutionItem, BatchExecutionRequest, BatchExecutionResult: Request and per-item result of batch executions
 """
 
 # Re-export models for easier imports
@@ -23,5 +28,8 @@ from torero_api.models.service import Service, ServiceType
 from torero_api.models.decorator import Decorator
 from torero_api.models.repository import Repository
 from torero_api.models.secret import Secret
-from torero_api.models.common import ErrorResponse, APIInfo
-from torero_api.models.execution import ServiceExecutionResult
\ No newline at end of file
+from torero_api.models.common import ErrorResponse, APIInfo, FacetCount, BulkDescribeRequest, DescribeResult
+from torero_api.models.execution import (
+    ServiceExecutionResult, ExecutionOutput, ExecutionJob, ExecutionRecord, ExecutionHistoryPage,
+    BatchExecutionItem, BatchExecutionRequest, BatchExecutionResult
+)
\ No newline at end of file
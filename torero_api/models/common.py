@@ -4,7 +4,7 @@ Common models for torero API
 This module defines common models used throughout the API.
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 class ErrorResponse(BaseModel):
@@ -34,6 +34,69 @@ class ErrorResponse(BaseModel):
         }
     }
 
+class FacetCount(BaseModel):
+    """
+    Number of inventory items sharing one facet value, such as a type or tag.
+    
+    Attributes:
+        value: The facet value
+        count: Number of items with the value
+    """
+    value: str = Field(..., description="Facet value, e.g. a type or tag")
+    count: int = Field(..., description="Number of items with this value")
+    
+    # Updated Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "value": "ansible-playbook",
+                "count": 42
+            }
+        }
+    }
+
+class BulkDescribeRequest(BaseModel):
+    """
+    Request body of the bulk describe endpoints.
+    
+    Attributes:
+        names: Names of the items to describe
+    """
+    names: List[str] = Field(..., min_length=1, max_length=1000, description="Names of the items to describe")
+    
+    # Updated Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "names": ["hello-ansible", "network-backup"]
+            }
+        }
+    }
+
+class DescribeResult(BaseModel):
+    """
+    Outcome of describing one item in a bulk describe request.
+    
+    Attributes:
+        status_code: HTTP status the single-item describe endpoint would have returned
+        description: Detailed description if it could be retrieved
+        error: Error message if it could not
+    """
+    status_code: int = Field(..., description="HTTP status code for this item")
+    description: Optional[Any] = Field(None, description="Detailed description from torero describe")
+    error: Optional[str] = Field(None, description="Error message if the item could not be described")
+    
+    # Updated Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "status_code": 404,
+                "description": None,
+                "error": "Service 'missing-service' not found"
+            }
+        }
+    }
+
 class APIInfo(BaseModel):
     """
     Information about the API for the root endpoint response.
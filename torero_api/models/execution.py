@@ -4,9 +4,19 @@ Execution models for torero API
 This module defines models related to service execution results.
 """
 
-from typing import Optional
+import re
+from typing import Dict, List, Literal, Optional, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Parameter names accepted by batch executions; they become --name=value arguments
+PARAM_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9-]*$")
+
+# Flags of torero itself, and the arguments of the run functions, that parameters may not set
+RESERVED_PARAM_NAMES = frozenset({
+    "config", "debug", "help", "name", "operation", "output", "raw",
+    "set", "set-secret", "state", "use", "version",
+})
 
 class ServiceExecutionResult(BaseModel):
     """
@@ -21,13 +31,24 @@ class ServiceExecutionResult(BaseModel):
         start_time: ISO 8601 timestamp when execution started
         end_time: ISO 8601 timestamp when execution completed
         elapsed_time: Execution duration in seconds
+        stdout_size: Size of the complete standard output in bytes
+        stderr_size: Size of the complete standard error output in bytes
+        truncated: Whether stdout or stderr only holds the head and tail of the output
+        output_url: URL of the complete output, if it was truncated
     """
     return_code: int = Field(..., description="Exit code from the execution")
-    stdout: str = Field(..., description="Standard output from the execution")
-    stderr: str = Field(..., description="Standard error output from the execution") 
+    stdout: str = Field(..., description="Standard output from the execution; head and tail only if truncated")
+    stderr: str = Field(..., description="Standard error output from the execution; head and tail only if truncated") 
     start_time: str = Field(..., description="ISO 8601 timestamp when execution started")
     end_time: str = Field(..., description="ISO 8601 timestamp when execution completed")
     elapsed_time: float = Field(..., description="Execution duration in seconds")
+    stdout_size: Optional[int] = Field(None, description="Size of the complete standard output in bytes")
+    stderr_size: Optional[int] = Field(None, description="Size of the complete standard error output in bytes")
+    truncated: bool = Field(False, description="Whether stdout or stderr only holds the head and tail of the output")
+    output_url: Optional[str] = Field(
+        None,
+        description="URL of the complete output if it was truncated; it lists the stdout and stderr download URLs"
+    )
     
     # Pydantic v2 configuration
     model_config = {
@@ -38,7 +59,255 @@ class ServiceExecutionResult(BaseModel):
                 "stderr": "[WARNING]: No inventory was parsed, only implicit localhost is available\n[WARNING]: provided hosts list is empty, only localhost is available. Note that\nthe implicit localhost does not match 'all'\n",
                 "start_time": "2025-05-26T22:18:41.905955Z",
                 "end_time": "2025-05-26T22:18:45.034007Z",
-                "elapsed_time": 3.1280594
+                "elapsed_time": 3.1280594,
+                "stdout_size": 602,
+                "stderr_size": 196,
+                "truncated": False,
+                "output_url": None
+            }
+        }
+    }
+class ExecutionOutput(BaseModel):
+    """
+    A kept execution output, with the URLs its streams are downloaded from.
+    
+    Attributes:
+        id: Output identifier
+        stdout_size: Size of the complete standard output in bytes
+        stderr_size: Size of the complete standard error output in bytes
+        stdout_url: URL of the complete standard output (supports Range requests)
+        stderr_url: URL of the complete standard error output (supports Range requests)
+        expires_in: Seconds until the output is no longer kept
+    """
+    id: str = Field(..., description="Output identifier")
+    stdout_size: int = Field(..., description="Size of the complete standard output in bytes")
+    stderr_size: int = Field(..., description="Size of the complete standard error output in bytes")
+    stdout_url: str = Field(..., description="URL of the complete standard output (supports Range requests)")
+    stderr_url: str = Field(..., description="URL of the complete standard error output (supports Range requests)")
+    expires_in: float = Field(..., description="Seconds until the output is no longer kept; it may be dropped earlier to make room")
+    
+    # Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "id": "3f2c9a7d1b4e4f0a9c8d7e6f5a4b3c2d",
+                "stdout_size": 73400320,
+                "stderr_size": 1024,
+                "stdout_url": "/v1/outputs/3f2c9a7d1b4e4f0a9c8d7e6f5a4b3c2d/stdout",
+                "stderr_url": "/v1/outputs/3f2c9a7d1b4e4f0a9c8d7e6f5a4b3c2d/stderr",
+                "expires_in": 3512.4
+            }
+        }
+    }
+
+class ExecutionJob(BaseModel):
+    """
+    State of a service execution running as a background job.
+    
+    Attributes:
+        id: Unique job identifier
+        service: Name of the executed service
+        operation: What is run, e.g. "ansible-playbook" or "opentofu-plan/apply"
+        priority: Priority class of the execution: high, normal or low
+        status: Job state: queued, running, completed or failed
+        queue_position: Position in the execution queue while the job waits for its turn
+        wait_time: Seconds the job waited before the execution started (so far, while queued)
+        created_at: ISO 8601 timestamp when the job was submitted
+        started_at: ISO 8601 timestamp when the execution started
+        finished_at: ISO 8601 timestamp when the job finished
+        result: Execution result once the job has completed
+        error: Error message if the job failed
+    """
+    id: str = Field(..., description="Unique job identifier")
+    service: str = Field(..., description="Name of the executed service")
+    operation: str = Field(..., description="What is run, e.g. 'ansible-playbook' or 'opentofu-plan/apply'")
+    priority: Literal["high", "normal", "low"] = Field("normal", description="Priority class of the execution")
+    status: Literal["queued", "running", "completed", "failed"] = Field(..., description="Job state")
+    queue_position: Optional[int] = Field(None, description="Position in the execution queue (1 is next) while the job waits for its turn")
+    wait_time: float = Field(0.0, description="Seconds the job waited before the execution started, so far while it is queued")
+    created_at: str = Field(..., description="ISO 8601 timestamp when the job was submitted")
+    started_at: Optional[str] = Field(None, description="ISO 8601 timestamp when the execution started")
+    finished_at: Optional[str] = Field(None, description="ISO 8601 timestamp when the job finished")
+    result: Optional[ServiceExecutionResult] = Field(None, description="Execution result once the job has completed")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    
+    # Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "id": "3f2b9c0e5d6a4e1f8a7b6c5d4e3f2a1b",
+                "service": "infrastructure-deploy",
+                "operation": "opentofu-plan/apply",
+                "priority": "normal",
+                "status": "running",
+                "queue_position": None,
+                "wait_time": 12.5,
+                "created_at": "2025-05-26T22:18:41.905955Z",
+                "started_at": "2025-05-26T22:18:41.912345Z",
+                "finished_at": None,
+                "result": None,
+                "error": None
+            }
+        }
+    }
+
+class ExecutionRecord(BaseModel):
+    """
+    A past service execution, as recorded in the execution history.
+    
+    Attributes:
+        id: Record identifier
+        service: Name of the executed service
+        operation: What was run, e.g. "ansible-playbook" or "opentofu-plan/apply"
+        status: succeeded, failed (non-zero return code) or error (not completed)
+        return_code: Return code of the execution, if it completed
+        start_time: ISO 8601 timestamp when the execution started
+        end_time: ISO 8601 timestamp when the execution ended
+        elapsed_time: Execution time in seconds
+        finished_at: ISO 8601 timestamp when the API recorded the execution
+        output_id: ID of the complete output, if it was kept after the execution
+        output_available: Whether the complete output can still be downloaded
+        output_url: URL of the complete output, while it can still be downloaded
+        error: Why the execution could not be completed
+    """
+    id: int = Field(..., description="Record identifier")
+    service: str = Field(..., description="Name of the executed service")
+    operation: str = Field(..., description="What was run, e.g. 'ansible-playbook' or 'opentofu-plan/apply'")
+    status: Literal["succeeded", "failed", "error"] = Field(..., description="Outcome of the execution")
+    return_code: Optional[int] = Field(None, description="Return code of the execution, if it completed")
+    start_time: Optional[str] = Field(None, description="ISO 8601 timestamp when the execution started")
+    end_time: Optional[str] = Field(None, description="ISO 8601 timestamp when the execution ended")
+    elapsed_time: Optional[float] = Field(None, description="Execution time in seconds")
+    finished_at: str = Field(..., description="ISO 8601 timestamp when the API recorded the execution")
+    output_id: Optional[str] = Field(None, description="ID of the complete output, if it was kept after the execution")
+    output_available: bool = Field(False, description="Whether the complete output can still be downloaded; kept outputs expire")
+    output_url: Optional[str] = Field(None, description="URL of the complete output, while it can still be downloaded")
+    error: Optional[str] = Field(None, description="Why the execution could not be completed")
+    
+    # Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "id": 1042,
+                "service": "hello-ansible",
+                "operation": "ansible-playbook",
+                "status": "succeeded",
+                "return_code": 0,
+                "start_time": "2025-05-26T22:18:41.905955",
+                "end_time": "2025-05-26T22:18:43.105955",
+                "elapsed_time": 1.2,
+                "finished_at": "2025-05-26T22:18:43.112000Z",
+                "output_id": None,
+                "output_available": False,
+                "output_url": None,
+                "error": None
+            }
+        }
+    }
+
+class ExecutionHistoryPage(BaseModel):
+    """
+    One page of recorded executions, newest first.
+    
+    Attributes:
+        items: The recorded executions
+        next_cursor: Cursor of the next page, or None if this is the last one
+    """
+    items: List[ExecutionRecord] = Field(..., description="The recorded executions, newest first")
+    next_cursor: Optional[str] = Field(None, description="Pass as 'cursor' to get the next page; null on the last page")
+
+class BatchExecutionItem(BaseModel):
+    """
+    One execution in a batch execution request.
+    
+    Attributes:
+        service: Name of the service to execute
+        operation: "apply" or "destroy" for OpenTofu plans; omitted for other service types
+        params: Additional parameters passed to the service as --key=value arguments
+    """
+    service: str = Field(..., description="Name of the service to execute")
+    operation: Optional[Literal["apply", "destroy"]] = Field(
+        None,
+        description="'apply' or 'destroy' for OpenTofu plan services; omit for other service types"
+    )
+    params: Dict[str, Union[str, int, float, bool]] = Field(
+        default_factory=dict,
+        description=(
+            "Additional parameters passed to the service as --key=value arguments; keys are "
+            "lowercase letters, digits and dashes, and may not be one of torero's own flags"
+        )
+    )
+    
+    @field_validator('params')
+    @classmethod
+    def validate_params(cls, v):
+        """
+        Validate the parameter names.
+        
+        Names must match PARAM_NAME_PATTERN, so a name cannot smuggle extra
+        arguments into the torero command, and may not be in RESERVED_PARAM_NAMES.
+        """
+        for key in v:
+            if not PARAM_NAME_PATTERN.fullmatch(key):
+                raise ValueError(f"Invalid parameter name {key!r}: use lowercase letters, digits and dashes")
+            if key in RESERVED_PARAM_NAMES:
+                raise ValueError(f"Parameter name {key!r} is reserved")
+        return v
+
+class BatchExecutionRequest(BaseModel):
+    """
+    Request body of the batch execution endpoint.
+    
+    Attributes:
+        items: The executions to run
+    """
+    items: List[BatchExecutionItem] = Field(..., min_length=1, max_length=1000, description="The executions to run")
+    
+    # Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "items": [
+                    {"service": "backup-core-01", "params": {"limit": "core-01"}},
+                    {"service": "backup-edge-01"},
+                    {"service": "infrastructure-deploy", "operation": "apply"}
+                ]
+            }
+        }
+    }
+
+class BatchExecutionResult(BaseModel):
+    """
+    Outcome of one execution in a batch.
+    
+    Attributes:
+        index: Position of the item in the request
+        service: Name of the service
+        operation: What was run, e.g. "ansible-playbook" or "opentofu-plan/apply", if the item was valid
+        status_code: HTTP status the single execution endpoint would have returned
+        result: Execution result, for synchronous batches
+        job: The background job, for async batches
+        error: Error message if the item could not be executed
+    """
+    index: int = Field(..., description="Position of the item in the request")
+    service: str = Field(..., description="Name of the service")
+    operation: Optional[str] = Field(None, description="What was run, e.g. 'ansible-playbook' or 'opentofu-plan/apply'")
+    status_code: int = Field(..., description="HTTP status code for this item")
+    result: Optional[ServiceExecutionResult] = Field(None, description="Execution result, for synchronous batches")
+    job: Optional[ExecutionJob] = Field(None, description="The background job, for async batches")
+    error: Optional[str] = Field(None, description="Error message if the item could not be executed")
+    
+    # Pydantic v2 configuration
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "index": 1,
+                "service": "backup-edge-01",
+                "operation": None,
+                "status_code": 404,
+                "result": None,
+                "job": None,
+                "error": "Service 'backup-edge-01' not found"
             }
         }
-    }
\ No newline at end of file
+    }
@@ -6,15 +6,31 @@ that serves the torero API.
 """
 
 import logging
+import math
 import os
 import sys
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
 from fastapi.openapi.utils import get_openapi
 
-from torero_api.api.v1.endpoints import services, decorators, repositories, secrets, execution, registries
+from torero_api.api.v1.endpoints import services, decorators, repositories, secrets, execution, registries, jobs, outputs, executions
 from torero_api.models.common import APIInfo, ErrorResponse
+from torero_api.core.limiter import ToreroBusyError
+from torero_api.core.backends import get_backend
+from torero_api.core.cache import inventory_cache
+from torero_api.core.describe_cache import describe_cache
+from torero_api.core.health import health_probe
+from torero_api.core.jobs import job_manager
+from torero_api.core.idempotency import idempotency_store
+from torero_api.core.outputs import output_store
+from torero_api.core.history import execution_history
+from torero_api.core.conditional import etag_matches, kind_for_path, make_etag
+from torero_api.core.inventory import track_snapshots
+from torero_api.core.refresher import InventoryRefresher, refresher_enabled
+from torero_api.core.warmup import Warmup, warmup_enabled
+from torero_api.core.watcher import start_watcher, stop_watcher, watch_enabled
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +42,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger("torero-api")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: warm up the caches, and run the background health
+    probe, the inventory refresher and, if enabled, the torero state watcher
+    while the API is up.
+    
+    Args:
+        app: The FastAPI application
+    """
+    from torero_api.core.torero_executor import refresh_inventory_async
+    
+    app.state.watcher = start_watcher() if watch_enabled() else None
+    
+    # Keep torero's availability and version in memory for /health
+    health_probe.start()
+    
+    # Preload the caches in the background; /ready reports 503 until done
+    warmup = None
+    if warmup_enabled():
+        warmup = Warmup.from_env()
+        warmup.start()
+    app.state.warmup = warmup
+    
+    refresher = None
+    if refresher_enabled():
+        refresher = InventoryRefresher(refresh_inventory_async, inventory_cache)
+        refresher.start()
+    app.state.refresher = refresher
+    
+    try:
+        yield
+    finally:
+        # Cancel executions still running as background jobs or for idempotency keys
+        await job_manager.shutdown()
+        await idempotency_store.shutdown()
+        # Delete the spool files of kept outputs
+        output_store.clear()
+        # Finish pending history writes, then close the database
+        await execution_history.drain()
+        execution_history.close()
+        if warmup is not None:
+            await warmup.stop()
+        if refresher is not None:
+            await refresher.stop()
+        await health_probe.stop()
+        await stop_watcher(app.state.watcher)
+        await get_backend().close()
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application instance.
@@ -48,9 +113,88 @@ def create_app() -> FastAPI:
         Model Context Protocol (MCP) Integration:
         This API follows OpenAPI standards and provides comprehensive type
         information for seamless integration with MCP-enabled applications.
-        """
+        """,
+        lifespan=lifespan
     )
     
+    # Report the age and version of the inventory data used to build each response
+    @app.middleware("http")
+    async def inventory_headers(request: Request, call_next):
+        """
+        Add X-Inventory-Age (seconds) to responses built from cached inventories.
+        
+        X-Inventory-Stale is added as well when the data is older than its
+        cache TTL, e.g. because torero could not be reached to refresh it.
+        Successful reads under /v1/<kind>/ also get an ETag derived from the
+        digest of the snapshot they were built from.
+        """
+        with track_snapshots() as used:
+            response = await call_next(request)
+        
+        if used:
+            response.headers["X-Inventory-Age"] = f"{max(snapshot.age for snapshot in used):.1f}"
+            if any(inventory_cache.is_stale(s.kind, s.age) for s in used):
+                response.headers["X-Inventory-Stale"] = "true"
+            
+            kind = kind_for_path(request.url.path)
+            snapshots = [s for s in used if s.kind == kind]
+            if snapshots and response.status_code == 200 and request.method == "GET":
+                response.headers["ETag"] = make_etag(snapshots[-1].digest, request.url.path, request.url.query)
+        return response
+    
+    # Answer HEAD and If-None-Match requests on read endpoints
+    @app.middleware("http")
+    async def conditional_get(request: Request, call_next):
+        """
+        Support HEAD and conditional GET on the read endpoints.
+        
+        HEAD is served like GET without the body. When If-None-Match matches
+        the ETag of the current inventory snapshot, 304 is returned before
+        the endpoint runs, so unchanged data costs neither a torero call nor
+        serializing the response. "If-None-Match: *" only matches a resource
+        that exists, so it is answered with 304 once the endpoint returned 200.
+        Requests outside the inventories pass through untouched.
+        """
+        from torero_api.core.torero_executor import get_inventory_snapshot_async
+        
+        kind = kind_for_path(request.url.path)
+        if kind is None or request.method not in ("GET", "HEAD"):
+            return await call_next(request)
+        
+        head = request.method == "HEAD"
+        if head:
+            request.scope["method"] = "GET"
+        
+        if_none_match = request.headers.get("if-none-match")
+        match_any = if_none_match is not None and if_none_match.strip() == "*"
+        if if_none_match and not match_any:
+            try:
+                snapshot = await get_inventory_snapshot_async(kind)
+            except Exception as e:
+                # Let the endpoint run and report the error
+                logger.debug(f"Skipping conditional check for {request.url.path}: {str(e)}")
+            else:
+                etag = make_etag(snapshot.digest, request.url.path, request.url.query)
+                if etag_matches(if_none_match, etag):
+                    return Response(
+                        status_code=304,
+                        headers={"ETag": etag, "X-Inventory-Age": f"{snapshot.age:.1f}"}
+                    )
+        
+        response = await call_next(request)
+        if match_any and response.status_code == 200:
+            validators = ("etag", "x-inventory-age", "x-inventory-stale")
+            return Response(
+                status_code=304,
+                headers={name: response.headers[name] for name in validators if name in response.headers}
+            )
+        if head:
+            # Copy the raw header list so repeated headers survive
+            headers_only = Response(status_code=response.status_code)
+            headers_only.raw_headers = list(response.raw_headers)
+            return headers_only
+        return response
+    
     # Include the routers
     app.include_router(services.router, prefix="/v1/services", tags=["services"])
     app.include_router(decorators.router, prefix="/v1/decorators", tags=["decorators"])
@@ -58,6 +202,9 @@ def create_app() -> FastAPI:
     app.include_router(secrets.router, prefix="/v1/secrets", tags=["secrets"])
     app.include_router(registries.router, prefix="/v1/registries", tags=["registries"])
     app.include_router(execution.router, prefix="/v1/execute", tags=["execution"])
+    app.include_router(jobs.router, prefix="/v1/jobs", tags=["jobs"])
+    app.include_router(outputs.router, prefix="/v1/outputs", tags=["outputs"])
+    app.include_router(executions.router, prefix="/v1/executions", tags=["executions"])
     
     # Root endpoint
     @app.get("/", response_model=APIInfo, tags=["root"], 
@@ -99,29 +246,45 @@ def create_app() -> FastAPI:
     # Health check endpoint
     @app.get("/health", tags=["system"], 
              summary="API health check",
-             description="Check if the API is operational and can connect to torero.")
-    async def health_check():
+             description="""
+             Check if the API is operational and can connect to torero.
+             
+             torero's availability and version are checked in the background and
+             served from memory, so probes are cheap. Use `?deep=true` to run a
+             live check; concurrent live checks share one torero call.
+             """)
+    async def health_check(
+        deep: bool = Query(False, description="Check torero now instead of using the last background check")
+    ):
         """
         Check if the API is operational and can connect to torero.
         
-        This endpoint attempts to execute a simple torero command to verify
-        that the API can communicate with the torero CLI.
-        """
-        from torero_api.core.torero_executor import check_torero_available
+        Args:
+            deep: Whether to run a live check instead of serving the cached result
         
+        Returns:
+            dict: Health status, torero availability and version, and the age in
+            seconds of the check the answer is based on; 503 if torero is unavailable
+        """
         try:
-            is_available, message = check_torero_available()
+            result = await health_probe.get(deep=deep)
             
-            if is_available:
-                return {"status": "healthy", "torero_available": True}
+            if result["available"]:
+                return {
+                    "status": "healthy",
+                    "torero_available": True,
+                    "torero_version": result["version"],
+                    "checked_age": round(result["age"], 1)
+                }
             else:
-                logger.warning(f"torero health check failed: {message}")
+                logger.warning(f"torero health check failed: {result['message']}")
                 return JSONResponse(
                     status_code=503,
                     content={
                         "status": "unhealthy", 
                         "torero_available": False, 
-                        "reason": message
+                        "reason": result["message"],
+                        "checked_age": round(result["age"], 1)
                     }
                 )
         except Exception as e:
@@ -135,13 +298,61 @@ def create_app() -> FastAPI:
                 }
             )
     
+    # Readiness endpoint
+    @app.get("/ready", tags=["system"],
+             summary="API readiness check",
+             description="""
+             Check whether the API has finished warming up its caches after startup.
+             
+             Returns 503 while the inventories are still being preloaded, so load
+             balancers only route traffic to nodes that can answer from memory.
+             Steps that failed during the warm-up are listed under `errors`.
+             """)
+    async def readiness_check(request: Request):
+        """
+        Report whether the startup warm-up has finished.
+        
+        Args:
+            request: The incoming request
+        
+        Returns:
+            dict: Readiness status, warm-up duration and warm-up errors; 503 while warming up
+        """
+        warmup = getattr(request.app.state, "warmup", None)
+        if warmup is None:
+            return {"status": "ready", "ready": True, "elapsed": None, "errors": {}}
+        
+        status = warmup.status()
+        if not status["ready"]:
+            return JSONResponse(status_code=503, content={"status": "warming_up", **status})
+        return {"status": "ready", **status}
+    
+    # Cache statistics endpoint
+    @app.get("/cache", tags=["system"],
+             summary="Cache statistics",
+             description="Report the state of the inventory cache, the usage of the describe cache and the kept execution outputs.")
+    async def cache_status():
+        """
+        Report the state of the inventory cache, the describe cache and the output store.
+        
+        Returns:
+            dict: Per-kind inventory cache status, the describe cache's size,
+            bounds and hit/miss counters, and the number and size of kept outputs
+        """
+        return {
+            "inventory": inventory_cache.status(),
+            "describe": describe_cache.stats(),
+            "outputs": output_store.stats()
+        }
+    
     # Custom exception handler for consistent error responses
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """
         Custom exception handler for HTTPExceptions.
         
-        Transforms HTTPExceptions into a consistent error response format.
+        Transforms HTTPExceptions into a consistent error response format,
+        keeping any headers they carry (e.g. Content-Range on 416).
         """
         error = ErrorResponse(
             status_code=exc.status_code,
@@ -149,7 +360,29 @@ def create_app() -> FastAPI:
             error_type="http_error",
             path=request.url.path
         )
-        return JSONResponse(status_code=exc.status_code, content=error.model_dump())
+        return JSONResponse(status_code=exc.status_code, content=error.model_dump(), headers=exc.headers)
+    
+    # Exception handler for torero process limiter rejections
+    @app.exception_handler(ToreroBusyError)
+    async def torero_busy_exception_handler(request: Request, exc: ToreroBusyError):
+        """
+        Exception handler for requests turned away by the torero process limiter.
+        
+        Returns 503 with a Retry-After header so clients back off instead of
+        piling more torero processes onto an overloaded host.
+        """
+        logger.warning(f"Rejecting request to {request.url.path}: {str(exc)}")
+        error = ErrorResponse(
+            status_code=503,
+            detail=str(exc),
+            error_type="busy",
+            path=request.url.path
+        )
+        return JSONResponse(
+            status_code=503,
+            content=error.model_dump(),
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))}
+        )
     
     # Exception handler for unexpected errors
     @app.exception_handler(Exception)